@@ -0,0 +1,229 @@
+import base64
+import json
+import re
+import zlib
+
+
+# Same rule of thumb as MAX_INPUT_CHARS: ~3 characters per token for German.
+CHARS_PER_TOKEN = 3
+
+# Session attribute holding the whole conversation, see HistoryStore.
+SESSION_KEY = "chat"
+LAYOUT_VERSION = 1
+# Layout used before HistoryStore; still read so running sessions carry over.
+LEGACY_HISTORY_KEY = "conversation_history"
+LEGACY_SUMMARY_KEY = "conversation_summary"
+TOPIC_WORDS = 8
+
+
+def estimate_tokens(text):
+    """Cheap token estimate, good enough for budgeting prompts."""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def clip(text, tokens):
+    """Cut text at a word boundary so it fits into tokens."""
+    limit = tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    return text[:max(limit - 3, 0)].rsplit(" ", 1)[0] + "..."
+
+
+def compact_turn(user_text, words=TOPIC_WORDS):
+    """Shrink a user turn to a short topic line for the running summary."""
+    parts = re.sub(r"\s+", " ", user_text.strip()).split(" ")
+    topic = " ".join(parts[:words])
+    return topic + "..." if len(parts) > words else topic
+
+
+def encoded_size(value):
+    """Bytes value takes up in the serialized response envelope."""
+    return len(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+class Conversation:
+    """Turns, summary and archive of one session, as loaded by HistoryStore."""
+
+    def __init__(self, turns=None, summary="", archive_blob=""):
+        self.turns = turns or []  # [(user_text, ai_reply), ...], oldest first
+        self.summary = summary
+        self.archive_blob = archive_blob
+        self._archive = None
+
+    @property
+    def archive(self):
+        """Older turns kept compressed; decoded on first access only."""
+        if self._archive is None:
+            self._archive = []
+            if self.archive_blob:
+                raw = zlib.decompress(base64.b64decode(self.archive_blob))
+                self._archive = [tuple(turn) for turn in json.loads(raw)]
+        return self._archive
+
+    def pack_archive(self):
+        if self._archive is None:
+            return self.archive_blob
+        if not self._archive:
+            return ""
+        raw = json.dumps(self._archive, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        return base64.b64encode(zlib.compress(raw, 9)).decode("ascii")
+
+
+class HistoryStore:
+    """Conversation history in session attributes with a hard byte budget.
+
+    Everything lives under one session key in a fixed, compact layout that
+    goes out verbatim in the response envelope::
+
+        {"v": 1, "s": "<summary>", "t": [user, ai, user, ai, ...], "z": "<archive>"}
+
+    With archive enabled, turns that leave the prompt context are kept in
+    the zlib+base64 blob "z" instead of being thrown away. When the layout
+    outgrows max_bytes, the oldest archived turns go first, then the oldest
+    live turns are folded into the summary, then summary topics are dropped,
+    until it fits again.
+    """
+
+    def __init__(self, max_bytes=2048, archive=False):
+        self.max_bytes = max_bytes
+        self.archive = archive
+
+    def load(self, session):
+        layout = session.get(SESSION_KEY)
+        if layout is None:
+            return self._load_legacy(session)
+        flat = layout.get("t", [])
+        turns = list(zip(flat[0::2], flat[1::2]))
+        return Conversation(turns=turns, summary=layout.get("s", ""), archive_blob=layout.get("z", ""))
+
+    def save(self, session, conversation, fold=None):
+        """Write conversation into session within the byte budget.
+
+        fold(summary, user_text) -> summary is used when turns have to be
+        dropped; without it they are simply discarded. Returns the size in
+        bytes of the stored layout.
+        """
+        layout = self._layout(conversation)
+        size = encoded_size(layout)
+        while size > self.max_bytes and self._shrink(conversation, fold):
+            layout = self._layout(conversation)
+            size = encoded_size(layout)
+
+        session.pop(LEGACY_HISTORY_KEY, None)
+        session.pop(LEGACY_SUMMARY_KEY, None)
+        session[SESSION_KEY] = layout
+        return size
+
+    def size(self, session):
+        """Bytes the stored conversation adds to each response envelope."""
+        layout = session.get(SESSION_KEY)
+        return encoded_size(layout) if layout is not None else 0
+
+    def _layout(self, conversation):
+        layout = {"v": LAYOUT_VERSION, "t": [text for turn in conversation.turns for text in turn]}
+        if conversation.summary:
+            layout["s"] = conversation.summary
+        blob = conversation.pack_archive()
+        if blob:
+            layout["z"] = blob
+        return layout
+
+    def _shrink(self, conversation, fold):
+        """Make the layout one step smaller; False once nothing is left to give."""
+        if conversation.archive:
+            conversation.archive.pop(0)
+            return True
+        if len(conversation.turns) > 1:
+            user_text, _ = conversation.turns.pop(0)
+            if fold is not None:
+                conversation.summary = fold(conversation.summary, user_text)
+            return True
+        if conversation.summary:
+            topics = conversation.summary.split("; ")
+            conversation.summary = "; ".join(topics[1:])
+            return True
+        if conversation.turns:
+            user_text, ai_reply = conversation.turns[0]
+            if len(user_text) + len(ai_reply) > 2:
+                conversation.turns[0] = (user_text[: len(user_text) // 2], ai_reply[: len(ai_reply) // 2])
+                return True
+        return False
+
+    @staticmethod
+    def _load_legacy(session):
+        history = session.get(LEGACY_HISTORY_KEY, [])
+        turns = []
+        for entry in history:
+            if entry.startswith("User: "):
+                turns.append([entry[len("User: "):], ""])
+            elif entry.startswith("AI: ") and turns:
+                turns[-1][1] = entry[len("AI: "):]
+        return Conversation(turns=[tuple(turn) for turn in turns], summary=session.get(LEGACY_SUMMARY_KEY, ""))
+
+
+class ContextBuilder:
+    """Packs the conversation into a fixed token budget.
+
+    The most recent turns are kept verbatim (the newest one cut down if it
+    alone is over budget); turns that no longer fit are folded into a
+    compact summary of earlier topics, which itself is capped, so the
+    prompt stays the same size however long the chat runs.
+    Storage in the session is left to a HistoryStore.
+    """
+
+    def __init__(self, max_tokens=300, summary_tokens=60, store=None):
+        self.max_tokens = max_tokens
+        self.summary_tokens = summary_tokens
+        self.store = store or HistoryStore()
+
+    def build(self, session):
+        """Return the context string for the next OpenAI call."""
+        conversation = self.store.load(session)
+
+        budget = self.max_tokens
+        recent = []
+        for user_text, ai_reply in reversed(conversation.turns):
+            entry = f"User: {user_text} AI: {ai_reply}"
+            cost = estimate_tokens(entry) + 1
+            if cost > budget:
+                # The newest turn always goes in, cut down to the budget.
+                if not recent:
+                    recent.append(clip(entry, budget - 1))
+                break
+            recent.append(entry)
+            budget -= cost
+        recent.reverse()
+
+        parts = []
+        if conversation.summary:
+            parts.append(f"Earlier topics: {conversation.summary}.")
+        parts.extend(recent)
+        return " ".join(parts)
+
+    def record(self, session, user_text, ai_reply):
+        """Append a turn, fold the oldest turns into the summary and store
+        the result. Returns the stored size in bytes."""
+        conversation = self.store.load(session)
+        conversation.turns.append((user_text, ai_reply))
+
+        while len(conversation.turns) > 1 and self.turn_tokens(conversation.turns) > self.max_tokens:
+            oldest = conversation.turns.pop(0)
+            conversation.summary = self.fold(conversation.summary, oldest[0])
+            if self.store.archive:
+                conversation.archive.append(oldest)
+
+        return self.store.save(session, conversation, fold=self.fold)
+
+    @staticmethod
+    def turn_tokens(turns):
+        return sum(estimate_tokens(f"User: {user_text} AI: {ai_reply}") + 1 for user_text, ai_reply in turns)
+
+    def fold(self, summary, user_text):
+        """Add a topic to the summary, dropping the oldest topics over budget."""
+        topics = [t for t in summary.split("; ") if t] if summary else []
+        topics.append(compact_turn(user_text))
+        while len(topics) > 1 and estimate_tokens("; ".join(topics)) > self.summary_tokens:
+            topics.pop(0)
+        return "; ".join(topics)
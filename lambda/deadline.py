@@ -0,0 +1,52 @@
+import contextvars
+import time
+
+
+# Alexa drops the request after ~8 s, whatever the Lambda timeout says.
+ALEXA_LIMIT_MS = 8000
+# Kept back for building and returning the response.
+RESERVE_MS = 700
+
+_current = contextvars.ContextVar("deadline", default=None)
+
+
+class Deadline:
+    """Absolute point in time by which the skill has to answer."""
+
+    def __init__(self, budget_ms):
+        self.expires_at = time.monotonic() + budget_ms / 1000.0
+
+    @classmethod
+    def from_lambda_context(cls, context, limit_ms=ALEXA_LIMIT_MS, reserve_ms=RESERVE_MS):
+        """Budget of an invocation: the Alexa limit or the Lambda time left,
+        whichever is shorter, minus a reserve for the response."""
+        budget_ms = limit_ms
+        get_remaining = getattr(context, "get_remaining_time_in_millis", None)
+        if get_remaining is not None:
+            budget_ms = min(budget_ms, get_remaining())
+        return cls(max(budget_ms - reserve_ms, 0))
+
+    def remaining(self):
+        """Seconds left, never negative."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+    def timeout(self, cap):
+        """Socket timeout for an outbound call: cap, but not past the deadline."""
+        return min(cap, self.remaining())
+
+
+def activate(deadline):
+    """Make deadline the current one for this invocation; returns a reset token."""
+    return _current.set(deadline)
+
+
+def reset(token):
+    _current.reset(token)
+
+
+def current():
+    """Deadline of the running invocation, or None outside of one."""
+    return _current.get()
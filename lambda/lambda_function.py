@@ -1,21 +1,65 @@
 import os
 import re
-import json
-import requests
-from ask_sdk_core.skill_builder import SkillBuilder
-from ask_sdk_core.dispatch_components import AbstractRequestHandler
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from ask_sdk_core.handler_input import HandlerInput
 from ask_sdk_model import Response
+from openai_client import OpenAIClient
+from response_cache import ResponseCache
+from conversation import ContextBuilder, HistoryStore
+import deadline as deadlines
+from deadline import Deadline
+from skill_logging import log
+from skill_runtime import RoutedRequestHandler, SkillBuilder, default_tracer as tracer, routes
+from skill_runtime.json_codec import default_codec as json_codec
+from skill_runtime import model_repr
 
 # === Configuration ===
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
-OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+OPENAI_URL = os.environ.get("OPENAI_URL", "https://api.openai.com/v1/chat/completions")
 MODEL = "gpt-4o-mini"
 VOICE_NAME = "Hans"  # Alexa voice for responses
 
 # ~500 tokens = ~1500 characters. Keep total request small and cheap.
 MAX_INPUT_CHARS = 1500
 
+# Stream completions and stop reading once the reply is long enough to speak.
+STREAM_REPLIES = os.environ.get("OPENAI_STREAM", "1") != "0"
+MAX_REPLY_CHARS = 320  # ~80 tokens, roughly 20 seconds of Alexa speech
+# A question only ends the reply once this much has been read; earlier ones
+# are usually rhetorical openers ("Weißt du, was ...?") before the answer.
+MIN_REPLY_CHARS = MAX_REPLY_CHARS // 2
+
+SENTENCE_END = re.compile(r"[.!?…](?=\s|$)")
+
+# Upper bound for a single OpenAI request; the invocation deadline usually
+# cuts it much shorter (Alexa gives up after ~8 s).
+OPENAI_TIMEOUT = 20
+# Send a second, hedged request if the first is silent this long (0 = off).
+HEDGE_AFTER_MS = int(os.environ.get("OPENAI_HEDGE_MS", "0"))
+OUT_OF_TIME_REPLY = "Hmm. Zu lange nachgedacht ich habe. Noch einmal fragen, du kannst?"
+
+# Shared by all handlers; lives as long as the warm container.
+openai_client = OpenAIClient(OPENAI_URL, OPENAI_API_KEY, json_codec=json_codec)
+# Runs OpenAI requests so waiting on them can be bounded by the deadline.
+llm_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="openai")
+
+# Replies to repeated questions, kept while the container stays warm.
+CACHE_TTL_SECONDS = 6 * 3600
+CACHE_MAX_BYTES = 512 * 1024
+response_cache = ResponseCache(max_entries=1000, max_bytes=CACHE_MAX_BYTES, ttl=CACHE_TTL_SECONDS)
+
+# Conversation context sent with each prompt, in tokens.
+CONTEXT_TOKENS = 300
+SUMMARY_TOKENS = 60
+# Hard cap for the conversation in session attributes (sent on every turn).
+HISTORY_MAX_BYTES = 2048
+HISTORY_ARCHIVE = os.environ.get("HISTORY_ARCHIVE") == "1"
+context_builder = ContextBuilder(
+    max_tokens=CONTEXT_TOKENS,
+    summary_tokens=SUMMARY_TOKENS,
+    store=HistoryStore(max_bytes=HISTORY_MAX_BYTES, archive=HISTORY_ARCHIVE),
+)
+
 # === Utility helpers ===
 def with_voice(text):
     """Wrap text with SSML prosody tag for deeper voice."""
@@ -27,12 +71,183 @@ def trim_text(text, limit=MAX_INPUT_CHARS):
         return text
     return text[:limit].rsplit(" ", 1)[0] + "..."
 
+def cut_at_sentence(text, limit=MAX_REPLY_CHARS):
+    """Cut text after the last complete sentence that fits into limit."""
+    text = text.strip()
+    if len(text) <= limit:
+        return text
+    ends = [m.end() for m in SENTENCE_END.finditer(text, 0, limit)]
+    if ends:
+        return text[:ends[-1]]
+    return trim_text(text, limit)
+
+def is_reply_complete(text, limit=MAX_REPLY_CHARS, minimum=MIN_REPLY_CHARS):
+    """True once the streamed reply has enough to speak.
+
+    Replies end with a small question, so a finished question sentence past
+    minimum characters is a natural stop. Past the speech budget anything
+    more would be cut anyway.
+    """
+    text = text.rstrip()
+    if len(text) >= limit:
+        return True
+    return len(text) >= minimum and text.endswith("?")
+
+def iter_stream_content(lines):
+    """Yield content deltas from the lines of an OpenAI chat-completions SSE
+    stream. Stopping early leaves lines itself open, so the rest can still
+    be drained."""
+    for line in lines:
+        if not line.startswith(b"data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == b"[DONE]":
+            break
+        chunk = json_codec.loads(payload)
+        choices = chunk.get("choices") or []
+        if choices:
+            delta = choices[0].get("delta") or {}
+            if delta.get("content"):
+                yield delta["content"]
+
+def whole_sentences(text):
+    """text up to its last complete sentence (within the speech budget),
+    or "" if it has none yet."""
+    text = text.strip()
+    ends = [m.end() for m in SENTENCE_END.finditer(text)]
+    return cut_at_sentence(text[:ends[-1]]) if ends else ""
+
+def streamed_tokens(data, reply):
+    """Token estimate for a streamed exchange: usage only arrives after the
+    last chunk, which we usually skip."""
+    sent = sum(len(m["content"]) for m in data["messages"])
+    return (sent + len(reply)) // 3
+
+def read_streamed_reply(lines, deadline=None, received=None):
+    """Assemble a streamed reply, stopping as soon as it is complete.
+
+    Returns (reply, complete). When the deadline passes first, the reply
+    is cut back to its last complete sentence and complete is False; with
+    no sentence yet, TimeoutError is raised. Each piece is also appended
+    to the list received, if given, for a caller that stops waiting first.
+    """
+    reply = ""
+    for piece in iter_stream_content(lines):
+        reply += piece
+        if received is not None:
+            received.append(piece)
+        if is_reply_complete(reply):
+            break
+        if deadline is not None and deadline.expired():
+            reply = whole_sentences(reply)
+            if not reply:
+                raise TimeoutError("OpenAI stream ran past the deadline")
+            return reply, False
+    return cut_at_sentence(reply), True
+
 # === Core OpenAI call ===
-def call_openai(prompt: str, context: str = "") -> tuple[str, int]:
-    """Send prompt to OpenAI and return reply + total token estimate."""
+def fetch_reply(client: OpenAIClient, data: dict, deadline: Deadline, received: list = None) -> tuple[str, int, bool]:
+    """Run one chat-completions request; raises on network or parse errors.
+
+    Returns (reply, total tokens, complete), complete being False for a
+    streamed reply cut short by the deadline. Streamed pieces are appended
+    to received as they arrive (see read_streamed_reply).
+    """
+    timeout = deadline.timeout(OPENAI_TIMEOUT)
+    if data["stream"]:
+        with tracer.span("openai", "stream"):
+            res = client.post(data, timeout=timeout, stream=True)
+            try:
+                res.raise_for_status()
+                lines = res.iter_lines()
+                reply, complete = read_streamed_reply(lines, deadline, received)
+            except BaseException:
+                res.close()
+                raise
+        # Reading the rest (at most max_tokens) keeps the connection for the
+        # next turn; it happens in the pool, after the reply is returned.
+        llm_pool.submit(client.release, res, lines)
+        return reply, streamed_tokens(data, reply), complete
+
+    with tracer.span("openai"):
+        res = client.post(data, timeout=timeout)
+        res.raise_for_status()
+        j = json_codec.loads(res.content)
+
+    # --- Extract text safely ---
+    reply = ""
+    total_tokens = 0
+    try:
+        if "choices" in j and len(j["choices"]) > 0:
+            reply = j["choices"][0]["message"]["content"].strip()
+        if "usage" in j and "total_tokens" in j["usage"]:
+            total_tokens = j["usage"]["total_tokens"]
+    except Exception as e:
+        raise ValueError(f"Parse error: {e}") from e
+    return reply, total_tokens, True
+
+def fetch_reply_before(deadline: Deadline, client: OpenAIClient, data: dict) -> tuple[str, int, bool]:
+    """Wait for a reply no longer than the deadline allows.
+
+    With OPENAI_HEDGE_MS set, a second identical request is sent when the
+    first one is still silent after that many milliseconds; whichever
+    answers first wins. When the deadline passes mid-stream, what has
+    arrived is cut back to its last complete sentence (complete False).
+    """
+    if deadline.timeout(OPENAI_TIMEOUT) <= 0:
+        raise TimeoutError("no time left for the OpenAI call")
+
+    received = []  # streamed pieces, one list per request
+
+    def submit():
+        pieces = []
+        received.append(pieces)
+        return llm_pool.submit(fetch_reply, client, data, deadline, pieces)
+
+    pending = {submit()}
+    hedged = not HEDGE_AFTER_MS
+    error = None
+    while pending:
+        wait_for = deadline.remaining() if hedged else min(HEDGE_AFTER_MS / 1000, deadline.remaining())
+        done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+        if deadline.expired():
+            reply = max((whole_sentences("".join(list(pieces))) for pieces in received), key=len)
+            if reply:
+                return reply, streamed_tokens(data, reply), False
+            raise TimeoutError("OpenAI call ran past the deadline")
+        if not hedged:
+            hedged = True
+            if not done:
+                log.info("openai hedged request", after_ms=HEDGE_AFTER_MS)
+                pending.add(submit())
+    raise error
+
+def call_openai(prompt: str, context: str = "", stream: bool = STREAM_REPLIES, client: OpenAIClient = None,
+                deadline: Deadline = None) -> tuple[str, int]:
+    """Send prompt to OpenAI and return reply + total token estimate.
+
+    With stream=True the reply is read from the SSE stream and returned as
+    soon as a complete sentence fits the speech budget; the rest of the
+    stream is drained in the background so the connection is reused.
+    Complete replies are cached per normalized prompt and context.
+    The call never outlives deadline (by default the one of the running
+    invocation); when it is spent, a streamed reply is cut back to its last
+    complete sentence, or an in-character stall reply is returned.
+    """
     prompt = trim_text(prompt)
     context = trim_text(context)
 
+    # Repeated questions are answered from memory, without a round trip.
+    cache_key = response_cache.make_key(prompt, context)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        log.annotate(openai="cache_hit")
+        return cached
+
     # --- Short, motivational system prompt ---
     system_message = (
         "You are Yoda, a friendly chat partner for a 13-year-old boy. Keep replies short, natural, and positive. Speak in German. Always ask a small, friendly question to keep the conversation going."
@@ -47,48 +262,44 @@ def call_openai(prompt: str, context: str = "") -> tuple[str, int]:
             {"role": "user", "content": user_message}
         ],
         "max_tokens": 80,  # short spoken replies (~40 words)
-        "temperature": 0.75
+        "temperature": 0.75,
+        "stream": stream,
     }
 
-    headers = {
-        "Authorization": f"Bearer {OPENAI_API_KEY}",
-        "Content-Type": "application/json",
-    }
+    client = client or openai_client
+    deadline = deadline or deadlines.current() or Deadline(OPENAI_TIMEOUT * 1000)
 
     try:
-        res = requests.post(OPENAI_URL, headers=headers, json=data, timeout=20)
-        res.raise_for_status()
-        j = res.json()
+        reply, total_tokens, complete = fetch_reply_before(deadline, client, data)
+    except TimeoutError as e:
+        log.warning("openai timeout", error=str(e))
+        log.annotate(openai="timeout")
+        return OUT_OF_TIME_REPLY, 0
+    except ValueError as e:
+        log.error("openai parse error", error=str(e))
+        log.annotate(openai="parse_error")
+        return "Sorry, something went wrong with the reply.", 0
     except Exception as e:
-        print("OpenAI API error:", e)
+        log.error("openai api error", error=str(e))
+        log.annotate(openai="error")
         return "Sorry, I couldn't reach the AI service right now.", 0
 
-    # --- Extract text safely ---
-    reply = ""
-    total_tokens = 0
-    try:
-        if "choices" in j and len(j["choices"]) > 0:
-            reply = j["choices"][0]["message"]["content"].strip()
-        if "usage" in j and "total_tokens" in j["usage"]:
-            total_tokens = j["usage"]["total_tokens"]
-        reply = reply or "Hmm, I'm not sure what to say right now."
-    except Exception as e:
-        print("Parse error:", e)
-        reply = "Sorry, something went wrong with the reply."
+    log.annotate(openai="ok", tokens=total_tokens)
+    if not reply:
+        return "Hmm, I'm not sure what to say right now.", total_tokens
 
+    # A reply cut short by the deadline is not what a repeat should get.
+    if complete:
+        response_cache.put(cache_key, (reply, total_tokens))
     return reply, total_tokens
 
 # === Alexa Handlers ===
-class LaunchRequestHandler(AbstractRequestHandler):
-    def can_handle(self, handler_input):
-        can = handler_input.request_envelope.request.object_type == "LaunchRequest"
-        print(f"LaunchRequestHandler.can_handle: {can}")
-        return can
+class LaunchRequestHandler(RoutedRequestHandler):
+    routes = routes(request_type="LaunchRequest")
 
     def handle(self, handler_input):
-        print("LaunchRequestHandler.handle called")
+        log.annotate(handler="LaunchRequestHandler")
         locale = handler_input.request_envelope.request.locale
-        print(f"Locale: {locale}")
         
         if locale.startswith('de'):
             speak = with_voice("Grüße dich! Yoda ich bin. Erzählen mir, du willst?")
@@ -97,40 +308,33 @@ class LaunchRequestHandler(AbstractRequestHandler):
             speak = with_voice("Greetings! Yoda I am. Tell me something, you will?")
             reprompt = with_voice("Speak to me, you can. What talk about, you wish?")
         
-        print(f"Launch: speak={speak}")
-        print(f"Launch: reprompt={reprompt}")
         response = handler_input.response_builder.speak(speak).ask(reprompt).response
-        print(f"Launch response: {response}")
+        log.debug("launch response", response=lambda: model_repr.to_dict(response))
         return response
 
 
-class ChatIntentHandler(AbstractRequestHandler):
-    def can_handle(self, handler_input):
-        req = handler_input.request_envelope.request
-        can = req.object_type == "IntentRequest" and req.intent.name == "ChatIntent"
-        print(f"ChatIntentHandler.can_handle: {can}")
-        return can
+class ChatIntentHandler(RoutedRequestHandler):
+    routes = routes(intent_name="ChatIntent")
 
     def handle(self, handler_input):
-        print("ChatIntentHandler.handle called")
+        log.annotate(handler="ChatIntentHandler")
         slots = handler_input.request_envelope.request.intent.slots
         user_text = slots["utterance"].value if "utterance" in slots and slots["utterance"].value else ""
-        print(f"ChatIntent utterance: {user_text}")
+        # Trimmed once here, so the prompt and the stored history agree.
+        user_text = trim_text(user_text)
+        log.debug("chat utterance", utterance=user_text)
         if not user_text:
             msg = with_voice("Verstanden, ich habe nicht. Wiederholen, du kannst?")
             return handler_input.response_builder.speak(msg).ask(msg).response
 
-        # Load short context
+        # Load context: recent turns plus a summary of older ones
         session = handler_input.attributes_manager.session_attributes
-        history = session.get("conversation_history", [])
-        context = " ".join(history[-3:])  # last 3 turns for continuity
+        context = context_builder.build(session)
 
         ai_reply, token_count = call_openai(user_text, context)
 
         # Save for next turn
-        history.append(f"User: {user_text}")
-        history.append(f"AI: {ai_reply}")
-        session["conversation_history"] = history[-6:]
+        log.annotate(history_bytes=context_builder.record(session, user_text, ai_reply))
         handler_input.attributes_manager.session_attributes = session
 
         return handler_input.response_builder.speak(
@@ -138,29 +342,21 @@ class ChatIntentHandler(AbstractRequestHandler):
         ).ask(with_voice("Weiter reden, du möchtest?")).response
 
 
-class HelpIntentHandler(AbstractRequestHandler):
-    def can_handle(self, handler_input):
-        req = handler_input.request_envelope.request
-        can = req.object_type == "IntentRequest" and req.intent.name == "AMAZON.HelpIntent"
-        print(f"HelpIntentHandler.can_handle: {can}")
-        return can
+class HelpIntentHandler(RoutedRequestHandler):
+    routes = routes(intent_name="AMAZON.HelpIntent")
 
     def handle(self, handler_input):
-        print("HelpIntentHandler.handle called")
+        log.annotate(handler="HelpIntentHandler")
         speak = with_voice("Über alles reden, mit mir du kannst — Spiele, Schule, Ideen. Hmm!")
         return handler_input.response_builder.speak(speak).ask(speak).response
 
 
-class FallbackIntentHandler(AbstractRequestHandler):
+class FallbackIntentHandler(RoutedRequestHandler):
     """Handler for AMAZON.FallbackIntent - treats unrecognized utterances as chat."""
-    def can_handle(self, handler_input):
-        req = handler_input.request_envelope.request
-        can = req.object_type == "IntentRequest" and req.intent.name == "AMAZON.FallbackIntent"
-        print(f"FallbackIntentHandler.can_handle: {can}")
-        return can
+    routes = routes(intent_name="AMAZON.FallbackIntent")
 
     def handle(self, handler_input):
-        print("FallbackIntentHandler.handle called")
+        log.annotate(handler="FallbackIntentHandler")
         # Get the raw text from the request
         req = handler_input.request_envelope.request
         # For FallbackIntent, we need to get the original utterance differently
@@ -169,14 +365,11 @@ class FallbackIntentHandler(AbstractRequestHandler):
         
         # Actually process as a chat message if possible
         session = handler_input.attributes_manager.session_attributes
-        history = session.get("conversation_history", [])
-        context = " ".join(history[-3:])
+        context = context_builder.build(session)
         
         ai_reply, token_count = call_openai(user_text, context)
         
-        history.append(f"User: {user_text}")
-        history.append(f"AI: {ai_reply}")
-        session["conversation_history"] = history[-6:]
+        log.annotate(history_bytes=context_builder.record(session, user_text, ai_reply))
         handler_input.attributes_manager.session_attributes = session
         
         return handler_input.response_builder.speak(
@@ -184,65 +377,66 @@ class FallbackIntentHandler(AbstractRequestHandler):
         ).ask(with_voice("Weiter reden, du möchtest?")).response
 
 
-class CancelOrStopHandler(AbstractRequestHandler):
-    def can_handle(self, handler_input):
-        req = handler_input.request_envelope.request
-        can = req.object_type == "IntentRequest" and req.intent.name in [
-            "AMAZON.CancelIntent",
-            "AMAZON.StopIntent",
-        ]
-        print(f"CancelOrStopHandler.can_handle: {can}")
-        return can
+class CancelOrStopHandler(RoutedRequestHandler):
+    routes = routes(intent_name=["AMAZON.CancelIntent", "AMAZON.StopIntent"])
 
     def handle(self, handler_input):
-        print("CancelOrStopHandler.handle called")
+        log.annotate(handler="CancelOrStopHandler")
         return handler_input.response_builder.speak(
             with_voice("Gehen du musst. Auf Wiedersehen, junger Padawan!")
         ).response
 
 
-class SessionEndedRequestHandler(AbstractRequestHandler):
+class SessionEndedRequestHandler(RoutedRequestHandler):
     """Handler for Session End."""
-    def can_handle(self, handler_input):
-        can = handler_input.request_envelope.request.object_type == "SessionEndedRequest"
-        print(f"SessionEndedRequestHandler.can_handle: {can}")
-        return can
+    routes = routes(request_type="SessionEndedRequest")
 
     def handle(self, handler_input):
-        print("SessionEndedRequestHandler.handle called")
+        log.annotate(handler="SessionEndedRequestHandler")
         req = handler_input.request_envelope.request
-        print(f"Session ended reason: {getattr(req, 'reason', 'UNKNOWN')}")
-        print(f"Session ended error: {getattr(req, 'error', 'NONE')}")
+        log.annotate(reason=str(getattr(req, 'reason', 'UNKNOWN')), session_error=str(getattr(req, 'error', 'NONE')))
         # Clean up session data if needed
         return handler_input.response_builder.response
 
 
 # === Skill Builder ===
-sb = SkillBuilder()
+sb = SkillBuilder(json_codec=json_codec)
 sb.add_request_handler(LaunchRequestHandler())
 sb.add_request_handler(ChatIntentHandler())
 sb.add_request_handler(HelpIntentHandler())
 sb.add_request_handler(FallbackIntentHandler())
 sb.add_request_handler(CancelOrStopHandler())
 sb.add_request_handler(SessionEndedRequestHandler())
+skill_handler = sb.lambda_handler()  # reuses one built skill across warm invocations
+# Build and rehearse the skill and open the OpenAI connection in the Lambda init phase
+# (SKILL_WARM_UP=0 leaves it all to the first request, OPENAI_PRECONNECT=0 only the connection).
+if os.environ.get("SKILL_WARM_UP", "1") != "0":
+    sb.warm_up(preconnect=() if os.environ.get("OPENAI_PRECONNECT") == "0" else [openai_client])
 
 # Wrapper to log all incoming requests
 def logged_handler(event, context):
-    """Log all incoming requests before processing."""
-    import json
-    print("=" * 80)
-    print("INCOMING REQUEST:")
-    print(f"Request type: {event.get('request', {}).get('type', 'UNKNOWN')}")
-    if event.get('request', {}).get('type') == 'IntentRequest':
-        print(f"Intent name: {event.get('request', {}).get('intent', {}).get('name', 'UNKNOWN')}")
-        print(f"Intent slots: {event.get('request', {}).get('intent', {}).get('slots', {})}")
-    print(f"Session new: {event.get('session', {}).get('new', 'UNKNOWN')}")
-    print(f"Full request: {json.dumps(event, indent=2, default=str)[:1000]}...")
-    print("=" * 80)
+    """Log each invocation as one compact JSON line (full event only at DEBUG)."""
+    request = event.get("request", {})
+    log.begin(
+        request_id=request.get("requestId"),
+        request_type=request.get("type", "UNKNOWN"),
+        intent=request.get("intent", {}).get("name"),
+        locale=request.get("locale"),
+        session_new=event.get("session", {}).get("new"),
+    )
+    log.debug("incoming request", event=lambda: event)
     
-    # Call the actual handler
-    return sb.lambda_handler()(event, context)
+    # Everything downstream (call_openai in particular) answers by this deadline
+    token = deadlines.activate(Deadline.from_lambda_context(context))
+    try:
+        # Call the actual handler
+        return skill_handler(event, context)
+    except Exception as e:
+        log.annotate(error=repr(e))
+        raise
+    finally:
+        deadlines.reset(token)
+        log.end()
 
 lambda_handler = logged_handler
 handler = logged_handler  # Alias for Alexa-hosted skills
-
@@ -0,0 +1,112 @@
+import json
+import ssl
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.certs import where as ca_bundle_path
+
+from skill_logging import log
+
+
+# One pool per host is plenty: we only ever talk to the OpenAI endpoint.
+POOL_CONNECTIONS = 1
+POOL_MAXSIZE = 4
+# Most of a streamed reply left unread that is still drained to keep its
+# connection (max_tokens=80 is well below this).
+DRAIN_MAX_BYTES = 64 * 1024
+
+
+class ReusedContextAdapter(HTTPAdapter):
+    """HTTPAdapter that hands one prebuilt SSLContext to every connection.
+
+    The default adapter sets ``ca_certs`` on each new connection, so urllib3
+    re-reads the CA bundle for every TLS handshake. Here the bundle is loaded
+    once into the shared context instead.
+    """
+
+    def __init__(self, ssl_context, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        pool_kwargs["ssl_context"] = self.ssl_context
+        return super().init_poolmanager(*args, **pool_kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True:
+            # CA certificates already live in self.ssl_context.
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+class OpenAIClient:
+    """Long-lived HTTP client for the chat-completions endpoint.
+
+    Created once at module import so warm Lambda invocations reuse the same
+    keep-alive connection, TLS context and auth headers.
+    """
+
+    def __init__(self, url, api_key, pool_maxsize=POOL_MAXSIZE, json_codec=None):
+        self.url = url
+        # Anything with loads/dumps; see skill_runtime.json_codec.
+        self.json = json_codec or json
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        self.ssl_context = ssl.create_default_context(cafile=ca_bundle_path())
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+        adapter = ReusedContextAdapter(
+            self.ssl_context,
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize))
+
+    def post(self, data, timeout=20, stream=False):
+        """POST a chat-completions payload and return the raw response."""
+        body = self.json.dumps(data)
+        return self.session.post(self.url, headers=self.headers, data=body, timeout=timeout, stream=stream)
+
+    def release(self, response, rest, max_bytes=DRAIN_MAX_BYTES):
+        """Read the rest of a partly read streamed response, so its
+        connection goes back to the pool instead of being closed (urllib3
+        cannot reuse a half-read one). rest is the iterator the response was
+        being read with (``iter_lines()``/``iter_content()``): abandoning it
+        would close the connection. Past max_bytes, or on errors, the
+        connection is closed. True if it was kept."""
+        read = 0
+        try:
+            for chunk in rest:
+                read += len(chunk)
+                if read > max_bytes:
+                    return False
+            return True
+        except (requests.RequestException, OSError) as e:
+            log.debug("openai drain failed", error=str(e))
+            return False
+        finally:
+            # Releases a fully read connection to the pool, closes it otherwise.
+            response.close()
+
+    def preconnect(self, timeout=2.0):
+        """Open a pooled connection (TCP + TLS) ahead of the first request.
+
+        Meant for the Lambda init phase. Failures are ignored: the first
+        real request will simply connect itself.
+        """
+        parts = urlsplit(self.url)
+        try:
+            self.session.head(f"{parts.scheme}://{parts.netloc}/", timeout=timeout)
+            return True
+        except requests.RequestException as e:
+            log.warning("openai preconnect failed", error=str(e))
+            return False
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,105 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+
+
+UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+# Hesitation sounds and the name the boy calls Yoda by, in front of the
+# utterance slot (see skill-package/interactionModels/custom/de-DE.json).
+# Words like "also", "na" or "gut" can carry meaning ("gut oder böse"), so
+# they stay part of the key.
+LEADING_FILLERS = re.compile(r"^(?:(?:aeh|aehm|oehm|hm+|yoda)\b[\s,]*)+")
+TRAILING_FILLERS = re.compile(r"[\s,]*\bbitte$")
+PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_utterance(text):
+    """Reduce an utterance to the form used as cache key.
+
+    Expects text already passed through trim_text (whitespace collapsed).
+    Case is folded, umlauts spelled out, punctuation and filler words dropped.
+    """
+    text = text.casefold().translate(UMLAUTS)
+    text = PUNCTUATION.sub(" ", text)
+    text = " ".join(text.split())
+    text = LEADING_FILLERS.sub("", text)
+    return TRAILING_FILLERS.sub("", text)
+
+
+class ResponseCache:
+    """In-process LRU cache with TTL and a byte-size cap.
+
+    Survives across warm invocations of the same container, so repeated
+    questions are answered without a network round trip.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=256 * 1024, ttl=3600):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries = OrderedDict()  # key -> (expires_at, size, value)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_key(prompt, context=""):
+        """Build the cache key from the utterance and a hash of the context."""
+        context_hash = hashlib.blake2b(context.encode("utf-8"), digest_size=8).hexdigest() if context else ""
+        return f"{normalize_utterance(prompt)}|{context_hash}"
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key, value):
+        """Store value (a reply string or a tuple of strings/ints)."""
+        size = len(key.encode("utf-8")) + self._value_size(value)
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (time.monotonic() + self.ttl, size, value)
+            self.size += size
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.size -= size
+
+    @staticmethod
+    def _value_size(value):
+        if isinstance(value, tuple):
+            return sum(len(str(v).encode("utf-8")) for v in value)
+        return len(str(value).encode("utf-8"))
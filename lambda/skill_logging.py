@@ -0,0 +1,123 @@
+import contextvars
+import json
+import os
+import random
+import sys
+import time
+
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+
+
+def _resolve(value):
+    """Values may be zero-argument callables, built only when logged."""
+    return value() if callable(value) else value
+
+
+class StructuredLogger:
+    """Level-gated JSON-lines logger with one summary line per invocation.
+
+    Messages and field values may be passed as callables (``lambda: ...``);
+    they are only evaluated when the line is actually written, so disabled
+    debug output costs a comparison and nothing else. A sampled fraction of
+    requests is logged at DEBUG regardless of the configured level.
+
+    The invocation record and the sampled threshold live in a ContextVar
+    (like deadline.py's deadline), so concurrent invocations, e.g. async
+    handlers or threads started with a copied context, keep their own.
+    """
+
+    def __init__(self, level=INFO, sample_rate=0.0, stream=None):
+        self.level = level
+        self.sample_rate = sample_rate
+        self.stream = stream or sys.stdout
+        # (record, threshold, started_at) of the running invocation.
+        self._invocation = contextvars.ContextVar("invocation", default=None)
+
+    @property
+    def record(self):
+        """Summary fields of the running invocation, or None outside of one."""
+        invocation = self._invocation.get()
+        return invocation[0] if invocation is not None else None
+
+    @property
+    def threshold(self):
+        invocation = self._invocation.get()
+        return invocation[1] if invocation is not None else self.level
+
+    # --- per-invocation record ---
+    def begin(self, **fields):
+        """Start the invocation record and decide whether it is sampled."""
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        record = {key: _resolve(value) for key, value in fields.items()}
+        if sampled:
+            record["sampled"] = True
+        self._invocation.set((record, DEBUG if sampled else self.level, time.perf_counter()))
+
+    def annotate(self, **fields):
+        """Add fields to the summary line of the running invocation.
+
+        Callables are resolved when the line is written."""
+        record = self.record
+        if record is not None:
+            record.update(fields)
+
+    def end(self, **fields):
+        """Write the invocation summary line and reset for the next one."""
+        invocation = self._invocation.get()
+        if invocation is None:
+            return
+        record = {key: _resolve(value) for key, value in invocation[0].items()}
+        record.update(fields)
+        record["duration_ms"] = round((time.perf_counter() - invocation[2]) * 1000, 1)
+        self._invocation.set(None)
+        if self.level <= INFO or record.get("error"):
+            self.write(INFO if not record.get("error") else ERROR, "invocation", record)
+
+    # --- individual lines ---
+    def enabled(self, level):
+        return level >= self.threshold
+
+    def debug(self, message, **fields):
+        if DEBUG >= self.threshold:
+            self.log(DEBUG, message, fields)
+
+    def info(self, message, **fields):
+        if INFO >= self.threshold:
+            self.log(INFO, message, fields)
+
+    def warning(self, message, **fields):
+        if WARNING >= self.threshold:
+            self.log(WARNING, message, fields)
+
+    def error(self, message, **fields):
+        if ERROR >= self.threshold:
+            self.log(ERROR, message, fields)
+
+    def log(self, level, message, fields):
+        fields = {key: _resolve(value) for key, value in fields.items()}
+        record = self.record
+        if record is not None and "request_id" in record:
+            fields.setdefault("request_id", record["request_id"])
+        self.write(level, _resolve(message), fields)
+
+    def write(self, level, message, fields):
+        line = {"level": LEVEL_NAMES[level], "msg": message}
+        line.update(fields)
+        self.stream.write(json.dumps(line, separators=(",", ":"), ensure_ascii=False, default=str) + "\n")
+
+
+def from_environment():
+    """Logger configured by LOG_LEVEL (default INFO) and LOG_SAMPLE_RATE
+    (fraction of requests logged at DEBUG, default 0)."""
+    level = LEVELS.get(os.environ.get("LOG_LEVEL", "INFO").upper(), INFO)
+    sample_rate = float(os.environ.get("LOG_SAMPLE_RATE", "0"))
+    return StructuredLogger(level=level, sample_rate=sample_rate)
+
+
+log = from_environment()
@@ -0,0 +1,8 @@
+"""Runtime extensions to the ASK SDK used by this skill."""
+from .api_client import DefaultApiClient
+from .dispatch import RequestDispatcher
+from .routing import IndexedRequestMapper, RoutedRequestHandler, routes
+from .serialize import DefaultSerializer, Serializer
+from .skill import CustomSkill
+from .skill_builder import CustomSkillBuilder, SkillBuilder
+from .tracing import NOOP_SPAN, TracedApiClient, Tracer, default_tracer
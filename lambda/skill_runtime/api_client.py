@@ -0,0 +1,42 @@
+"""API client with a pluggable JSON codec."""
+from ask_sdk_core.api_client import DefaultApiClient as BaseDefaultApiClient
+from ask_sdk_core.exceptions import ApiClientException
+from ask_sdk_model.services import ApiClientResponse
+from urllib3.util import parse_url
+
+from .json_codec import default_codec
+
+
+class DefaultApiClient(BaseDefaultApiClient):
+    """``ask_sdk_core.api_client.DefaultApiClient`` encoding JSON request
+    bodies with json_codec (see skill_runtime.json_codec) instead of the
+    stdlib ``json``."""
+
+    def __init__(self, json_codec=None):
+        self.json_codec = json_codec or default_codec
+
+    def invoke(self, request):
+        try:
+            http_method = self._resolve_method(request)
+            http_headers = self._convert_list_tuples_to_dict(headers_list=request.headers)
+
+            parsed_url = parse_url(request.url)
+            if parsed_url.scheme is None or parsed_url.scheme != "https":
+                raise ApiClientException("Requests against non-HTTPS endpoints are not allowed.")
+
+            raw_data = None
+            if request.body:
+                body_content_type = http_headers.get("Content-type", None)
+                if body_content_type is not None and "json" in body_content_type:
+                    raw_data = self.json_codec.dumps(request.body)
+                else:
+                    raw_data = request.body
+
+            http_response = http_method(url=request.url, headers=http_headers, data=raw_data)
+
+            return ApiClientResponse(
+                headers=self._convert_dict_to_list_tuples(http_response.headers),
+                status_code=http_response.status_code,
+                body=http_response.text)
+        except Exception as e:
+            raise ApiClientException("Error executing the request: {}".format(str(e)))
@@ -0,0 +1,183 @@
+"""Asyncio flavour of the ASK SDK skill.
+
+Handlers, interceptors and exception handlers may define ``async def``
+``can_handle``/``handle``/``process`` methods (plain methods keep working),
+so independent I/O inside one turn can be awaited concurrently. Routing is
+the same as in ``GenericRequestDispatcher``: global request interceptors,
+first matching handler chain in registration order, chain interceptors,
+global response interceptors, then the exception mapper on errors.
+"""
+import asyncio
+import inspect
+
+from ask_sdk_model import RequestEnvelope
+from ask_sdk_runtime.exceptions import DispatchException
+
+from .api_client import DefaultApiClient
+from .routing import candidates
+from .skill import CustomSkill
+from .skill_builder import CustomSkillBuilder
+
+
+async def maybe_await(value):
+    """Await value if a coroutine (or other awaitable) was returned."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncRequestDispatcher:
+    """Async counterpart of ``GenericRequestDispatcher``."""
+
+    def __init__(self, options):
+        self.handler_adapters = options.handler_adapters or []
+        self.request_mappers = options.request_mappers or []
+        self.exception_mapper = options.exception_mapper
+        self.request_interceptors = options.request_interceptors or []
+        self.response_interceptors = options.response_interceptors or []
+
+    async def dispatch(self, handler_input):
+        try:
+            for request_interceptor in self.request_interceptors:
+                await maybe_await(request_interceptor.process(handler_input=handler_input))
+
+            output = await self.dispatch_request(handler_input)
+
+            for response_interceptor in self.response_interceptors:
+                await maybe_await(response_interceptor.process(handler_input=handler_input, response=output))
+
+            return output
+        except Exception as e:
+            exception_handler = await self.find_exception_handler(handler_input, e)
+            if exception_handler is None:
+                raise e
+            return await maybe_await(exception_handler.handle(handler_input, e))
+
+    async def dispatch_request(self, handler_input):
+        request_handler_chain = await self.find_handler_chain(handler_input)
+        if request_handler_chain is None:
+            raise DispatchException("Unable to find a suitable request handler")
+
+        request_handler = request_handler_chain.request_handler
+        supported_handler_adapter = None
+        for adapter in self.handler_adapters:
+            if adapter.supports(request_handler):
+                supported_handler_adapter = adapter
+                break
+        if supported_handler_adapter is None:
+            raise DispatchException("Unable to find a suitable request adapter")
+
+        for interceptor in request_handler_chain.request_interceptors:
+            await maybe_await(interceptor.process(handler_input=handler_input))
+
+        output = await maybe_await(supported_handler_adapter.execute(
+            handler_input=handler_input, handler=request_handler))
+
+        for response_interceptor in request_handler_chain.response_interceptors:
+            await maybe_await(response_interceptor.process(handler_input=handler_input, response=output))
+
+        return output
+
+    async def find_handler_chain(self, handler_input):
+        for mapper in self.request_mappers:
+            chains = getattr(mapper, "request_handler_chains", None)
+            if chains is None:
+                # Custom mapper without visible chains: ask it directly.
+                chain = mapper.get_request_handler_chain(handler_input)
+                if chain is not None:
+                    return chain
+                continue
+            for chain, matched in candidates(mapper, chains, handler_input):
+                if matched or await maybe_await(chain.request_handler.can_handle(handler_input)):
+                    return chain
+        return None
+
+    async def find_exception_handler(self, handler_input, exception):
+        if self.exception_mapper is None:
+            return None
+        handlers = getattr(self.exception_mapper, "exception_handlers", None)
+        if handlers is None:
+            return self.exception_mapper.get_handler(handler_input, exception)
+        for handler in handlers:
+            if await maybe_await(handler.can_handle(handler_input=handler_input, exception=exception)):
+                return handler
+        return None
+
+
+class AsyncDefaultApiClient(DefaultApiClient):
+    """``DefaultApiClient`` with an awaitable ``invoke_async``.
+
+    The blocking ``requests`` call runs in a worker thread, so several
+    service calls (or a service call and an OpenAI request) can overlap.
+    The plain ``invoke`` stays available for the generated service clients.
+    """
+
+    async def invoke_async(self, request):
+        return await asyncio.to_thread(self.invoke, request)
+
+
+class AsyncCustomSkill(CustomSkill):
+    """``CustomSkill`` whose dispatcher awaits handlers and interceptors."""
+
+    def create_dispatcher(self, skill_configuration):
+        return AsyncRequestDispatcher(options=skill_configuration)
+
+    def invoke(self, request_envelope, context):
+        """Sync entry point; runs invoke_async to completion."""
+        return run(self.invoke_async(request_envelope, context))
+
+    def dispatch(self, handler_input):
+        return run(self.request_dispatcher.dispatch(handler_input=handler_input))
+
+    async def invoke_async(self, request_envelope, context):
+        handler_input = self.handler_input_for(request_envelope, context)
+        response = await self.request_dispatcher.dispatch(handler_input=handler_input)
+        return self.response_envelope_for(handler_input, response)
+
+
+class AsyncSkillBuilder(CustomSkillBuilder):
+    """Skill builder for skills with async handlers.
+
+    Accepts the same components as ``CustomSkillBuilder`` (handlers may mix
+    sync and async methods) and still hands Lambda a plain sync function.
+    The skill is built once and reused, like with ``SkillBuilder``.
+    """
+
+    def create(self):
+        return AsyncCustomSkill(skill_configuration=self.skill_configuration, tracer=self.tracer,
+                                json_codec=self.json_codec)
+
+    def lambda_handler(self):
+        tracer = self.tracer
+
+        def wrapper(event, context):
+            tracer.start_trace()
+            try:
+                skill = self.skill()
+                request = event.get("request", {})
+                tracer.set_dimension("RequestType", request.get("type"))
+                with tracer.span("deserialize"):
+                    request_envelope = skill.serializer.deserialize_object(
+                        payload=event, obj_type=RequestEnvelope)
+                response_envelope = run(skill.invoke_async(
+                    request_envelope=request_envelope, context=context))
+                with tracer.span("serialize"):
+                    return skill.serializer.serialize(response_envelope)
+            finally:
+                tracer.finish_trace()
+        return wrapper
+
+
+_loop = None
+
+
+def run(coroutine):
+    """Run coroutine on one event loop that survives warm invocations.
+
+    Creating a fresh loop per request (as ``asyncio.run`` does) costs more
+    than most handlers.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coroutine)
@@ -0,0 +1,96 @@
+"""Request dispatcher with per-phase tracing."""
+from ask_sdk_runtime.dispatch import GenericRequestDispatcher
+from ask_sdk_runtime.exceptions import DispatchException
+
+from .routing import candidates
+from .tracing import default_tracer
+
+
+class RequestDispatcher(GenericRequestDispatcher):
+    """``GenericRequestDispatcher`` with the same routing rules, timing each
+    can_handle probe, the interceptors and the handler as separate spans."""
+
+    def __init__(self, options, tracer=None):
+        super().__init__(options=options)
+        self.tracer = tracer or default_tracer
+
+    def dispatch(self, handler_input):
+        tracer = self.tracer
+        try:
+            with tracer.span("request_interceptors"):
+                for request_interceptor in self.request_interceptors:
+                    request_interceptor.process(handler_input=handler_input)
+
+            output = self.dispatch_request(handler_input)
+
+            with tracer.span("response_interceptors"):
+                for response_interceptor in self.response_interceptors:
+                    response_interceptor.process(handler_input=handler_input, response=output)
+
+            return output
+        except Exception as e:
+            if self.exception_mapper is None:
+                raise e
+            with tracer.span("exception_handler"):
+                exception_handler = self.exception_mapper.get_handler(handler_input, e)
+                if exception_handler is None:
+                    raise e
+                return exception_handler.handle(handler_input, e)
+
+    def dispatch_request(self, handler_input):
+        tracer = self.tracer
+        request_handler_chain = self.find_handler_chain(handler_input)
+        if request_handler_chain is None:
+            raise DispatchException("Unable to find a suitable request handler")
+
+        request_handler = request_handler_chain.request_handler
+        supported_handler_adapter = None
+        for adapter in self.handler_adapters:
+            if adapter.supports(request_handler):
+                supported_handler_adapter = adapter
+                break
+        if supported_handler_adapter is None:
+            raise DispatchException("Unable to find a suitable request adapter")
+
+        handler_name = type(request_handler).__name__
+        with tracer.span("handler_interceptors"):
+            for interceptor in request_handler_chain.request_interceptors:
+                interceptor.process(handler_input=handler_input)
+
+        with tracer.span("handle", handler_name):
+            output = supported_handler_adapter.execute(handler_input=handler_input, handler=request_handler)
+
+        with tracer.span("handler_interceptors"):
+            for response_interceptor in request_handler_chain.response_interceptors:
+                response_interceptor.process(handler_input=handler_input, response=output)
+
+        return output
+
+    def find_handler_chain(self, handler_input):
+        """First handler chain that can handle the input, in registration
+        order, across all request mappers."""
+        tracer = self.tracer
+        if tracer.active is None:
+            for mapper in self.request_mappers:
+                chain = mapper.get_request_handler_chain(handler_input)
+                if chain is not None:
+                    return chain
+            return None
+
+        for mapper in self.request_mappers:
+            chains = getattr(mapper, "request_handler_chains", None)
+            if chains is None:
+                with tracer.span("can_handle", type(mapper).__name__):
+                    chain = mapper.get_request_handler_chain(handler_input)
+                if chain is not None:
+                    return chain
+                continue
+            for chain, matched in candidates(mapper, chains, handler_input):
+                if matched:
+                    return chain
+                handler = chain.request_handler
+                with tracer.span("can_handle", type(handler).__name__):
+                    can = handler.can_handle(handler_input)
+                if can:
+                    return chain
+        return None
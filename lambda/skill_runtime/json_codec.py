@@ -0,0 +1,66 @@
+"""Pluggable JSON codecs.
+
+A codec is anything with ``loads(str | bytes)`` and ``dumps(obj)``
+returning str or bytes; the stdlib ``json`` module itself is one. The
+serializer, the API client and the OpenAI client take a codec, and
+``default_codec`` picks orjson when it is installed and the stdlib
+otherwise. ``JSON_CODEC=stdlib`` (or ``orjson``) overrides the choice.
+"""
+import json
+import os
+
+
+class StdlibCodec:
+    name = "stdlib"
+    loads = staticmethod(json.loads)
+    dumps = staticmethod(json.dumps)
+
+
+class OrjsonCodec:
+    """orjson: bytes out, compact, non-ASCII as UTF-8.
+
+    Values orjson refuses (integers beyond 64 bits, non-str dict keys)
+    are encoded by the stdlib instead.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self.loads = orjson.loads
+        self._dumps = orjson.dumps
+        self._error = orjson.JSONEncodeError
+
+    def dumps(self, obj):
+        try:
+            return self._dumps(obj)
+        except self._error:
+            return json.dumps(obj)
+
+
+CODECS = {"orjson": OrjsonCodec, "stdlib": StdlibCodec}
+
+
+def get_codec(name):
+    """Codec by name; raises ImportError if its library is missing."""
+    return CODECS[name]()
+
+
+def detect(preferred=("orjson",)):
+    """First installed codec out of preferred, else the stdlib one."""
+    for name in preferred:
+        try:
+            return get_codec(name)
+        except ImportError:
+            continue
+    return StdlibCodec()
+
+
+def from_environment():
+    name = os.environ.get("JSON_CODEC", "auto")
+    if name == "auto":
+        return detect()
+    return get_codec(name)
+
+
+default_codec = from_environment()
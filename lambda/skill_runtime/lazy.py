@@ -0,0 +1,167 @@
+"""Lazily materialized models.
+
+A handler usually reads a handful of fields (request type, intent name and
+slots, locale, session attributes), but decoding an envelope builds every
+nested model: context, supported interfaces, viewports and, on Echo Show,
+the whole APL ``componentsVisibleOnScreen`` tree. The plans here return
+instances of per-class lazy subclasses instead. They hold the raw payload
+dict and decode a field on first access, memoizing it in the instance
+``__dict__``. Subtrees nobody reads are never built.
+
+The lazy instances are instances of the model class, compare equal to
+their eagerly decoded counterparts and serialize the same way. Decoding
+errors in a nested model surface when the field is first read. Copies
+and pickles of them are plain (fully decoded) instances of the model
+class.
+"""
+import copy
+import copyreg
+import threading
+
+from .plans import ModelPlan, PlanRegistry, attribute_names
+
+PAYLOAD = "_lazy_payload"
+MISSING = object()
+
+
+class LazyModel:
+    """Mixin of the generated lazy subclasses; see :py:func:`lazy_class`."""
+
+    _lazy_plan = None
+
+    def __getattr__(self, name):
+        # Only called for names not (yet) in the instance __dict__. Special
+        # method probes (copy, pickle) and instances made without a payload
+        # (object.__new__) must see a plain AttributeError.
+        if (name[:2] == "__" and name[-2:] == "__") or PAYLOAD not in self.__dict__:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(type(self).__name__, name))
+        return self._lazy_plan.resolve(self, name)
+
+    def __eq__(self, other):
+        if not isinstance(other, self._lazy_plan.cls):
+            return False
+        return materialized(self) == materialized(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __copy__(self):
+        obj = object.__new__(self._lazy_plan.cls)
+        obj.__dict__.update(materialized(self))
+        return obj
+
+    def __deepcopy__(self, memo):
+        obj = memo[id(self)] = object.__new__(self._lazy_plan.cls)
+        obj.__dict__.update(copy.deepcopy(materialized(self), memo))
+        return obj
+
+    def __reduce_ex__(self, protocol):
+        # Not __newobj__: pickle insists its class argument is type(self).
+        return copyreg._reconstructor, (self._lazy_plan.cls, object, None), materialized(self)
+
+
+def materialized(obj):
+    """obj's attributes with every lazy field decoded."""
+    plan = getattr(type(obj), "_lazy_plan", None)
+    if plan is None:
+        return obj.__dict__
+    return plan.materialize(obj)
+
+
+class LazyModelPlan(ModelPlan):
+    """Decodes into a lazy subclass of cls instead of cls itself."""
+
+    def __init__(self, cls, registry):
+        super().__init__(cls, registry)
+        self.lazy_cls = None
+        self.attributes = None
+        self.defaults = None
+        self._lock = threading.Lock()
+
+    def compile_lazy(self):
+        with self._lock:
+            if self.lazy_cls is None:
+                cls = self.cls
+                names = attribute_names(cls)
+                self.attributes = {
+                    attr: (key, self.registry.plan(cls.deserialized_types[attr]))
+                    for attr, key in names.items() if attr in cls.deserialized_types
+                }
+                self.known_keys = frozenset(key for key, _ in self.attributes.values())
+                self.defaults = dict(vars(cls()))
+                self.lazy_cls = lazy_class(cls, self)
+        return self.lazy_cls
+
+    def field_plans(self):
+        if self.lazy_cls is None:
+            self.compile_lazy()
+        return [plan for _, plan in self.attributes.values()]
+
+    def decode(self, payload):
+        if not isinstance(payload, dict):
+            # Let the eager path raise the SDK's error.
+            return super().decode(payload)
+        lazy_cls = self.lazy_cls or self.compile_lazy()
+        obj = object.__new__(lazy_cls)
+        obj.__dict__[PAYLOAD] = payload
+        return obj
+
+    def resolve(self, obj, name):
+        """Decode, memoize and return attribute name of obj."""
+        state = obj.__dict__
+        payload = state[PAYLOAD]
+        field = self.attributes.get(name)
+        if field is not None:
+            key, plan = field
+            value = payload.get(key, MISSING)
+            if value is MISSING:
+                value = self.defaults[name]
+            elif value is not None:
+                value = plan.decode(value)
+        elif name in self.defaults:
+            value = self.defaults[name]
+        elif name in payload and name not in self.known_keys:
+            value = payload[name]
+        else:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(self.cls.__name__, name))
+        state[name] = value
+        return value
+
+    def materialize(self, obj):
+        state = obj.__dict__
+        for name in self.attributes:
+            if name not in state:
+                self.resolve(obj, name)
+        for name, value in self.defaults.items():
+            state.setdefault(name, value)
+        for key, value in state[PAYLOAD].items():
+            if key not in self.known_keys:
+                state.setdefault(key, value)
+        return {name: value for name, value in state.items() if name != PAYLOAD}
+
+
+def lazy_class(cls, plan):
+    """Subclass of model cls whose instances decode fields on first access.
+
+    It keeps cls's name and module, so anything keyed on those (the
+    generated codecs, logging) treats it as cls.
+    """
+    return type(cls.__name__, (LazyModel, cls), {
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+        "_lazy_plan": plan,
+    })
+
+
+class LazyPlanRegistry(PlanRegistry):
+    """:py:class:`skill_runtime.plans.PlanRegistry` whose model plans
+    (including discriminated subclasses and models inside lists and dicts)
+    decode lazily."""
+
+    model_plan_type = LazyModelPlan
+
+
+default_lazy_plans = LazyPlanRegistry()
@@ -0,0 +1,18637 @@
+"""Generated by tools/gen_codecs.py from ask-sdk-model 1.82.0; do not edit.
+
+Specialized decoders/encoders for 338 model classes (reachable from
+ask_sdk_model.RequestEnvelope, ask_sdk_model.ResponseEnvelope). Regenerate after upgrading ask-sdk-model:
+
+    python tools/gen_codecs.py
+
+Importing this module imports no models: each class's codecs start out as
+stubs that import the class and define the real functions on first call.
+"""
+import datetime as _dt
+import decimal as _decimal
+from enum import Enum as _Enum
+
+from ask_sdk_core.exceptions import SerializationException
+
+from .plans import DatetimePlan, PrimitivePlan, default_plans
+
+SDK_VERSION = '1.82.0'
+
+_GLOBALS = globals()
+_PRIMITIVES = frozenset((str, int, float, bool, bytes))
+_PRIMITIVE_TYPES = (str, int, float, bool, bytes)
+_str = PrimitivePlan(str).decode
+_int = PrimitivePlan(int).decode
+_float = PrimitivePlan(float).decode
+_bool = PrimitivePlan(bool).decode
+_datetime = DatetimePlan(_dt.datetime).decode
+_date = DatetimePlan(_dt.date).decode
+_encoder_names = {}
+
+
+def _lazy(name, bind):
+    """Stand-in for the codec called name until bind() defines it."""
+    def stub(value):
+        if _GLOBALS[name] is stub:
+            bind()
+        return _GLOBALS[name](value)
+    return stub
+
+
+def _reflect(type_string, value):
+    return default_plans.plan(type_string).decode(value)
+
+
+def _failed(e):
+    if isinstance(e, SerializationException):
+        return e
+    return SerializationException(str(e))
+
+
+def _undiscriminated(base):
+    return SerializationException(
+        "Couldn't resolve object by discriminator type for {} class".format(base))
+
+
+def decoder(cls):
+    """Function decoding a payload into a cls instance, or None."""
+    name = DECODERS.get(cls.__module__ + "." + cls.__name__)
+    if name is None:
+        return None
+    return lambda payload: _GLOBALS[name](payload)
+
+
+def encode(value):
+    """Serialize value like DefaultSerializer.serialize."""
+    if value is None:
+        return None
+    cls = value.__class__
+    if cls in _PRIMITIVES:
+        return value
+    try:
+        name = _encoder_names[cls]
+    except KeyError:
+        name = _encoder_names[cls] = ENCODERS.get(cls.__module__ + "." + cls.__name__)
+    if name is not None:
+        return _GLOBALS[name](value)
+    if isinstance(value, _PRIMITIVE_TYPES):
+        return value
+    if isinstance(value, list):
+        return [encode(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(encode(item) for item in value)
+    if isinstance(value, (_dt.datetime, _dt.date)):
+        return value.isoformat()
+    if isinstance(value, _Enum):
+        return value.value
+    if isinstance(value, _decimal.Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    if isinstance(value, dict):
+        return {key: encode(item) for key, item in value.items()}
+    result = {}
+    for attr, key in default_plans.serialized_keys(cls):
+        item = getattr(value, attr)
+        if item is not None:
+            result[key] = encode(item)
+    return result
+
+_dispatch_Cause = {
+    'ConnectionCompleted': 'decode_ConnectionCompleted',
+}
+
+
+def dispatch_Cause(payload):
+    try:
+        codec = _dispatch_Cause.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.cause.Cause'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_UpdatedRequest = {
+    'Dialog.InputRequest': 'decode_UpdatedInputRequest',
+    'IntentRequest': 'decode_UpdatedIntentRequest',
+}
+
+
+def dispatch_UpdatedRequest(payload):
+    try:
+        codec = _dispatch_UpdatedRequest.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.dialog.updated_request.UpdatedRequest'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Directive = {
+    'CustomInterfaceController.StopEventHandler': 'decode_StopEventHandlerDirective',
+    'Navigation.Assistance.AnnounceRoadRegulation': 'decode_AnnounceRoadRegulation',
+    'Connections.SendRequest': 'decode_SendRequestDirective',
+    'Dialog.UpdateDynamicEntities': 'decode_DynamicEntitiesDirective',
+    'CustomInterfaceController.StartEventHandler': 'decode_StartEventHandlerDirective',
+    'GadgetController.SetLight': 'decode_SetLightDirective',
+    'Alexa.Presentation.APL.SendIndexListData': 'decode_SendIndexListDataDirective',
+    'Dialog.Delegate': 'decode_DelegateDirective',
+    'Dialog.ConfirmIntent': 'decode_ConfirmIntentDirective',
+    'Alexa.Advertisement.InjectAds': 'decode_InjectAds',
+    'CustomInterfaceController.SendDirective': 'decode_SendDirectiveDirective',
+    'Alexa.Presentation.HTML.HandleMessage': 'decode_HandleMessageDirective',
+    'Alexa.Presentation.APLA.RenderDocument': 'decode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive',
+    'Dialog.ElicitSlot': 'decode_ElicitSlotDirective',
+    'Alexa.Presentation.HTML.Start': 'decode_StartDirective',
+    'Alexa.SmartVision.SnapshotProvider.GetSnapshotDirective': 'decode_GetSnapshotDirective',
+    'AudioPlayer.Stop': 'decode_StopDirective',
+    'Dialog.ConfirmSlot': 'decode_ConfirmSlotDirective',
+    'AudioPlayer.Play': 'decode_PlayDirective',
+    'Alexa.Presentation.APL.ExecuteCommands': 'decode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive',
+    'Display.RenderTemplate': 'decode_RenderTemplateDirective',
+    'Conversations.ResetContext': 'decode_ResetContextDirective',
+    'Dialog.DelegateRequest': 'decode_DelegateRequestDirective',
+    'Hint': 'decode_HintDirective',
+    'Connections.StartConnection': 'decode_StartConnectionDirective',
+    'Alexa.Presentation.APLT.RenderDocument': 'decode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive',
+    'GameEngine.StartInputHandler': 'decode_StartInputHandlerDirective',
+    'VideoApp.Launch': 'decode_LaunchDirective',
+    'Alexa.Presentation.APLT.ExecuteCommands': 'decode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive',
+    'GameEngine.StopInputHandler': 'decode_StopInputHandlerDirective',
+    'Tasks.CompleteTask': 'decode_CompleteTaskDirective',
+    'Alexa.Presentation.APL.RenderDocument': 'decode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive',
+    'Connections.SendResponse': 'decode_SendResponseDirective',
+    'Alexa.Presentation.APL.SendTokenListData': 'decode_SendTokenListDataDirective',
+    'AudioPlayer.ClearQueue': 'decode_ClearQueueDirective',
+    'Alexa.Presentation.APL.UpdateIndexListData': 'decode_UpdateIndexListDataDirective',
+}
+
+
+def dispatch_Directive(payload):
+    try:
+        codec = _dispatch_Directive.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.directive.Directive'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_CommandsError = {
+    'DEVICE_UNAVAILABLE': 'decode_DeviceUnavailableError',
+    'DEVICE_PERMANENTLY_UNAVAILABLE': 'decode_DevicePermanantlyUnavailableError',
+    'DATASTORE_INTERNAL_ERROR': 'decode_DataStoreInternalError',
+    'STORAGE_LIMIT_EXCEEDED': 'decode_StorageLimitExeceededError',
+}
+
+
+def dispatch_CommandsError(payload):
+    try:
+        codec = _dispatch_CommandsError.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.alexa.datastore.commands_error.CommandsError'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_AnimatedProperty = {
+    'opacity': 'decode_AnimatedOpacityProperty',
+    'transform': 'decode_AnimatedTransformProperty',
+}
+
+
+def dispatch_AnimatedProperty(payload):
+    try:
+        codec = _dispatch_AnimatedProperty.get(payload['property'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.alexa.presentation.apl.animated_property.AnimatedProperty'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Command__interfaces_alexa_presentation_apl_command = {
+    'SetPage': 'decode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command',
+    'ControlMedia': 'decode_ControlMediaCommand',
+    'Finish': 'decode_FinishCommand',
+    'AutoPage': 'decode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command',
+    'PlayMedia': 'decode_PlayMediaCommand',
+    'GoBack': 'decode_GoBackCommand',
+    'Scroll': 'decode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command',
+    'Idle': 'decode_IdleCommand__interfaces_alexa_presentation_apl_idle_command',
+    'AnimateItem': 'decode_AnimateItemCommand',
+    'SendEvent': 'decode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command',
+    'ShowOverlay': 'decode_ShowOverlayCommand',
+    'SpeakList': 'decode_SpeakListCommand',
+    'Select': 'decode_SelectCommand',
+    'HideOverlay': 'decode_HideOverlayCommand',
+    'Sequential': 'decode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command',
+    'SetState': 'decode_SetStateCommand',
+    'SpeakItem': 'decode_SpeakItemCommand',
+    'Parallel': 'decode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command',
+    'OpenURL': 'decode_OpenUrlCommand',
+    'Reinflate': 'decode_ReinflateCommand',
+    'ClearFocus': 'decode_ClearFocusCommand',
+    'ScrollToIndex': 'decode_ScrollToIndexCommand',
+    'SetValue': 'decode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command',
+    'SetFocus': 'decode_SetFocusCommand',
+    'ScrollToComponent': 'decode_ScrollToComponentCommand',
+}
+
+
+def dispatch_Command__interfaces_alexa_presentation_apl_command(payload):
+    try:
+        codec = _dispatch_Command__interfaces_alexa_presentation_apl_command.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.alexa.presentation.apl.command.Command'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Operation = {
+    'SetItem': 'decode_SetItemOperation',
+    'InsertMultipleItems': 'decode_InsertMultipleItemsOperation',
+    'DeleteMultipleItems': 'decode_DeleteMultipleItemsOperation',
+    'InsertItem': 'decode_InsertItemOperation',
+    'DeleteItem': 'decode_DeleteItemOperation',
+}
+
+
+def dispatch_Operation(payload):
+    try:
+        codec = _dispatch_Operation.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.operation.Operation'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_RuntimeError__interfaces_alexa_presentation_apl_runtime_error = {
+    'LIST_ERROR': 'decode_ListRuntimeError',
+}
+
+
+def dispatch_RuntimeError__interfaces_alexa_presentation_apl_runtime_error(payload):
+    try:
+        codec = _dispatch_RuntimeError__interfaces_alexa_presentation_apl_runtime_error.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.alexa.presentation.apl.runtime_error.RuntimeError'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_RuntimeError__interfaces_alexa_presentation_apla_runtime_error = {
+    'AUDIO_SOURCE_ERROR': 'decode_AudioSourceRuntimeError',
+    'RENDER_ERROR': 'decode_RenderRuntimeError',
+    'DOCUMENT_ERROR': 'decode_DocumentRuntimeError',
+    'LINK_ERROR': 'decode_LinkRuntimeError',
+}
+
+
+def dispatch_RuntimeError__interfaces_alexa_presentation_apla_runtime_error(payload):
+    try:
+        codec = _dispatch_RuntimeError__interfaces_alexa_presentation_apla_runtime_error.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.alexa.presentation.apla.runtime_error.RuntimeError'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Command__interfaces_alexa_presentation_aplt_command = {
+    'SetValue': 'decode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command',
+    'Idle': 'decode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command',
+    'AutoPage': 'decode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command',
+    'Scroll': 'decode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command',
+    'SendEvent': 'decode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command',
+    'Parallel': 'decode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command',
+    'SetPage': 'decode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command',
+    'Sequential': 'decode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command',
+}
+
+
+def dispatch_Command__interfaces_alexa_presentation_aplt_command(payload):
+    try:
+        codec = _dispatch_Command__interfaces_alexa_presentation_aplt_command.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.alexa.presentation.aplt.command.Command'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_PresentationStateContext = {
+    'Alexa.Presentation.APL': 'decode_AplPresentationStateContext',
+}
+
+
+def dispatch_PresentationStateContext(payload):
+    try:
+        codec = _dispatch_PresentationStateContext.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.alexa.presentation.presentation_state_context.PresentationStateContext'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Hint = {
+    'PlainText': 'decode_PlainTextHint',
+}
+
+
+def dispatch_Hint(payload):
+    try:
+        codec = _dispatch_Hint.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.display.hint.Hint'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Template = {
+    'ListTemplate2': 'decode_ListTemplate2',
+    'ListTemplate1': 'decode_ListTemplate1',
+    'BodyTemplate7': 'decode_BodyTemplate7',
+    'BodyTemplate6': 'decode_BodyTemplate6',
+    'BodyTemplate3': 'decode_BodyTemplate3',
+    'BodyTemplate2': 'decode_BodyTemplate2',
+    'BodyTemplate1': 'decode_BodyTemplate1',
+}
+
+
+def dispatch_Template(payload):
+    try:
+        codec = _dispatch_Template.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.display.template.Template'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_TextField = {
+    'RichText': 'decode_RichText',
+    'PlainText': 'decode_PlainText',
+}
+
+
+def dispatch_TextField(payload):
+    try:
+        codec = _dispatch_TextField.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.display.text_field.TextField'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_ViewportSize = {
+    'CONTINUOUS': 'decode_ContinuousViewportSize',
+    'DISCRETE': 'decode_DiscreteViewportSize',
+}
+
+
+def dispatch_ViewportSize(payload):
+    try:
+        codec = _dispatch_ViewportSize.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.viewport.size.viewport_size.ViewportSize'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_TypedViewportState = {
+    'APL': 'decode_APLViewportState',
+    'APLT': 'decode_APLTViewportState',
+}
+
+
+def dispatch_TypedViewportState(payload):
+    try:
+        codec = _dispatch_TypedViewportState.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.interfaces.viewport.typed_viewport_state.TypedViewportState'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Request = {
+    'Alexa.Advertisement.AdNotRendered': 'decode_AdNotRendered',
+    'Alexa.DataStore.PackageManager.InstallationError': 'decode_InstallationError',
+    'AlexaSkillEvent.SkillEnabled': 'decode_SkillEnabledRequest',
+    'AlexaHouseholdListEvent.ListUpdated': 'decode_ListUpdatedEventRequest',
+    'Alexa.Presentation.APL.UserEvent': 'decode_UserEvent__interfaces_alexa_presentation_apl_user_event',
+    'AlexaSkillEvent.SkillDisabled': 'decode_SkillDisabledRequest',
+    'AlexaHouseholdListEvent.ItemsCreated': 'decode_ListItemsCreatedEventRequest',
+    'SessionResumedRequest': 'decode_SessionResumedRequest',
+    'SessionEndedRequest': 'decode_SessionEndedRequest',
+    'Alexa.Presentation.APL.LoadIndexListData': 'decode_LoadIndexListDataEvent',
+    'Alexa.Presentation.APL.LoadTokenListData': 'decode_LoadTokenListDataEvent',
+    'AudioPlayer.PlaybackFailed': 'decode_PlaybackFailedRequest',
+    'CanFulfillIntentRequest': 'decode_CanFulfillIntentRequest',
+    'CustomInterfaceController.Expired': 'decode_ExpiredRequest',
+    'Alexa.Presentation.HTML.Message': 'decode_MessageRequest',
+    'Alexa.DataStore.Error': 'decode_DataStoreError',
+    'LaunchRequest': 'decode_LaunchRequest',
+    'Alexa.Authorization.Grant': 'decode_AuthorizationGrantRequest',
+    'Reminders.ReminderCreated': 'decode_ReminderCreatedEventRequest',
+    'Alexa.Presentation.APLT.UserEvent': 'decode_UserEvent__interfaces_alexa_presentation_aplt_user_event',
+    'Alexa.Advertisement.ReadyToEnqueueAudio': 'decode_ReadyToEnqueueAudio',
+    'AlexaHouseholdListEvent.ItemsUpdated': 'decode_ListItemsUpdatedEventRequest',
+    'AlexaHouseholdListEvent.ListCreated': 'decode_ListCreatedEventRequest',
+    'AudioPlayer.PlaybackStarted': 'decode_PlaybackStartedRequest',
+    'AudioPlayer.PlaybackNearlyFinished': 'decode_PlaybackNearlyFinishedRequest',
+    'CustomInterfaceController.EventsReceived': 'decode_EventsReceivedRequest',
+    'Reminders.ReminderStatusChanged': 'decode_ReminderStatusChangedEventRequest',
+    'AlexaHouseholdListEvent.ItemsDeleted': 'decode_ListItemsDeletedEventRequest',
+    'Reminders.ReminderDeleted': 'decode_ReminderDeletedEventRequest',
+    'Connections.Response': 'decode_ConnectionsResponse',
+    'AlexaHouseholdListEvent.ListDeleted': 'decode_ListDeletedEventRequest',
+    'GameEngine.InputHandlerEvent': 'decode_InputHandlerEventRequest',
+    'PlaybackController.PauseCommandIssued': 'decode_PauseCommandIssuedRequest',
+    'PlaybackController.PlayCommandIssued': 'decode_PlayCommandIssuedRequest',
+    'AudioPlayer.PlaybackFinished': 'decode_PlaybackFinishedRequest',
+    'AlexaSkillEvent.ProactiveSubscriptionChanged': 'decode_ProactiveSubscriptionChangedRequest',
+    'Display.ElementSelected': 'decode_ElementSelectedRequest',
+    'AlexaSkillEvent.SkillPermissionChanged': 'decode_PermissionChangedRequest',
+    'Reminders.ReminderUpdated': 'decode_ReminderUpdatedEventRequest',
+    'Alexa.Advertisement.AdCompleted': 'decode_AdCompleted',
+    'Alexa.DataStore.PackageManager.UpdateRequest': 'decode_UpdateRequest',
+    'Alexa.Presentation.APL.RuntimeError': 'decode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event',
+    'Alexa.Presentation.HTML.RuntimeError': 'decode_RuntimeErrorRequest',
+    'Dialog.InputRequest': 'decode_InputRequest',
+    'IntentRequest': 'decode_IntentRequest',
+    'Alexa.DataStore.PackageManager.UsagesRemoved': 'decode_UsagesRemoved',
+    'AlexaSkillEvent.NotificationSubscriptionChanged': 'decode_NotificationSubscriptionChangedRequest',
+    'Dialog.API.Invoked': 'decode_APIInvocationRequest',
+    'Reminders.ReminderStarted': 'decode_ReminderStartedEventRequest',
+    'AudioPlayer.PlaybackStopped': 'decode_PlaybackStoppedRequest',
+    'PlaybackController.PreviousCommandIssued': 'decode_PreviousCommandIssuedRequest',
+    'Alexa.DataStore.PackageManager.UsagesInstalled': 'decode_UsagesInstalled',
+    'AlexaSkillEvent.SkillAccountLinked': 'decode_AccountLinkedRequest',
+    'Messaging.MessageReceived': 'decode_MessageReceivedRequest',
+    'Connections.Request': 'decode_ConnectionsRequest',
+    'System.ExceptionEncountered': 'decode_ExceptionEncounteredRequest',
+    'AlexaSkillEvent.SkillPermissionAccepted': 'decode_PermissionAcceptedRequest',
+    'PlaybackController.NextCommandIssued': 'decode_NextCommandIssuedRequest',
+    'Alexa.Presentation.APLA.RuntimeError': 'decode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event',
+}
+
+
+def dispatch_Request(payload):
+    try:
+        codec = _dispatch_Request.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.request.Request'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Command__services_datastore_v1_command = {
+    'REMOVE_NAMESPACE': 'decode_RemoveNamespaceCommand',
+    'REMOVE_OBJECT': 'decode_RemoveObjectCommand',
+    'PUT_OBJECT': 'decode_PutObjectCommand',
+    'CLEAR': 'decode_ClearCommand',
+    'PUT_NAMESPACE': 'decode_PutNamespaceCommand',
+}
+
+
+def dispatch_Command__services_datastore_v1_command(payload):
+    try:
+        codec = _dispatch_Command__services_datastore_v1_command.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.services.datastore.v1.command.Command'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Recognizer = {
+    'match': 'decode_PatternRecognizer',
+    'deviation': 'decode_DeviationRecognizer',
+    'progress': 'decode_ProgressRecognizer',
+}
+
+
+def dispatch_Recognizer(payload):
+    try:
+        codec = _dispatch_Recognizer.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.services.game_engine.recognizer.Recognizer'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_SlotValue = {
+    'List': 'decode_ListSlotValue',
+    'Simple': 'decode_SimpleSlotValue',
+}
+
+
+def dispatch_SlotValue(payload):
+    try:
+        codec = _dispatch_SlotValue.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.slot_value.SlotValue'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_Card = {
+    'AskForPermissionsConsent': 'decode_AskForPermissionsConsentCard',
+    'LinkAccount': 'decode_LinkAccountCard',
+    'Standard': 'decode_StandardCard',
+    'Simple': 'decode_SimpleCard',
+}
+
+
+def dispatch_Card(payload):
+    try:
+        codec = _dispatch_Card.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.ui.card.Card'>")
+    return _GLOBALS[codec](payload)
+
+
+_dispatch_OutputSpeech = {
+    'SSML': 'decode_SsmlOutputSpeech',
+    'PlainText': 'decode_PlainTextOutputSpeech',
+}
+
+
+def dispatch_OutputSpeech(payload):
+    try:
+        codec = _dispatch_OutputSpeech.get(payload['type'])
+    except Exception as e:
+        raise _failed(e)
+    if codec is None:
+        raise _undiscriminated("<class 'ask_sdk_model.ui.output_speech.OutputSpeech'>")
+    return _GLOBALS[codec](payload)
+
+
+def _bind_Application():
+    global decode_Application, encode_Application
+    from ask_sdk_model.application import Application as model
+    keys = frozenset(('applicationId',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('applicationId')
+            if value is not None:
+                obj.application_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.application_id
+        if value is not None:
+            result['applicationId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Application, encode_Application = decode_model, encode_model
+
+
+decode_Application = _lazy('decode_Application', _bind_Application)
+encode_Application = _lazy('encode_Application', _bind_Application)
+
+
+def _bind_AuthorizationGrantBody():
+    global decode_AuthorizationGrantBody, encode_AuthorizationGrantBody
+    from ask_sdk_model.authorization.authorization_grant_body import AuthorizationGrantBody as model
+    keys = frozenset(('grant',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('grant')
+            if value is not None:
+                obj.grant = decode_Grant(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.grant
+        if value is not None:
+            result['grant'] = encode(value)
+        return result
+
+    decode_AuthorizationGrantBody, encode_AuthorizationGrantBody = decode_model, encode_model
+
+
+decode_AuthorizationGrantBody = _lazy('decode_AuthorizationGrantBody', _bind_AuthorizationGrantBody)
+encode_AuthorizationGrantBody = _lazy('encode_AuthorizationGrantBody', _bind_AuthorizationGrantBody)
+
+
+def _bind_AuthorizationGrantRequest():
+    global decode_AuthorizationGrantRequest, encode_AuthorizationGrantRequest
+    from ask_sdk_model.authorization.authorization_grant_request import AuthorizationGrantRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_AuthorizationGrantBody(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        return result
+
+    decode_AuthorizationGrantRequest, encode_AuthorizationGrantRequest = decode_model, encode_model
+
+
+decode_AuthorizationGrantRequest = _lazy('decode_AuthorizationGrantRequest', _bind_AuthorizationGrantRequest)
+encode_AuthorizationGrantRequest = _lazy('encode_AuthorizationGrantRequest', _bind_AuthorizationGrantRequest)
+
+
+def _bind_Grant():
+    global decode_Grant, encode_Grant
+    from ask_sdk_model.authorization.grant import Grant as model
+    from ask_sdk_model.authorization.grant_type import GrantType as enum0
+    keys = frozenset(('type', 'code'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = enum0(value)
+            value = get('code')
+            if value is not None:
+                obj.code = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.code
+        if value is not None:
+            result['code'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Grant, encode_Grant = decode_model, encode_model
+
+
+decode_Grant = _lazy('decode_Grant', _bind_Grant)
+encode_Grant = _lazy('encode_Grant', _bind_Grant)
+
+
+def _bind_CanFulfillIntent():
+    global decode_CanFulfillIntent, encode_CanFulfillIntent
+    from ask_sdk_model.canfulfill.can_fulfill_intent import CanFulfillIntent as model
+    from ask_sdk_model.canfulfill.can_fulfill_intent_values import CanFulfillIntentValues as enum0
+    keys = frozenset(('canFulfill', 'slots'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('canFulfill')
+            if value is not None:
+                obj.can_fulfill = enum0(value)
+            value = get('slots')
+            if value is not None:
+                obj.slots = {k0: None if v0 is None else decode_CanFulfillSlot(v0) for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.can_fulfill
+        if value is not None:
+            result['canFulfill'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.slots
+        if value is not None:
+            result['slots'] = encode(value)
+        return result
+
+    decode_CanFulfillIntent, encode_CanFulfillIntent = decode_model, encode_model
+
+
+decode_CanFulfillIntent = _lazy('decode_CanFulfillIntent', _bind_CanFulfillIntent)
+encode_CanFulfillIntent = _lazy('encode_CanFulfillIntent', _bind_CanFulfillIntent)
+
+
+def _bind_CanFulfillIntentRequest():
+    global decode_CanFulfillIntentRequest, encode_CanFulfillIntentRequest
+    from ask_sdk_model.canfulfill.can_fulfill_intent_request import CanFulfillIntentRequest as model
+    from ask_sdk_model.dialog_state import DialogState as enum0
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'dialogState', 'intent'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('dialogState')
+            if value is not None:
+                obj.dialog_state = enum0(value)
+            value = get('intent')
+            if value is not None:
+                obj.intent = decode_Intent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.dialog_state
+        if value is not None:
+            result['dialogState'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.intent
+        if value is not None:
+            result['intent'] = encode(value)
+        return result
+
+    decode_CanFulfillIntentRequest, encode_CanFulfillIntentRequest = decode_model, encode_model
+
+
+decode_CanFulfillIntentRequest = _lazy('decode_CanFulfillIntentRequest', _bind_CanFulfillIntentRequest)
+encode_CanFulfillIntentRequest = _lazy('encode_CanFulfillIntentRequest', _bind_CanFulfillIntentRequest)
+
+
+def _bind_CanFulfillSlot():
+    global decode_CanFulfillSlot, encode_CanFulfillSlot
+    from ask_sdk_model.canfulfill.can_fulfill_slot import CanFulfillSlot as model
+    from ask_sdk_model.canfulfill.can_understand_slot_values import CanUnderstandSlotValues as enum0
+    from ask_sdk_model.canfulfill.can_fulfill_slot_values import CanFulfillSlotValues as enum1
+    keys = frozenset(('canUnderstand', 'canFulfill'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('canUnderstand')
+            if value is not None:
+                obj.can_understand = enum0(value)
+            value = get('canFulfill')
+            if value is not None:
+                obj.can_fulfill = enum1(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.can_understand
+        if value is not None:
+            result['canUnderstand'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.can_fulfill
+        if value is not None:
+            result['canFulfill'] = value.value if value.__class__ is enum1 else encode(value)
+        return result
+
+    decode_CanFulfillSlot, encode_CanFulfillSlot = decode_model, encode_model
+
+
+decode_CanFulfillSlot = _lazy('decode_CanFulfillSlot', _bind_CanFulfillSlot)
+encode_CanFulfillSlot = _lazy('encode_CanFulfillSlot', _bind_CanFulfillSlot)
+
+
+def _bind_Cause():
+    global decode_Cause, encode_Cause
+    from ask_sdk_model.cause import Cause as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Cause, encode_Cause = decode_model, encode_model
+
+
+decode_Cause = _lazy('decode_Cause', _bind_Cause)
+encode_Cause = _lazy('encode_Cause', _bind_Cause)
+
+
+def _bind_ConnectionCompleted():
+    global decode_ConnectionCompleted, encode_ConnectionCompleted
+    from ask_sdk_model.connection_completed import ConnectionCompleted as model
+    keys = frozenset(('type', 'token', 'status', 'result'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('status')
+            if value is not None:
+                obj.status = decode_Status__status(value)
+            value = get('result')
+            if value is not None:
+                obj.result = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.status
+        if value is not None:
+            result['status'] = encode(value)
+        value = obj.result
+        if value is not None:
+            result['result'] = encode(value)
+        return result
+
+    decode_ConnectionCompleted, encode_ConnectionCompleted = decode_model, encode_model
+
+
+decode_ConnectionCompleted = _lazy('decode_ConnectionCompleted', _bind_ConnectionCompleted)
+encode_ConnectionCompleted = _lazy('encode_ConnectionCompleted', _bind_ConnectionCompleted)
+
+
+def _bind_Context():
+    global decode_Context, encode_Context
+    from ask_sdk_model.context import Context as model
+    keys = frozenset(('System', 'Alexa.Presentation', 'Alexa.Presentation.APL', 'AudioPlayer', 'Automotive', 'Display', 'Geolocation', 'Viewport', 'Viewports', 'Extensions', 'Alexa.DataStore.PackageManager', 'AppLink', 'Experimentation'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('System')
+            if value is not None:
+                obj.system = decode_SystemState(value)
+            value = get('Alexa.Presentation')
+            if value is not None:
+                obj.alexa_presentation = decode_PresentationState(value)
+            value = get('Alexa.Presentation.APL')
+            if value is not None:
+                obj.alexa_presentation_apl = decode_RenderedDocumentState(value)
+            value = get('AudioPlayer')
+            if value is not None:
+                obj.audio_player = decode_AudioPlayerState(value)
+            value = get('Automotive')
+            if value is not None:
+                obj.automotive = decode_AutomotiveState(value)
+            value = get('Display')
+            if value is not None:
+                obj.display = decode_DisplayState(value)
+            value = get('Geolocation')
+            if value is not None:
+                obj.geolocation = decode_GeolocationState(value)
+            value = get('Viewport')
+            if value is not None:
+                obj.viewport = decode_ViewportState(value)
+            value = get('Viewports')
+            if value is not None:
+                obj.viewports = [None if i0 is None else dispatch_TypedViewportState(i0) for i0 in value]
+            value = get('Extensions')
+            if value is not None:
+                obj.extensions = decode_ExtensionsState(value)
+            value = get('Alexa.DataStore.PackageManager')
+            if value is not None:
+                obj.alexa_data_store_package_manager = decode_PackageManagerState(value)
+            value = get('AppLink')
+            if value is not None:
+                obj.app_link = decode_AppLinkState(value)
+            value = get('Experimentation')
+            if value is not None:
+                obj.experimentation = decode_ExperimentationState(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.system
+        if value is not None:
+            result['System'] = encode(value)
+        value = obj.alexa_presentation
+        if value is not None:
+            result['Alexa.Presentation'] = encode(value)
+        value = obj.alexa_presentation_apl
+        if value is not None:
+            result['Alexa.Presentation.APL'] = encode(value)
+        value = obj.audio_player
+        if value is not None:
+            result['AudioPlayer'] = encode(value)
+        value = obj.automotive
+        if value is not None:
+            result['Automotive'] = encode(value)
+        value = obj.display
+        if value is not None:
+            result['Display'] = encode(value)
+        value = obj.geolocation
+        if value is not None:
+            result['Geolocation'] = encode(value)
+        value = obj.viewport
+        if value is not None:
+            result['Viewport'] = encode(value)
+        value = obj.viewports
+        if value is not None:
+            result['Viewports'] = encode(value)
+        value = obj.extensions
+        if value is not None:
+            result['Extensions'] = encode(value)
+        value = obj.alexa_data_store_package_manager
+        if value is not None:
+            result['Alexa.DataStore.PackageManager'] = encode(value)
+        value = obj.app_link
+        if value is not None:
+            result['AppLink'] = encode(value)
+        value = obj.experimentation
+        if value is not None:
+            result['Experimentation'] = encode(value)
+        return result
+
+    decode_Context, encode_Context = decode_model, encode_model
+
+
+decode_Context = _lazy('decode_Context', _bind_Context)
+encode_Context = _lazy('encode_Context', _bind_Context)
+
+
+def _bind_Device():
+    global decode_Device, encode_Device
+    from ask_sdk_model.device import Device as model
+    keys = frozenset(('deviceId', 'persistentEndpointId', 'supportedInterfaces'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('deviceId')
+            if value is not None:
+                obj.device_id = value if value.__class__ is str else _str(value)
+            value = get('persistentEndpointId')
+            if value is not None:
+                obj.persistent_endpoint_id = value if value.__class__ is str else _str(value)
+            value = get('supportedInterfaces')
+            if value is not None:
+                obj.supported_interfaces = decode_SupportedInterfaces(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.device_id
+        if value is not None:
+            result['deviceId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.persistent_endpoint_id
+        if value is not None:
+            result['persistentEndpointId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.supported_interfaces
+        if value is not None:
+            result['supportedInterfaces'] = encode(value)
+        return result
+
+    decode_Device, encode_Device = decode_model, encode_model
+
+
+decode_Device = _lazy('decode_Device', _bind_Device)
+encode_Device = _lazy('encode_Device', _bind_Device)
+
+
+def _bind_ConfirmIntentDirective():
+    global decode_ConfirmIntentDirective, encode_ConfirmIntentDirective
+    from ask_sdk_model.dialog.confirm_intent_directive import ConfirmIntentDirective as model
+    keys = frozenset(('type', 'updatedIntent'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('updatedIntent')
+            if value is not None:
+                obj.updated_intent = decode_Intent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.updated_intent
+        if value is not None:
+            result['updatedIntent'] = encode(value)
+        return result
+
+    decode_ConfirmIntentDirective, encode_ConfirmIntentDirective = decode_model, encode_model
+
+
+decode_ConfirmIntentDirective = _lazy('decode_ConfirmIntentDirective', _bind_ConfirmIntentDirective)
+encode_ConfirmIntentDirective = _lazy('encode_ConfirmIntentDirective', _bind_ConfirmIntentDirective)
+
+
+def _bind_ConfirmSlotDirective():
+    global decode_ConfirmSlotDirective, encode_ConfirmSlotDirective
+    from ask_sdk_model.dialog.confirm_slot_directive import ConfirmSlotDirective as model
+    keys = frozenset(('type', 'updatedIntent', 'slotToConfirm'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('updatedIntent')
+            if value is not None:
+                obj.updated_intent = decode_Intent(value)
+            value = get('slotToConfirm')
+            if value is not None:
+                obj.slot_to_confirm = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.updated_intent
+        if value is not None:
+            result['updatedIntent'] = encode(value)
+        value = obj.slot_to_confirm
+        if value is not None:
+            result['slotToConfirm'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ConfirmSlotDirective, encode_ConfirmSlotDirective = decode_model, encode_model
+
+
+decode_ConfirmSlotDirective = _lazy('decode_ConfirmSlotDirective', _bind_ConfirmSlotDirective)
+encode_ConfirmSlotDirective = _lazy('encode_ConfirmSlotDirective', _bind_ConfirmSlotDirective)
+
+
+def _bind_DelegateDirective():
+    global decode_DelegateDirective, encode_DelegateDirective
+    from ask_sdk_model.dialog.delegate_directive import DelegateDirective as model
+    keys = frozenset(('type', 'updatedIntent'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('updatedIntent')
+            if value is not None:
+                obj.updated_intent = decode_Intent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.updated_intent
+        if value is not None:
+            result['updatedIntent'] = encode(value)
+        return result
+
+    decode_DelegateDirective, encode_DelegateDirective = decode_model, encode_model
+
+
+decode_DelegateDirective = _lazy('decode_DelegateDirective', _bind_DelegateDirective)
+encode_DelegateDirective = _lazy('encode_DelegateDirective', _bind_DelegateDirective)
+
+
+def _bind_DelegateRequestDirective():
+    global decode_DelegateRequestDirective, encode_DelegateRequestDirective
+    from ask_sdk_model.dialog.delegate_request_directive import DelegateRequestDirective as model
+    keys = frozenset(('type', 'target', 'period', 'updatedRequest'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('target')
+            if value is not None:
+                obj.target = value if value.__class__ is str else _str(value)
+            value = get('period')
+            if value is not None:
+                obj.period = decode_DelegationPeriod(value)
+            value = get('updatedRequest')
+            if value is not None:
+                obj.updated_request = dispatch_UpdatedRequest(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.target
+        if value is not None:
+            result['target'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.period
+        if value is not None:
+            result['period'] = encode(value)
+        value = obj.updated_request
+        if value is not None:
+            result['updatedRequest'] = encode(value)
+        return result
+
+    decode_DelegateRequestDirective, encode_DelegateRequestDirective = decode_model, encode_model
+
+
+decode_DelegateRequestDirective = _lazy('decode_DelegateRequestDirective', _bind_DelegateRequestDirective)
+encode_DelegateRequestDirective = _lazy('encode_DelegateRequestDirective', _bind_DelegateRequestDirective)
+
+
+def _bind_DelegationPeriod():
+    global decode_DelegationPeriod, encode_DelegationPeriod
+    from ask_sdk_model.dialog.delegation_period import DelegationPeriod as model
+    from ask_sdk_model.dialog.delegation_period_until import DelegationPeriodUntil as enum0
+    keys = frozenset(('until',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('until')
+            if value is not None:
+                obj.until = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.until
+        if value is not None:
+            result['until'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_DelegationPeriod, encode_DelegationPeriod = decode_model, encode_model
+
+
+decode_DelegationPeriod = _lazy('decode_DelegationPeriod', _bind_DelegationPeriod)
+encode_DelegationPeriod = _lazy('encode_DelegationPeriod', _bind_DelegationPeriod)
+
+
+def _bind_DynamicEntitiesDirective():
+    global decode_DynamicEntitiesDirective, encode_DynamicEntitiesDirective
+    from ask_sdk_model.dialog.dynamic_entities_directive import DynamicEntitiesDirective as model
+    from ask_sdk_model.er.dynamic.update_behavior import UpdateBehavior as enum0
+    keys = frozenset(('type', 'updateBehavior', 'types'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('updateBehavior')
+            if value is not None:
+                obj.update_behavior = enum0(value)
+            value = get('types')
+            if value is not None:
+                obj.types = [None if i0 is None else decode_EntityListItem(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.update_behavior
+        if value is not None:
+            result['updateBehavior'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.types
+        if value is not None:
+            result['types'] = encode(value)
+        return result
+
+    decode_DynamicEntitiesDirective, encode_DynamicEntitiesDirective = decode_model, encode_model
+
+
+decode_DynamicEntitiesDirective = _lazy('decode_DynamicEntitiesDirective', _bind_DynamicEntitiesDirective)
+encode_DynamicEntitiesDirective = _lazy('encode_DynamicEntitiesDirective', _bind_DynamicEntitiesDirective)
+
+
+def _bind_ElicitSlotDirective():
+    global decode_ElicitSlotDirective, encode_ElicitSlotDirective
+    from ask_sdk_model.dialog.elicit_slot_directive import ElicitSlotDirective as model
+    keys = frozenset(('type', 'updatedIntent', 'slotToElicit'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('updatedIntent')
+            if value is not None:
+                obj.updated_intent = decode_Intent(value)
+            value = get('slotToElicit')
+            if value is not None:
+                obj.slot_to_elicit = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.updated_intent
+        if value is not None:
+            result['updatedIntent'] = encode(value)
+        value = obj.slot_to_elicit
+        if value is not None:
+            result['slotToElicit'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ElicitSlotDirective, encode_ElicitSlotDirective = decode_model, encode_model
+
+
+decode_ElicitSlotDirective = _lazy('decode_ElicitSlotDirective', _bind_ElicitSlotDirective)
+encode_ElicitSlotDirective = _lazy('encode_ElicitSlotDirective', _bind_ElicitSlotDirective)
+
+
+def _bind_Input():
+    global decode_Input, encode_Input
+    from ask_sdk_model.dialog.input import Input as model
+    keys = frozenset(('name', 'slots'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('slots')
+            if value is not None:
+                obj.slots = {k0: None if v0 is None else decode_Slot(v0) for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.slots
+        if value is not None:
+            result['slots'] = encode(value)
+        return result
+
+    decode_Input, encode_Input = decode_model, encode_model
+
+
+decode_Input = _lazy('decode_Input', _bind_Input)
+encode_Input = _lazy('encode_Input', _bind_Input)
+
+
+def _bind_InputRequest():
+    global decode_InputRequest, encode_InputRequest
+    from ask_sdk_model.dialog.input_request import InputRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'input'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('input')
+            if value is not None:
+                obj.input = decode_Input(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.input
+        if value is not None:
+            result['input'] = encode(value)
+        return result
+
+    decode_InputRequest, encode_InputRequest = decode_model, encode_model
+
+
+decode_InputRequest = _lazy('decode_InputRequest', _bind_InputRequest)
+encode_InputRequest = _lazy('encode_InputRequest', _bind_InputRequest)
+
+
+def _bind_UpdatedInputRequest():
+    global decode_UpdatedInputRequest, encode_UpdatedInputRequest
+    from ask_sdk_model.dialog.updated_input_request import UpdatedInputRequest as model
+    keys = frozenset(('type', 'input'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('input')
+            if value is not None:
+                obj.input = decode_Input(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.input
+        if value is not None:
+            result['input'] = encode(value)
+        return result
+
+    decode_UpdatedInputRequest, encode_UpdatedInputRequest = decode_model, encode_model
+
+
+decode_UpdatedInputRequest = _lazy('decode_UpdatedInputRequest', _bind_UpdatedInputRequest)
+encode_UpdatedInputRequest = _lazy('encode_UpdatedInputRequest', _bind_UpdatedInputRequest)
+
+
+def _bind_UpdatedIntentRequest():
+    global decode_UpdatedIntentRequest, encode_UpdatedIntentRequest
+    from ask_sdk_model.dialog.updated_intent_request import UpdatedIntentRequest as model
+    keys = frozenset(('type', 'intent'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('intent')
+            if value is not None:
+                obj.intent = decode_Intent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.intent
+        if value is not None:
+            result['intent'] = encode(value)
+        return result
+
+    decode_UpdatedIntentRequest, encode_UpdatedIntentRequest = decode_model, encode_model
+
+
+decode_UpdatedIntentRequest = _lazy('decode_UpdatedIntentRequest', _bind_UpdatedIntentRequest)
+encode_UpdatedIntentRequest = _lazy('encode_UpdatedIntentRequest', _bind_UpdatedIntentRequest)
+
+
+def _bind_UpdatedRequest():
+    global decode_UpdatedRequest, encode_UpdatedRequest
+    from ask_sdk_model.dialog.updated_request import UpdatedRequest as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_UpdatedRequest, encode_UpdatedRequest = decode_model, encode_model
+
+
+decode_UpdatedRequest = _lazy('decode_UpdatedRequest', _bind_UpdatedRequest)
+encode_UpdatedRequest = _lazy('encode_UpdatedRequest', _bind_UpdatedRequest)
+
+
+def _bind_Directive():
+    global decode_Directive, encode_Directive
+    from ask_sdk_model.directive import Directive as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Directive, encode_Directive = decode_model, encode_model
+
+
+decode_Directive = _lazy('decode_Directive', _bind_Directive)
+encode_Directive = _lazy('encode_Directive', _bind_Directive)
+
+
+def _bind_Entity():
+    global decode_Entity, encode_Entity
+    from ask_sdk_model.er.dynamic.entity import Entity as model
+    keys = frozenset(('id', 'name'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('id')
+            if value is not None:
+                obj.id = value if value.__class__ is str else _str(value)
+            value = get('name')
+            if value is not None:
+                obj.name = decode_EntityValueAndSynonyms(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.id
+        if value is not None:
+            result['id'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.name
+        if value is not None:
+            result['name'] = encode(value)
+        return result
+
+    decode_Entity, encode_Entity = decode_model, encode_model
+
+
+decode_Entity = _lazy('decode_Entity', _bind_Entity)
+encode_Entity = _lazy('encode_Entity', _bind_Entity)
+
+
+def _bind_EntityListItem():
+    global decode_EntityListItem, encode_EntityListItem
+    from ask_sdk_model.er.dynamic.entity_list_item import EntityListItem as model
+    keys = frozenset(('name', 'values'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('values')
+            if value is not None:
+                obj.values = [None if i0 is None else decode_Entity(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.values
+        if value is not None:
+            result['values'] = encode(value)
+        return result
+
+    decode_EntityListItem, encode_EntityListItem = decode_model, encode_model
+
+
+decode_EntityListItem = _lazy('decode_EntityListItem', _bind_EntityListItem)
+encode_EntityListItem = _lazy('encode_EntityListItem', _bind_EntityListItem)
+
+
+def _bind_EntityValueAndSynonyms():
+    global decode_EntityValueAndSynonyms, encode_EntityValueAndSynonyms
+    from ask_sdk_model.er.dynamic.entity_value_and_synonyms import EntityValueAndSynonyms as model
+    keys = frozenset(('value', 'synonyms'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is str else _str(value)
+            value = get('synonyms')
+            if value is not None:
+                obj.synonyms = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.synonyms
+        if value is not None:
+            result['synonyms'] = encode(value)
+        return result
+
+    decode_EntityValueAndSynonyms, encode_EntityValueAndSynonyms = decode_model, encode_model
+
+
+decode_EntityValueAndSynonyms = _lazy('decode_EntityValueAndSynonyms', _bind_EntityValueAndSynonyms)
+encode_EntityValueAndSynonyms = _lazy('encode_EntityValueAndSynonyms', _bind_EntityValueAndSynonyms)
+
+
+def _bind_AccountLinkedBody():
+    global decode_AccountLinkedBody, encode_AccountLinkedBody
+    from ask_sdk_model.events.skillevents.account_linked_body import AccountLinkedBody as model
+    keys = frozenset(('accessToken',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('accessToken')
+            if value is not None:
+                obj.access_token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.access_token
+        if value is not None:
+            result['accessToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_AccountLinkedBody, encode_AccountLinkedBody = decode_model, encode_model
+
+
+decode_AccountLinkedBody = _lazy('decode_AccountLinkedBody', _bind_AccountLinkedBody)
+encode_AccountLinkedBody = _lazy('encode_AccountLinkedBody', _bind_AccountLinkedBody)
+
+
+def _bind_AccountLinkedRequest():
+    global decode_AccountLinkedRequest, encode_AccountLinkedRequest
+    from ask_sdk_model.events.skillevents.account_linked_request import AccountLinkedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_AccountLinkedBody(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_AccountLinkedRequest, encode_AccountLinkedRequest = decode_model, encode_model
+
+
+decode_AccountLinkedRequest = _lazy('decode_AccountLinkedRequest', _bind_AccountLinkedRequest)
+encode_AccountLinkedRequest = _lazy('encode_AccountLinkedRequest', _bind_AccountLinkedRequest)
+
+
+def _bind_NotificationSubscriptionChangedBody():
+    global decode_NotificationSubscriptionChangedBody, encode_NotificationSubscriptionChangedBody
+    from ask_sdk_model.events.skillevents.notification_subscription_changed_body import NotificationSubscriptionChangedBody as model
+    keys = frozenset(('subscriptions',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('subscriptions')
+            if value is not None:
+                obj.subscriptions = [None if i0 is None else decode_NotificationSubscriptionEvent(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.subscriptions
+        if value is not None:
+            result['subscriptions'] = encode(value)
+        return result
+
+    decode_NotificationSubscriptionChangedBody, encode_NotificationSubscriptionChangedBody = decode_model, encode_model
+
+
+decode_NotificationSubscriptionChangedBody = _lazy('decode_NotificationSubscriptionChangedBody', _bind_NotificationSubscriptionChangedBody)
+encode_NotificationSubscriptionChangedBody = _lazy('encode_NotificationSubscriptionChangedBody', _bind_NotificationSubscriptionChangedBody)
+
+
+def _bind_NotificationSubscriptionChangedRequest():
+    global decode_NotificationSubscriptionChangedRequest, encode_NotificationSubscriptionChangedRequest
+    from ask_sdk_model.events.skillevents.notification_subscription_changed_request import NotificationSubscriptionChangedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_NotificationSubscriptionChangedBody(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        return result
+
+    decode_NotificationSubscriptionChangedRequest, encode_NotificationSubscriptionChangedRequest = decode_model, encode_model
+
+
+decode_NotificationSubscriptionChangedRequest = _lazy('decode_NotificationSubscriptionChangedRequest', _bind_NotificationSubscriptionChangedRequest)
+encode_NotificationSubscriptionChangedRequest = _lazy('encode_NotificationSubscriptionChangedRequest', _bind_NotificationSubscriptionChangedRequest)
+
+
+def _bind_NotificationSubscriptionEvent():
+    global decode_NotificationSubscriptionEvent, encode_NotificationSubscriptionEvent
+    from ask_sdk_model.events.skillevents.notification_subscription_event import NotificationSubscriptionEvent as model
+    keys = frozenset(('topicId',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('topicId')
+            if value is not None:
+                obj.topic_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.topic_id
+        if value is not None:
+            result['topicId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_NotificationSubscriptionEvent, encode_NotificationSubscriptionEvent = decode_model, encode_model
+
+
+decode_NotificationSubscriptionEvent = _lazy('decode_NotificationSubscriptionEvent', _bind_NotificationSubscriptionEvent)
+encode_NotificationSubscriptionEvent = _lazy('encode_NotificationSubscriptionEvent', _bind_NotificationSubscriptionEvent)
+
+
+def _bind_Permission():
+    global decode_Permission, encode_Permission
+    from ask_sdk_model.events.skillevents.permission import Permission as model
+    keys = frozenset(('scope',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('scope')
+            if value is not None:
+                obj.scope = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.scope
+        if value is not None:
+            result['scope'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Permission, encode_Permission = decode_model, encode_model
+
+
+decode_Permission = _lazy('decode_Permission', _bind_Permission)
+encode_Permission = _lazy('encode_Permission', _bind_Permission)
+
+
+def _bind_PermissionAcceptedRequest():
+    global decode_PermissionAcceptedRequest, encode_PermissionAcceptedRequest
+    from ask_sdk_model.events.skillevents.permission_accepted_request import PermissionAcceptedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_PermissionBody(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_PermissionAcceptedRequest, encode_PermissionAcceptedRequest = decode_model, encode_model
+
+
+decode_PermissionAcceptedRequest = _lazy('decode_PermissionAcceptedRequest', _bind_PermissionAcceptedRequest)
+encode_PermissionAcceptedRequest = _lazy('encode_PermissionAcceptedRequest', _bind_PermissionAcceptedRequest)
+
+
+def _bind_PermissionBody():
+    global decode_PermissionBody, encode_PermissionBody
+    from ask_sdk_model.events.skillevents.permission_body import PermissionBody as model
+    keys = frozenset(('acceptedPermissions', 'acceptedPersonPermissions'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('acceptedPermissions')
+            if value is not None:
+                obj.accepted_permissions = [None if i0 is None else decode_Permission(i0) for i0 in value]
+            value = get('acceptedPersonPermissions')
+            if value is not None:
+                obj.accepted_person_permissions = [None if i0 is None else decode_Permission(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.accepted_permissions
+        if value is not None:
+            result['acceptedPermissions'] = encode(value)
+        value = obj.accepted_person_permissions
+        if value is not None:
+            result['acceptedPersonPermissions'] = encode(value)
+        return result
+
+    decode_PermissionBody, encode_PermissionBody = decode_model, encode_model
+
+
+decode_PermissionBody = _lazy('decode_PermissionBody', _bind_PermissionBody)
+encode_PermissionBody = _lazy('encode_PermissionBody', _bind_PermissionBody)
+
+
+def _bind_PermissionChangedRequest():
+    global decode_PermissionChangedRequest, encode_PermissionChangedRequest
+    from ask_sdk_model.events.skillevents.permission_changed_request import PermissionChangedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_PermissionBody(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_PermissionChangedRequest, encode_PermissionChangedRequest = decode_model, encode_model
+
+
+decode_PermissionChangedRequest = _lazy('decode_PermissionChangedRequest', _bind_PermissionChangedRequest)
+encode_PermissionChangedRequest = _lazy('encode_PermissionChangedRequest', _bind_PermissionChangedRequest)
+
+
+def _bind_ProactiveSubscriptionChangedBody():
+    global decode_ProactiveSubscriptionChangedBody, encode_ProactiveSubscriptionChangedBody
+    from ask_sdk_model.events.skillevents.proactive_subscription_changed_body import ProactiveSubscriptionChangedBody as model
+    keys = frozenset(('subscriptions',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('subscriptions')
+            if value is not None:
+                obj.subscriptions = [None if i0 is None else decode_ProactiveSubscriptionEvent(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.subscriptions
+        if value is not None:
+            result['subscriptions'] = encode(value)
+        return result
+
+    decode_ProactiveSubscriptionChangedBody, encode_ProactiveSubscriptionChangedBody = decode_model, encode_model
+
+
+decode_ProactiveSubscriptionChangedBody = _lazy('decode_ProactiveSubscriptionChangedBody', _bind_ProactiveSubscriptionChangedBody)
+encode_ProactiveSubscriptionChangedBody = _lazy('encode_ProactiveSubscriptionChangedBody', _bind_ProactiveSubscriptionChangedBody)
+
+
+def _bind_ProactiveSubscriptionChangedRequest():
+    global decode_ProactiveSubscriptionChangedRequest, encode_ProactiveSubscriptionChangedRequest
+    from ask_sdk_model.events.skillevents.proactive_subscription_changed_request import ProactiveSubscriptionChangedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_ProactiveSubscriptionChangedBody(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        return result
+
+    decode_ProactiveSubscriptionChangedRequest, encode_ProactiveSubscriptionChangedRequest = decode_model, encode_model
+
+
+decode_ProactiveSubscriptionChangedRequest = _lazy('decode_ProactiveSubscriptionChangedRequest', _bind_ProactiveSubscriptionChangedRequest)
+encode_ProactiveSubscriptionChangedRequest = _lazy('encode_ProactiveSubscriptionChangedRequest', _bind_ProactiveSubscriptionChangedRequest)
+
+
+def _bind_ProactiveSubscriptionEvent():
+    global decode_ProactiveSubscriptionEvent, encode_ProactiveSubscriptionEvent
+    from ask_sdk_model.events.skillevents.proactive_subscription_event import ProactiveSubscriptionEvent as model
+    keys = frozenset(('eventName',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('eventName')
+            if value is not None:
+                obj.event_name = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.event_name
+        if value is not None:
+            result['eventName'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ProactiveSubscriptionEvent, encode_ProactiveSubscriptionEvent = decode_model, encode_model
+
+
+decode_ProactiveSubscriptionEvent = _lazy('decode_ProactiveSubscriptionEvent', _bind_ProactiveSubscriptionEvent)
+encode_ProactiveSubscriptionEvent = _lazy('encode_ProactiveSubscriptionEvent', _bind_ProactiveSubscriptionEvent)
+
+
+def _bind_SkillDisabledRequest():
+    global decode_SkillDisabledRequest, encode_SkillDisabledRequest
+    from ask_sdk_model.events.skillevents.skill_disabled_request import SkillDisabledRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_SkillDisabledRequest, encode_SkillDisabledRequest = decode_model, encode_model
+
+
+decode_SkillDisabledRequest = _lazy('decode_SkillDisabledRequest', _bind_SkillDisabledRequest)
+encode_SkillDisabledRequest = _lazy('encode_SkillDisabledRequest', _bind_SkillDisabledRequest)
+
+
+def _bind_SkillEnabledRequest():
+    global decode_SkillEnabledRequest, encode_SkillEnabledRequest
+    from ask_sdk_model.events.skillevents.skill_enabled_request import SkillEnabledRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_SkillEnabledRequest, encode_SkillEnabledRequest = decode_model, encode_model
+
+
+decode_SkillEnabledRequest = _lazy('decode_SkillEnabledRequest', _bind_SkillEnabledRequest)
+encode_SkillEnabledRequest = _lazy('encode_SkillEnabledRequest', _bind_SkillEnabledRequest)
+
+
+def _bind_Intent():
+    global decode_Intent, encode_Intent
+    from ask_sdk_model.intent import Intent as model
+    from ask_sdk_model.intent_confirmation_status import IntentConfirmationStatus as enum0
+    keys = frozenset(('name', 'slots', 'confirmationStatus'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('slots')
+            if value is not None:
+                obj.slots = {k0: None if v0 is None else decode_Slot(v0) for k0, v0 in value.items()}
+            value = get('confirmationStatus')
+            if value is not None:
+                obj.confirmation_status = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.slots
+        if value is not None:
+            result['slots'] = encode(value)
+        value = obj.confirmation_status
+        if value is not None:
+            result['confirmationStatus'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_Intent, encode_Intent = decode_model, encode_model
+
+
+decode_Intent = _lazy('decode_Intent', _bind_Intent)
+encode_Intent = _lazy('encode_Intent', _bind_Intent)
+
+
+def _bind_IntentRequest():
+    global decode_IntentRequest, encode_IntentRequest
+    from ask_sdk_model.intent_request import IntentRequest as model
+    from ask_sdk_model.dialog_state import DialogState as enum0
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'dialogState', 'intent'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('dialogState')
+            if value is not None:
+                obj.dialog_state = enum0(value)
+            value = get('intent')
+            if value is not None:
+                obj.intent = decode_Intent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.dialog_state
+        if value is not None:
+            result['dialogState'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.intent
+        if value is not None:
+            result['intent'] = encode(value)
+        return result
+
+    decode_IntentRequest, encode_IntentRequest = decode_model, encode_model
+
+
+decode_IntentRequest = _lazy('decode_IntentRequest', _bind_IntentRequest)
+encode_IntentRequest = _lazy('encode_IntentRequest', _bind_IntentRequest)
+
+
+def _bind_AdCompleted():
+    global decode_AdCompleted, encode_AdCompleted
+    from ask_sdk_model.interfaces.alexa.advertisement.ad_completed import AdCompleted as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_AdCompleted, encode_AdCompleted = decode_model, encode_model
+
+
+decode_AdCompleted = _lazy('decode_AdCompleted', _bind_AdCompleted)
+encode_AdCompleted = _lazy('encode_AdCompleted', _bind_AdCompleted)
+
+
+def _bind_AdNotRendered():
+    global decode_AdNotRendered, encode_AdNotRendered
+    from ask_sdk_model.interfaces.alexa.advertisement.ad_not_rendered import AdNotRendered as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'reason'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('reason')
+            if value is not None:
+                obj.reason = decode_Reason(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.reason
+        if value is not None:
+            result['reason'] = encode(value)
+        return result
+
+    decode_AdNotRendered, encode_AdNotRendered = decode_model, encode_model
+
+
+decode_AdNotRendered = _lazy('decode_AdNotRendered', _bind_AdNotRendered)
+encode_AdNotRendered = _lazy('encode_AdNotRendered', _bind_AdNotRendered)
+
+
+def _bind_AlexaAdvertisementInterface():
+    global decode_AlexaAdvertisementInterface, encode_AlexaAdvertisementInterface
+    from ask_sdk_model.interfaces.alexa.advertisement.alexa_advertisement_interface import AlexaAdvertisementInterface as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_AlexaAdvertisementInterface, encode_AlexaAdvertisementInterface = decode_model, encode_model
+
+
+decode_AlexaAdvertisementInterface = _lazy('decode_AlexaAdvertisementInterface', _bind_AlexaAdvertisementInterface)
+encode_AlexaAdvertisementInterface = _lazy('encode_AlexaAdvertisementInterface', _bind_AlexaAdvertisementInterface)
+
+
+def _bind_InjectAds():
+    global decode_InjectAds, encode_InjectAds
+    from ask_sdk_model.interfaces.alexa.advertisement.inject_ads import InjectAds as model
+    keys = frozenset(('type', 'expectedPreviousToken'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('expectedPreviousToken')
+            if value is not None:
+                obj.expected_previous_token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.expected_previous_token
+        if value is not None:
+            result['expectedPreviousToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_InjectAds, encode_InjectAds = decode_model, encode_model
+
+
+decode_InjectAds = _lazy('decode_InjectAds', _bind_InjectAds)
+encode_InjectAds = _lazy('encode_InjectAds', _bind_InjectAds)
+
+
+def _bind_ReadyToEnqueueAudio():
+    global decode_ReadyToEnqueueAudio, encode_ReadyToEnqueueAudio
+    from ask_sdk_model.interfaces.alexa.advertisement.ready_to_enqueue_audio import ReadyToEnqueueAudio as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token', 'previousToken'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('previousToken')
+            if value is not None:
+                obj.previous_token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.previous_token
+        if value is not None:
+            result['previousToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ReadyToEnqueueAudio, encode_ReadyToEnqueueAudio = decode_model, encode_model
+
+
+decode_ReadyToEnqueueAudio = _lazy('decode_ReadyToEnqueueAudio', _bind_ReadyToEnqueueAudio)
+encode_ReadyToEnqueueAudio = _lazy('encode_ReadyToEnqueueAudio', _bind_ReadyToEnqueueAudio)
+
+
+def _bind_Reason():
+    global decode_Reason, encode_Reason
+    from ask_sdk_model.interfaces.alexa.advertisement.reason import Reason as model
+    from ask_sdk_model.interfaces.alexa.advertisement.reason_code import ReasonCode as enum0
+    keys = frozenset(('type', 'message'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = enum0(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Reason, encode_Reason = decode_model, encode_model
+
+
+decode_Reason = _lazy('decode_Reason', _bind_Reason)
+encode_Reason = _lazy('encode_Reason', _bind_Reason)
+
+
+def _bind_CommandsError():
+    global decode_CommandsError, encode_CommandsError
+    from ask_sdk_model.interfaces.alexa.datastore.commands_error import CommandsError as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_CommandsError, encode_CommandsError = decode_model, encode_model
+
+
+decode_CommandsError = _lazy('decode_CommandsError', _bind_CommandsError)
+encode_CommandsError = _lazy('encode_CommandsError', _bind_CommandsError)
+
+
+def _bind_DataStoreError():
+    global decode_DataStoreError, encode_DataStoreError
+    from ask_sdk_model.interfaces.alexa.datastore.data_store_error import DataStoreError as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'error'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('error')
+            if value is not None:
+                obj.error = dispatch_CommandsError(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.error
+        if value is not None:
+            result['error'] = encode(value)
+        return result
+
+    decode_DataStoreError, encode_DataStoreError = decode_model, encode_model
+
+
+decode_DataStoreError = _lazy('decode_DataStoreError', _bind_DataStoreError)
+encode_DataStoreError = _lazy('encode_DataStoreError', _bind_DataStoreError)
+
+
+def _bind_DataStoreInternalError():
+    global decode_DataStoreInternalError, encode_DataStoreInternalError
+    from ask_sdk_model.interfaces.alexa.datastore.data_store_internal_error import DataStoreInternalError as model
+    keys = frozenset(('type', 'content'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('content')
+            if value is not None:
+                obj.content = decode_ExecutionErrorContent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.content
+        if value is not None:
+            result['content'] = encode(value)
+        return result
+
+    decode_DataStoreInternalError, encode_DataStoreInternalError = decode_model, encode_model
+
+
+decode_DataStoreInternalError = _lazy('decode_DataStoreInternalError', _bind_DataStoreInternalError)
+encode_DataStoreInternalError = _lazy('encode_DataStoreInternalError', _bind_DataStoreInternalError)
+
+
+def _bind_DevicePermanantlyUnavailableError():
+    global decode_DevicePermanantlyUnavailableError, encode_DevicePermanantlyUnavailableError
+    from ask_sdk_model.interfaces.alexa.datastore.device_permanantly_unavailable_error import DevicePermanantlyUnavailableError as model
+    keys = frozenset(('type', 'content'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('content')
+            if value is not None:
+                obj.content = decode_DispatchErrorContent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.content
+        if value is not None:
+            result['content'] = encode(value)
+        return result
+
+    decode_DevicePermanantlyUnavailableError, encode_DevicePermanantlyUnavailableError = decode_model, encode_model
+
+
+decode_DevicePermanantlyUnavailableError = _lazy('decode_DevicePermanantlyUnavailableError', _bind_DevicePermanantlyUnavailableError)
+encode_DevicePermanantlyUnavailableError = _lazy('encode_DevicePermanantlyUnavailableError', _bind_DevicePermanantlyUnavailableError)
+
+
+def _bind_DeviceUnavailableError():
+    global decode_DeviceUnavailableError, encode_DeviceUnavailableError
+    from ask_sdk_model.interfaces.alexa.datastore.device_unavailable_error import DeviceUnavailableError as model
+    keys = frozenset(('type', 'content'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('content')
+            if value is not None:
+                obj.content = decode_DispatchErrorContent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.content
+        if value is not None:
+            result['content'] = encode(value)
+        return result
+
+    decode_DeviceUnavailableError, encode_DeviceUnavailableError = decode_model, encode_model
+
+
+decode_DeviceUnavailableError = _lazy('decode_DeviceUnavailableError', _bind_DeviceUnavailableError)
+encode_DeviceUnavailableError = _lazy('encode_DeviceUnavailableError', _bind_DeviceUnavailableError)
+
+
+def _bind_DispatchErrorContent():
+    global decode_DispatchErrorContent, encode_DispatchErrorContent
+    from ask_sdk_model.interfaces.alexa.datastore.dispatch_error_content import DispatchErrorContent as model
+    keys = frozenset(('deviceId', 'commands'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('deviceId')
+            if value is not None:
+                obj.device_id = value if value.__class__ is str else _str(value)
+            value = get('commands')
+            if value is not None:
+                obj.commands = [None if i0 is None else dispatch_Command__services_datastore_v1_command(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.device_id
+        if value is not None:
+            result['deviceId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.commands
+        if value is not None:
+            result['commands'] = encode(value)
+        return result
+
+    decode_DispatchErrorContent, encode_DispatchErrorContent = decode_model, encode_model
+
+
+decode_DispatchErrorContent = _lazy('decode_DispatchErrorContent', _bind_DispatchErrorContent)
+encode_DispatchErrorContent = _lazy('encode_DispatchErrorContent', _bind_DispatchErrorContent)
+
+
+def _bind_ExecutionErrorContent():
+    global decode_ExecutionErrorContent, encode_ExecutionErrorContent
+    from ask_sdk_model.interfaces.alexa.datastore.execution_error_content import ExecutionErrorContent as model
+    keys = frozenset(('deviceId', 'failedCommand', 'message'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('deviceId')
+            if value is not None:
+                obj.device_id = value if value.__class__ is str else _str(value)
+            value = get('failedCommand')
+            if value is not None:
+                obj.failed_command = dispatch_Command__services_datastore_v1_command(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.device_id
+        if value is not None:
+            result['deviceId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.failed_command
+        if value is not None:
+            result['failedCommand'] = encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ExecutionErrorContent, encode_ExecutionErrorContent = decode_model, encode_model
+
+
+decode_ExecutionErrorContent = _lazy('decode_ExecutionErrorContent', _bind_ExecutionErrorContent)
+encode_ExecutionErrorContent = _lazy('encode_ExecutionErrorContent', _bind_ExecutionErrorContent)
+
+
+def _bind_InstallationError():
+    global decode_InstallationError, encode_InstallationError
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.installation_error import InstallationError as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'packageId', 'version', 'error'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('packageId')
+            if value is not None:
+                obj.package_id = value if value.__class__ is str else _str(value)
+            value = get('version')
+            if value is not None:
+                obj.version = value if value.__class__ is str else _str(value)
+            value = get('error')
+            if value is not None:
+                obj.error = decode_PackageError(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.package_id
+        if value is not None:
+            result['packageId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.version
+        if value is not None:
+            result['version'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.error
+        if value is not None:
+            result['error'] = encode(value)
+        return result
+
+    decode_InstallationError, encode_InstallationError = decode_model, encode_model
+
+
+decode_InstallationError = _lazy('decode_InstallationError', _bind_InstallationError)
+encode_InstallationError = _lazy('encode_InstallationError', _bind_InstallationError)
+
+
+def _bind_PackageError():
+    global decode_PackageError, encode_PackageError
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_error import PackageError as model
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.error_type import ErrorType as enum0
+    keys = frozenset(('type', 'content'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = enum0(value)
+            value = get('content')
+            if value is not None:
+                obj.content = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.content
+        if value is not None:
+            result['content'] = encode(value)
+        return result
+
+    decode_PackageError, encode_PackageError = decode_model, encode_model
+
+
+decode_PackageError = _lazy('decode_PackageError', _bind_PackageError)
+encode_PackageError = _lazy('encode_PackageError', _bind_PackageError)
+
+
+def _bind_PackageInstallUsage():
+    global decode_PackageInstallUsage, encode_PackageInstallUsage
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_install_usage import PackageInstallUsage as model
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.locations import Locations as enum0
+    keys = frozenset(('location', 'instanceId'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('location')
+            if value is not None:
+                obj.location = enum0(value)
+            value = get('instanceId')
+            if value is not None:
+                obj.instance_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.location
+        if value is not None:
+            result['location'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.instance_id
+        if value is not None:
+            result['instanceId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PackageInstallUsage, encode_PackageInstallUsage = decode_model, encode_model
+
+
+decode_PackageInstallUsage = _lazy('decode_PackageInstallUsage', _bind_PackageInstallUsage)
+encode_PackageInstallUsage = _lazy('encode_PackageInstallUsage', _bind_PackageInstallUsage)
+
+
+def _bind_PackageManagerState():
+    global decode_PackageManagerState, encode_PackageManagerState
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_manager_state import PackageManagerState as model
+    keys = frozenset(('installedPackages',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('installedPackages')
+            if value is not None:
+                obj.installed_packages = [None if i0 is None else decode_PackageStateInformation(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.installed_packages
+        if value is not None:
+            result['installedPackages'] = encode(value)
+        return result
+
+    decode_PackageManagerState, encode_PackageManagerState = decode_model, encode_model
+
+
+decode_PackageManagerState = _lazy('decode_PackageManagerState', _bind_PackageManagerState)
+encode_PackageManagerState = _lazy('encode_PackageManagerState', _bind_PackageManagerState)
+
+
+def _bind_PackageRemoveUsage():
+    global decode_PackageRemoveUsage, encode_PackageRemoveUsage
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_remove_usage import PackageRemoveUsage as model
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.locations import Locations as enum0
+    keys = frozenset(('location', 'instanceId'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('location')
+            if value is not None:
+                obj.location = enum0(value)
+            value = get('instanceId')
+            if value is not None:
+                obj.instance_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.location
+        if value is not None:
+            result['location'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.instance_id
+        if value is not None:
+            result['instanceId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PackageRemoveUsage, encode_PackageRemoveUsage = decode_model, encode_model
+
+
+decode_PackageRemoveUsage = _lazy('decode_PackageRemoveUsage', _bind_PackageRemoveUsage)
+encode_PackageRemoveUsage = _lazy('encode_PackageRemoveUsage', _bind_PackageRemoveUsage)
+
+
+def _bind_PackageStateInformation():
+    global decode_PackageStateInformation, encode_PackageStateInformation
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_state_information import PackageStateInformation as model
+    keys = frozenset(('packageId', 'version'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('packageId')
+            if value is not None:
+                obj.package_id = value if value.__class__ is str else _str(value)
+            value = get('version')
+            if value is not None:
+                obj.version = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.package_id
+        if value is not None:
+            result['packageId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.version
+        if value is not None:
+            result['version'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PackageStateInformation, encode_PackageStateInformation = decode_model, encode_model
+
+
+decode_PackageStateInformation = _lazy('decode_PackageStateInformation', _bind_PackageStateInformation)
+encode_PackageStateInformation = _lazy('encode_PackageStateInformation', _bind_PackageStateInformation)
+
+
+def _bind_UpdateRequest():
+    global decode_UpdateRequest, encode_UpdateRequest
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.update_request import UpdateRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'packageId', 'fromVersion', 'toVersion'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('packageId')
+            if value is not None:
+                obj.package_id = value if value.__class__ is str else _str(value)
+            value = get('fromVersion')
+            if value is not None:
+                obj.from_version = value if value.__class__ is str else _str(value)
+            value = get('toVersion')
+            if value is not None:
+                obj.to_version = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.package_id
+        if value is not None:
+            result['packageId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.from_version
+        if value is not None:
+            result['fromVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.to_version
+        if value is not None:
+            result['toVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_UpdateRequest, encode_UpdateRequest = decode_model, encode_model
+
+
+decode_UpdateRequest = _lazy('decode_UpdateRequest', _bind_UpdateRequest)
+encode_UpdateRequest = _lazy('encode_UpdateRequest', _bind_UpdateRequest)
+
+
+def _bind_UsagesInstallRequest():
+    global decode_UsagesInstallRequest, encode_UsagesInstallRequest
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_install_request import UsagesInstallRequest as model
+    keys = frozenset(('packageId', 'packageVersion', 'usages'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('packageId')
+            if value is not None:
+                obj.package_id = value if value.__class__ is str else _str(value)
+            value = get('packageVersion')
+            if value is not None:
+                obj.package_version = value if value.__class__ is str else _str(value)
+            value = get('usages')
+            if value is not None:
+                obj.usages = [None if i0 is None else decode_PackageInstallUsage(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.package_id
+        if value is not None:
+            result['packageId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.package_version
+        if value is not None:
+            result['packageVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.usages
+        if value is not None:
+            result['usages'] = encode(value)
+        return result
+
+    decode_UsagesInstallRequest, encode_UsagesInstallRequest = decode_model, encode_model
+
+
+decode_UsagesInstallRequest = _lazy('decode_UsagesInstallRequest', _bind_UsagesInstallRequest)
+encode_UsagesInstallRequest = _lazy('encode_UsagesInstallRequest', _bind_UsagesInstallRequest)
+
+
+def _bind_UsagesInstalled():
+    global decode_UsagesInstalled, encode_UsagesInstalled
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_installed import UsagesInstalled as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'payload'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('payload')
+            if value is not None:
+                obj.payload = decode_UsagesInstallRequest(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.payload
+        if value is not None:
+            result['payload'] = encode(value)
+        return result
+
+    decode_UsagesInstalled, encode_UsagesInstalled = decode_model, encode_model
+
+
+decode_UsagesInstalled = _lazy('decode_UsagesInstalled', _bind_UsagesInstalled)
+encode_UsagesInstalled = _lazy('encode_UsagesInstalled', _bind_UsagesInstalled)
+
+
+def _bind_UsagesRemoved():
+    global decode_UsagesRemoved, encode_UsagesRemoved
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_removed import UsagesRemoved as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'payload'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('payload')
+            if value is not None:
+                obj.payload = decode_UsagesRemovedRequest(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.payload
+        if value is not None:
+            result['payload'] = encode(value)
+        return result
+
+    decode_UsagesRemoved, encode_UsagesRemoved = decode_model, encode_model
+
+
+decode_UsagesRemoved = _lazy('decode_UsagesRemoved', _bind_UsagesRemoved)
+encode_UsagesRemoved = _lazy('encode_UsagesRemoved', _bind_UsagesRemoved)
+
+
+def _bind_UsagesRemovedRequest():
+    global decode_UsagesRemovedRequest, encode_UsagesRemovedRequest
+    from ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_removed_request import UsagesRemovedRequest as model
+    keys = frozenset(('packageId', 'packageVersion', 'usages'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('packageId')
+            if value is not None:
+                obj.package_id = value if value.__class__ is str else _str(value)
+            value = get('packageVersion')
+            if value is not None:
+                obj.package_version = value if value.__class__ is str else _str(value)
+            value = get('usages')
+            if value is not None:
+                obj.usages = [None if i0 is None else decode_PackageRemoveUsage(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.package_id
+        if value is not None:
+            result['packageId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.package_version
+        if value is not None:
+            result['packageVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.usages
+        if value is not None:
+            result['usages'] = encode(value)
+        return result
+
+    decode_UsagesRemovedRequest, encode_UsagesRemovedRequest = decode_model, encode_model
+
+
+decode_UsagesRemovedRequest = _lazy('decode_UsagesRemovedRequest', _bind_UsagesRemovedRequest)
+encode_UsagesRemovedRequest = _lazy('encode_UsagesRemovedRequest', _bind_UsagesRemovedRequest)
+
+
+def _bind_StorageLimitExeceededError():
+    global decode_StorageLimitExeceededError, encode_StorageLimitExeceededError
+    from ask_sdk_model.interfaces.alexa.datastore.storage_limit_execeeded_error import StorageLimitExeceededError as model
+    keys = frozenset(('type', 'content'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('content')
+            if value is not None:
+                obj.content = decode_ExecutionErrorContent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.content
+        if value is not None:
+            result['content'] = encode(value)
+        return result
+
+    decode_StorageLimitExeceededError, encode_StorageLimitExeceededError = decode_model, encode_model
+
+
+decode_StorageLimitExeceededError = _lazy('decode_StorageLimitExeceededError', _bind_StorageLimitExeceededError)
+encode_StorageLimitExeceededError = _lazy('encode_StorageLimitExeceededError', _bind_StorageLimitExeceededError)
+
+
+def _bind_ExperimentAssignment():
+    global decode_ExperimentAssignment, encode_ExperimentAssignment
+    from ask_sdk_model.interfaces.alexa.experimentation.experiment_assignment import ExperimentAssignment as model
+    from ask_sdk_model.interfaces.alexa.experimentation.treatment_id import TreatmentId as enum0
+    keys = frozenset(('id', 'treatmentId'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('id')
+            if value is not None:
+                obj.id = value if value.__class__ is str else _str(value)
+            value = get('treatmentId')
+            if value is not None:
+                obj.treatment_id = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.id
+        if value is not None:
+            result['id'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.treatment_id
+        if value is not None:
+            result['treatmentId'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_ExperimentAssignment, encode_ExperimentAssignment = decode_model, encode_model
+
+
+decode_ExperimentAssignment = _lazy('decode_ExperimentAssignment', _bind_ExperimentAssignment)
+encode_ExperimentAssignment = _lazy('encode_ExperimentAssignment', _bind_ExperimentAssignment)
+
+
+def _bind_ExperimentTriggerResponse():
+    global decode_ExperimentTriggerResponse, encode_ExperimentTriggerResponse
+    from ask_sdk_model.interfaces.alexa.experimentation.experiment_trigger_response import ExperimentTriggerResponse as model
+    keys = frozenset(('triggeredExperiments',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('triggeredExperiments')
+            if value is not None:
+                obj.triggered_experiments = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.triggered_experiments
+        if value is not None:
+            result['triggeredExperiments'] = encode(value)
+        return result
+
+    decode_ExperimentTriggerResponse, encode_ExperimentTriggerResponse = decode_model, encode_model
+
+
+decode_ExperimentTriggerResponse = _lazy('decode_ExperimentTriggerResponse', _bind_ExperimentTriggerResponse)
+encode_ExperimentTriggerResponse = _lazy('encode_ExperimentTriggerResponse', _bind_ExperimentTriggerResponse)
+
+
+def _bind_ExperimentationState():
+    global decode_ExperimentationState, encode_ExperimentationState
+    from ask_sdk_model.interfaces.alexa.experimentation.experimentation_state import ExperimentationState as model
+    keys = frozenset(('activeExperiments',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('activeExperiments')
+            if value is not None:
+                obj.active_experiments = [None if i0 is None else decode_ExperimentAssignment(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.active_experiments
+        if value is not None:
+            result['activeExperiments'] = encode(value)
+        return result
+
+    decode_ExperimentationState, encode_ExperimentationState = decode_model, encode_model
+
+
+decode_ExperimentationState = _lazy('decode_ExperimentationState', _bind_ExperimentationState)
+encode_ExperimentationState = _lazy('encode_ExperimentationState', _bind_ExperimentationState)
+
+
+def _bind_AvailableExtension():
+    global decode_AvailableExtension, encode_AvailableExtension
+    from ask_sdk_model.interfaces.alexa.extension.available_extension import AvailableExtension as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_AvailableExtension, encode_AvailableExtension = decode_model, encode_model
+
+
+decode_AvailableExtension = _lazy('decode_AvailableExtension', _bind_AvailableExtension)
+encode_AvailableExtension = _lazy('encode_AvailableExtension', _bind_AvailableExtension)
+
+
+def _bind_ExtensionsState():
+    global decode_ExtensionsState, encode_ExtensionsState
+    from ask_sdk_model.interfaces.alexa.extension.extensions_state import ExtensionsState as model
+    keys = frozenset(('available',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('available')
+            if value is not None:
+                obj.available = {k0: None if v0 is None else decode_AvailableExtension(v0) for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.available
+        if value is not None:
+            result['available'] = encode(value)
+        return result
+
+    decode_ExtensionsState, encode_ExtensionsState = decode_model, encode_model
+
+
+decode_ExtensionsState = _lazy('decode_ExtensionsState', _bind_ExtensionsState)
+encode_ExtensionsState = _lazy('encode_ExtensionsState', _bind_ExtensionsState)
+
+
+def _bind_AlexaPresentationAplInterface():
+    global decode_AlexaPresentationAplInterface, encode_AlexaPresentationAplInterface
+    from ask_sdk_model.interfaces.alexa.presentation.apl.alexa_presentation_apl_interface import AlexaPresentationAplInterface as model
+    keys = frozenset(('runtime',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('runtime')
+            if value is not None:
+                obj.runtime = decode_Runtime__interfaces_alexa_presentation_apl_runtime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.runtime
+        if value is not None:
+            result['runtime'] = encode(value)
+        return result
+
+    decode_AlexaPresentationAplInterface, encode_AlexaPresentationAplInterface = decode_model, encode_model
+
+
+decode_AlexaPresentationAplInterface = _lazy('decode_AlexaPresentationAplInterface', _bind_AlexaPresentationAplInterface)
+encode_AlexaPresentationAplInterface = _lazy('encode_AlexaPresentationAplInterface', _bind_AlexaPresentationAplInterface)
+
+
+def _bind_AnimateItemCommand():
+    global decode_AnimateItemCommand, encode_AnimateItemCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.animate_item_command import AnimateItemCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.animate_item_repeat_mode import AnimateItemRepeatMode as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'componentId', 'duration', 'easing', 'repeatCount', 'repeatMode', 'value'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('duration')
+            if value is not None:
+                obj.duration = value if value.__class__ is int else _int(value)
+            if 'easing' in payload:
+                value = payload['easing']
+                obj.easing = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('repeatCount')
+            if value is not None:
+                obj.repeat_count = value if value.__class__ is int else _int(value)
+            value = get('repeatMode')
+            if value is not None:
+                obj.repeat_mode = enum0(value)
+            value = get('value')
+            if value is not None:
+                obj.value = [None if i0 is None else dispatch_AnimatedProperty(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.duration
+        if value is not None:
+            result['duration'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.easing
+        if value is not None:
+            result['easing'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.repeat_count
+        if value is not None:
+            result['repeatCount'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.repeat_mode
+        if value is not None:
+            result['repeatMode'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = encode(value)
+        return result
+
+    decode_AnimateItemCommand, encode_AnimateItemCommand = decode_model, encode_model
+
+
+decode_AnimateItemCommand = _lazy('decode_AnimateItemCommand', _bind_AnimateItemCommand)
+encode_AnimateItemCommand = _lazy('encode_AnimateItemCommand', _bind_AnimateItemCommand)
+
+
+def _bind_AnimatedOpacityProperty():
+    global decode_AnimatedOpacityProperty, encode_AnimatedOpacityProperty
+    from ask_sdk_model.interfaces.alexa.presentation.apl.animated_opacity_property import AnimatedOpacityProperty as model
+    keys = frozenset(('property', 'from', 'to'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'property' in payload:
+                value = payload['property']
+                obj.object_property = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('from')
+            if value is not None:
+                obj.object_from = value if value.__class__ is float else _float(value)
+            value = get('to')
+            if value is not None:
+                obj.to = value if value.__class__ is float else _float(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_property
+        if value is not None:
+            result['property'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.object_from
+        if value is not None:
+            result['from'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.to
+        if value is not None:
+            result['to'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_AnimatedOpacityProperty, encode_AnimatedOpacityProperty = decode_model, encode_model
+
+
+decode_AnimatedOpacityProperty = _lazy('decode_AnimatedOpacityProperty', _bind_AnimatedOpacityProperty)
+encode_AnimatedOpacityProperty = _lazy('encode_AnimatedOpacityProperty', _bind_AnimatedOpacityProperty)
+
+
+def _bind_AnimatedProperty():
+    global decode_AnimatedProperty, encode_AnimatedProperty
+    from ask_sdk_model.interfaces.alexa.presentation.apl.animated_property import AnimatedProperty as model
+    keys = frozenset(('property',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('property')
+            if value is not None:
+                obj.object_property = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_property
+        if value is not None:
+            result['property'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_AnimatedProperty, encode_AnimatedProperty = decode_model, encode_model
+
+
+decode_AnimatedProperty = _lazy('decode_AnimatedProperty', _bind_AnimatedProperty)
+encode_AnimatedProperty = _lazy('encode_AnimatedProperty', _bind_AnimatedProperty)
+
+
+def _bind_AnimatedTransformProperty():
+    global decode_AnimatedTransformProperty, encode_AnimatedTransformProperty
+    from ask_sdk_model.interfaces.alexa.presentation.apl.animated_transform_property import AnimatedTransformProperty as model
+    keys = frozenset(('property', 'from', 'to'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'property' in payload:
+                value = payload['property']
+                obj.object_property = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('from')
+            if value is not None:
+                obj.object_from = [None if i0 is None else decode_TransformProperty(i0) for i0 in value]
+            value = get('to')
+            if value is not None:
+                obj.to = [None if i0 is None else decode_TransformProperty(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_property
+        if value is not None:
+            result['property'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.object_from
+        if value is not None:
+            result['from'] = encode(value)
+        value = obj.to
+        if value is not None:
+            result['to'] = encode(value)
+        return result
+
+    decode_AnimatedTransformProperty, encode_AnimatedTransformProperty = decode_model, encode_model
+
+
+decode_AnimatedTransformProperty = _lazy('decode_AnimatedTransformProperty', _bind_AnimatedTransformProperty)
+encode_AnimatedTransformProperty = _lazy('encode_AnimatedTransformProperty', _bind_AnimatedTransformProperty)
+
+
+def _bind_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command():
+    global decode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command, encode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command
+    from ask_sdk_model.interfaces.alexa.presentation.apl.auto_page_command import AutoPageCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'componentId', 'count', 'duration'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('count')
+            if value is not None:
+                obj.count = value if value.__class__ is int else _int(value)
+            value = get('duration')
+            if value is not None:
+                obj.duration = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.count
+        if value is not None:
+            result['count'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.duration
+        if value is not None:
+            result['duration'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command, encode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command = decode_model, encode_model
+
+
+decode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command = _lazy('decode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command', _bind_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command)
+encode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command = _lazy('encode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command', _bind_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command)
+
+
+def _bind_ClearFocusCommand():
+    global decode_ClearFocusCommand, encode_ClearFocusCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.clear_focus_command import ClearFocusCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ClearFocusCommand, encode_ClearFocusCommand = decode_model, encode_model
+
+
+decode_ClearFocusCommand = _lazy('decode_ClearFocusCommand', _bind_ClearFocusCommand)
+encode_ClearFocusCommand = _lazy('encode_ClearFocusCommand', _bind_ClearFocusCommand)
+
+
+def _bind_Command__interfaces_alexa_presentation_apl_command():
+    global decode_Command__interfaces_alexa_presentation_apl_command, encode_Command__interfaces_alexa_presentation_apl_command
+    from ask_sdk_model.interfaces.alexa.presentation.apl.command import Command as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Command__interfaces_alexa_presentation_apl_command, encode_Command__interfaces_alexa_presentation_apl_command = decode_model, encode_model
+
+
+decode_Command__interfaces_alexa_presentation_apl_command = _lazy('decode_Command__interfaces_alexa_presentation_apl_command', _bind_Command__interfaces_alexa_presentation_apl_command)
+encode_Command__interfaces_alexa_presentation_apl_command = _lazy('encode_Command__interfaces_alexa_presentation_apl_command', _bind_Command__interfaces_alexa_presentation_apl_command)
+
+
+def _bind_ComponentEntity():
+    global decode_ComponentEntity, encode_ComponentEntity
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_entity import ComponentEntity as model
+    keys = frozenset(('type', 'value', 'id'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is str else _str(value)
+            value = get('id')
+            if value is not None:
+                obj.id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.id
+        if value is not None:
+            result['id'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ComponentEntity, encode_ComponentEntity = decode_model, encode_model
+
+
+decode_ComponentEntity = _lazy('decode_ComponentEntity', _bind_ComponentEntity)
+encode_ComponentEntity = _lazy('encode_ComponentEntity', _bind_ComponentEntity)
+
+
+def _bind_ComponentVisibleOnScreen():
+    global decode_ComponentVisibleOnScreen, encode_ComponentVisibleOnScreen
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen import ComponentVisibleOnScreen as model
+    keys = frozenset(('children', 'entities', 'id', 'position', 'tags', 'transform', 'type', 'uid', 'visibility'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('children')
+            if value is not None:
+                obj.children = [None if i0 is None else decode_ComponentVisibleOnScreen(i0) for i0 in value]
+            value = get('entities')
+            if value is not None:
+                obj.entities = [None if i0 is None else decode_ComponentEntity(i0) for i0 in value]
+            value = get('id')
+            if value is not None:
+                obj.id = value if value.__class__ is str else _str(value)
+            value = get('position')
+            if value is not None:
+                obj.position = value if value.__class__ is str else _str(value)
+            value = get('tags')
+            if value is not None:
+                obj.tags = decode_ComponentVisibleOnScreenTags(value)
+            value = get('transform')
+            if value is not None:
+                obj.transform = [None if i0 is None else i0 if i0.__class__ is float else _float(i0) for i0 in value]
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('uid')
+            if value is not None:
+                obj.uid = value if value.__class__ is str else _str(value)
+            value = get('visibility')
+            if value is not None:
+                obj.visibility = value if value.__class__ is float else _float(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.children
+        if value is not None:
+            result['children'] = encode(value)
+        value = obj.entities
+        if value is not None:
+            result['entities'] = encode(value)
+        value = obj.id
+        if value is not None:
+            result['id'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.position
+        if value is not None:
+            result['position'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.tags
+        if value is not None:
+            result['tags'] = encode(value)
+        value = obj.transform
+        if value is not None:
+            result['transform'] = encode(value)
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.uid
+        if value is not None:
+            result['uid'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.visibility
+        if value is not None:
+            result['visibility'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ComponentVisibleOnScreen, encode_ComponentVisibleOnScreen = decode_model, encode_model
+
+
+decode_ComponentVisibleOnScreen = _lazy('decode_ComponentVisibleOnScreen', _bind_ComponentVisibleOnScreen)
+encode_ComponentVisibleOnScreen = _lazy('encode_ComponentVisibleOnScreen', _bind_ComponentVisibleOnScreen)
+
+
+def _bind_ComponentVisibleOnScreenListItemTag():
+    global decode_ComponentVisibleOnScreenListItemTag, encode_ComponentVisibleOnScreenListItemTag
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_list_item_tag import ComponentVisibleOnScreenListItemTag as model
+    keys = frozenset(('index',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('index')
+            if value is not None:
+                obj.index = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.index
+        if value is not None:
+            result['index'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ComponentVisibleOnScreenListItemTag, encode_ComponentVisibleOnScreenListItemTag = decode_model, encode_model
+
+
+decode_ComponentVisibleOnScreenListItemTag = _lazy('decode_ComponentVisibleOnScreenListItemTag', _bind_ComponentVisibleOnScreenListItemTag)
+encode_ComponentVisibleOnScreenListItemTag = _lazy('encode_ComponentVisibleOnScreenListItemTag', _bind_ComponentVisibleOnScreenListItemTag)
+
+
+def _bind_ComponentVisibleOnScreenListTag():
+    global decode_ComponentVisibleOnScreenListTag, encode_ComponentVisibleOnScreenListTag
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_list_tag import ComponentVisibleOnScreenListTag as model
+    keys = frozenset(('itemCount', 'lowestIndexSeen', 'highestIndexSeen', 'lowestOrdinalSeen', 'highestOrdinalSeen'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('itemCount')
+            if value is not None:
+                obj.item_count = value if value.__class__ is int else _int(value)
+            value = get('lowestIndexSeen')
+            if value is not None:
+                obj.lowest_index_seen = value if value.__class__ is int else _int(value)
+            value = get('highestIndexSeen')
+            if value is not None:
+                obj.highest_index_seen = value if value.__class__ is int else _int(value)
+            value = get('lowestOrdinalSeen')
+            if value is not None:
+                obj.lowest_ordinal_seen = value if value.__class__ is int else _int(value)
+            value = get('highestOrdinalSeen')
+            if value is not None:
+                obj.highest_ordinal_seen = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.item_count
+        if value is not None:
+            result['itemCount'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.lowest_index_seen
+        if value is not None:
+            result['lowestIndexSeen'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.highest_index_seen
+        if value is not None:
+            result['highestIndexSeen'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.lowest_ordinal_seen
+        if value is not None:
+            result['lowestOrdinalSeen'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.highest_ordinal_seen
+        if value is not None:
+            result['highestOrdinalSeen'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ComponentVisibleOnScreenListTag, encode_ComponentVisibleOnScreenListTag = decode_model, encode_model
+
+
+decode_ComponentVisibleOnScreenListTag = _lazy('decode_ComponentVisibleOnScreenListTag', _bind_ComponentVisibleOnScreenListTag)
+encode_ComponentVisibleOnScreenListTag = _lazy('encode_ComponentVisibleOnScreenListTag', _bind_ComponentVisibleOnScreenListTag)
+
+
+def _bind_ComponentVisibleOnScreenMediaTag():
+    global decode_ComponentVisibleOnScreenMediaTag, encode_ComponentVisibleOnScreenMediaTag
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_media_tag import ComponentVisibleOnScreenMediaTag as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_media_tag_state_enum import ComponentVisibleOnScreenMediaTagStateEnum as enum0
+    keys = frozenset(('positionInMilliseconds', 'state', 'allowAdjustSeekPositionForward', 'allowAdjustSeekPositionBackwards', 'allowNext', 'allowPrevious', 'entities', 'url'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('positionInMilliseconds')
+            if value is not None:
+                obj.position_in_milliseconds = value if value.__class__ is int else _int(value)
+            value = get('state')
+            if value is not None:
+                obj.state = enum0(value)
+            value = get('allowAdjustSeekPositionForward')
+            if value is not None:
+                obj.allow_adjust_seek_position_forward = value if value.__class__ is bool else _bool(value)
+            value = get('allowAdjustSeekPositionBackwards')
+            if value is not None:
+                obj.allow_adjust_seek_position_backwards = value if value.__class__ is bool else _bool(value)
+            value = get('allowNext')
+            if value is not None:
+                obj.allow_next = value if value.__class__ is bool else _bool(value)
+            value = get('allowPrevious')
+            if value is not None:
+                obj.allow_previous = value if value.__class__ is bool else _bool(value)
+            value = get('entities')
+            if value is not None:
+                obj.entities = [None if i0 is None else decode_ComponentEntity(i0) for i0 in value]
+            value = get('url')
+            if value is not None:
+                obj.url = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.position_in_milliseconds
+        if value is not None:
+            result['positionInMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.state
+        if value is not None:
+            result['state'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.allow_adjust_seek_position_forward
+        if value is not None:
+            result['allowAdjustSeekPositionForward'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.allow_adjust_seek_position_backwards
+        if value is not None:
+            result['allowAdjustSeekPositionBackwards'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.allow_next
+        if value is not None:
+            result['allowNext'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.allow_previous
+        if value is not None:
+            result['allowPrevious'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.entities
+        if value is not None:
+            result['entities'] = encode(value)
+        value = obj.url
+        if value is not None:
+            result['url'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ComponentVisibleOnScreenMediaTag, encode_ComponentVisibleOnScreenMediaTag = decode_model, encode_model
+
+
+decode_ComponentVisibleOnScreenMediaTag = _lazy('decode_ComponentVisibleOnScreenMediaTag', _bind_ComponentVisibleOnScreenMediaTag)
+encode_ComponentVisibleOnScreenMediaTag = _lazy('encode_ComponentVisibleOnScreenMediaTag', _bind_ComponentVisibleOnScreenMediaTag)
+
+
+def _bind_ComponentVisibleOnScreenPagerTag():
+    global decode_ComponentVisibleOnScreenPagerTag, encode_ComponentVisibleOnScreenPagerTag
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_pager_tag import ComponentVisibleOnScreenPagerTag as model
+    keys = frozenset(('index', 'pageCount', 'allowForward', 'allowBackwards'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('index')
+            if value is not None:
+                obj.index = value if value.__class__ is int else _int(value)
+            value = get('pageCount')
+            if value is not None:
+                obj.page_count = value if value.__class__ is int else _int(value)
+            value = get('allowForward')
+            if value is not None:
+                obj.allow_forward = value if value.__class__ is bool else _bool(value)
+            value = get('allowBackwards')
+            if value is not None:
+                obj.allow_backwards = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.index
+        if value is not None:
+            result['index'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.page_count
+        if value is not None:
+            result['pageCount'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.allow_forward
+        if value is not None:
+            result['allowForward'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.allow_backwards
+        if value is not None:
+            result['allowBackwards'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ComponentVisibleOnScreenPagerTag, encode_ComponentVisibleOnScreenPagerTag = decode_model, encode_model
+
+
+decode_ComponentVisibleOnScreenPagerTag = _lazy('decode_ComponentVisibleOnScreenPagerTag', _bind_ComponentVisibleOnScreenPagerTag)
+encode_ComponentVisibleOnScreenPagerTag = _lazy('encode_ComponentVisibleOnScreenPagerTag', _bind_ComponentVisibleOnScreenPagerTag)
+
+
+def _bind_ComponentVisibleOnScreenScrollableTag():
+    global decode_ComponentVisibleOnScreenScrollableTag, encode_ComponentVisibleOnScreenScrollableTag
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_scrollable_tag import ComponentVisibleOnScreenScrollableTag as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_scrollable_tag_direction_enum import ComponentVisibleOnScreenScrollableTagDirectionEnum as enum0
+    keys = frozenset(('direction', 'allowForward', 'allowBackward'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('direction')
+            if value is not None:
+                obj.direction = enum0(value)
+            value = get('allowForward')
+            if value is not None:
+                obj.allow_forward = value if value.__class__ is bool else _bool(value)
+            value = get('allowBackward')
+            if value is not None:
+                obj.allow_backward = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.direction
+        if value is not None:
+            result['direction'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.allow_forward
+        if value is not None:
+            result['allowForward'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.allow_backward
+        if value is not None:
+            result['allowBackward'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ComponentVisibleOnScreenScrollableTag, encode_ComponentVisibleOnScreenScrollableTag = decode_model, encode_model
+
+
+decode_ComponentVisibleOnScreenScrollableTag = _lazy('decode_ComponentVisibleOnScreenScrollableTag', _bind_ComponentVisibleOnScreenScrollableTag)
+encode_ComponentVisibleOnScreenScrollableTag = _lazy('encode_ComponentVisibleOnScreenScrollableTag', _bind_ComponentVisibleOnScreenScrollableTag)
+
+
+def _bind_ComponentVisibleOnScreenTags():
+    global decode_ComponentVisibleOnScreenTags, encode_ComponentVisibleOnScreenTags
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_tags import ComponentVisibleOnScreenTags as model
+    keys = frozenset(('checked', 'clickable', 'disabled', 'focused', 'list', 'listItem', 'media', 'ordinal', 'pager', 'scrollable', 'spoken', 'viewport'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('checked')
+            if value is not None:
+                obj.checked = value if value.__class__ is bool else _bool(value)
+            value = get('clickable')
+            if value is not None:
+                obj.clickable = value if value.__class__ is bool else _bool(value)
+            value = get('disabled')
+            if value is not None:
+                obj.disabled = value if value.__class__ is bool else _bool(value)
+            value = get('focused')
+            if value is not None:
+                obj.focused = value if value.__class__ is bool else _bool(value)
+            value = get('list')
+            if value is not None:
+                obj.list = decode_ComponentVisibleOnScreenListTag(value)
+            value = get('listItem')
+            if value is not None:
+                obj.list_item = decode_ComponentVisibleOnScreenListItemTag(value)
+            value = get('media')
+            if value is not None:
+                obj.media = decode_ComponentVisibleOnScreenMediaTag(value)
+            value = get('ordinal')
+            if value is not None:
+                obj.ordinal = value if value.__class__ is int else _int(value)
+            value = get('pager')
+            if value is not None:
+                obj.pager = decode_ComponentVisibleOnScreenPagerTag(value)
+            value = get('scrollable')
+            if value is not None:
+                obj.scrollable = decode_ComponentVisibleOnScreenScrollableTag(value)
+            value = get('spoken')
+            if value is not None:
+                obj.spoken = value if value.__class__ is bool else _bool(value)
+            value = get('viewport')
+            if value is not None:
+                obj.viewport = decode_ComponentVisibleOnScreenViewportTag(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.checked
+        if value is not None:
+            result['checked'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.clickable
+        if value is not None:
+            result['clickable'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.disabled
+        if value is not None:
+            result['disabled'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.focused
+        if value is not None:
+            result['focused'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list
+        if value is not None:
+            result['list'] = encode(value)
+        value = obj.list_item
+        if value is not None:
+            result['listItem'] = encode(value)
+        value = obj.media
+        if value is not None:
+            result['media'] = encode(value)
+        value = obj.ordinal
+        if value is not None:
+            result['ordinal'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.pager
+        if value is not None:
+            result['pager'] = encode(value)
+        value = obj.scrollable
+        if value is not None:
+            result['scrollable'] = encode(value)
+        value = obj.spoken
+        if value is not None:
+            result['spoken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.viewport
+        if value is not None:
+            result['viewport'] = encode(value)
+        return result
+
+    decode_ComponentVisibleOnScreenTags, encode_ComponentVisibleOnScreenTags = decode_model, encode_model
+
+
+decode_ComponentVisibleOnScreenTags = _lazy('decode_ComponentVisibleOnScreenTags', _bind_ComponentVisibleOnScreenTags)
+encode_ComponentVisibleOnScreenTags = _lazy('encode_ComponentVisibleOnScreenTags', _bind_ComponentVisibleOnScreenTags)
+
+
+def _bind_ComponentVisibleOnScreenViewportTag():
+    global decode_ComponentVisibleOnScreenViewportTag, encode_ComponentVisibleOnScreenViewportTag
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_viewport_tag import ComponentVisibleOnScreenViewportTag as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_ComponentVisibleOnScreenViewportTag, encode_ComponentVisibleOnScreenViewportTag = decode_model, encode_model
+
+
+decode_ComponentVisibleOnScreenViewportTag = _lazy('decode_ComponentVisibleOnScreenViewportTag', _bind_ComponentVisibleOnScreenViewportTag)
+encode_ComponentVisibleOnScreenViewportTag = _lazy('encode_ComponentVisibleOnScreenViewportTag', _bind_ComponentVisibleOnScreenViewportTag)
+
+
+def _bind_ControlMediaCommand():
+    global decode_ControlMediaCommand, encode_ControlMediaCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.control_media_command import ControlMediaCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.media_command_type import MediaCommandType as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'command', 'componentId', 'value'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('command')
+            if value is not None:
+                obj.command = enum0(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.command
+        if value is not None:
+            result['command'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ControlMediaCommand, encode_ControlMediaCommand = decode_model, encode_model
+
+
+decode_ControlMediaCommand = _lazy('decode_ControlMediaCommand', _bind_ControlMediaCommand)
+encode_ControlMediaCommand = _lazy('encode_ControlMediaCommand', _bind_ControlMediaCommand)
+
+
+def _bind_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive():
+    global decode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive, encode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive
+    from ask_sdk_model.interfaces.alexa.presentation.apl.execute_commands_directive import ExecuteCommandsDirective as model
+    keys = frozenset(('type', 'commands', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('commands')
+            if value is not None:
+                obj.commands = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_apl_command(i0) for i0 in value]
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.commands
+        if value is not None:
+            result['commands'] = encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive, encode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive = decode_model, encode_model
+
+
+decode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive = _lazy('decode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive', _bind_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive)
+encode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive = _lazy('encode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive', _bind_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive)
+
+
+def _bind_FinishCommand():
+    global decode_FinishCommand, encode_FinishCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.finish_command import FinishCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_FinishCommand, encode_FinishCommand = decode_model, encode_model
+
+
+decode_FinishCommand = _lazy('decode_FinishCommand', _bind_FinishCommand)
+encode_FinishCommand = _lazy('encode_FinishCommand', _bind_FinishCommand)
+
+
+def _bind_GoBackCommand():
+    global decode_GoBackCommand, encode_GoBackCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.go_back_command import GoBackCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.back_type import BackType as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'backType', 'backValue'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('backType')
+            if value is not None:
+                obj.back_type = enum0(value)
+            value = get('backValue')
+            if value is not None:
+                obj.back_value = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.back_type
+        if value is not None:
+            result['backType'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.back_value
+        if value is not None:
+            result['backValue'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_GoBackCommand, encode_GoBackCommand = decode_model, encode_model
+
+
+decode_GoBackCommand = _lazy('decode_GoBackCommand', _bind_GoBackCommand)
+encode_GoBackCommand = _lazy('encode_GoBackCommand', _bind_GoBackCommand)
+
+
+def _bind_HideOverlayCommand():
+    global decode_HideOverlayCommand, encode_HideOverlayCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.hide_overlay_command import HideOverlayCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'overlayLayoutId', 'underlyingLayoutId', 'overlayWidth', 'duration'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('overlayLayoutId')
+            if value is not None:
+                obj.overlay_layout_id = value if value.__class__ is str else _str(value)
+            value = get('underlyingLayoutId')
+            if value is not None:
+                obj.underlying_layout_id = value if value.__class__ is str else _str(value)
+            value = get('overlayWidth')
+            if value is not None:
+                obj.overlay_width = value if value.__class__ is str else _str(value)
+            value = get('duration')
+            if value is not None:
+                obj.duration = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.overlay_layout_id
+        if value is not None:
+            result['overlayLayoutId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.underlying_layout_id
+        if value is not None:
+            result['underlyingLayoutId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.overlay_width
+        if value is not None:
+            result['overlayWidth'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.duration
+        if value is not None:
+            result['duration'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_HideOverlayCommand, encode_HideOverlayCommand = decode_model, encode_model
+
+
+decode_HideOverlayCommand = _lazy('decode_HideOverlayCommand', _bind_HideOverlayCommand)
+encode_HideOverlayCommand = _lazy('encode_HideOverlayCommand', _bind_HideOverlayCommand)
+
+
+def _bind_IdleCommand__interfaces_alexa_presentation_apl_idle_command():
+    global decode_IdleCommand__interfaces_alexa_presentation_apl_idle_command, encode_IdleCommand__interfaces_alexa_presentation_apl_idle_command
+    from ask_sdk_model.interfaces.alexa.presentation.apl.idle_command import IdleCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_IdleCommand__interfaces_alexa_presentation_apl_idle_command, encode_IdleCommand__interfaces_alexa_presentation_apl_idle_command = decode_model, encode_model
+
+
+decode_IdleCommand__interfaces_alexa_presentation_apl_idle_command = _lazy('decode_IdleCommand__interfaces_alexa_presentation_apl_idle_command', _bind_IdleCommand__interfaces_alexa_presentation_apl_idle_command)
+encode_IdleCommand__interfaces_alexa_presentation_apl_idle_command = _lazy('encode_IdleCommand__interfaces_alexa_presentation_apl_idle_command', _bind_IdleCommand__interfaces_alexa_presentation_apl_idle_command)
+
+
+def _bind_ListRuntimeError():
+    global decode_ListRuntimeError, encode_ListRuntimeError
+    from ask_sdk_model.interfaces.alexa.presentation.apl.list_runtime_error import ListRuntimeError as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.list_runtime_error_reason import ListRuntimeErrorReason as enum0
+    keys = frozenset(('type', 'message', 'token', 'reason', 'listId', 'listVersion', 'operationIndex'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('reason')
+            if value is not None:
+                obj.reason = enum0(value)
+            value = get('listId')
+            if value is not None:
+                obj.list_id = value if value.__class__ is str else _str(value)
+            value = get('listVersion')
+            if value is not None:
+                obj.list_version = value if value.__class__ is int else _int(value)
+            value = get('operationIndex')
+            if value is not None:
+                obj.operation_index = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.reason
+        if value is not None:
+            result['reason'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.list_id
+        if value is not None:
+            result['listId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_version
+        if value is not None:
+            result['listVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.operation_index
+        if value is not None:
+            result['operationIndex'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ListRuntimeError, encode_ListRuntimeError = decode_model, encode_model
+
+
+decode_ListRuntimeError = _lazy('decode_ListRuntimeError', _bind_ListRuntimeError)
+encode_ListRuntimeError = _lazy('encode_ListRuntimeError', _bind_ListRuntimeError)
+
+
+def _bind_DeleteItemOperation():
+    global decode_DeleteItemOperation, encode_DeleteItemOperation
+    from ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.delete_item_operation import DeleteItemOperation as model
+    keys = frozenset(('type', 'index'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('index')
+            if value is not None:
+                obj.index = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.index
+        if value is not None:
+            result['index'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_DeleteItemOperation, encode_DeleteItemOperation = decode_model, encode_model
+
+
+decode_DeleteItemOperation = _lazy('decode_DeleteItemOperation', _bind_DeleteItemOperation)
+encode_DeleteItemOperation = _lazy('encode_DeleteItemOperation', _bind_DeleteItemOperation)
+
+
+def _bind_DeleteMultipleItemsOperation():
+    global decode_DeleteMultipleItemsOperation, encode_DeleteMultipleItemsOperation
+    from ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.delete_multiple_items_operation import DeleteMultipleItemsOperation as model
+    keys = frozenset(('type', 'index', 'count'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('index')
+            if value is not None:
+                obj.index = value if value.__class__ is int else _int(value)
+            value = get('count')
+            if value is not None:
+                obj.count = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.index
+        if value is not None:
+            result['index'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.count
+        if value is not None:
+            result['count'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_DeleteMultipleItemsOperation, encode_DeleteMultipleItemsOperation = decode_model, encode_model
+
+
+decode_DeleteMultipleItemsOperation = _lazy('decode_DeleteMultipleItemsOperation', _bind_DeleteMultipleItemsOperation)
+encode_DeleteMultipleItemsOperation = _lazy('encode_DeleteMultipleItemsOperation', _bind_DeleteMultipleItemsOperation)
+
+
+def _bind_InsertItemOperation():
+    global decode_InsertItemOperation, encode_InsertItemOperation
+    from ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.insert_item_operation import InsertItemOperation as model
+    keys = frozenset(('type', 'index', 'item'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('index')
+            if value is not None:
+                obj.index = value if value.__class__ is int else _int(value)
+            value = get('item')
+            if value is not None:
+                obj.item = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.index
+        if value is not None:
+            result['index'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.item
+        if value is not None:
+            result['item'] = encode(value)
+        return result
+
+    decode_InsertItemOperation, encode_InsertItemOperation = decode_model, encode_model
+
+
+decode_InsertItemOperation = _lazy('decode_InsertItemOperation', _bind_InsertItemOperation)
+encode_InsertItemOperation = _lazy('encode_InsertItemOperation', _bind_InsertItemOperation)
+
+
+def _bind_InsertMultipleItemsOperation():
+    global decode_InsertMultipleItemsOperation, encode_InsertMultipleItemsOperation
+    from ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.insert_multiple_items_operation import InsertMultipleItemsOperation as model
+    keys = frozenset(('type', 'index', 'items'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('index')
+            if value is not None:
+                obj.index = value if value.__class__ is int else _int(value)
+            value = get('items')
+            if value is not None:
+                obj.items = [None if i0 is None else i0 for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.index
+        if value is not None:
+            result['index'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.items
+        if value is not None:
+            result['items'] = encode(value)
+        return result
+
+    decode_InsertMultipleItemsOperation, encode_InsertMultipleItemsOperation = decode_model, encode_model
+
+
+decode_InsertMultipleItemsOperation = _lazy('decode_InsertMultipleItemsOperation', _bind_InsertMultipleItemsOperation)
+encode_InsertMultipleItemsOperation = _lazy('encode_InsertMultipleItemsOperation', _bind_InsertMultipleItemsOperation)
+
+
+def _bind_Operation():
+    global decode_Operation, encode_Operation
+    from ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.operation import Operation as model
+    keys = frozenset(('type', 'index'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('index')
+            if value is not None:
+                obj.index = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.index
+        if value is not None:
+            result['index'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Operation, encode_Operation = decode_model, encode_model
+
+
+decode_Operation = _lazy('decode_Operation', _bind_Operation)
+encode_Operation = _lazy('encode_Operation', _bind_Operation)
+
+
+def _bind_SetItemOperation():
+    global decode_SetItemOperation, encode_SetItemOperation
+    from ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.set_item_operation import SetItemOperation as model
+    keys = frozenset(('type', 'index', 'item'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('index')
+            if value is not None:
+                obj.index = value if value.__class__ is int else _int(value)
+            value = get('item')
+            if value is not None:
+                obj.item = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.index
+        if value is not None:
+            result['index'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.item
+        if value is not None:
+            result['item'] = encode(value)
+        return result
+
+    decode_SetItemOperation, encode_SetItemOperation = decode_model, encode_model
+
+
+decode_SetItemOperation = _lazy('decode_SetItemOperation', _bind_SetItemOperation)
+encode_SetItemOperation = _lazy('encode_SetItemOperation', _bind_SetItemOperation)
+
+
+def _bind_LoadIndexListDataEvent():
+    global decode_LoadIndexListDataEvent, encode_LoadIndexListDataEvent
+    from ask_sdk_model.interfaces.alexa.presentation.apl.load_index_list_data_event import LoadIndexListDataEvent as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token', 'correlationToken', 'listId', 'startIndex', 'count'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('correlationToken')
+            if value is not None:
+                obj.correlation_token = value if value.__class__ is str else _str(value)
+            value = get('listId')
+            if value is not None:
+                obj.list_id = value if value.__class__ is str else _str(value)
+            value = get('startIndex')
+            if value is not None:
+                obj.start_index = value if value.__class__ is int else _int(value)
+            value = get('count')
+            if value is not None:
+                obj.count = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.correlation_token
+        if value is not None:
+            result['correlationToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_id
+        if value is not None:
+            result['listId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.start_index
+        if value is not None:
+            result['startIndex'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.count
+        if value is not None:
+            result['count'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_LoadIndexListDataEvent, encode_LoadIndexListDataEvent = decode_model, encode_model
+
+
+decode_LoadIndexListDataEvent = _lazy('decode_LoadIndexListDataEvent', _bind_LoadIndexListDataEvent)
+encode_LoadIndexListDataEvent = _lazy('encode_LoadIndexListDataEvent', _bind_LoadIndexListDataEvent)
+
+
+def _bind_LoadTokenListDataEvent():
+    global decode_LoadTokenListDataEvent, encode_LoadTokenListDataEvent
+    from ask_sdk_model.interfaces.alexa.presentation.apl.load_token_list_data_event import LoadTokenListDataEvent as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token', 'correlationToken', 'listId', 'pageToken'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('correlationToken')
+            if value is not None:
+                obj.correlation_token = value if value.__class__ is str else _str(value)
+            value = get('listId')
+            if value is not None:
+                obj.list_id = value if value.__class__ is str else _str(value)
+            value = get('pageToken')
+            if value is not None:
+                obj.page_token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.correlation_token
+        if value is not None:
+            result['correlationToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_id
+        if value is not None:
+            result['listId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.page_token
+        if value is not None:
+            result['pageToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_LoadTokenListDataEvent, encode_LoadTokenListDataEvent = decode_model, encode_model
+
+
+decode_LoadTokenListDataEvent = _lazy('decode_LoadTokenListDataEvent', _bind_LoadTokenListDataEvent)
+encode_LoadTokenListDataEvent = _lazy('encode_LoadTokenListDataEvent', _bind_LoadTokenListDataEvent)
+
+
+def _bind_OpenUrlCommand():
+    global decode_OpenUrlCommand, encode_OpenUrlCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.open_url_command import OpenUrlCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'source', 'onFail'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('source')
+            if value is not None:
+                obj.source = value if value.__class__ is str else _str(value)
+            value = get('onFail')
+            if value is not None:
+                obj.on_fail = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_apl_command(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.source
+        if value is not None:
+            result['source'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.on_fail
+        if value is not None:
+            result['onFail'] = encode(value)
+        return result
+
+    decode_OpenUrlCommand, encode_OpenUrlCommand = decode_model, encode_model
+
+
+decode_OpenUrlCommand = _lazy('decode_OpenUrlCommand', _bind_OpenUrlCommand)
+encode_OpenUrlCommand = _lazy('encode_OpenUrlCommand', _bind_OpenUrlCommand)
+
+
+def _bind_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command():
+    global decode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command, encode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command
+    from ask_sdk_model.interfaces.alexa.presentation.apl.parallel_command import ParallelCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'commands'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('commands')
+            if value is not None:
+                obj.commands = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_apl_command(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.commands
+        if value is not None:
+            result['commands'] = encode(value)
+        return result
+
+    decode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command, encode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command = decode_model, encode_model
+
+
+decode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command = _lazy('decode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command', _bind_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command)
+encode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command = _lazy('encode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command', _bind_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command)
+
+
+def _bind_PlayMediaCommand():
+    global decode_PlayMediaCommand, encode_PlayMediaCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.play_media_command import PlayMediaCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.audio_track import AudioTrack as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'audioTrack', 'componentId', 'source'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('audioTrack')
+            if value is not None:
+                obj.audio_track = enum0(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('source')
+            if value is not None:
+                obj.source = [None if i0 is None else decode_VideoSource(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.audio_track
+        if value is not None:
+            result['audioTrack'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.source
+        if value is not None:
+            result['source'] = encode(value)
+        return result
+
+    decode_PlayMediaCommand, encode_PlayMediaCommand = decode_model, encode_model
+
+
+decode_PlayMediaCommand = _lazy('decode_PlayMediaCommand', _bind_PlayMediaCommand)
+encode_PlayMediaCommand = _lazy('encode_PlayMediaCommand', _bind_PlayMediaCommand)
+
+
+def _bind_ReinflateCommand():
+    global decode_ReinflateCommand, encode_ReinflateCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.reinflate_command import ReinflateCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ReinflateCommand, encode_ReinflateCommand = decode_model, encode_model
+
+
+decode_ReinflateCommand = _lazy('decode_ReinflateCommand', _bind_ReinflateCommand)
+encode_ReinflateCommand = _lazy('encode_ReinflateCommand', _bind_ReinflateCommand)
+
+
+def _bind_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive():
+    global decode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive, encode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive
+    from ask_sdk_model.interfaces.alexa.presentation.apl.render_document_directive import RenderDocumentDirective as model
+    keys = frozenset(('type', 'token', 'document', 'datasources', 'sources', 'packages'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('document')
+            if value is not None:
+                obj.document = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('datasources')
+            if value is not None:
+                obj.datasources = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('sources')
+            if value is not None:
+                obj.sources = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('packages')
+            if value is not None:
+                obj.packages = [None if i0 is None else i0 for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.document
+        if value is not None:
+            result['document'] = encode(value)
+        value = obj.datasources
+        if value is not None:
+            result['datasources'] = encode(value)
+        value = obj.sources
+        if value is not None:
+            result['sources'] = encode(value)
+        value = obj.packages
+        if value is not None:
+            result['packages'] = encode(value)
+        return result
+
+    decode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive, encode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive = decode_model, encode_model
+
+
+decode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive = _lazy('decode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive', _bind_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive)
+encode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive = _lazy('encode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive', _bind_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive)
+
+
+def _bind_RenderedDocumentState():
+    global decode_RenderedDocumentState, encode_RenderedDocumentState
+    from ask_sdk_model.interfaces.alexa.presentation.apl.rendered_document_state import RenderedDocumentState as model
+    keys = frozenset(('token', 'version', 'componentsVisibleOnScreen', 'dataSources'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('version')
+            if value is not None:
+                obj.version = value if value.__class__ is str else _str(value)
+            value = get('componentsVisibleOnScreen')
+            if value is not None:
+                obj.components_visible_on_screen = [None if i0 is None else decode_ComponentVisibleOnScreen(i0) for i0 in value]
+            value = get('dataSources')
+            if value is not None:
+                obj.data_sources = [None if i0 is None else i0 for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.version
+        if value is not None:
+            result['version'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.components_visible_on_screen
+        if value is not None:
+            result['componentsVisibleOnScreen'] = encode(value)
+        value = obj.data_sources
+        if value is not None:
+            result['dataSources'] = encode(value)
+        return result
+
+    decode_RenderedDocumentState, encode_RenderedDocumentState = decode_model, encode_model
+
+
+decode_RenderedDocumentState = _lazy('decode_RenderedDocumentState', _bind_RenderedDocumentState)
+encode_RenderedDocumentState = _lazy('encode_RenderedDocumentState', _bind_RenderedDocumentState)
+
+
+def _bind_Runtime__interfaces_alexa_presentation_apl_runtime():
+    global decode_Runtime__interfaces_alexa_presentation_apl_runtime, encode_Runtime__interfaces_alexa_presentation_apl_runtime
+    from ask_sdk_model.interfaces.alexa.presentation.apl.runtime import Runtime as model
+    keys = frozenset(('maxVersion',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('maxVersion')
+            if value is not None:
+                obj.max_version = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.max_version
+        if value is not None:
+            result['maxVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Runtime__interfaces_alexa_presentation_apl_runtime, encode_Runtime__interfaces_alexa_presentation_apl_runtime = decode_model, encode_model
+
+
+decode_Runtime__interfaces_alexa_presentation_apl_runtime = _lazy('decode_Runtime__interfaces_alexa_presentation_apl_runtime', _bind_Runtime__interfaces_alexa_presentation_apl_runtime)
+encode_Runtime__interfaces_alexa_presentation_apl_runtime = _lazy('encode_Runtime__interfaces_alexa_presentation_apl_runtime', _bind_Runtime__interfaces_alexa_presentation_apl_runtime)
+
+
+def _bind_RuntimeError__interfaces_alexa_presentation_apl_runtime_error():
+    global decode_RuntimeError__interfaces_alexa_presentation_apl_runtime_error, encode_RuntimeError__interfaces_alexa_presentation_apl_runtime_error
+    from ask_sdk_model.interfaces.alexa.presentation.apl.runtime_error import RuntimeError as model
+    keys = frozenset(('type', 'message', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_RuntimeError__interfaces_alexa_presentation_apl_runtime_error, encode_RuntimeError__interfaces_alexa_presentation_apl_runtime_error = decode_model, encode_model
+
+
+decode_RuntimeError__interfaces_alexa_presentation_apl_runtime_error = _lazy('decode_RuntimeError__interfaces_alexa_presentation_apl_runtime_error', _bind_RuntimeError__interfaces_alexa_presentation_apl_runtime_error)
+encode_RuntimeError__interfaces_alexa_presentation_apl_runtime_error = _lazy('encode_RuntimeError__interfaces_alexa_presentation_apl_runtime_error', _bind_RuntimeError__interfaces_alexa_presentation_apl_runtime_error)
+
+
+def _bind_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event():
+    global decode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event, encode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event
+    from ask_sdk_model.interfaces.alexa.presentation.apl.runtime_error_event import RuntimeErrorEvent as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token', 'errors'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('errors')
+            if value is not None:
+                obj.errors = [None if i0 is None else dispatch_RuntimeError__interfaces_alexa_presentation_apl_runtime_error(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.errors
+        if value is not None:
+            result['errors'] = encode(value)
+        return result
+
+    decode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event, encode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event = decode_model, encode_model
+
+
+decode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event = _lazy('decode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event', _bind_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event)
+encode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event = _lazy('encode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event', _bind_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event)
+
+
+def _bind_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command():
+    global decode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command, encode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command
+    from ask_sdk_model.interfaces.alexa.presentation.apl.scroll_command import ScrollCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'distance', 'componentId'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('distance')
+            if value is not None:
+                obj.distance = value if value.__class__ is int else _int(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.distance
+        if value is not None:
+            result['distance'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command, encode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command = decode_model, encode_model
+
+
+decode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command = _lazy('decode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command', _bind_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command)
+encode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command = _lazy('encode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command', _bind_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command)
+
+
+def _bind_ScrollToComponentCommand():
+    global decode_ScrollToComponentCommand, encode_ScrollToComponentCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.scroll_to_component_command import ScrollToComponentCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.align import Align as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'align', 'componentId'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('align')
+            if value is not None:
+                obj.align = enum0(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.align
+        if value is not None:
+            result['align'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ScrollToComponentCommand, encode_ScrollToComponentCommand = decode_model, encode_model
+
+
+decode_ScrollToComponentCommand = _lazy('decode_ScrollToComponentCommand', _bind_ScrollToComponentCommand)
+encode_ScrollToComponentCommand = _lazy('encode_ScrollToComponentCommand', _bind_ScrollToComponentCommand)
+
+
+def _bind_ScrollToIndexCommand():
+    global decode_ScrollToIndexCommand, encode_ScrollToIndexCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.scroll_to_index_command import ScrollToIndexCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.align import Align as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'align', 'componentId', 'index'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('align')
+            if value is not None:
+                obj.align = enum0(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('index')
+            if value is not None:
+                obj.index = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.align
+        if value is not None:
+            result['align'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.index
+        if value is not None:
+            result['index'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ScrollToIndexCommand, encode_ScrollToIndexCommand = decode_model, encode_model
+
+
+decode_ScrollToIndexCommand = _lazy('decode_ScrollToIndexCommand', _bind_ScrollToIndexCommand)
+encode_ScrollToIndexCommand = _lazy('encode_ScrollToIndexCommand', _bind_ScrollToIndexCommand)
+
+
+def _bind_SelectCommand():
+    global decode_SelectCommand, encode_SelectCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.select_command import SelectCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'commands', 'data', 'otherwise'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('commands')
+            if value is not None:
+                obj.commands = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_apl_command(i0) for i0 in value]
+            value = get('data')
+            if value is not None:
+                obj.data = [None if i0 is None else i0 for i0 in value]
+            value = get('otherwise')
+            if value is not None:
+                obj.otherwise = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_apl_command(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.commands
+        if value is not None:
+            result['commands'] = encode(value)
+        value = obj.data
+        if value is not None:
+            result['data'] = encode(value)
+        value = obj.otherwise
+        if value is not None:
+            result['otherwise'] = encode(value)
+        return result
+
+    decode_SelectCommand, encode_SelectCommand = decode_model, encode_model
+
+
+decode_SelectCommand = _lazy('decode_SelectCommand', _bind_SelectCommand)
+encode_SelectCommand = _lazy('encode_SelectCommand', _bind_SelectCommand)
+
+
+def _bind_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command():
+    global decode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command, encode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command
+    from ask_sdk_model.interfaces.alexa.presentation.apl.send_event_command import SendEventCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'arguments', 'components'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('arguments')
+            if value is not None:
+                obj.arguments = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('components')
+            if value is not None:
+                obj.components = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.arguments
+        if value is not None:
+            result['arguments'] = encode(value)
+        value = obj.components
+        if value is not None:
+            result['components'] = encode(value)
+        return result
+
+    decode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command, encode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command = decode_model, encode_model
+
+
+decode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command = _lazy('decode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command', _bind_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command)
+encode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command = _lazy('encode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command', _bind_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command)
+
+
+def _bind_SendIndexListDataDirective():
+    global decode_SendIndexListDataDirective, encode_SendIndexListDataDirective
+    from ask_sdk_model.interfaces.alexa.presentation.apl.send_index_list_data_directive import SendIndexListDataDirective as model
+    keys = frozenset(('type', 'correlationToken', 'listId', 'listVersion', 'startIndex', 'minimumInclusiveIndex', 'maximumExclusiveIndex', 'items'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('correlationToken')
+            if value is not None:
+                obj.correlation_token = value if value.__class__ is str else _str(value)
+            value = get('listId')
+            if value is not None:
+                obj.list_id = value if value.__class__ is str else _str(value)
+            value = get('listVersion')
+            if value is not None:
+                obj.list_version = value if value.__class__ is int else _int(value)
+            value = get('startIndex')
+            if value is not None:
+                obj.start_index = value if value.__class__ is int else _int(value)
+            value = get('minimumInclusiveIndex')
+            if value is not None:
+                obj.minimum_inclusive_index = value if value.__class__ is int else _int(value)
+            value = get('maximumExclusiveIndex')
+            if value is not None:
+                obj.maximum_exclusive_index = value if value.__class__ is int else _int(value)
+            value = get('items')
+            if value is not None:
+                obj.items = [None if i0 is None else i0 for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.correlation_token
+        if value is not None:
+            result['correlationToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_id
+        if value is not None:
+            result['listId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_version
+        if value is not None:
+            result['listVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.start_index
+        if value is not None:
+            result['startIndex'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.minimum_inclusive_index
+        if value is not None:
+            result['minimumInclusiveIndex'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.maximum_exclusive_index
+        if value is not None:
+            result['maximumExclusiveIndex'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.items
+        if value is not None:
+            result['items'] = encode(value)
+        return result
+
+    decode_SendIndexListDataDirective, encode_SendIndexListDataDirective = decode_model, encode_model
+
+
+decode_SendIndexListDataDirective = _lazy('decode_SendIndexListDataDirective', _bind_SendIndexListDataDirective)
+encode_SendIndexListDataDirective = _lazy('encode_SendIndexListDataDirective', _bind_SendIndexListDataDirective)
+
+
+def _bind_SendTokenListDataDirective():
+    global decode_SendTokenListDataDirective, encode_SendTokenListDataDirective
+    from ask_sdk_model.interfaces.alexa.presentation.apl.send_token_list_data_directive import SendTokenListDataDirective as model
+    keys = frozenset(('type', 'correlationToken', 'listId', 'pageToken', 'nextPageToken', 'items'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('correlationToken')
+            if value is not None:
+                obj.correlation_token = value if value.__class__ is str else _str(value)
+            value = get('listId')
+            if value is not None:
+                obj.list_id = value if value.__class__ is str else _str(value)
+            value = get('pageToken')
+            if value is not None:
+                obj.page_token = value if value.__class__ is str else _str(value)
+            value = get('nextPageToken')
+            if value is not None:
+                obj.next_page_token = value if value.__class__ is str else _str(value)
+            value = get('items')
+            if value is not None:
+                obj.items = [None if i0 is None else i0 for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.correlation_token
+        if value is not None:
+            result['correlationToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_id
+        if value is not None:
+            result['listId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.page_token
+        if value is not None:
+            result['pageToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.next_page_token
+        if value is not None:
+            result['nextPageToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.items
+        if value is not None:
+            result['items'] = encode(value)
+        return result
+
+    decode_SendTokenListDataDirective, encode_SendTokenListDataDirective = decode_model, encode_model
+
+
+decode_SendTokenListDataDirective = _lazy('decode_SendTokenListDataDirective', _bind_SendTokenListDataDirective)
+encode_SendTokenListDataDirective = _lazy('encode_SendTokenListDataDirective', _bind_SendTokenListDataDirective)
+
+
+def _bind_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command():
+    global decode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command, encode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command
+    from ask_sdk_model.interfaces.alexa.presentation.apl.sequential_command import SequentialCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'catch', 'commands', 'finally', 'repeatCount'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('catch')
+            if value is not None:
+                obj.catch = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_apl_command(i0) for i0 in value]
+            value = get('commands')
+            if value is not None:
+                obj.commands = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_apl_command(i0) for i0 in value]
+            value = get('finally')
+            if value is not None:
+                obj.object_finally = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_apl_command(i0) for i0 in value]
+            value = get('repeatCount')
+            if value is not None:
+                obj.repeat_count = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.catch
+        if value is not None:
+            result['catch'] = encode(value)
+        value = obj.commands
+        if value is not None:
+            result['commands'] = encode(value)
+        value = obj.object_finally
+        if value is not None:
+            result['finally'] = encode(value)
+        value = obj.repeat_count
+        if value is not None:
+            result['repeatCount'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command, encode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command = decode_model, encode_model
+
+
+decode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command = _lazy('decode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command', _bind_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command)
+encode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command = _lazy('encode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command', _bind_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command)
+
+
+def _bind_SetFocusCommand():
+    global decode_SetFocusCommand, encode_SetFocusCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.set_focus_command import SetFocusCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'componentId'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SetFocusCommand, encode_SetFocusCommand = decode_model, encode_model
+
+
+decode_SetFocusCommand = _lazy('decode_SetFocusCommand', _bind_SetFocusCommand)
+encode_SetFocusCommand = _lazy('encode_SetFocusCommand', _bind_SetFocusCommand)
+
+
+def _bind_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command():
+    global decode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command, encode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command
+    from ask_sdk_model.interfaces.alexa.presentation.apl.set_page_command import SetPageCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.position import Position as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'componentId', 'position', 'value'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('position')
+            if value is not None:
+                obj.position = enum0(value)
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.position
+        if value is not None:
+            result['position'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command, encode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command = decode_model, encode_model
+
+
+decode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command = _lazy('decode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command', _bind_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command)
+encode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command = _lazy('encode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command', _bind_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command)
+
+
+def _bind_SetStateCommand():
+    global decode_SetStateCommand, encode_SetStateCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.set_state_command import SetStateCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.component_state import ComponentState as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'componentId', 'state', 'value'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('state')
+            if value is not None:
+                obj.state = enum0(value)
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.state
+        if value is not None:
+            result['state'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SetStateCommand, encode_SetStateCommand = decode_model, encode_model
+
+
+decode_SetStateCommand = _lazy('decode_SetStateCommand', _bind_SetStateCommand)
+encode_SetStateCommand = _lazy('encode_SetStateCommand', _bind_SetStateCommand)
+
+
+def _bind_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command():
+    global decode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command, encode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command
+    from ask_sdk_model.interfaces.alexa.presentation.apl.set_value_command import SetValueCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'componentId', 'property', 'value'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('property')
+            if value is not None:
+                obj.object_property = value if value.__class__ is str else _str(value)
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.object_property
+        if value is not None:
+            result['property'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command, encode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command = decode_model, encode_model
+
+
+decode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command = _lazy('decode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command', _bind_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command)
+encode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command = _lazy('encode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command', _bind_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command)
+
+
+def _bind_ShowOverlayCommand():
+    global decode_ShowOverlayCommand, encode_ShowOverlayCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.show_overlay_command import ShowOverlayCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'overlayLayoutId', 'underlyingLayoutId', 'overlayWidth', 'duration'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('overlayLayoutId')
+            if value is not None:
+                obj.overlay_layout_id = value if value.__class__ is str else _str(value)
+            value = get('underlyingLayoutId')
+            if value is not None:
+                obj.underlying_layout_id = value if value.__class__ is str else _str(value)
+            value = get('overlayWidth')
+            if value is not None:
+                obj.overlay_width = value if value.__class__ is str else _str(value)
+            value = get('duration')
+            if value is not None:
+                obj.duration = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.overlay_layout_id
+        if value is not None:
+            result['overlayLayoutId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.underlying_layout_id
+        if value is not None:
+            result['underlyingLayoutId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.overlay_width
+        if value is not None:
+            result['overlayWidth'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.duration
+        if value is not None:
+            result['duration'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ShowOverlayCommand, encode_ShowOverlayCommand = decode_model, encode_model
+
+
+decode_ShowOverlayCommand = _lazy('decode_ShowOverlayCommand', _bind_ShowOverlayCommand)
+encode_ShowOverlayCommand = _lazy('encode_ShowOverlayCommand', _bind_ShowOverlayCommand)
+
+
+def _bind_SpeakItemCommand():
+    global decode_SpeakItemCommand, encode_SpeakItemCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.speak_item_command import SpeakItemCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.align import Align as enum0
+    from ask_sdk_model.interfaces.alexa.presentation.apl.highlight_mode import HighlightMode as enum1
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'align', 'componentId', 'highlightMode', 'minimumDwellTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('align')
+            if value is not None:
+                obj.align = enum0(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('highlightMode')
+            if value is not None:
+                obj.highlight_mode = enum1(value)
+            value = get('minimumDwellTime')
+            if value is not None:
+                obj.minimum_dwell_time = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.align
+        if value is not None:
+            result['align'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.highlight_mode
+        if value is not None:
+            result['highlightMode'] = value.value if value.__class__ is enum1 else encode(value)
+        value = obj.minimum_dwell_time
+        if value is not None:
+            result['minimumDwellTime'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SpeakItemCommand, encode_SpeakItemCommand = decode_model, encode_model
+
+
+decode_SpeakItemCommand = _lazy('decode_SpeakItemCommand', _bind_SpeakItemCommand)
+encode_SpeakItemCommand = _lazy('encode_SpeakItemCommand', _bind_SpeakItemCommand)
+
+
+def _bind_SpeakListCommand():
+    global decode_SpeakListCommand, encode_SpeakListCommand
+    from ask_sdk_model.interfaces.alexa.presentation.apl.speak_list_command import SpeakListCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.apl.align import Align as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'sequencer', 'when', 'align', 'componentId', 'count', 'minimumDwellTime', 'start'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('sequencer')
+            if value is not None:
+                obj.sequencer = value if value.__class__ is str else _str(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('align')
+            if value is not None:
+                obj.align = enum0(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('count')
+            if value is not None:
+                obj.count = value if value.__class__ is int else _int(value)
+            value = get('minimumDwellTime')
+            if value is not None:
+                obj.minimum_dwell_time = value if value.__class__ is int else _int(value)
+            value = get('start')
+            if value is not None:
+                obj.start = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sequencer
+        if value is not None:
+            result['sequencer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.align
+        if value is not None:
+            result['align'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.count
+        if value is not None:
+            result['count'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.minimum_dwell_time
+        if value is not None:
+            result['minimumDwellTime'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.start
+        if value is not None:
+            result['start'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SpeakListCommand, encode_SpeakListCommand = decode_model, encode_model
+
+
+decode_SpeakListCommand = _lazy('decode_SpeakListCommand', _bind_SpeakListCommand)
+encode_SpeakListCommand = _lazy('encode_SpeakListCommand', _bind_SpeakListCommand)
+
+
+def _bind_TransformProperty():
+    global decode_TransformProperty, encode_TransformProperty
+    from ask_sdk_model.interfaces.alexa.presentation.apl.transform_property import TransformProperty as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_TransformProperty, encode_TransformProperty = decode_model, encode_model
+
+
+decode_TransformProperty = _lazy('decode_TransformProperty', _bind_TransformProperty)
+encode_TransformProperty = _lazy('encode_TransformProperty', _bind_TransformProperty)
+
+
+def _bind_UpdateIndexListDataDirective():
+    global decode_UpdateIndexListDataDirective, encode_UpdateIndexListDataDirective
+    from ask_sdk_model.interfaces.alexa.presentation.apl.update_index_list_data_directive import UpdateIndexListDataDirective as model
+    keys = frozenset(('type', 'token', 'listId', 'listVersion', 'operations'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('listId')
+            if value is not None:
+                obj.list_id = value if value.__class__ is str else _str(value)
+            value = get('listVersion')
+            if value is not None:
+                obj.list_version = value if value.__class__ is int else _int(value)
+            value = get('operations')
+            if value is not None:
+                obj.operations = [None if i0 is None else dispatch_Operation(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_id
+        if value is not None:
+            result['listId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_version
+        if value is not None:
+            result['listVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.operations
+        if value is not None:
+            result['operations'] = encode(value)
+        return result
+
+    decode_UpdateIndexListDataDirective, encode_UpdateIndexListDataDirective = decode_model, encode_model
+
+
+decode_UpdateIndexListDataDirective = _lazy('decode_UpdateIndexListDataDirective', _bind_UpdateIndexListDataDirective)
+encode_UpdateIndexListDataDirective = _lazy('encode_UpdateIndexListDataDirective', _bind_UpdateIndexListDataDirective)
+
+
+def _bind_UserEvent__interfaces_alexa_presentation_apl_user_event():
+    global decode_UserEvent__interfaces_alexa_presentation_apl_user_event, encode_UserEvent__interfaces_alexa_presentation_apl_user_event
+    from ask_sdk_model.interfaces.alexa.presentation.apl.user_event import UserEvent as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token', 'arguments', 'source', 'components'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('arguments')
+            if value is not None:
+                obj.arguments = [None if i0 is None else i0 for i0 in value]
+            value = get('source')
+            if value is not None:
+                obj.source = value
+            value = get('components')
+            if value is not None:
+                obj.components = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.arguments
+        if value is not None:
+            result['arguments'] = encode(value)
+        value = obj.source
+        if value is not None:
+            result['source'] = encode(value)
+        value = obj.components
+        if value is not None:
+            result['components'] = encode(value)
+        return result
+
+    decode_UserEvent__interfaces_alexa_presentation_apl_user_event, encode_UserEvent__interfaces_alexa_presentation_apl_user_event = decode_model, encode_model
+
+
+decode_UserEvent__interfaces_alexa_presentation_apl_user_event = _lazy('decode_UserEvent__interfaces_alexa_presentation_apl_user_event', _bind_UserEvent__interfaces_alexa_presentation_apl_user_event)
+encode_UserEvent__interfaces_alexa_presentation_apl_user_event = _lazy('encode_UserEvent__interfaces_alexa_presentation_apl_user_event', _bind_UserEvent__interfaces_alexa_presentation_apl_user_event)
+
+
+def _bind_VideoSource():
+    global decode_VideoSource, encode_VideoSource
+    from ask_sdk_model.interfaces.alexa.presentation.apl.video_source import VideoSource as model
+    keys = frozenset(('description', 'duration', 'url', 'repeatCount', 'offset'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('duration')
+            if value is not None:
+                obj.duration = value if value.__class__ is int else _int(value)
+            value = get('url')
+            if value is not None:
+                obj.url = value if value.__class__ is str else _str(value)
+            value = get('repeatCount')
+            if value is not None:
+                obj.repeat_count = value if value.__class__ is int else _int(value)
+            value = get('offset')
+            if value is not None:
+                obj.offset = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.duration
+        if value is not None:
+            result['duration'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.url
+        if value is not None:
+            result['url'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.repeat_count
+        if value is not None:
+            result['repeatCount'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.offset
+        if value is not None:
+            result['offset'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_VideoSource, encode_VideoSource = decode_model, encode_model
+
+
+decode_VideoSource = _lazy('decode_VideoSource', _bind_VideoSource)
+encode_VideoSource = _lazy('encode_VideoSource', _bind_VideoSource)
+
+
+def _bind_AplPresentationStateContext():
+    global decode_AplPresentationStateContext, encode_AplPresentationStateContext
+    from ask_sdk_model.interfaces.alexa.presentation.apl_presentation_state_context import AplPresentationStateContext as model
+    keys = frozenset(('type', 'context'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('context')
+            if value is not None:
+                obj.context = decode_RenderedDocumentState(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.context
+        if value is not None:
+            result['context'] = encode(value)
+        return result
+
+    decode_AplPresentationStateContext, encode_AplPresentationStateContext = decode_model, encode_model
+
+
+decode_AplPresentationStateContext = _lazy('decode_AplPresentationStateContext', _bind_AplPresentationStateContext)
+encode_AplPresentationStateContext = _lazy('encode_AplPresentationStateContext', _bind_AplPresentationStateContext)
+
+
+def _bind_AudioSourceRuntimeError():
+    global decode_AudioSourceRuntimeError, encode_AudioSourceRuntimeError
+    from ask_sdk_model.interfaces.alexa.presentation.apla.audio_source_runtime_error import AudioSourceRuntimeError as model
+    from ask_sdk_model.interfaces.alexa.presentation.apla.audio_source_error_reason import AudioSourceErrorReason as enum0
+    keys = frozenset(('type', 'message', 'reason'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            value = get('reason')
+            if value is not None:
+                obj.reason = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.reason
+        if value is not None:
+            result['reason'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_AudioSourceRuntimeError, encode_AudioSourceRuntimeError = decode_model, encode_model
+
+
+decode_AudioSourceRuntimeError = _lazy('decode_AudioSourceRuntimeError', _bind_AudioSourceRuntimeError)
+encode_AudioSourceRuntimeError = _lazy('encode_AudioSourceRuntimeError', _bind_AudioSourceRuntimeError)
+
+
+def _bind_DocumentRuntimeError():
+    global decode_DocumentRuntimeError, encode_DocumentRuntimeError
+    from ask_sdk_model.interfaces.alexa.presentation.apla.document_runtime_error import DocumentRuntimeError as model
+    from ask_sdk_model.interfaces.alexa.presentation.apla.document_error_reason import DocumentErrorReason as enum0
+    keys = frozenset(('type', 'message', 'reason'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            value = get('reason')
+            if value is not None:
+                obj.reason = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.reason
+        if value is not None:
+            result['reason'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_DocumentRuntimeError, encode_DocumentRuntimeError = decode_model, encode_model
+
+
+decode_DocumentRuntimeError = _lazy('decode_DocumentRuntimeError', _bind_DocumentRuntimeError)
+encode_DocumentRuntimeError = _lazy('encode_DocumentRuntimeError', _bind_DocumentRuntimeError)
+
+
+def _bind_LinkRuntimeError():
+    global decode_LinkRuntimeError, encode_LinkRuntimeError
+    from ask_sdk_model.interfaces.alexa.presentation.apla.link_runtime_error import LinkRuntimeError as model
+    from ask_sdk_model.interfaces.alexa.presentation.apla.link_error_reason import LinkErrorReason as enum0
+    keys = frozenset(('type', 'message', 'reason'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            value = get('reason')
+            if value is not None:
+                obj.reason = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.reason
+        if value is not None:
+            result['reason'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_LinkRuntimeError, encode_LinkRuntimeError = decode_model, encode_model
+
+
+decode_LinkRuntimeError = _lazy('decode_LinkRuntimeError', _bind_LinkRuntimeError)
+encode_LinkRuntimeError = _lazy('encode_LinkRuntimeError', _bind_LinkRuntimeError)
+
+
+def _bind_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive():
+    global decode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive, encode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive
+    from ask_sdk_model.interfaces.alexa.presentation.apla.render_document_directive import RenderDocumentDirective as model
+    keys = frozenset(('type', 'token', 'document', 'datasources'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('document')
+            if value is not None:
+                obj.document = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('datasources')
+            if value is not None:
+                obj.datasources = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.document
+        if value is not None:
+            result['document'] = encode(value)
+        value = obj.datasources
+        if value is not None:
+            result['datasources'] = encode(value)
+        return result
+
+    decode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive, encode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive = decode_model, encode_model
+
+
+decode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive = _lazy('decode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive', _bind_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive)
+encode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive = _lazy('encode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive', _bind_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive)
+
+
+def _bind_RenderRuntimeError():
+    global decode_RenderRuntimeError, encode_RenderRuntimeError
+    from ask_sdk_model.interfaces.alexa.presentation.apla.render_runtime_error import RenderRuntimeError as model
+    from ask_sdk_model.interfaces.alexa.presentation.apla.render_error_reason import RenderErrorReason as enum0
+    keys = frozenset(('type', 'message', 'reason'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            value = get('reason')
+            if value is not None:
+                obj.reason = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.reason
+        if value is not None:
+            result['reason'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_RenderRuntimeError, encode_RenderRuntimeError = decode_model, encode_model
+
+
+decode_RenderRuntimeError = _lazy('decode_RenderRuntimeError', _bind_RenderRuntimeError)
+encode_RenderRuntimeError = _lazy('encode_RenderRuntimeError', _bind_RenderRuntimeError)
+
+
+def _bind_RuntimeError__interfaces_alexa_presentation_apla_runtime_error():
+    global decode_RuntimeError__interfaces_alexa_presentation_apla_runtime_error, encode_RuntimeError__interfaces_alexa_presentation_apla_runtime_error
+    from ask_sdk_model.interfaces.alexa.presentation.apla.runtime_error import RuntimeError as model
+    keys = frozenset(('type', 'message'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_RuntimeError__interfaces_alexa_presentation_apla_runtime_error, encode_RuntimeError__interfaces_alexa_presentation_apla_runtime_error = decode_model, encode_model
+
+
+decode_RuntimeError__interfaces_alexa_presentation_apla_runtime_error = _lazy('decode_RuntimeError__interfaces_alexa_presentation_apla_runtime_error', _bind_RuntimeError__interfaces_alexa_presentation_apla_runtime_error)
+encode_RuntimeError__interfaces_alexa_presentation_apla_runtime_error = _lazy('encode_RuntimeError__interfaces_alexa_presentation_apla_runtime_error', _bind_RuntimeError__interfaces_alexa_presentation_apla_runtime_error)
+
+
+def _bind_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event():
+    global decode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event, encode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event
+    from ask_sdk_model.interfaces.alexa.presentation.apla.runtime_error_event import RuntimeErrorEvent as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token', 'errors'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('errors')
+            if value is not None:
+                obj.errors = [None if i0 is None else dispatch_RuntimeError__interfaces_alexa_presentation_apla_runtime_error(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.errors
+        if value is not None:
+            result['errors'] = encode(value)
+        return result
+
+    decode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event, encode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event = decode_model, encode_model
+
+
+decode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event = _lazy('decode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event', _bind_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event)
+encode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event = _lazy('encode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event', _bind_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event)
+
+
+def _bind_AlexaPresentationApltInterface():
+    global decode_AlexaPresentationApltInterface, encode_AlexaPresentationApltInterface
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.alexa_presentation_aplt_interface import AlexaPresentationApltInterface as model
+    keys = frozenset(('runtime',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('runtime')
+            if value is not None:
+                obj.runtime = decode_Runtime__interfaces_alexa_presentation_aplt_runtime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.runtime
+        if value is not None:
+            result['runtime'] = encode(value)
+        return result
+
+    decode_AlexaPresentationApltInterface, encode_AlexaPresentationApltInterface = decode_model, encode_model
+
+
+decode_AlexaPresentationApltInterface = _lazy('decode_AlexaPresentationApltInterface', _bind_AlexaPresentationApltInterface)
+encode_AlexaPresentationApltInterface = _lazy('encode_AlexaPresentationApltInterface', _bind_AlexaPresentationApltInterface)
+
+
+def _bind_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command():
+    global decode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command, encode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.auto_page_command import AutoPageCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'when', 'componentId', 'count', 'duration'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('count')
+            if value is not None:
+                obj.count = value if value.__class__ is int else _int(value)
+            value = get('duration')
+            if value is not None:
+                obj.duration = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.count
+        if value is not None:
+            result['count'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.duration
+        if value is not None:
+            result['duration'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command, encode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command = decode_model, encode_model
+
+
+decode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command = _lazy('decode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command', _bind_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command)
+encode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command = _lazy('encode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command', _bind_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command)
+
+
+def _bind_Command__interfaces_alexa_presentation_aplt_command():
+    global decode_Command__interfaces_alexa_presentation_aplt_command, encode_Command__interfaces_alexa_presentation_aplt_command
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.command import Command as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'when'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Command__interfaces_alexa_presentation_aplt_command, encode_Command__interfaces_alexa_presentation_aplt_command = decode_model, encode_model
+
+
+decode_Command__interfaces_alexa_presentation_aplt_command = _lazy('decode_Command__interfaces_alexa_presentation_aplt_command', _bind_Command__interfaces_alexa_presentation_aplt_command)
+encode_Command__interfaces_alexa_presentation_aplt_command = _lazy('encode_Command__interfaces_alexa_presentation_aplt_command', _bind_Command__interfaces_alexa_presentation_aplt_command)
+
+
+def _bind_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive():
+    global decode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive, encode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.execute_commands_directive import ExecuteCommandsDirective as model
+    keys = frozenset(('type', 'commands', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('commands')
+            if value is not None:
+                obj.commands = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_aplt_command(i0) for i0 in value]
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.commands
+        if value is not None:
+            result['commands'] = encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive, encode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive = decode_model, encode_model
+
+
+decode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive = _lazy('decode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive', _bind_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive)
+encode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive = _lazy('encode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive', _bind_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive)
+
+
+def _bind_IdleCommand__interfaces_alexa_presentation_aplt_idle_command():
+    global decode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command, encode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.idle_command import IdleCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'when'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command, encode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command = decode_model, encode_model
+
+
+decode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command = _lazy('decode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command', _bind_IdleCommand__interfaces_alexa_presentation_aplt_idle_command)
+encode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command = _lazy('encode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command', _bind_IdleCommand__interfaces_alexa_presentation_aplt_idle_command)
+
+
+def _bind_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command():
+    global decode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command, encode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.parallel_command import ParallelCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'when', 'commands'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('commands')
+            if value is not None:
+                obj.commands = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_aplt_command(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.commands
+        if value is not None:
+            result['commands'] = encode(value)
+        return result
+
+    decode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command, encode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command = decode_model, encode_model
+
+
+decode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command = _lazy('decode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command', _bind_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command)
+encode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command = _lazy('encode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command', _bind_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command)
+
+
+def _bind_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive():
+    global decode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive, encode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.render_document_directive import RenderDocumentDirective as model
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.target_profile import TargetProfile as enum0
+    keys = frozenset(('type', 'token', 'targetProfile', 'document', 'datasources'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('targetProfile')
+            if value is not None:
+                obj.target_profile = enum0(value)
+            value = get('document')
+            if value is not None:
+                obj.document = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('datasources')
+            if value is not None:
+                obj.datasources = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.target_profile
+        if value is not None:
+            result['targetProfile'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.document
+        if value is not None:
+            result['document'] = encode(value)
+        value = obj.datasources
+        if value is not None:
+            result['datasources'] = encode(value)
+        return result
+
+    decode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive, encode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive = decode_model, encode_model
+
+
+decode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive = _lazy('decode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive', _bind_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive)
+encode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive = _lazy('encode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive', _bind_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive)
+
+
+def _bind_Runtime__interfaces_alexa_presentation_aplt_runtime():
+    global decode_Runtime__interfaces_alexa_presentation_aplt_runtime, encode_Runtime__interfaces_alexa_presentation_aplt_runtime
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.runtime import Runtime as model
+    keys = frozenset(('maxVersion',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('maxVersion')
+            if value is not None:
+                obj.max_version = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.max_version
+        if value is not None:
+            result['maxVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Runtime__interfaces_alexa_presentation_aplt_runtime, encode_Runtime__interfaces_alexa_presentation_aplt_runtime = decode_model, encode_model
+
+
+decode_Runtime__interfaces_alexa_presentation_aplt_runtime = _lazy('decode_Runtime__interfaces_alexa_presentation_aplt_runtime', _bind_Runtime__interfaces_alexa_presentation_aplt_runtime)
+encode_Runtime__interfaces_alexa_presentation_aplt_runtime = _lazy('encode_Runtime__interfaces_alexa_presentation_aplt_runtime', _bind_Runtime__interfaces_alexa_presentation_aplt_runtime)
+
+
+def _bind_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command():
+    global decode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command, encode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.scroll_command import ScrollCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'when', 'distance', 'componentId'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('distance')
+            if value is not None:
+                obj.distance = value if value.__class__ is int else _int(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.distance
+        if value is not None:
+            result['distance'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command, encode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command = decode_model, encode_model
+
+
+decode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command = _lazy('decode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command', _bind_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command)
+encode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command = _lazy('encode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command', _bind_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command)
+
+
+def _bind_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command():
+    global decode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command, encode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.send_event_command import SendEventCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'when', 'arguments', 'components'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('arguments')
+            if value is not None:
+                obj.arguments = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('components')
+            if value is not None:
+                obj.components = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.arguments
+        if value is not None:
+            result['arguments'] = encode(value)
+        value = obj.components
+        if value is not None:
+            result['components'] = encode(value)
+        return result
+
+    decode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command, encode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command = decode_model, encode_model
+
+
+decode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command = _lazy('decode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command', _bind_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command)
+encode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command = _lazy('encode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command', _bind_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command)
+
+
+def _bind_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command():
+    global decode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command, encode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.sequential_command import SequentialCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'when', 'catch', 'commands', 'finally', 'repeatCount'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('catch')
+            if value is not None:
+                obj.catch = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_aplt_command(i0) for i0 in value]
+            value = get('commands')
+            if value is not None:
+                obj.commands = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_aplt_command(i0) for i0 in value]
+            value = get('finally')
+            if value is not None:
+                obj.object_finally = [None if i0 is None else dispatch_Command__interfaces_alexa_presentation_aplt_command(i0) for i0 in value]
+            value = get('repeatCount')
+            if value is not None:
+                obj.repeat_count = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.catch
+        if value is not None:
+            result['catch'] = encode(value)
+        value = obj.commands
+        if value is not None:
+            result['commands'] = encode(value)
+        value = obj.object_finally
+        if value is not None:
+            result['finally'] = encode(value)
+        value = obj.repeat_count
+        if value is not None:
+            result['repeatCount'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command, encode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command = decode_model, encode_model
+
+
+decode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command = _lazy('decode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command', _bind_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command)
+encode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command = _lazy('encode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command', _bind_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command)
+
+
+def _bind_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command():
+    global decode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command, encode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.set_page_command import SetPageCommand as model
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.position import Position as enum0
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'when', 'componentId', 'position', 'value'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('position')
+            if value is not None:
+                obj.position = enum0(value)
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.position
+        if value is not None:
+            result['position'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command, encode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command = decode_model, encode_model
+
+
+decode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command = _lazy('decode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command', _bind_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command)
+encode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command = _lazy('encode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command', _bind_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command)
+
+
+def _bind_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command():
+    global decode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command, encode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.set_value_command import SetValueCommand as model
+    keys = frozenset(('type', 'delay', 'description', 'screenLock', 'when', 'componentId', 'property', 'value'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('delay')
+            if value is not None:
+                obj.delay = value if value.__class__ is int else _int(value)
+            value = get('description')
+            if value is not None:
+                obj.description = value if value.__class__ is str else _str(value)
+            value = get('screenLock')
+            if value is not None:
+                obj.screen_lock = value if value.__class__ is bool else _bool(value)
+            value = get('when')
+            if value is not None:
+                obj.when = value if value.__class__ is bool else _bool(value)
+            value = get('componentId')
+            if value is not None:
+                obj.component_id = value if value.__class__ is str else _str(value)
+            value = get('property')
+            if value is not None:
+                obj.object_property = value if value.__class__ is str else _str(value)
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.delay
+        if value is not None:
+            result['delay'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.description
+        if value is not None:
+            result['description'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.screen_lock
+        if value is not None:
+            result['screenLock'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.when
+        if value is not None:
+            result['when'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.component_id
+        if value is not None:
+            result['componentId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.object_property
+        if value is not None:
+            result['property'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command, encode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command = decode_model, encode_model
+
+
+decode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command = _lazy('decode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command', _bind_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command)
+encode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command = _lazy('encode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command', _bind_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command)
+
+
+def _bind_UserEvent__interfaces_alexa_presentation_aplt_user_event():
+    global decode_UserEvent__interfaces_alexa_presentation_aplt_user_event, encode_UserEvent__interfaces_alexa_presentation_aplt_user_event
+    from ask_sdk_model.interfaces.alexa.presentation.aplt.user_event import UserEvent as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token', 'arguments', 'source'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('arguments')
+            if value is not None:
+                obj.arguments = [None if i0 is None else i0 for i0 in value]
+            value = get('source')
+            if value is not None:
+                obj.source = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.arguments
+        if value is not None:
+            result['arguments'] = encode(value)
+        value = obj.source
+        if value is not None:
+            result['source'] = encode(value)
+        return result
+
+    decode_UserEvent__interfaces_alexa_presentation_aplt_user_event, encode_UserEvent__interfaces_alexa_presentation_aplt_user_event = decode_model, encode_model
+
+
+decode_UserEvent__interfaces_alexa_presentation_aplt_user_event = _lazy('decode_UserEvent__interfaces_alexa_presentation_aplt_user_event', _bind_UserEvent__interfaces_alexa_presentation_aplt_user_event)
+encode_UserEvent__interfaces_alexa_presentation_aplt_user_event = _lazy('encode_UserEvent__interfaces_alexa_presentation_aplt_user_event', _bind_UserEvent__interfaces_alexa_presentation_aplt_user_event)
+
+
+def _bind_AlexaPresentationHtmlInterface():
+    global decode_AlexaPresentationHtmlInterface, encode_AlexaPresentationHtmlInterface
+    from ask_sdk_model.interfaces.alexa.presentation.html.alexa_presentation_html_interface import AlexaPresentationHtmlInterface as model
+    keys = frozenset(('runtime',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('runtime')
+            if value is not None:
+                obj.runtime = decode_Runtime__interfaces_alexa_presentation_html_runtime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.runtime
+        if value is not None:
+            result['runtime'] = encode(value)
+        return result
+
+    decode_AlexaPresentationHtmlInterface, encode_AlexaPresentationHtmlInterface = decode_model, encode_model
+
+
+decode_AlexaPresentationHtmlInterface = _lazy('decode_AlexaPresentationHtmlInterface', _bind_AlexaPresentationHtmlInterface)
+encode_AlexaPresentationHtmlInterface = _lazy('encode_AlexaPresentationHtmlInterface', _bind_AlexaPresentationHtmlInterface)
+
+
+def _bind_Configuration():
+    global decode_Configuration, encode_Configuration
+    from ask_sdk_model.interfaces.alexa.presentation.html.configuration import Configuration as model
+    keys = frozenset(('timeoutInSeconds',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('timeoutInSeconds')
+            if value is not None:
+                obj.timeout_in_seconds = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.timeout_in_seconds
+        if value is not None:
+            result['timeoutInSeconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Configuration, encode_Configuration = decode_model, encode_model
+
+
+decode_Configuration = _lazy('decode_Configuration', _bind_Configuration)
+encode_Configuration = _lazy('encode_Configuration', _bind_Configuration)
+
+
+def _bind_HandleMessageDirective():
+    global decode_HandleMessageDirective, encode_HandleMessageDirective
+    from ask_sdk_model.interfaces.alexa.presentation.html.handle_message_directive import HandleMessageDirective as model
+    keys = frozenset(('type', 'message', 'transformers'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value
+            value = get('transformers')
+            if value is not None:
+                obj.transformers = [None if i0 is None else decode_Transformer(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = encode(value)
+        value = obj.transformers
+        if value is not None:
+            result['transformers'] = encode(value)
+        return result
+
+    decode_HandleMessageDirective, encode_HandleMessageDirective = decode_model, encode_model
+
+
+decode_HandleMessageDirective = _lazy('decode_HandleMessageDirective', _bind_HandleMessageDirective)
+encode_HandleMessageDirective = _lazy('encode_HandleMessageDirective', _bind_HandleMessageDirective)
+
+
+def _bind_MessageRequest():
+    global decode_MessageRequest, encode_MessageRequest
+    from ask_sdk_model.interfaces.alexa.presentation.html.message_request import MessageRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'message'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = encode(value)
+        return result
+
+    decode_MessageRequest, encode_MessageRequest = decode_model, encode_model
+
+
+decode_MessageRequest = _lazy('decode_MessageRequest', _bind_MessageRequest)
+encode_MessageRequest = _lazy('encode_MessageRequest', _bind_MessageRequest)
+
+
+def _bind_Runtime__interfaces_alexa_presentation_html_runtime():
+    global decode_Runtime__interfaces_alexa_presentation_html_runtime, encode_Runtime__interfaces_alexa_presentation_html_runtime
+    from ask_sdk_model.interfaces.alexa.presentation.html.runtime import Runtime as model
+    keys = frozenset(('maxVersion',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('maxVersion')
+            if value is not None:
+                obj.max_version = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.max_version
+        if value is not None:
+            result['maxVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Runtime__interfaces_alexa_presentation_html_runtime, encode_Runtime__interfaces_alexa_presentation_html_runtime = decode_model, encode_model
+
+
+decode_Runtime__interfaces_alexa_presentation_html_runtime = _lazy('decode_Runtime__interfaces_alexa_presentation_html_runtime', _bind_Runtime__interfaces_alexa_presentation_html_runtime)
+encode_Runtime__interfaces_alexa_presentation_html_runtime = _lazy('encode_Runtime__interfaces_alexa_presentation_html_runtime', _bind_Runtime__interfaces_alexa_presentation_html_runtime)
+
+
+def _bind_RuntimeError__interfaces_alexa_presentation_html_runtime_error():
+    global decode_RuntimeError__interfaces_alexa_presentation_html_runtime_error, encode_RuntimeError__interfaces_alexa_presentation_html_runtime_error
+    from ask_sdk_model.interfaces.alexa.presentation.html.runtime_error import RuntimeError as model
+    from ask_sdk_model.interfaces.alexa.presentation.html.runtime_error_reason import RuntimeErrorReason as enum0
+    keys = frozenset(('reason', 'message', 'code'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('reason')
+            if value is not None:
+                obj.reason = enum0(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            value = get('code')
+            if value is not None:
+                obj.code = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.reason
+        if value is not None:
+            result['reason'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.code
+        if value is not None:
+            result['code'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_RuntimeError__interfaces_alexa_presentation_html_runtime_error, encode_RuntimeError__interfaces_alexa_presentation_html_runtime_error = decode_model, encode_model
+
+
+decode_RuntimeError__interfaces_alexa_presentation_html_runtime_error = _lazy('decode_RuntimeError__interfaces_alexa_presentation_html_runtime_error', _bind_RuntimeError__interfaces_alexa_presentation_html_runtime_error)
+encode_RuntimeError__interfaces_alexa_presentation_html_runtime_error = _lazy('encode_RuntimeError__interfaces_alexa_presentation_html_runtime_error', _bind_RuntimeError__interfaces_alexa_presentation_html_runtime_error)
+
+
+def _bind_RuntimeErrorRequest():
+    global decode_RuntimeErrorRequest, encode_RuntimeErrorRequest
+    from ask_sdk_model.interfaces.alexa.presentation.html.runtime_error_request import RuntimeErrorRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'error'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('error')
+            if value is not None:
+                obj.error = decode_RuntimeError__interfaces_alexa_presentation_html_runtime_error(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.error
+        if value is not None:
+            result['error'] = encode(value)
+        return result
+
+    decode_RuntimeErrorRequest, encode_RuntimeErrorRequest = decode_model, encode_model
+
+
+decode_RuntimeErrorRequest = _lazy('decode_RuntimeErrorRequest', _bind_RuntimeErrorRequest)
+encode_RuntimeErrorRequest = _lazy('encode_RuntimeErrorRequest', _bind_RuntimeErrorRequest)
+
+
+def _bind_StartDirective():
+    global decode_StartDirective, encode_StartDirective
+    from ask_sdk_model.interfaces.alexa.presentation.html.start_directive import StartDirective as model
+    keys = frozenset(('type', 'data', 'transformers', 'request', 'configuration'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('data')
+            if value is not None:
+                obj.data = value
+            value = get('transformers')
+            if value is not None:
+                obj.transformers = [None if i0 is None else decode_Transformer(i0) for i0 in value]
+            value = get('request')
+            if value is not None:
+                obj.request = decode_StartRequest(value)
+            value = get('configuration')
+            if value is not None:
+                obj.configuration = decode_Configuration(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.data
+        if value is not None:
+            result['data'] = encode(value)
+        value = obj.transformers
+        if value is not None:
+            result['transformers'] = encode(value)
+        value = obj.request
+        if value is not None:
+            result['request'] = encode(value)
+        value = obj.configuration
+        if value is not None:
+            result['configuration'] = encode(value)
+        return result
+
+    decode_StartDirective, encode_StartDirective = decode_model, encode_model
+
+
+decode_StartDirective = _lazy('decode_StartDirective', _bind_StartDirective)
+encode_StartDirective = _lazy('encode_StartDirective', _bind_StartDirective)
+
+
+def _bind_StartRequest():
+    global decode_StartRequest, encode_StartRequest
+    from ask_sdk_model.interfaces.alexa.presentation.html.start_request import StartRequest as model
+    from ask_sdk_model.interfaces.alexa.presentation.html.start_request_method import StartRequestMethod as enum0
+    keys = frozenset(('method', 'uri', 'headers'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('method')
+            if value is not None:
+                obj.method = enum0(value)
+            value = get('uri')
+            if value is not None:
+                obj.uri = value if value.__class__ is str else _str(value)
+            value = get('headers')
+            if value is not None:
+                obj.headers = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.method
+        if value is not None:
+            result['method'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.uri
+        if value is not None:
+            result['uri'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.headers
+        if value is not None:
+            result['headers'] = encode(value)
+        return result
+
+    decode_StartRequest, encode_StartRequest = decode_model, encode_model
+
+
+decode_StartRequest = _lazy('decode_StartRequest', _bind_StartRequest)
+encode_StartRequest = _lazy('encode_StartRequest', _bind_StartRequest)
+
+
+def _bind_Transformer():
+    global decode_Transformer, encode_Transformer
+    from ask_sdk_model.interfaces.alexa.presentation.html.transformer import Transformer as model
+    from ask_sdk_model.interfaces.alexa.presentation.html.transformer_type import TransformerType as enum0
+    keys = frozenset(('transformer', 'inputPath', 'outputName'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('transformer')
+            if value is not None:
+                obj.transformer = enum0(value)
+            value = get('inputPath')
+            if value is not None:
+                obj.input_path = value if value.__class__ is str else _str(value)
+            value = get('outputName')
+            if value is not None:
+                obj.output_name = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.transformer
+        if value is not None:
+            result['transformer'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.input_path
+        if value is not None:
+            result['inputPath'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.output_name
+        if value is not None:
+            result['outputName'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Transformer, encode_Transformer = decode_model, encode_model
+
+
+decode_Transformer = _lazy('decode_Transformer', _bind_Transformer)
+encode_Transformer = _lazy('encode_Transformer', _bind_Transformer)
+
+
+def _bind_PresentationState():
+    global decode_PresentationState, encode_PresentationState
+    from ask_sdk_model.interfaces.alexa.presentation.presentation_state import PresentationState as model
+    keys = frozenset(('contexts',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('contexts')
+            if value is not None:
+                obj.contexts = [None if i0 is None else dispatch_PresentationStateContext(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.contexts
+        if value is not None:
+            result['contexts'] = encode(value)
+        return result
+
+    decode_PresentationState, encode_PresentationState = decode_model, encode_model
+
+
+decode_PresentationState = _lazy('decode_PresentationState', _bind_PresentationState)
+encode_PresentationState = _lazy('encode_PresentationState', _bind_PresentationState)
+
+
+def _bind_PresentationStateContext():
+    global decode_PresentationStateContext, encode_PresentationStateContext
+    from ask_sdk_model.interfaces.alexa.presentation.presentation_state_context import PresentationStateContext as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PresentationStateContext, encode_PresentationStateContext = decode_model, encode_model
+
+
+decode_PresentationStateContext = _lazy('decode_PresentationStateContext', _bind_PresentationStateContext)
+encode_PresentationStateContext = _lazy('encode_PresentationStateContext', _bind_PresentationStateContext)
+
+
+def _bind_GetSnapshotDirective():
+    global decode_GetSnapshotDirective, encode_GetSnapshotDirective
+    from ask_sdk_model.interfaces.alexa.smartvision.snapshotprovider.get_snapshot_directive import GetSnapshotDirective as model
+    keys = frozenset(('type', 'preferOnDemandSnapshot'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('preferOnDemandSnapshot')
+            if value is not None:
+                obj.prefer_on_demand_snapshot = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.prefer_on_demand_snapshot
+        if value is not None:
+            result['preferOnDemandSnapshot'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_GetSnapshotDirective, encode_GetSnapshotDirective = decode_model, encode_model
+
+
+decode_GetSnapshotDirective = _lazy('decode_GetSnapshotDirective', _bind_GetSnapshotDirective)
+encode_GetSnapshotDirective = _lazy('encode_GetSnapshotDirective', _bind_GetSnapshotDirective)
+
+
+def _bind_AppLinkInterface():
+    global decode_AppLinkInterface, encode_AppLinkInterface
+    from ask_sdk_model.interfaces.applink.app_link_interface import AppLinkInterface as model
+    keys = frozenset(('version',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('version')
+            if value is not None:
+                obj.version = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.version
+        if value is not None:
+            result['version'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_AppLinkInterface, encode_AppLinkInterface = decode_model, encode_model
+
+
+decode_AppLinkInterface = _lazy('decode_AppLinkInterface', _bind_AppLinkInterface)
+encode_AppLinkInterface = _lazy('encode_AppLinkInterface', _bind_AppLinkInterface)
+
+
+def _bind_AppLinkState():
+    global decode_AppLinkState, encode_AppLinkState
+    from ask_sdk_model.interfaces.applink.app_link_state import AppLinkState as model
+    from ask_sdk_model.interfaces.applink.catalog_types import CatalogTypes as enum0
+    keys = frozenset(('supportedCatalogTypes', 'directLaunch', 'sendToDevice'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('supportedCatalogTypes')
+            if value is not None:
+                obj.supported_catalog_types = [None if i0 is None else enum0(i0) for i0 in value]
+            value = get('directLaunch')
+            if value is not None:
+                obj.direct_launch = decode_DirectLaunch(value)
+            value = get('sendToDevice')
+            if value is not None:
+                obj.send_to_device = decode_SendToDevice(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.supported_catalog_types
+        if value is not None:
+            result['supportedCatalogTypes'] = encode(value)
+        value = obj.direct_launch
+        if value is not None:
+            result['directLaunch'] = encode(value)
+        value = obj.send_to_device
+        if value is not None:
+            result['sendToDevice'] = encode(value)
+        return result
+
+    decode_AppLinkState, encode_AppLinkState = decode_model, encode_model
+
+
+decode_AppLinkState = _lazy('decode_AppLinkState', _bind_AppLinkState)
+encode_AppLinkState = _lazy('encode_AppLinkState', _bind_AppLinkState)
+
+
+def _bind_DirectLaunch():
+    global decode_DirectLaunch, encode_DirectLaunch
+    from ask_sdk_model.interfaces.applink.direct_launch import DirectLaunch as model
+    keys = frozenset(('IOS_APP_STORE', 'GOOGLE_PLAY_STORE'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('IOS_APP_STORE')
+            if value is not None:
+                obj.ios_app_store = value
+            value = get('GOOGLE_PLAY_STORE')
+            if value is not None:
+                obj.google_play_store = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.ios_app_store
+        if value is not None:
+            result['IOS_APP_STORE'] = encode(value)
+        value = obj.google_play_store
+        if value is not None:
+            result['GOOGLE_PLAY_STORE'] = encode(value)
+        return result
+
+    decode_DirectLaunch, encode_DirectLaunch = decode_model, encode_model
+
+
+decode_DirectLaunch = _lazy('decode_DirectLaunch', _bind_DirectLaunch)
+encode_DirectLaunch = _lazy('encode_DirectLaunch', _bind_DirectLaunch)
+
+
+def _bind_SendToDevice():
+    global decode_SendToDevice, encode_SendToDevice
+    from ask_sdk_model.interfaces.applink.send_to_device import SendToDevice as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_SendToDevice, encode_SendToDevice = decode_model, encode_model
+
+
+decode_SendToDevice = _lazy('decode_SendToDevice', _bind_SendToDevice)
+encode_SendToDevice = _lazy('encode_SendToDevice', _bind_SendToDevice)
+
+
+def _bind_AudioItem():
+    global decode_AudioItem, encode_AudioItem
+    from ask_sdk_model.interfaces.audioplayer.audio_item import AudioItem as model
+    keys = frozenset(('stream', 'metadata'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('stream')
+            if value is not None:
+                obj.stream = decode_Stream(value)
+            value = get('metadata')
+            if value is not None:
+                obj.metadata = decode_AudioItemMetadata(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.stream
+        if value is not None:
+            result['stream'] = encode(value)
+        value = obj.metadata
+        if value is not None:
+            result['metadata'] = encode(value)
+        return result
+
+    decode_AudioItem, encode_AudioItem = decode_model, encode_model
+
+
+decode_AudioItem = _lazy('decode_AudioItem', _bind_AudioItem)
+encode_AudioItem = _lazy('encode_AudioItem', _bind_AudioItem)
+
+
+def _bind_AudioItemMetadata():
+    global decode_AudioItemMetadata, encode_AudioItemMetadata
+    from ask_sdk_model.interfaces.audioplayer.audio_item_metadata import AudioItemMetadata as model
+    keys = frozenset(('title', 'subtitle', 'art', 'backgroundImage'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('subtitle')
+            if value is not None:
+                obj.subtitle = value if value.__class__ is str else _str(value)
+            value = get('art')
+            if value is not None:
+                obj.art = decode_Image__interfaces_display_image(value)
+            value = get('backgroundImage')
+            if value is not None:
+                obj.background_image = decode_Image__interfaces_display_image(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.subtitle
+        if value is not None:
+            result['subtitle'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.art
+        if value is not None:
+            result['art'] = encode(value)
+        value = obj.background_image
+        if value is not None:
+            result['backgroundImage'] = encode(value)
+        return result
+
+    decode_AudioItemMetadata, encode_AudioItemMetadata = decode_model, encode_model
+
+
+decode_AudioItemMetadata = _lazy('decode_AudioItemMetadata', _bind_AudioItemMetadata)
+encode_AudioItemMetadata = _lazy('encode_AudioItemMetadata', _bind_AudioItemMetadata)
+
+
+def _bind_AudioPlayerInterface():
+    global decode_AudioPlayerInterface, encode_AudioPlayerInterface
+    from ask_sdk_model.interfaces.audioplayer.audio_player_interface import AudioPlayerInterface as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_AudioPlayerInterface, encode_AudioPlayerInterface = decode_model, encode_model
+
+
+decode_AudioPlayerInterface = _lazy('decode_AudioPlayerInterface', _bind_AudioPlayerInterface)
+encode_AudioPlayerInterface = _lazy('encode_AudioPlayerInterface', _bind_AudioPlayerInterface)
+
+
+def _bind_AudioPlayerState():
+    global decode_AudioPlayerState, encode_AudioPlayerState
+    from ask_sdk_model.interfaces.audioplayer.audio_player_state import AudioPlayerState as model
+    from ask_sdk_model.interfaces.audioplayer.player_activity import PlayerActivity as enum0
+    keys = frozenset(('offsetInMilliseconds', 'token', 'playerActivity'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('offsetInMilliseconds')
+            if value is not None:
+                obj.offset_in_milliseconds = value if value.__class__ is int else _int(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('playerActivity')
+            if value is not None:
+                obj.player_activity = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.offset_in_milliseconds
+        if value is not None:
+            result['offsetInMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.player_activity
+        if value is not None:
+            result['playerActivity'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_AudioPlayerState, encode_AudioPlayerState = decode_model, encode_model
+
+
+decode_AudioPlayerState = _lazy('decode_AudioPlayerState', _bind_AudioPlayerState)
+encode_AudioPlayerState = _lazy('encode_AudioPlayerState', _bind_AudioPlayerState)
+
+
+def _bind_CaptionData():
+    global decode_CaptionData, encode_CaptionData
+    from ask_sdk_model.interfaces.audioplayer.caption_data import CaptionData as model
+    from ask_sdk_model.interfaces.audioplayer.caption_type import CaptionType as enum0
+    keys = frozenset(('content', 'type'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('content')
+            if value is not None:
+                obj.content = value if value.__class__ is str else _str(value)
+            value = get('type')
+            if value is not None:
+                obj.object_type = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.content
+        if value is not None:
+            result['content'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_CaptionData, encode_CaptionData = decode_model, encode_model
+
+
+decode_CaptionData = _lazy('decode_CaptionData', _bind_CaptionData)
+encode_CaptionData = _lazy('encode_CaptionData', _bind_CaptionData)
+
+
+def _bind_ClearQueueDirective():
+    global decode_ClearQueueDirective, encode_ClearQueueDirective
+    from ask_sdk_model.interfaces.audioplayer.clear_queue_directive import ClearQueueDirective as model
+    from ask_sdk_model.interfaces.audioplayer.clear_behavior import ClearBehavior as enum0
+    keys = frozenset(('type', 'clearBehavior'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('clearBehavior')
+            if value is not None:
+                obj.clear_behavior = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.clear_behavior
+        if value is not None:
+            result['clearBehavior'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_ClearQueueDirective, encode_ClearQueueDirective = decode_model, encode_model
+
+
+decode_ClearQueueDirective = _lazy('decode_ClearQueueDirective', _bind_ClearQueueDirective)
+encode_ClearQueueDirective = _lazy('encode_ClearQueueDirective', _bind_ClearQueueDirective)
+
+
+def _bind_CurrentPlaybackState():
+    global decode_CurrentPlaybackState, encode_CurrentPlaybackState
+    from ask_sdk_model.interfaces.audioplayer.current_playback_state import CurrentPlaybackState as model
+    from ask_sdk_model.interfaces.audioplayer.player_activity import PlayerActivity as enum0
+    keys = frozenset(('offsetInMilliseconds', 'playerActivity', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('offsetInMilliseconds')
+            if value is not None:
+                obj.offset_in_milliseconds = value if value.__class__ is int else _int(value)
+            value = get('playerActivity')
+            if value is not None:
+                obj.player_activity = enum0(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.offset_in_milliseconds
+        if value is not None:
+            result['offsetInMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.player_activity
+        if value is not None:
+            result['playerActivity'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_CurrentPlaybackState, encode_CurrentPlaybackState = decode_model, encode_model
+
+
+decode_CurrentPlaybackState = _lazy('decode_CurrentPlaybackState', _bind_CurrentPlaybackState)
+encode_CurrentPlaybackState = _lazy('encode_CurrentPlaybackState', _bind_CurrentPlaybackState)
+
+
+def _bind_Error__interfaces_audioplayer_error():
+    global decode_Error__interfaces_audioplayer_error, encode_Error__interfaces_audioplayer_error
+    from ask_sdk_model.interfaces.audioplayer.error import Error as model
+    from ask_sdk_model.interfaces.audioplayer.error_type import ErrorType as enum0
+    keys = frozenset(('message', 'type'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            value = get('type')
+            if value is not None:
+                obj.object_type = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_Error__interfaces_audioplayer_error, encode_Error__interfaces_audioplayer_error = decode_model, encode_model
+
+
+decode_Error__interfaces_audioplayer_error = _lazy('decode_Error__interfaces_audioplayer_error', _bind_Error__interfaces_audioplayer_error)
+encode_Error__interfaces_audioplayer_error = _lazy('encode_Error__interfaces_audioplayer_error', _bind_Error__interfaces_audioplayer_error)
+
+
+def _bind_PlayDirective():
+    global decode_PlayDirective, encode_PlayDirective
+    from ask_sdk_model.interfaces.audioplayer.play_directive import PlayDirective as model
+    from ask_sdk_model.interfaces.audioplayer.play_behavior import PlayBehavior as enum0
+    keys = frozenset(('type', 'playBehavior', 'audioItem'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('playBehavior')
+            if value is not None:
+                obj.play_behavior = enum0(value)
+            value = get('audioItem')
+            if value is not None:
+                obj.audio_item = decode_AudioItem(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.play_behavior
+        if value is not None:
+            result['playBehavior'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.audio_item
+        if value is not None:
+            result['audioItem'] = encode(value)
+        return result
+
+    decode_PlayDirective, encode_PlayDirective = decode_model, encode_model
+
+
+decode_PlayDirective = _lazy('decode_PlayDirective', _bind_PlayDirective)
+encode_PlayDirective = _lazy('encode_PlayDirective', _bind_PlayDirective)
+
+
+def _bind_PlaybackFailedRequest():
+    global decode_PlaybackFailedRequest, encode_PlaybackFailedRequest
+    from ask_sdk_model.interfaces.audioplayer.playback_failed_request import PlaybackFailedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'currentPlaybackState', 'error', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('currentPlaybackState')
+            if value is not None:
+                obj.current_playback_state = decode_CurrentPlaybackState(value)
+            value = get('error')
+            if value is not None:
+                obj.error = decode_Error__interfaces_audioplayer_error(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.current_playback_state
+        if value is not None:
+            result['currentPlaybackState'] = encode(value)
+        value = obj.error
+        if value is not None:
+            result['error'] = encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PlaybackFailedRequest, encode_PlaybackFailedRequest = decode_model, encode_model
+
+
+decode_PlaybackFailedRequest = _lazy('decode_PlaybackFailedRequest', _bind_PlaybackFailedRequest)
+encode_PlaybackFailedRequest = _lazy('encode_PlaybackFailedRequest', _bind_PlaybackFailedRequest)
+
+
+def _bind_PlaybackFinishedRequest():
+    global decode_PlaybackFinishedRequest, encode_PlaybackFinishedRequest
+    from ask_sdk_model.interfaces.audioplayer.playback_finished_request import PlaybackFinishedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'offsetInMilliseconds', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('offsetInMilliseconds')
+            if value is not None:
+                obj.offset_in_milliseconds = value if value.__class__ is int else _int(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.offset_in_milliseconds
+        if value is not None:
+            result['offsetInMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PlaybackFinishedRequest, encode_PlaybackFinishedRequest = decode_model, encode_model
+
+
+decode_PlaybackFinishedRequest = _lazy('decode_PlaybackFinishedRequest', _bind_PlaybackFinishedRequest)
+encode_PlaybackFinishedRequest = _lazy('encode_PlaybackFinishedRequest', _bind_PlaybackFinishedRequest)
+
+
+def _bind_PlaybackNearlyFinishedRequest():
+    global decode_PlaybackNearlyFinishedRequest, encode_PlaybackNearlyFinishedRequest
+    from ask_sdk_model.interfaces.audioplayer.playback_nearly_finished_request import PlaybackNearlyFinishedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'offsetInMilliseconds', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('offsetInMilliseconds')
+            if value is not None:
+                obj.offset_in_milliseconds = value if value.__class__ is int else _int(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.offset_in_milliseconds
+        if value is not None:
+            result['offsetInMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PlaybackNearlyFinishedRequest, encode_PlaybackNearlyFinishedRequest = decode_model, encode_model
+
+
+decode_PlaybackNearlyFinishedRequest = _lazy('decode_PlaybackNearlyFinishedRequest', _bind_PlaybackNearlyFinishedRequest)
+encode_PlaybackNearlyFinishedRequest = _lazy('encode_PlaybackNearlyFinishedRequest', _bind_PlaybackNearlyFinishedRequest)
+
+
+def _bind_PlaybackStartedRequest():
+    global decode_PlaybackStartedRequest, encode_PlaybackStartedRequest
+    from ask_sdk_model.interfaces.audioplayer.playback_started_request import PlaybackStartedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'offsetInMilliseconds', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('offsetInMilliseconds')
+            if value is not None:
+                obj.offset_in_milliseconds = value if value.__class__ is int else _int(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.offset_in_milliseconds
+        if value is not None:
+            result['offsetInMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PlaybackStartedRequest, encode_PlaybackStartedRequest = decode_model, encode_model
+
+
+decode_PlaybackStartedRequest = _lazy('decode_PlaybackStartedRequest', _bind_PlaybackStartedRequest)
+encode_PlaybackStartedRequest = _lazy('encode_PlaybackStartedRequest', _bind_PlaybackStartedRequest)
+
+
+def _bind_PlaybackStoppedRequest():
+    global decode_PlaybackStoppedRequest, encode_PlaybackStoppedRequest
+    from ask_sdk_model.interfaces.audioplayer.playback_stopped_request import PlaybackStoppedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'offsetInMilliseconds', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('offsetInMilliseconds')
+            if value is not None:
+                obj.offset_in_milliseconds = value if value.__class__ is int else _int(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.offset_in_milliseconds
+        if value is not None:
+            result['offsetInMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PlaybackStoppedRequest, encode_PlaybackStoppedRequest = decode_model, encode_model
+
+
+decode_PlaybackStoppedRequest = _lazy('decode_PlaybackStoppedRequest', _bind_PlaybackStoppedRequest)
+encode_PlaybackStoppedRequest = _lazy('encode_PlaybackStoppedRequest', _bind_PlaybackStoppedRequest)
+
+
+def _bind_StopDirective():
+    global decode_StopDirective, encode_StopDirective
+    from ask_sdk_model.interfaces.audioplayer.stop_directive import StopDirective as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_StopDirective, encode_StopDirective = decode_model, encode_model
+
+
+decode_StopDirective = _lazy('decode_StopDirective', _bind_StopDirective)
+encode_StopDirective = _lazy('encode_StopDirective', _bind_StopDirective)
+
+
+def _bind_Stream():
+    global decode_Stream, encode_Stream
+    from ask_sdk_model.interfaces.audioplayer.stream import Stream as model
+    keys = frozenset(('expectedPreviousToken', 'token', 'url', 'offsetInMilliseconds', 'captionData'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('expectedPreviousToken')
+            if value is not None:
+                obj.expected_previous_token = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('url')
+            if value is not None:
+                obj.url = value if value.__class__ is str else _str(value)
+            value = get('offsetInMilliseconds')
+            if value is not None:
+                obj.offset_in_milliseconds = value if value.__class__ is int else _int(value)
+            value = get('captionData')
+            if value is not None:
+                obj.caption_data = decode_CaptionData(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.expected_previous_token
+        if value is not None:
+            result['expectedPreviousToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.url
+        if value is not None:
+            result['url'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.offset_in_milliseconds
+        if value is not None:
+            result['offsetInMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.caption_data
+        if value is not None:
+            result['captionData'] = encode(value)
+        return result
+
+    decode_Stream, encode_Stream = decode_model, encode_model
+
+
+decode_Stream = _lazy('decode_Stream', _bind_Stream)
+encode_Stream = _lazy('encode_Stream', _bind_Stream)
+
+
+def _bind_AutomotiveState():
+    global decode_AutomotiveState, encode_AutomotiveState
+    from ask_sdk_model.interfaces.automotive.automotive_state import AutomotiveState as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_AutomotiveState, encode_AutomotiveState = decode_model, encode_model
+
+
+decode_AutomotiveState = _lazy('decode_AutomotiveState', _bind_AutomotiveState)
+encode_AutomotiveState = _lazy('encode_AutomotiveState', _bind_AutomotiveState)
+
+
+def _bind_ConnectionsRequest():
+    global decode_ConnectionsRequest, encode_ConnectionsRequest
+    from ask_sdk_model.interfaces.connections.connections_request import ConnectionsRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'name', 'payload'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('payload')
+            if value is not None:
+                obj.payload = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.payload
+        if value is not None:
+            result['payload'] = encode(value)
+        return result
+
+    decode_ConnectionsRequest, encode_ConnectionsRequest = decode_model, encode_model
+
+
+decode_ConnectionsRequest = _lazy('decode_ConnectionsRequest', _bind_ConnectionsRequest)
+encode_ConnectionsRequest = _lazy('encode_ConnectionsRequest', _bind_ConnectionsRequest)
+
+
+def _bind_ConnectionsResponse():
+    global decode_ConnectionsResponse, encode_ConnectionsResponse
+    from ask_sdk_model.interfaces.connections.connections_response import ConnectionsResponse as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'status', 'name', 'payload', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('status')
+            if value is not None:
+                obj.status = decode_ConnectionsStatus(value)
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('payload')
+            if value is not None:
+                obj.payload = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.status
+        if value is not None:
+            result['status'] = encode(value)
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.payload
+        if value is not None:
+            result['payload'] = encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ConnectionsResponse, encode_ConnectionsResponse = decode_model, encode_model
+
+
+decode_ConnectionsResponse = _lazy('decode_ConnectionsResponse', _bind_ConnectionsResponse)
+encode_ConnectionsResponse = _lazy('encode_ConnectionsResponse', _bind_ConnectionsResponse)
+
+
+def _bind_ConnectionsStatus():
+    global decode_ConnectionsStatus, encode_ConnectionsStatus
+    from ask_sdk_model.interfaces.connections.connections_status import ConnectionsStatus as model
+    keys = frozenset(('code', 'message'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('code')
+            if value is not None:
+                obj.code = value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.code
+        if value is not None:
+            result['code'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ConnectionsStatus, encode_ConnectionsStatus = decode_model, encode_model
+
+
+decode_ConnectionsStatus = _lazy('decode_ConnectionsStatus', _bind_ConnectionsStatus)
+encode_ConnectionsStatus = _lazy('encode_ConnectionsStatus', _bind_ConnectionsStatus)
+
+
+def _bind_SendRequestDirective():
+    global decode_SendRequestDirective, encode_SendRequestDirective
+    from ask_sdk_model.interfaces.connections.send_request_directive import SendRequestDirective as model
+    keys = frozenset(('type', 'name', 'payload', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('payload')
+            if value is not None:
+                obj.payload = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.payload
+        if value is not None:
+            result['payload'] = encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SendRequestDirective, encode_SendRequestDirective = decode_model, encode_model
+
+
+decode_SendRequestDirective = _lazy('decode_SendRequestDirective', _bind_SendRequestDirective)
+encode_SendRequestDirective = _lazy('encode_SendRequestDirective', _bind_SendRequestDirective)
+
+
+def _bind_SendResponseDirective():
+    global decode_SendResponseDirective, encode_SendResponseDirective
+    from ask_sdk_model.interfaces.connections.send_response_directive import SendResponseDirective as model
+    keys = frozenset(('type', 'status', 'payload'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('status')
+            if value is not None:
+                obj.status = decode_ConnectionsStatus(value)
+            value = get('payload')
+            if value is not None:
+                obj.payload = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.status
+        if value is not None:
+            result['status'] = encode(value)
+        value = obj.payload
+        if value is not None:
+            result['payload'] = encode(value)
+        return result
+
+    decode_SendResponseDirective, encode_SendResponseDirective = decode_model, encode_model
+
+
+decode_SendResponseDirective = _lazy('decode_SendResponseDirective', _bind_SendResponseDirective)
+encode_SendResponseDirective = _lazy('encode_SendResponseDirective', _bind_SendResponseDirective)
+
+
+def _bind_StartConnectionDirective():
+    global decode_StartConnectionDirective, encode_StartConnectionDirective
+    from ask_sdk_model.interfaces.connections.v1.start_connection_directive import StartConnectionDirective as model
+    from ask_sdk_model.interfaces.connections.on_completion import OnCompletion as enum0
+    keys = frozenset(('type', 'uri', 'onCompletion', 'input', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('uri')
+            if value is not None:
+                obj.uri = value if value.__class__ is str else _str(value)
+            value = get('onCompletion')
+            if value is not None:
+                obj.on_completion = enum0(value)
+            value = get('input')
+            if value is not None:
+                obj.input = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.uri
+        if value is not None:
+            result['uri'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.on_completion
+        if value is not None:
+            result['onCompletion'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.input
+        if value is not None:
+            result['input'] = encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_StartConnectionDirective, encode_StartConnectionDirective = decode_model, encode_model
+
+
+decode_StartConnectionDirective = _lazy('decode_StartConnectionDirective', _bind_StartConnectionDirective)
+encode_StartConnectionDirective = _lazy('encode_StartConnectionDirective', _bind_StartConnectionDirective)
+
+
+def _bind_APIInvocationRequest():
+    global decode_APIInvocationRequest, encode_APIInvocationRequest
+    from ask_sdk_model.interfaces.conversations.api_invocation_request import APIInvocationRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'apiRequest'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('apiRequest')
+            if value is not None:
+                obj.api_request = decode_APIRequest(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.api_request
+        if value is not None:
+            result['apiRequest'] = encode(value)
+        return result
+
+    decode_APIInvocationRequest, encode_APIInvocationRequest = decode_model, encode_model
+
+
+decode_APIInvocationRequest = _lazy('decode_APIInvocationRequest', _bind_APIInvocationRequest)
+encode_APIInvocationRequest = _lazy('encode_APIInvocationRequest', _bind_APIInvocationRequest)
+
+
+def _bind_APIRequest():
+    global decode_APIRequest, encode_APIRequest
+    from ask_sdk_model.interfaces.conversations.api_request import APIRequest as model
+    keys = frozenset(('name', 'arguments', 'slots'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('arguments')
+            if value is not None:
+                obj.arguments = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('slots')
+            if value is not None:
+                obj.slots = {k0: None if v0 is None else dispatch_SlotValue(v0) for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.arguments
+        if value is not None:
+            result['arguments'] = encode(value)
+        value = obj.slots
+        if value is not None:
+            result['slots'] = encode(value)
+        return result
+
+    decode_APIRequest, encode_APIRequest = decode_model, encode_model
+
+
+decode_APIRequest = _lazy('decode_APIRequest', _bind_APIRequest)
+encode_APIRequest = _lazy('encode_APIRequest', _bind_APIRequest)
+
+
+def _bind_ResetContextDirective():
+    global decode_ResetContextDirective, encode_ResetContextDirective
+    from ask_sdk_model.interfaces.conversations.reset_context_directive import ResetContextDirective as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ResetContextDirective, encode_ResetContextDirective = decode_model, encode_model
+
+
+decode_ResetContextDirective = _lazy('decode_ResetContextDirective', _bind_ResetContextDirective)
+encode_ResetContextDirective = _lazy('encode_ResetContextDirective', _bind_ResetContextDirective)
+
+
+def _bind_Endpoint():
+    global decode_Endpoint, encode_Endpoint
+    from ask_sdk_model.interfaces.custom_interface_controller.endpoint import Endpoint as model
+    keys = frozenset(('endpointId',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('endpointId')
+            if value is not None:
+                obj.endpoint_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.endpoint_id
+        if value is not None:
+            result['endpointId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Endpoint, encode_Endpoint = decode_model, encode_model
+
+
+decode_Endpoint = _lazy('decode_Endpoint', _bind_Endpoint)
+encode_Endpoint = _lazy('encode_Endpoint', _bind_Endpoint)
+
+
+def _bind_Event__interfaces_custom_interface_controller_event():
+    global decode_Event__interfaces_custom_interface_controller_event, encode_Event__interfaces_custom_interface_controller_event
+    from ask_sdk_model.interfaces.custom_interface_controller.event import Event as model
+    keys = frozenset(('header', 'payload', 'endpoint'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('header')
+            if value is not None:
+                obj.header = decode_Header(value)
+            value = get('payload')
+            if value is not None:
+                obj.payload = value
+            value = get('endpoint')
+            if value is not None:
+                obj.endpoint = decode_Endpoint(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.header
+        if value is not None:
+            result['header'] = encode(value)
+        value = obj.payload
+        if value is not None:
+            result['payload'] = encode(value)
+        value = obj.endpoint
+        if value is not None:
+            result['endpoint'] = encode(value)
+        return result
+
+    decode_Event__interfaces_custom_interface_controller_event, encode_Event__interfaces_custom_interface_controller_event = decode_model, encode_model
+
+
+decode_Event__interfaces_custom_interface_controller_event = _lazy('decode_Event__interfaces_custom_interface_controller_event', _bind_Event__interfaces_custom_interface_controller_event)
+encode_Event__interfaces_custom_interface_controller_event = _lazy('encode_Event__interfaces_custom_interface_controller_event', _bind_Event__interfaces_custom_interface_controller_event)
+
+
+def _bind_EventFilter():
+    global decode_EventFilter, encode_EventFilter
+    from ask_sdk_model.interfaces.custom_interface_controller.event_filter import EventFilter as model
+    from ask_sdk_model.interfaces.custom_interface_controller.filter_match_action import FilterMatchAction as enum0
+    keys = frozenset(('filterExpression', 'filterMatchAction'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('filterExpression')
+            if value is not None:
+                obj.filter_expression = value
+            value = get('filterMatchAction')
+            if value is not None:
+                obj.filter_match_action = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.filter_expression
+        if value is not None:
+            result['filterExpression'] = encode(value)
+        value = obj.filter_match_action
+        if value is not None:
+            result['filterMatchAction'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_EventFilter, encode_EventFilter = decode_model, encode_model
+
+
+decode_EventFilter = _lazy('decode_EventFilter', _bind_EventFilter)
+encode_EventFilter = _lazy('encode_EventFilter', _bind_EventFilter)
+
+
+def _bind_EventsReceivedRequest():
+    global decode_EventsReceivedRequest, encode_EventsReceivedRequest
+    from ask_sdk_model.interfaces.custom_interface_controller.events_received_request import EventsReceivedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token', 'events'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('events')
+            if value is not None:
+                obj.events = [None if i0 is None else decode_Event__interfaces_custom_interface_controller_event(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.events
+        if value is not None:
+            result['events'] = encode(value)
+        return result
+
+    decode_EventsReceivedRequest, encode_EventsReceivedRequest = decode_model, encode_model
+
+
+decode_EventsReceivedRequest = _lazy('decode_EventsReceivedRequest', _bind_EventsReceivedRequest)
+encode_EventsReceivedRequest = _lazy('encode_EventsReceivedRequest', _bind_EventsReceivedRequest)
+
+
+def _bind_Expiration():
+    global decode_Expiration, encode_Expiration
+    from ask_sdk_model.interfaces.custom_interface_controller.expiration import Expiration as model
+    keys = frozenset(('durationInMilliseconds', 'expirationPayload'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('durationInMilliseconds')
+            if value is not None:
+                obj.duration_in_milliseconds = value if value.__class__ is int else _int(value)
+            value = get('expirationPayload')
+            if value is not None:
+                obj.expiration_payload = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.duration_in_milliseconds
+        if value is not None:
+            result['durationInMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.expiration_payload
+        if value is not None:
+            result['expirationPayload'] = encode(value)
+        return result
+
+    decode_Expiration, encode_Expiration = decode_model, encode_model
+
+
+decode_Expiration = _lazy('decode_Expiration', _bind_Expiration)
+encode_Expiration = _lazy('encode_Expiration', _bind_Expiration)
+
+
+def _bind_ExpiredRequest():
+    global decode_ExpiredRequest, encode_ExpiredRequest
+    from ask_sdk_model.interfaces.custom_interface_controller.expired_request import ExpiredRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token', 'expirationPayload'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('expirationPayload')
+            if value is not None:
+                obj.expiration_payload = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.expiration_payload
+        if value is not None:
+            result['expirationPayload'] = encode(value)
+        return result
+
+    decode_ExpiredRequest, encode_ExpiredRequest = decode_model, encode_model
+
+
+decode_ExpiredRequest = _lazy('decode_ExpiredRequest', _bind_ExpiredRequest)
+encode_ExpiredRequest = _lazy('encode_ExpiredRequest', _bind_ExpiredRequest)
+
+
+def _bind_Header():
+    global decode_Header, encode_Header
+    from ask_sdk_model.interfaces.custom_interface_controller.header import Header as model
+    keys = frozenset(('namespace', 'name'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('namespace')
+            if value is not None:
+                obj.namespace = value if value.__class__ is str else _str(value)
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.namespace
+        if value is not None:
+            result['namespace'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Header, encode_Header = decode_model, encode_model
+
+
+decode_Header = _lazy('decode_Header', _bind_Header)
+encode_Header = _lazy('encode_Header', _bind_Header)
+
+
+def _bind_SendDirectiveDirective():
+    global decode_SendDirectiveDirective, encode_SendDirectiveDirective
+    from ask_sdk_model.interfaces.custom_interface_controller.send_directive_directive import SendDirectiveDirective as model
+    keys = frozenset(('type', 'header', 'payload', 'endpoint'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('header')
+            if value is not None:
+                obj.header = decode_Header(value)
+            value = get('payload')
+            if value is not None:
+                obj.payload = value
+            value = get('endpoint')
+            if value is not None:
+                obj.endpoint = decode_Endpoint(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.header
+        if value is not None:
+            result['header'] = encode(value)
+        value = obj.payload
+        if value is not None:
+            result['payload'] = encode(value)
+        value = obj.endpoint
+        if value is not None:
+            result['endpoint'] = encode(value)
+        return result
+
+    decode_SendDirectiveDirective, encode_SendDirectiveDirective = decode_model, encode_model
+
+
+decode_SendDirectiveDirective = _lazy('decode_SendDirectiveDirective', _bind_SendDirectiveDirective)
+encode_SendDirectiveDirective = _lazy('encode_SendDirectiveDirective', _bind_SendDirectiveDirective)
+
+
+def _bind_StartEventHandlerDirective():
+    global decode_StartEventHandlerDirective, encode_StartEventHandlerDirective
+    from ask_sdk_model.interfaces.custom_interface_controller.start_event_handler_directive import StartEventHandlerDirective as model
+    keys = frozenset(('type', 'token', 'eventFilter', 'expiration'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('eventFilter')
+            if value is not None:
+                obj.event_filter = decode_EventFilter(value)
+            value = get('expiration')
+            if value is not None:
+                obj.expiration = decode_Expiration(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.event_filter
+        if value is not None:
+            result['eventFilter'] = encode(value)
+        value = obj.expiration
+        if value is not None:
+            result['expiration'] = encode(value)
+        return result
+
+    decode_StartEventHandlerDirective, encode_StartEventHandlerDirective = decode_model, encode_model
+
+
+decode_StartEventHandlerDirective = _lazy('decode_StartEventHandlerDirective', _bind_StartEventHandlerDirective)
+encode_StartEventHandlerDirective = _lazy('encode_StartEventHandlerDirective', _bind_StartEventHandlerDirective)
+
+
+def _bind_StopEventHandlerDirective():
+    global decode_StopEventHandlerDirective, encode_StopEventHandlerDirective
+    from ask_sdk_model.interfaces.custom_interface_controller.stop_event_handler_directive import StopEventHandlerDirective as model
+    keys = frozenset(('type', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_StopEventHandlerDirective, encode_StopEventHandlerDirective = decode_model, encode_model
+
+
+decode_StopEventHandlerDirective = _lazy('decode_StopEventHandlerDirective', _bind_StopEventHandlerDirective)
+encode_StopEventHandlerDirective = _lazy('encode_StopEventHandlerDirective', _bind_StopEventHandlerDirective)
+
+
+def _bind_BodyTemplate1():
+    global decode_BodyTemplate1, encode_BodyTemplate1
+    from ask_sdk_model.interfaces.display.body_template1 import BodyTemplate1 as model
+    from ask_sdk_model.interfaces.display.back_button_behavior import BackButtonBehavior as enum0
+    keys = frozenset(('type', 'token', 'backButton', 'backgroundImage', 'title', 'textContent'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('backButton')
+            if value is not None:
+                obj.back_button = enum0(value)
+            value = get('backgroundImage')
+            if value is not None:
+                obj.background_image = decode_Image__interfaces_display_image(value)
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('textContent')
+            if value is not None:
+                obj.text_content = decode_TextContent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.back_button
+        if value is not None:
+            result['backButton'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.background_image
+        if value is not None:
+            result['backgroundImage'] = encode(value)
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.text_content
+        if value is not None:
+            result['textContent'] = encode(value)
+        return result
+
+    decode_BodyTemplate1, encode_BodyTemplate1 = decode_model, encode_model
+
+
+decode_BodyTemplate1 = _lazy('decode_BodyTemplate1', _bind_BodyTemplate1)
+encode_BodyTemplate1 = _lazy('encode_BodyTemplate1', _bind_BodyTemplate1)
+
+
+def _bind_BodyTemplate2():
+    global decode_BodyTemplate2, encode_BodyTemplate2
+    from ask_sdk_model.interfaces.display.body_template2 import BodyTemplate2 as model
+    from ask_sdk_model.interfaces.display.back_button_behavior import BackButtonBehavior as enum0
+    keys = frozenset(('type', 'token', 'backButton', 'backgroundImage', 'image', 'title', 'textContent'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('backButton')
+            if value is not None:
+                obj.back_button = enum0(value)
+            value = get('backgroundImage')
+            if value is not None:
+                obj.background_image = decode_Image__interfaces_display_image(value)
+            value = get('image')
+            if value is not None:
+                obj.image = decode_Image__interfaces_display_image(value)
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('textContent')
+            if value is not None:
+                obj.text_content = decode_TextContent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.back_button
+        if value is not None:
+            result['backButton'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.background_image
+        if value is not None:
+            result['backgroundImage'] = encode(value)
+        value = obj.image
+        if value is not None:
+            result['image'] = encode(value)
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.text_content
+        if value is not None:
+            result['textContent'] = encode(value)
+        return result
+
+    decode_BodyTemplate2, encode_BodyTemplate2 = decode_model, encode_model
+
+
+decode_BodyTemplate2 = _lazy('decode_BodyTemplate2', _bind_BodyTemplate2)
+encode_BodyTemplate2 = _lazy('encode_BodyTemplate2', _bind_BodyTemplate2)
+
+
+def _bind_BodyTemplate3():
+    global decode_BodyTemplate3, encode_BodyTemplate3
+    from ask_sdk_model.interfaces.display.body_template3 import BodyTemplate3 as model
+    from ask_sdk_model.interfaces.display.back_button_behavior import BackButtonBehavior as enum0
+    keys = frozenset(('type', 'token', 'backButton', 'backgroundImage', 'image', 'title', 'textContent'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('backButton')
+            if value is not None:
+                obj.back_button = enum0(value)
+            value = get('backgroundImage')
+            if value is not None:
+                obj.background_image = decode_Image__interfaces_display_image(value)
+            value = get('image')
+            if value is not None:
+                obj.image = decode_Image__interfaces_display_image(value)
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('textContent')
+            if value is not None:
+                obj.text_content = decode_TextContent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.back_button
+        if value is not None:
+            result['backButton'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.background_image
+        if value is not None:
+            result['backgroundImage'] = encode(value)
+        value = obj.image
+        if value is not None:
+            result['image'] = encode(value)
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.text_content
+        if value is not None:
+            result['textContent'] = encode(value)
+        return result
+
+    decode_BodyTemplate3, encode_BodyTemplate3 = decode_model, encode_model
+
+
+decode_BodyTemplate3 = _lazy('decode_BodyTemplate3', _bind_BodyTemplate3)
+encode_BodyTemplate3 = _lazy('encode_BodyTemplate3', _bind_BodyTemplate3)
+
+
+def _bind_BodyTemplate6():
+    global decode_BodyTemplate6, encode_BodyTemplate6
+    from ask_sdk_model.interfaces.display.body_template6 import BodyTemplate6 as model
+    from ask_sdk_model.interfaces.display.back_button_behavior import BackButtonBehavior as enum0
+    keys = frozenset(('type', 'token', 'backButton', 'backgroundImage', 'textContent', 'image'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('backButton')
+            if value is not None:
+                obj.back_button = enum0(value)
+            value = get('backgroundImage')
+            if value is not None:
+                obj.background_image = decode_Image__interfaces_display_image(value)
+            value = get('textContent')
+            if value is not None:
+                obj.text_content = decode_TextContent(value)
+            value = get('image')
+            if value is not None:
+                obj.image = decode_Image__interfaces_display_image(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.back_button
+        if value is not None:
+            result['backButton'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.background_image
+        if value is not None:
+            result['backgroundImage'] = encode(value)
+        value = obj.text_content
+        if value is not None:
+            result['textContent'] = encode(value)
+        value = obj.image
+        if value is not None:
+            result['image'] = encode(value)
+        return result
+
+    decode_BodyTemplate6, encode_BodyTemplate6 = decode_model, encode_model
+
+
+decode_BodyTemplate6 = _lazy('decode_BodyTemplate6', _bind_BodyTemplate6)
+encode_BodyTemplate6 = _lazy('encode_BodyTemplate6', _bind_BodyTemplate6)
+
+
+def _bind_BodyTemplate7():
+    global decode_BodyTemplate7, encode_BodyTemplate7
+    from ask_sdk_model.interfaces.display.body_template7 import BodyTemplate7 as model
+    from ask_sdk_model.interfaces.display.back_button_behavior import BackButtonBehavior as enum0
+    keys = frozenset(('type', 'token', 'backButton', 'title', 'image', 'backgroundImage'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('backButton')
+            if value is not None:
+                obj.back_button = enum0(value)
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('image')
+            if value is not None:
+                obj.image = decode_Image__interfaces_display_image(value)
+            value = get('backgroundImage')
+            if value is not None:
+                obj.background_image = decode_Image__interfaces_display_image(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.back_button
+        if value is not None:
+            result['backButton'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.image
+        if value is not None:
+            result['image'] = encode(value)
+        value = obj.background_image
+        if value is not None:
+            result['backgroundImage'] = encode(value)
+        return result
+
+    decode_BodyTemplate7, encode_BodyTemplate7 = decode_model, encode_model
+
+
+decode_BodyTemplate7 = _lazy('decode_BodyTemplate7', _bind_BodyTemplate7)
+encode_BodyTemplate7 = _lazy('encode_BodyTemplate7', _bind_BodyTemplate7)
+
+
+def _bind_DisplayInterface():
+    global decode_DisplayInterface, encode_DisplayInterface
+    from ask_sdk_model.interfaces.display.display_interface import DisplayInterface as model
+    keys = frozenset(('templateVersion', 'markupVersion'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('templateVersion')
+            if value is not None:
+                obj.template_version = value if value.__class__ is str else _str(value)
+            value = get('markupVersion')
+            if value is not None:
+                obj.markup_version = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.template_version
+        if value is not None:
+            result['templateVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.markup_version
+        if value is not None:
+            result['markupVersion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_DisplayInterface, encode_DisplayInterface = decode_model, encode_model
+
+
+decode_DisplayInterface = _lazy('decode_DisplayInterface', _bind_DisplayInterface)
+encode_DisplayInterface = _lazy('encode_DisplayInterface', _bind_DisplayInterface)
+
+
+def _bind_DisplayState():
+    global decode_DisplayState, encode_DisplayState
+    from ask_sdk_model.interfaces.display.display_state import DisplayState as model
+    keys = frozenset(('token',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_DisplayState, encode_DisplayState = decode_model, encode_model
+
+
+decode_DisplayState = _lazy('decode_DisplayState', _bind_DisplayState)
+encode_DisplayState = _lazy('encode_DisplayState', _bind_DisplayState)
+
+
+def _bind_ElementSelectedRequest():
+    global decode_ElementSelectedRequest, encode_ElementSelectedRequest
+    from ask_sdk_model.interfaces.display.element_selected_request import ElementSelectedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'token'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ElementSelectedRequest, encode_ElementSelectedRequest = decode_model, encode_model
+
+
+decode_ElementSelectedRequest = _lazy('decode_ElementSelectedRequest', _bind_ElementSelectedRequest)
+encode_ElementSelectedRequest = _lazy('encode_ElementSelectedRequest', _bind_ElementSelectedRequest)
+
+
+def _bind_Hint():
+    global decode_Hint, encode_Hint
+    from ask_sdk_model.interfaces.display.hint import Hint as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Hint, encode_Hint = decode_model, encode_model
+
+
+decode_Hint = _lazy('decode_Hint', _bind_Hint)
+encode_Hint = _lazy('encode_Hint', _bind_Hint)
+
+
+def _bind_HintDirective():
+    global decode_HintDirective, encode_HintDirective
+    from ask_sdk_model.interfaces.display.hint_directive import HintDirective as model
+    keys = frozenset(('type', 'hint'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('hint')
+            if value is not None:
+                obj.hint = dispatch_Hint(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.hint
+        if value is not None:
+            result['hint'] = encode(value)
+        return result
+
+    decode_HintDirective, encode_HintDirective = decode_model, encode_model
+
+
+decode_HintDirective = _lazy('decode_HintDirective', _bind_HintDirective)
+encode_HintDirective = _lazy('encode_HintDirective', _bind_HintDirective)
+
+
+def _bind_Image__interfaces_display_image():
+    global decode_Image__interfaces_display_image, encode_Image__interfaces_display_image
+    from ask_sdk_model.interfaces.display.image import Image as model
+    keys = frozenset(('contentDescription', 'sources'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('contentDescription')
+            if value is not None:
+                obj.content_description = value if value.__class__ is str else _str(value)
+            value = get('sources')
+            if value is not None:
+                obj.sources = [None if i0 is None else decode_ImageInstance(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.content_description
+        if value is not None:
+            result['contentDescription'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.sources
+        if value is not None:
+            result['sources'] = encode(value)
+        return result
+
+    decode_Image__interfaces_display_image, encode_Image__interfaces_display_image = decode_model, encode_model
+
+
+decode_Image__interfaces_display_image = _lazy('decode_Image__interfaces_display_image', _bind_Image__interfaces_display_image)
+encode_Image__interfaces_display_image = _lazy('encode_Image__interfaces_display_image', _bind_Image__interfaces_display_image)
+
+
+def _bind_ImageInstance():
+    global decode_ImageInstance, encode_ImageInstance
+    from ask_sdk_model.interfaces.display.image_instance import ImageInstance as model
+    from ask_sdk_model.interfaces.display.image_size import ImageSize as enum0
+    keys = frozenset(('url', 'size', 'widthPixels', 'heightPixels'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('url')
+            if value is not None:
+                obj.url = value if value.__class__ is str else _str(value)
+            value = get('size')
+            if value is not None:
+                obj.size = enum0(value)
+            value = get('widthPixels')
+            if value is not None:
+                obj.width_pixels = value if value.__class__ is int else _int(value)
+            value = get('heightPixels')
+            if value is not None:
+                obj.height_pixels = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.url
+        if value is not None:
+            result['url'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.size
+        if value is not None:
+            result['size'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.width_pixels
+        if value is not None:
+            result['widthPixels'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.height_pixels
+        if value is not None:
+            result['heightPixels'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ImageInstance, encode_ImageInstance = decode_model, encode_model
+
+
+decode_ImageInstance = _lazy('decode_ImageInstance', _bind_ImageInstance)
+encode_ImageInstance = _lazy('encode_ImageInstance', _bind_ImageInstance)
+
+
+def _bind_ListItem():
+    global decode_ListItem, encode_ListItem
+    from ask_sdk_model.interfaces.display.list_item import ListItem as model
+    keys = frozenset(('token', 'image', 'textContent'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('image')
+            if value is not None:
+                obj.image = decode_Image__interfaces_display_image(value)
+            value = get('textContent')
+            if value is not None:
+                obj.text_content = decode_TextContent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.image
+        if value is not None:
+            result['image'] = encode(value)
+        value = obj.text_content
+        if value is not None:
+            result['textContent'] = encode(value)
+        return result
+
+    decode_ListItem, encode_ListItem = decode_model, encode_model
+
+
+decode_ListItem = _lazy('decode_ListItem', _bind_ListItem)
+encode_ListItem = _lazy('encode_ListItem', _bind_ListItem)
+
+
+def _bind_ListTemplate1():
+    global decode_ListTemplate1, encode_ListTemplate1
+    from ask_sdk_model.interfaces.display.list_template1 import ListTemplate1 as model
+    from ask_sdk_model.interfaces.display.back_button_behavior import BackButtonBehavior as enum0
+    keys = frozenset(('type', 'token', 'backButton', 'backgroundImage', 'title', 'listItems'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('backButton')
+            if value is not None:
+                obj.back_button = enum0(value)
+            value = get('backgroundImage')
+            if value is not None:
+                obj.background_image = decode_Image__interfaces_display_image(value)
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('listItems')
+            if value is not None:
+                obj.list_items = [None if i0 is None else decode_ListItem(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.back_button
+        if value is not None:
+            result['backButton'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.background_image
+        if value is not None:
+            result['backgroundImage'] = encode(value)
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_items
+        if value is not None:
+            result['listItems'] = encode(value)
+        return result
+
+    decode_ListTemplate1, encode_ListTemplate1 = decode_model, encode_model
+
+
+decode_ListTemplate1 = _lazy('decode_ListTemplate1', _bind_ListTemplate1)
+encode_ListTemplate1 = _lazy('encode_ListTemplate1', _bind_ListTemplate1)
+
+
+def _bind_ListTemplate2():
+    global decode_ListTemplate2, encode_ListTemplate2
+    from ask_sdk_model.interfaces.display.list_template2 import ListTemplate2 as model
+    from ask_sdk_model.interfaces.display.back_button_behavior import BackButtonBehavior as enum0
+    keys = frozenset(('type', 'token', 'backButton', 'backgroundImage', 'title', 'listItems'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('backButton')
+            if value is not None:
+                obj.back_button = enum0(value)
+            value = get('backgroundImage')
+            if value is not None:
+                obj.background_image = decode_Image__interfaces_display_image(value)
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('listItems')
+            if value is not None:
+                obj.list_items = [None if i0 is None else decode_ListItem(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.back_button
+        if value is not None:
+            result['backButton'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.background_image
+        if value is not None:
+            result['backgroundImage'] = encode(value)
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_items
+        if value is not None:
+            result['listItems'] = encode(value)
+        return result
+
+    decode_ListTemplate2, encode_ListTemplate2 = decode_model, encode_model
+
+
+decode_ListTemplate2 = _lazy('decode_ListTemplate2', _bind_ListTemplate2)
+encode_ListTemplate2 = _lazy('encode_ListTemplate2', _bind_ListTemplate2)
+
+
+def _bind_PlainText():
+    global decode_PlainText, encode_PlainText
+    from ask_sdk_model.interfaces.display.plain_text import PlainText as model
+    keys = frozenset(('type', 'text'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('text')
+            if value is not None:
+                obj.text = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.text
+        if value is not None:
+            result['text'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PlainText, encode_PlainText = decode_model, encode_model
+
+
+decode_PlainText = _lazy('decode_PlainText', _bind_PlainText)
+encode_PlainText = _lazy('encode_PlainText', _bind_PlainText)
+
+
+def _bind_PlainTextHint():
+    global decode_PlainTextHint, encode_PlainTextHint
+    from ask_sdk_model.interfaces.display.plain_text_hint import PlainTextHint as model
+    keys = frozenset(('type', 'text'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('text')
+            if value is not None:
+                obj.text = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.text
+        if value is not None:
+            result['text'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PlainTextHint, encode_PlainTextHint = decode_model, encode_model
+
+
+decode_PlainTextHint = _lazy('decode_PlainTextHint', _bind_PlainTextHint)
+encode_PlainTextHint = _lazy('encode_PlainTextHint', _bind_PlainTextHint)
+
+
+def _bind_RenderTemplateDirective():
+    global decode_RenderTemplateDirective, encode_RenderTemplateDirective
+    from ask_sdk_model.interfaces.display.render_template_directive import RenderTemplateDirective as model
+    keys = frozenset(('type', 'template'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('template')
+            if value is not None:
+                obj.template = dispatch_Template(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.template
+        if value is not None:
+            result['template'] = encode(value)
+        return result
+
+    decode_RenderTemplateDirective, encode_RenderTemplateDirective = decode_model, encode_model
+
+
+decode_RenderTemplateDirective = _lazy('decode_RenderTemplateDirective', _bind_RenderTemplateDirective)
+encode_RenderTemplateDirective = _lazy('encode_RenderTemplateDirective', _bind_RenderTemplateDirective)
+
+
+def _bind_RichText():
+    global decode_RichText, encode_RichText
+    from ask_sdk_model.interfaces.display.rich_text import RichText as model
+    keys = frozenset(('type', 'text'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('text')
+            if value is not None:
+                obj.text = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.text
+        if value is not None:
+            result['text'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_RichText, encode_RichText = decode_model, encode_model
+
+
+decode_RichText = _lazy('decode_RichText', _bind_RichText)
+encode_RichText = _lazy('encode_RichText', _bind_RichText)
+
+
+def _bind_Template():
+    global decode_Template, encode_Template
+    from ask_sdk_model.interfaces.display.template import Template as model
+    from ask_sdk_model.interfaces.display.back_button_behavior import BackButtonBehavior as enum0
+    keys = frozenset(('type', 'token', 'backButton'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('token')
+            if value is not None:
+                obj.token = value if value.__class__ is str else _str(value)
+            value = get('backButton')
+            if value is not None:
+                obj.back_button = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.token
+        if value is not None:
+            result['token'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.back_button
+        if value is not None:
+            result['backButton'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_Template, encode_Template = decode_model, encode_model
+
+
+decode_Template = _lazy('decode_Template', _bind_Template)
+encode_Template = _lazy('encode_Template', _bind_Template)
+
+
+def _bind_TextContent():
+    global decode_TextContent, encode_TextContent
+    from ask_sdk_model.interfaces.display.text_content import TextContent as model
+    keys = frozenset(('primaryText', 'secondaryText', 'tertiaryText'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('primaryText')
+            if value is not None:
+                obj.primary_text = dispatch_TextField(value)
+            value = get('secondaryText')
+            if value is not None:
+                obj.secondary_text = dispatch_TextField(value)
+            value = get('tertiaryText')
+            if value is not None:
+                obj.tertiary_text = dispatch_TextField(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.primary_text
+        if value is not None:
+            result['primaryText'] = encode(value)
+        value = obj.secondary_text
+        if value is not None:
+            result['secondaryText'] = encode(value)
+        value = obj.tertiary_text
+        if value is not None:
+            result['tertiaryText'] = encode(value)
+        return result
+
+    decode_TextContent, encode_TextContent = decode_model, encode_model
+
+
+decode_TextContent = _lazy('decode_TextContent', _bind_TextContent)
+encode_TextContent = _lazy('encode_TextContent', _bind_TextContent)
+
+
+def _bind_TextField():
+    global decode_TextField, encode_TextField
+    from ask_sdk_model.interfaces.display.text_field import TextField as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_TextField, encode_TextField = decode_model, encode_model
+
+
+decode_TextField = _lazy('decode_TextField', _bind_TextField)
+encode_TextField = _lazy('encode_TextField', _bind_TextField)
+
+
+def _bind_SetLightDirective():
+    global decode_SetLightDirective, encode_SetLightDirective
+    from ask_sdk_model.interfaces.gadget_controller.set_light_directive import SetLightDirective as model
+    keys = frozenset(('type', 'version', 'targetGadgets', 'parameters'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('version')
+            if value is not None:
+                obj.version = value if value.__class__ is int else _int(value)
+            value = get('targetGadgets')
+            if value is not None:
+                obj.target_gadgets = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('parameters')
+            if value is not None:
+                obj.parameters = decode_SetLightParameters(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.version
+        if value is not None:
+            result['version'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.target_gadgets
+        if value is not None:
+            result['targetGadgets'] = encode(value)
+        value = obj.parameters
+        if value is not None:
+            result['parameters'] = encode(value)
+        return result
+
+    decode_SetLightDirective, encode_SetLightDirective = decode_model, encode_model
+
+
+decode_SetLightDirective = _lazy('decode_SetLightDirective', _bind_SetLightDirective)
+encode_SetLightDirective = _lazy('encode_SetLightDirective', _bind_SetLightDirective)
+
+
+def _bind_InputHandlerEventRequest():
+    global decode_InputHandlerEventRequest, encode_InputHandlerEventRequest
+    from ask_sdk_model.interfaces.game_engine.input_handler_event_request import InputHandlerEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'originatingRequestId', 'events'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('originatingRequestId')
+            if value is not None:
+                obj.originating_request_id = value if value.__class__ is str else _str(value)
+            value = get('events')
+            if value is not None:
+                obj.events = [None if i0 is None else decode_InputHandlerEvent(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.originating_request_id
+        if value is not None:
+            result['originatingRequestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.events
+        if value is not None:
+            result['events'] = encode(value)
+        return result
+
+    decode_InputHandlerEventRequest, encode_InputHandlerEventRequest = decode_model, encode_model
+
+
+decode_InputHandlerEventRequest = _lazy('decode_InputHandlerEventRequest', _bind_InputHandlerEventRequest)
+encode_InputHandlerEventRequest = _lazy('encode_InputHandlerEventRequest', _bind_InputHandlerEventRequest)
+
+
+def _bind_StartInputHandlerDirective():
+    global decode_StartInputHandlerDirective, encode_StartInputHandlerDirective
+    from ask_sdk_model.interfaces.game_engine.start_input_handler_directive import StartInputHandlerDirective as model
+    keys = frozenset(('type', 'timeout', 'proxies', 'recognizers', 'events'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('timeout')
+            if value is not None:
+                obj.timeout = value if value.__class__ is int else _int(value)
+            value = get('proxies')
+            if value is not None:
+                obj.proxies = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('recognizers')
+            if value is not None:
+                obj.recognizers = {k0: None if v0 is None else dispatch_Recognizer(v0) for k0, v0 in value.items()}
+            value = get('events')
+            if value is not None:
+                obj.events = {k0: None if v0 is None else decode_Event__services_game_engine_event(v0) for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timeout
+        if value is not None:
+            result['timeout'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.proxies
+        if value is not None:
+            result['proxies'] = encode(value)
+        value = obj.recognizers
+        if value is not None:
+            result['recognizers'] = encode(value)
+        value = obj.events
+        if value is not None:
+            result['events'] = encode(value)
+        return result
+
+    decode_StartInputHandlerDirective, encode_StartInputHandlerDirective = decode_model, encode_model
+
+
+decode_StartInputHandlerDirective = _lazy('decode_StartInputHandlerDirective', _bind_StartInputHandlerDirective)
+encode_StartInputHandlerDirective = _lazy('encode_StartInputHandlerDirective', _bind_StartInputHandlerDirective)
+
+
+def _bind_StopInputHandlerDirective():
+    global decode_StopInputHandlerDirective, encode_StopInputHandlerDirective
+    from ask_sdk_model.interfaces.game_engine.stop_input_handler_directive import StopInputHandlerDirective as model
+    keys = frozenset(('type', 'originatingRequestId'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('originatingRequestId')
+            if value is not None:
+                obj.originating_request_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.originating_request_id
+        if value is not None:
+            result['originatingRequestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_StopInputHandlerDirective, encode_StopInputHandlerDirective = decode_model, encode_model
+
+
+decode_StopInputHandlerDirective = _lazy('decode_StopInputHandlerDirective', _bind_StopInputHandlerDirective)
+encode_StopInputHandlerDirective = _lazy('encode_StopInputHandlerDirective', _bind_StopInputHandlerDirective)
+
+
+def _bind_Altitude():
+    global decode_Altitude, encode_Altitude
+    from ask_sdk_model.interfaces.geolocation.altitude import Altitude as model
+    keys = frozenset(('altitudeInMeters', 'accuracyInMeters'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('altitudeInMeters')
+            if value is not None:
+                obj.altitude_in_meters = value if value.__class__ is float else _float(value)
+            value = get('accuracyInMeters')
+            if value is not None:
+                obj.accuracy_in_meters = value if value.__class__ is float else _float(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.altitude_in_meters
+        if value is not None:
+            result['altitudeInMeters'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.accuracy_in_meters
+        if value is not None:
+            result['accuracyInMeters'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Altitude, encode_Altitude = decode_model, encode_model
+
+
+decode_Altitude = _lazy('decode_Altitude', _bind_Altitude)
+encode_Altitude = _lazy('encode_Altitude', _bind_Altitude)
+
+
+def _bind_Coordinate():
+    global decode_Coordinate, encode_Coordinate
+    from ask_sdk_model.interfaces.geolocation.coordinate import Coordinate as model
+    keys = frozenset(('latitudeInDegrees', 'longitudeInDegrees', 'accuracyInMeters'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('latitudeInDegrees')
+            if value is not None:
+                obj.latitude_in_degrees = value if value.__class__ is float else _float(value)
+            value = get('longitudeInDegrees')
+            if value is not None:
+                obj.longitude_in_degrees = value if value.__class__ is float else _float(value)
+            value = get('accuracyInMeters')
+            if value is not None:
+                obj.accuracy_in_meters = value if value.__class__ is float else _float(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.latitude_in_degrees
+        if value is not None:
+            result['latitudeInDegrees'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.longitude_in_degrees
+        if value is not None:
+            result['longitudeInDegrees'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.accuracy_in_meters
+        if value is not None:
+            result['accuracyInMeters'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Coordinate, encode_Coordinate = decode_model, encode_model
+
+
+decode_Coordinate = _lazy('decode_Coordinate', _bind_Coordinate)
+encode_Coordinate = _lazy('encode_Coordinate', _bind_Coordinate)
+
+
+def _bind_GeolocationInterface():
+    global decode_GeolocationInterface, encode_GeolocationInterface
+    from ask_sdk_model.interfaces.geolocation.geolocation_interface import GeolocationInterface as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_GeolocationInterface, encode_GeolocationInterface = decode_model, encode_model
+
+
+decode_GeolocationInterface = _lazy('decode_GeolocationInterface', _bind_GeolocationInterface)
+encode_GeolocationInterface = _lazy('encode_GeolocationInterface', _bind_GeolocationInterface)
+
+
+def _bind_GeolocationState():
+    global decode_GeolocationState, encode_GeolocationState
+    from ask_sdk_model.interfaces.geolocation.geolocation_state import GeolocationState as model
+    keys = frozenset(('timestamp', 'coordinate', 'altitude', 'heading', 'speed', 'locationServices'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = value if value.__class__ is str else _str(value)
+            value = get('coordinate')
+            if value is not None:
+                obj.coordinate = decode_Coordinate(value)
+            value = get('altitude')
+            if value is not None:
+                obj.altitude = decode_Altitude(value)
+            value = get('heading')
+            if value is not None:
+                obj.heading = decode_Heading(value)
+            value = get('speed')
+            if value is not None:
+                obj.speed = decode_Speed(value)
+            value = get('locationServices')
+            if value is not None:
+                obj.location_services = decode_LocationServices(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.coordinate
+        if value is not None:
+            result['coordinate'] = encode(value)
+        value = obj.altitude
+        if value is not None:
+            result['altitude'] = encode(value)
+        value = obj.heading
+        if value is not None:
+            result['heading'] = encode(value)
+        value = obj.speed
+        if value is not None:
+            result['speed'] = encode(value)
+        value = obj.location_services
+        if value is not None:
+            result['locationServices'] = encode(value)
+        return result
+
+    decode_GeolocationState, encode_GeolocationState = decode_model, encode_model
+
+
+decode_GeolocationState = _lazy('decode_GeolocationState', _bind_GeolocationState)
+encode_GeolocationState = _lazy('encode_GeolocationState', _bind_GeolocationState)
+
+
+def _bind_Heading():
+    global decode_Heading, encode_Heading
+    from ask_sdk_model.interfaces.geolocation.heading import Heading as model
+    keys = frozenset(('directionInDegrees', 'accuracyInDegrees'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('directionInDegrees')
+            if value is not None:
+                obj.direction_in_degrees = value if value.__class__ is float else _float(value)
+            value = get('accuracyInDegrees')
+            if value is not None:
+                obj.accuracy_in_degrees = value if value.__class__ is float else _float(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.direction_in_degrees
+        if value is not None:
+            result['directionInDegrees'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.accuracy_in_degrees
+        if value is not None:
+            result['accuracyInDegrees'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Heading, encode_Heading = decode_model, encode_model
+
+
+decode_Heading = _lazy('decode_Heading', _bind_Heading)
+encode_Heading = _lazy('encode_Heading', _bind_Heading)
+
+
+def _bind_LocationServices():
+    global decode_LocationServices, encode_LocationServices
+    from ask_sdk_model.interfaces.geolocation.location_services import LocationServices as model
+    from ask_sdk_model.interfaces.geolocation.status import Status as enum0
+    from ask_sdk_model.interfaces.geolocation.access import Access as enum1
+    keys = frozenset(('status', 'access'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('status')
+            if value is not None:
+                obj.status = enum0(value)
+            value = get('access')
+            if value is not None:
+                obj.access = enum1(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.status
+        if value is not None:
+            result['status'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.access
+        if value is not None:
+            result['access'] = value.value if value.__class__ is enum1 else encode(value)
+        return result
+
+    decode_LocationServices, encode_LocationServices = decode_model, encode_model
+
+
+decode_LocationServices = _lazy('decode_LocationServices', _bind_LocationServices)
+encode_LocationServices = _lazy('encode_LocationServices', _bind_LocationServices)
+
+
+def _bind_Speed():
+    global decode_Speed, encode_Speed
+    from ask_sdk_model.interfaces.geolocation.speed import Speed as model
+    keys = frozenset(('speedInMetersPerSecond', 'accuracyInMetersPerSecond'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('speedInMetersPerSecond')
+            if value is not None:
+                obj.speed_in_meters_per_second = value if value.__class__ is float else _float(value)
+            value = get('accuracyInMetersPerSecond')
+            if value is not None:
+                obj.accuracy_in_meters_per_second = value if value.__class__ is float else _float(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.speed_in_meters_per_second
+        if value is not None:
+            result['speedInMetersPerSecond'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.accuracy_in_meters_per_second
+        if value is not None:
+            result['accuracyInMetersPerSecond'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Speed, encode_Speed = decode_model, encode_model
+
+
+decode_Speed = _lazy('decode_Speed', _bind_Speed)
+encode_Speed = _lazy('encode_Speed', _bind_Speed)
+
+
+def _bind_MessageReceivedRequest():
+    global decode_MessageReceivedRequest, encode_MessageReceivedRequest
+    from ask_sdk_model.interfaces.messaging.message_received_request import MessageReceivedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'message'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = encode(value)
+        return result
+
+    decode_MessageReceivedRequest, encode_MessageReceivedRequest = decode_model, encode_model
+
+
+decode_MessageReceivedRequest = _lazy('decode_MessageReceivedRequest', _bind_MessageReceivedRequest)
+encode_MessageReceivedRequest = _lazy('encode_MessageReceivedRequest', _bind_MessageReceivedRequest)
+
+
+def _bind_AnnounceRoadRegulation():
+    global decode_AnnounceRoadRegulation, encode_AnnounceRoadRegulation
+    from ask_sdk_model.interfaces.navigation.assistance.announce_road_regulation import AnnounceRoadRegulation as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_AnnounceRoadRegulation, encode_AnnounceRoadRegulation = decode_model, encode_model
+
+
+decode_AnnounceRoadRegulation = _lazy('decode_AnnounceRoadRegulation', _bind_AnnounceRoadRegulation)
+encode_AnnounceRoadRegulation = _lazy('encode_AnnounceRoadRegulation', _bind_AnnounceRoadRegulation)
+
+
+def _bind_NavigationInterface():
+    global decode_NavigationInterface, encode_NavigationInterface
+    from ask_sdk_model.interfaces.navigation.navigation_interface import NavigationInterface as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_NavigationInterface, encode_NavigationInterface = decode_model, encode_model
+
+
+decode_NavigationInterface = _lazy('decode_NavigationInterface', _bind_NavigationInterface)
+encode_NavigationInterface = _lazy('encode_NavigationInterface', _bind_NavigationInterface)
+
+
+def _bind_NextCommandIssuedRequest():
+    global decode_NextCommandIssuedRequest, encode_NextCommandIssuedRequest
+    from ask_sdk_model.interfaces.playbackcontroller.next_command_issued_request import NextCommandIssuedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_NextCommandIssuedRequest, encode_NextCommandIssuedRequest = decode_model, encode_model
+
+
+decode_NextCommandIssuedRequest = _lazy('decode_NextCommandIssuedRequest', _bind_NextCommandIssuedRequest)
+encode_NextCommandIssuedRequest = _lazy('encode_NextCommandIssuedRequest', _bind_NextCommandIssuedRequest)
+
+
+def _bind_PauseCommandIssuedRequest():
+    global decode_PauseCommandIssuedRequest, encode_PauseCommandIssuedRequest
+    from ask_sdk_model.interfaces.playbackcontroller.pause_command_issued_request import PauseCommandIssuedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PauseCommandIssuedRequest, encode_PauseCommandIssuedRequest = decode_model, encode_model
+
+
+decode_PauseCommandIssuedRequest = _lazy('decode_PauseCommandIssuedRequest', _bind_PauseCommandIssuedRequest)
+encode_PauseCommandIssuedRequest = _lazy('encode_PauseCommandIssuedRequest', _bind_PauseCommandIssuedRequest)
+
+
+def _bind_PlayCommandIssuedRequest():
+    global decode_PlayCommandIssuedRequest, encode_PlayCommandIssuedRequest
+    from ask_sdk_model.interfaces.playbackcontroller.play_command_issued_request import PlayCommandIssuedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PlayCommandIssuedRequest, encode_PlayCommandIssuedRequest = decode_model, encode_model
+
+
+decode_PlayCommandIssuedRequest = _lazy('decode_PlayCommandIssuedRequest', _bind_PlayCommandIssuedRequest)
+encode_PlayCommandIssuedRequest = _lazy('encode_PlayCommandIssuedRequest', _bind_PlayCommandIssuedRequest)
+
+
+def _bind_PreviousCommandIssuedRequest():
+    global decode_PreviousCommandIssuedRequest, encode_PreviousCommandIssuedRequest
+    from ask_sdk_model.interfaces.playbackcontroller.previous_command_issued_request import PreviousCommandIssuedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PreviousCommandIssuedRequest, encode_PreviousCommandIssuedRequest = decode_model, encode_model
+
+
+decode_PreviousCommandIssuedRequest = _lazy('decode_PreviousCommandIssuedRequest', _bind_PreviousCommandIssuedRequest)
+encode_PreviousCommandIssuedRequest = _lazy('encode_PreviousCommandIssuedRequest', _bind_PreviousCommandIssuedRequest)
+
+
+def _bind_Error__interfaces_system_error():
+    global decode_Error__interfaces_system_error, encode_Error__interfaces_system_error
+    from ask_sdk_model.interfaces.system.error import Error as model
+    from ask_sdk_model.interfaces.system.error_type import ErrorType as enum0
+    keys = frozenset(('type', 'message'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = enum0(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Error__interfaces_system_error, encode_Error__interfaces_system_error = decode_model, encode_model
+
+
+decode_Error__interfaces_system_error = _lazy('decode_Error__interfaces_system_error', _bind_Error__interfaces_system_error)
+encode_Error__interfaces_system_error = _lazy('encode_Error__interfaces_system_error', _bind_Error__interfaces_system_error)
+
+
+def _bind_ErrorCause():
+    global decode_ErrorCause, encode_ErrorCause
+    from ask_sdk_model.interfaces.system.error_cause import ErrorCause as model
+    keys = frozenset(('requestId',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ErrorCause, encode_ErrorCause = decode_model, encode_model
+
+
+decode_ErrorCause = _lazy('decode_ErrorCause', _bind_ErrorCause)
+encode_ErrorCause = _lazy('encode_ErrorCause', _bind_ErrorCause)
+
+
+def _bind_ExceptionEncounteredRequest():
+    global decode_ExceptionEncounteredRequest, encode_ExceptionEncounteredRequest
+    from ask_sdk_model.interfaces.system.exception_encountered_request import ExceptionEncounteredRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'error', 'cause'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('error')
+            if value is not None:
+                obj.error = decode_Error__interfaces_system_error(value)
+            value = get('cause')
+            if value is not None:
+                obj.cause = decode_ErrorCause(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.error
+        if value is not None:
+            result['error'] = encode(value)
+        value = obj.cause
+        if value is not None:
+            result['cause'] = encode(value)
+        return result
+
+    decode_ExceptionEncounteredRequest, encode_ExceptionEncounteredRequest = decode_model, encode_model
+
+
+decode_ExceptionEncounteredRequest = _lazy('decode_ExceptionEncounteredRequest', _bind_ExceptionEncounteredRequest)
+encode_ExceptionEncounteredRequest = _lazy('encode_ExceptionEncounteredRequest', _bind_ExceptionEncounteredRequest)
+
+
+def _bind_SystemState():
+    global decode_SystemState, encode_SystemState
+    from ask_sdk_model.interfaces.system.system_state import SystemState as model
+    keys = frozenset(('application', 'user', 'device', 'person', 'unit', 'apiEndpoint', 'apiAccessToken'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('application')
+            if value is not None:
+                obj.application = decode_Application(value)
+            value = get('user')
+            if value is not None:
+                obj.user = decode_User(value)
+            value = get('device')
+            if value is not None:
+                obj.device = decode_Device(value)
+            value = get('person')
+            if value is not None:
+                obj.person = decode_Person(value)
+            value = get('unit')
+            if value is not None:
+                obj.unit = decode_Unit(value)
+            value = get('apiEndpoint')
+            if value is not None:
+                obj.api_endpoint = value if value.__class__ is str else _str(value)
+            value = get('apiAccessToken')
+            if value is not None:
+                obj.api_access_token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.application
+        if value is not None:
+            result['application'] = encode(value)
+        value = obj.user
+        if value is not None:
+            result['user'] = encode(value)
+        value = obj.device
+        if value is not None:
+            result['device'] = encode(value)
+        value = obj.person
+        if value is not None:
+            result['person'] = encode(value)
+        value = obj.unit
+        if value is not None:
+            result['unit'] = encode(value)
+        value = obj.api_endpoint
+        if value is not None:
+            result['apiEndpoint'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.api_access_token
+        if value is not None:
+            result['apiAccessToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SystemState, encode_SystemState = decode_model, encode_model
+
+
+decode_SystemState = _lazy('decode_SystemState', _bind_SystemState)
+encode_SystemState = _lazy('encode_SystemState', _bind_SystemState)
+
+
+def _bind_Unit():
+    global decode_Unit, encode_Unit
+    from ask_sdk_model.interfaces.system_unit.unit import Unit as model
+    keys = frozenset(('unitId', 'persistentUnitId'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('unitId')
+            if value is not None:
+                obj.unit_id = value if value.__class__ is str else _str(value)
+            value = get('persistentUnitId')
+            if value is not None:
+                obj.persistent_unit_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.unit_id
+        if value is not None:
+            result['unitId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.persistent_unit_id
+        if value is not None:
+            result['persistentUnitId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Unit, encode_Unit = decode_model, encode_model
+
+
+decode_Unit = _lazy('decode_Unit', _bind_Unit)
+encode_Unit = _lazy('encode_Unit', _bind_Unit)
+
+
+def _bind_CompleteTaskDirective():
+    global decode_CompleteTaskDirective, encode_CompleteTaskDirective
+    from ask_sdk_model.interfaces.tasks.complete_task_directive import CompleteTaskDirective as model
+    keys = frozenset(('type', 'status', 'result'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('status')
+            if value is not None:
+                obj.status = decode_Status__status(value)
+            value = get('result')
+            if value is not None:
+                obj.result = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.status
+        if value is not None:
+            result['status'] = encode(value)
+        value = obj.result
+        if value is not None:
+            result['result'] = encode(value)
+        return result
+
+    decode_CompleteTaskDirective, encode_CompleteTaskDirective = decode_model, encode_model
+
+
+decode_CompleteTaskDirective = _lazy('decode_CompleteTaskDirective', _bind_CompleteTaskDirective)
+encode_CompleteTaskDirective = _lazy('encode_CompleteTaskDirective', _bind_CompleteTaskDirective)
+
+
+def _bind_LaunchDirective():
+    global decode_LaunchDirective, encode_LaunchDirective
+    from ask_sdk_model.interfaces.videoapp.launch_directive import LaunchDirective as model
+    keys = frozenset(('type', 'videoItem'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('videoItem')
+            if value is not None:
+                obj.video_item = decode_VideoItem(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.video_item
+        if value is not None:
+            result['videoItem'] = encode(value)
+        return result
+
+    decode_LaunchDirective, encode_LaunchDirective = decode_model, encode_model
+
+
+decode_LaunchDirective = _lazy('decode_LaunchDirective', _bind_LaunchDirective)
+encode_LaunchDirective = _lazy('encode_LaunchDirective', _bind_LaunchDirective)
+
+
+def _bind_Metadata():
+    global decode_Metadata, encode_Metadata
+    from ask_sdk_model.interfaces.videoapp.metadata import Metadata as model
+    keys = frozenset(('title', 'subtitle'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('subtitle')
+            if value is not None:
+                obj.subtitle = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.subtitle
+        if value is not None:
+            result['subtitle'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Metadata, encode_Metadata = decode_model, encode_model
+
+
+decode_Metadata = _lazy('decode_Metadata', _bind_Metadata)
+encode_Metadata = _lazy('encode_Metadata', _bind_Metadata)
+
+
+def _bind_VideoAppInterface():
+    global decode_VideoAppInterface, encode_VideoAppInterface
+    from ask_sdk_model.interfaces.videoapp.video_app_interface import VideoAppInterface as model
+    keys = frozenset(())
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        return result
+
+    decode_VideoAppInterface, encode_VideoAppInterface = decode_model, encode_model
+
+
+decode_VideoAppInterface = _lazy('decode_VideoAppInterface', _bind_VideoAppInterface)
+encode_VideoAppInterface = _lazy('encode_VideoAppInterface', _bind_VideoAppInterface)
+
+
+def _bind_VideoItem():
+    global decode_VideoItem, encode_VideoItem
+    from ask_sdk_model.interfaces.videoapp.video_item import VideoItem as model
+    keys = frozenset(('source', 'metadata'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('source')
+            if value is not None:
+                obj.source = value if value.__class__ is str else _str(value)
+            value = get('metadata')
+            if value is not None:
+                obj.metadata = decode_Metadata(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.source
+        if value is not None:
+            result['source'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.metadata
+        if value is not None:
+            result['metadata'] = encode(value)
+        return result
+
+    decode_VideoItem, encode_VideoItem = decode_model, encode_model
+
+
+decode_VideoItem = _lazy('decode_VideoItem', _bind_VideoItem)
+encode_VideoItem = _lazy('encode_VideoItem', _bind_VideoItem)
+
+
+def _bind_CurrentConfiguration():
+    global decode_CurrentConfiguration, encode_CurrentConfiguration
+    from ask_sdk_model.interfaces.viewport.apl.current_configuration import CurrentConfiguration as model
+    from ask_sdk_model.interfaces.viewport.mode import Mode as enum0
+    from ask_sdk_model.interfaces.viewport.dialog import Dialog as enum1
+    keys = frozenset(('mode', 'video', 'size', 'dialog'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('mode')
+            if value is not None:
+                obj.mode = enum0(value)
+            value = get('video')
+            if value is not None:
+                obj.video = decode_ViewportVideo(value)
+            value = get('size')
+            if value is not None:
+                obj.size = dispatch_ViewportSize(value)
+            value = get('dialog')
+            if value is not None:
+                obj.dialog = enum1(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.mode
+        if value is not None:
+            result['mode'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.video
+        if value is not None:
+            result['video'] = encode(value)
+        value = obj.size
+        if value is not None:
+            result['size'] = encode(value)
+        value = obj.dialog
+        if value is not None:
+            result['dialog'] = value.value if value.__class__ is enum1 else encode(value)
+        return result
+
+    decode_CurrentConfiguration, encode_CurrentConfiguration = decode_model, encode_model
+
+
+decode_CurrentConfiguration = _lazy('decode_CurrentConfiguration', _bind_CurrentConfiguration)
+encode_CurrentConfiguration = _lazy('encode_CurrentConfiguration', _bind_CurrentConfiguration)
+
+
+def _bind_ViewportConfiguration():
+    global decode_ViewportConfiguration, encode_ViewportConfiguration
+    from ask_sdk_model.interfaces.viewport.apl.viewport_configuration import ViewportConfiguration as model
+    keys = frozenset(('current',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('current')
+            if value is not None:
+                obj.current = decode_CurrentConfiguration(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.current
+        if value is not None:
+            result['current'] = encode(value)
+        return result
+
+    decode_ViewportConfiguration, encode_ViewportConfiguration = decode_model, encode_model
+
+
+decode_ViewportConfiguration = _lazy('decode_ViewportConfiguration', _bind_ViewportConfiguration)
+encode_ViewportConfiguration = _lazy('encode_ViewportConfiguration', _bind_ViewportConfiguration)
+
+
+def _bind_APLViewportState():
+    global decode_APLViewportState, encode_APLViewportState
+    from ask_sdk_model.interfaces.viewport.apl_viewport_state import APLViewportState as model
+    from ask_sdk_model.interfaces.viewport.shape import Shape as enum0
+    from ask_sdk_model.interfaces.viewport.presentation_type import PresentationType as enum1
+    keys = frozenset(('id', 'type', 'shape', 'dpi', 'presentationType', 'canRotate', 'configuration'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('id')
+            if value is not None:
+                obj.id = value if value.__class__ is str else _str(value)
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('shape')
+            if value is not None:
+                obj.shape = enum0(value)
+            value = get('dpi')
+            if value is not None:
+                obj.dpi = value if value.__class__ is float else _float(value)
+            value = get('presentationType')
+            if value is not None:
+                obj.presentation_type = enum1(value)
+            value = get('canRotate')
+            if value is not None:
+                obj.can_rotate = value if value.__class__ is bool else _bool(value)
+            value = get('configuration')
+            if value is not None:
+                obj.configuration = decode_ViewportConfiguration(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.id
+        if value is not None:
+            result['id'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.shape
+        if value is not None:
+            result['shape'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.dpi
+        if value is not None:
+            result['dpi'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.presentation_type
+        if value is not None:
+            result['presentationType'] = value.value if value.__class__ is enum1 else encode(value)
+        value = obj.can_rotate
+        if value is not None:
+            result['canRotate'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.configuration
+        if value is not None:
+            result['configuration'] = encode(value)
+        return result
+
+    decode_APLViewportState, encode_APLViewportState = decode_model, encode_model
+
+
+decode_APLViewportState = _lazy('decode_APLViewportState', _bind_APLViewportState)
+encode_APLViewportState = _lazy('encode_APLViewportState', _bind_APLViewportState)
+
+
+def _bind_InterSegment():
+    global decode_InterSegment, encode_InterSegment
+    from ask_sdk_model.interfaces.viewport.aplt.inter_segment import InterSegment as model
+    keys = frozenset(('x', 'y', 'characters'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('x')
+            if value is not None:
+                obj.x = value if value.__class__ is int else _int(value)
+            value = get('y')
+            if value is not None:
+                obj.y = value if value.__class__ is int else _int(value)
+            value = get('characters')
+            if value is not None:
+                obj.characters = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.x
+        if value is not None:
+            result['x'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.y
+        if value is not None:
+            result['y'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.characters
+        if value is not None:
+            result['characters'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_InterSegment, encode_InterSegment = decode_model, encode_model
+
+
+decode_InterSegment = _lazy('decode_InterSegment', _bind_InterSegment)
+encode_InterSegment = _lazy('encode_InterSegment', _bind_InterSegment)
+
+
+def _bind_APLTViewportState():
+    global decode_APLTViewportState, encode_APLTViewportState
+    from ask_sdk_model.interfaces.viewport.aplt_viewport_state import APLTViewportState as model
+    from ask_sdk_model.interfaces.viewport.aplt.viewport_profile import ViewportProfile as enum0
+    from ask_sdk_model.interfaces.viewport.aplt.character_format import CharacterFormat as enum1
+    keys = frozenset(('id', 'type', 'supportedProfiles', 'lineLength', 'lineCount', 'characterFormat', 'interSegments'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('id')
+            if value is not None:
+                obj.id = value if value.__class__ is str else _str(value)
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('supportedProfiles')
+            if value is not None:
+                obj.supported_profiles = [None if i0 is None else enum0(i0) for i0 in value]
+            value = get('lineLength')
+            if value is not None:
+                obj.line_length = value if value.__class__ is int else _int(value)
+            value = get('lineCount')
+            if value is not None:
+                obj.line_count = value if value.__class__ is int else _int(value)
+            value = get('characterFormat')
+            if value is not None:
+                obj.character_format = enum1(value)
+            value = get('interSegments')
+            if value is not None:
+                obj.inter_segments = [None if i0 is None else decode_InterSegment(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.id
+        if value is not None:
+            result['id'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.supported_profiles
+        if value is not None:
+            result['supportedProfiles'] = encode(value)
+        value = obj.line_length
+        if value is not None:
+            result['lineLength'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.line_count
+        if value is not None:
+            result['lineCount'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.character_format
+        if value is not None:
+            result['characterFormat'] = value.value if value.__class__ is enum1 else encode(value)
+        value = obj.inter_segments
+        if value is not None:
+            result['interSegments'] = encode(value)
+        return result
+
+    decode_APLTViewportState, encode_APLTViewportState = decode_model, encode_model
+
+
+decode_APLTViewportState = _lazy('decode_APLTViewportState', _bind_APLTViewportState)
+encode_APLTViewportState = _lazy('encode_APLTViewportState', _bind_APLTViewportState)
+
+
+def _bind_Experience():
+    global decode_Experience, encode_Experience
+    from ask_sdk_model.interfaces.viewport.experience import Experience as model
+    keys = frozenset(('arcMinuteWidth', 'arcMinuteHeight', 'canRotate', 'canResize'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('arcMinuteWidth')
+            if value is not None:
+                obj.arc_minute_width = value if value.__class__ is float else _float(value)
+            value = get('arcMinuteHeight')
+            if value is not None:
+                obj.arc_minute_height = value if value.__class__ is float else _float(value)
+            value = get('canRotate')
+            if value is not None:
+                obj.can_rotate = value if value.__class__ is bool else _bool(value)
+            value = get('canResize')
+            if value is not None:
+                obj.can_resize = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.arc_minute_width
+        if value is not None:
+            result['arcMinuteWidth'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.arc_minute_height
+        if value is not None:
+            result['arcMinuteHeight'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.can_rotate
+        if value is not None:
+            result['canRotate'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.can_resize
+        if value is not None:
+            result['canResize'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Experience, encode_Experience = decode_model, encode_model
+
+
+decode_Experience = _lazy('decode_Experience', _bind_Experience)
+encode_Experience = _lazy('encode_Experience', _bind_Experience)
+
+
+def _bind_ContinuousViewportSize():
+    global decode_ContinuousViewportSize, encode_ContinuousViewportSize
+    from ask_sdk_model.interfaces.viewport.size.continuous_viewport_size import ContinuousViewportSize as model
+    keys = frozenset(('type', 'minPixelWidth', 'minPixelHeight', 'maxPixelWidth', 'maxPixelHeight'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('minPixelWidth')
+            if value is not None:
+                obj.min_pixel_width = value if value.__class__ is int else _int(value)
+            value = get('minPixelHeight')
+            if value is not None:
+                obj.min_pixel_height = value if value.__class__ is int else _int(value)
+            value = get('maxPixelWidth')
+            if value is not None:
+                obj.max_pixel_width = value if value.__class__ is int else _int(value)
+            value = get('maxPixelHeight')
+            if value is not None:
+                obj.max_pixel_height = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.min_pixel_width
+        if value is not None:
+            result['minPixelWidth'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.min_pixel_height
+        if value is not None:
+            result['minPixelHeight'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.max_pixel_width
+        if value is not None:
+            result['maxPixelWidth'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.max_pixel_height
+        if value is not None:
+            result['maxPixelHeight'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ContinuousViewportSize, encode_ContinuousViewportSize = decode_model, encode_model
+
+
+decode_ContinuousViewportSize = _lazy('decode_ContinuousViewportSize', _bind_ContinuousViewportSize)
+encode_ContinuousViewportSize = _lazy('encode_ContinuousViewportSize', _bind_ContinuousViewportSize)
+
+
+def _bind_DiscreteViewportSize():
+    global decode_DiscreteViewportSize, encode_DiscreteViewportSize
+    from ask_sdk_model.interfaces.viewport.size.discrete_viewport_size import DiscreteViewportSize as model
+    keys = frozenset(('type', 'pixelWidth', 'pixelHeight'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('pixelWidth')
+            if value is not None:
+                obj.pixel_width = value if value.__class__ is int else _int(value)
+            value = get('pixelHeight')
+            if value is not None:
+                obj.pixel_height = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.pixel_width
+        if value is not None:
+            result['pixelWidth'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.pixel_height
+        if value is not None:
+            result['pixelHeight'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_DiscreteViewportSize, encode_DiscreteViewportSize = decode_model, encode_model
+
+
+decode_DiscreteViewportSize = _lazy('decode_DiscreteViewportSize', _bind_DiscreteViewportSize)
+encode_DiscreteViewportSize = _lazy('encode_DiscreteViewportSize', _bind_DiscreteViewportSize)
+
+
+def _bind_ViewportSize():
+    global decode_ViewportSize, encode_ViewportSize
+    from ask_sdk_model.interfaces.viewport.size.viewport_size import ViewportSize as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ViewportSize, encode_ViewportSize = decode_model, encode_model
+
+
+decode_ViewportSize = _lazy('decode_ViewportSize', _bind_ViewportSize)
+encode_ViewportSize = _lazy('encode_ViewportSize', _bind_ViewportSize)
+
+
+def _bind_TypedViewportState():
+    global decode_TypedViewportState, encode_TypedViewportState
+    from ask_sdk_model.interfaces.viewport.typed_viewport_state import TypedViewportState as model
+    keys = frozenset(('id', 'type'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('id')
+            if value is not None:
+                obj.id = value if value.__class__ is str else _str(value)
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.id
+        if value is not None:
+            result['id'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_TypedViewportState, encode_TypedViewportState = decode_model, encode_model
+
+
+decode_TypedViewportState = _lazy('decode_TypedViewportState', _bind_TypedViewportState)
+encode_TypedViewportState = _lazy('encode_TypedViewportState', _bind_TypedViewportState)
+
+
+def _bind_ViewportState():
+    global decode_ViewportState, encode_ViewportState
+    from ask_sdk_model.interfaces.viewport.viewport_state import ViewportState as model
+    from ask_sdk_model.interfaces.viewport.mode import Mode as enum0
+    from ask_sdk_model.interfaces.viewport.shape import Shape as enum1
+    from ask_sdk_model.interfaces.viewport.touch import Touch as enum2
+    from ask_sdk_model.interfaces.viewport.keyboard import Keyboard as enum3
+    keys = frozenset(('experiences', 'mode', 'shape', 'pixelWidth', 'pixelHeight', 'dpi', 'currentPixelWidth', 'currentPixelHeight', 'touch', 'keyboard', 'video'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('experiences')
+            if value is not None:
+                obj.experiences = [None if i0 is None else decode_Experience(i0) for i0 in value]
+            value = get('mode')
+            if value is not None:
+                obj.mode = enum0(value)
+            value = get('shape')
+            if value is not None:
+                obj.shape = enum1(value)
+            value = get('pixelWidth')
+            if value is not None:
+                obj.pixel_width = value if value.__class__ is float else _float(value)
+            value = get('pixelHeight')
+            if value is not None:
+                obj.pixel_height = value if value.__class__ is float else _float(value)
+            value = get('dpi')
+            if value is not None:
+                obj.dpi = value if value.__class__ is float else _float(value)
+            value = get('currentPixelWidth')
+            if value is not None:
+                obj.current_pixel_width = value if value.__class__ is float else _float(value)
+            value = get('currentPixelHeight')
+            if value is not None:
+                obj.current_pixel_height = value if value.__class__ is float else _float(value)
+            value = get('touch')
+            if value is not None:
+                obj.touch = [None if i0 is None else enum2(i0) for i0 in value]
+            value = get('keyboard')
+            if value is not None:
+                obj.keyboard = [None if i0 is None else enum3(i0) for i0 in value]
+            value = get('video')
+            if value is not None:
+                obj.video = decode_ViewportStateVideo(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.experiences
+        if value is not None:
+            result['experiences'] = encode(value)
+        value = obj.mode
+        if value is not None:
+            result['mode'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.shape
+        if value is not None:
+            result['shape'] = value.value if value.__class__ is enum1 else encode(value)
+        value = obj.pixel_width
+        if value is not None:
+            result['pixelWidth'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.pixel_height
+        if value is not None:
+            result['pixelHeight'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.dpi
+        if value is not None:
+            result['dpi'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.current_pixel_width
+        if value is not None:
+            result['currentPixelWidth'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.current_pixel_height
+        if value is not None:
+            result['currentPixelHeight'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.touch
+        if value is not None:
+            result['touch'] = encode(value)
+        value = obj.keyboard
+        if value is not None:
+            result['keyboard'] = encode(value)
+        value = obj.video
+        if value is not None:
+            result['video'] = encode(value)
+        return result
+
+    decode_ViewportState, encode_ViewportState = decode_model, encode_model
+
+
+decode_ViewportState = _lazy('decode_ViewportState', _bind_ViewportState)
+encode_ViewportState = _lazy('encode_ViewportState', _bind_ViewportState)
+
+
+def _bind_ViewportStateVideo():
+    global decode_ViewportStateVideo, encode_ViewportStateVideo
+    from ask_sdk_model.interfaces.viewport.viewport_state_video import ViewportStateVideo as model
+    from ask_sdk_model.interfaces.viewport.video.codecs import Codecs as enum0
+    keys = frozenset(('codecs',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('codecs')
+            if value is not None:
+                obj.codecs = [None if i0 is None else enum0(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.codecs
+        if value is not None:
+            result['codecs'] = encode(value)
+        return result
+
+    decode_ViewportStateVideo, encode_ViewportStateVideo = decode_model, encode_model
+
+
+decode_ViewportStateVideo = _lazy('decode_ViewportStateVideo', _bind_ViewportStateVideo)
+encode_ViewportStateVideo = _lazy('encode_ViewportStateVideo', _bind_ViewportStateVideo)
+
+
+def _bind_ViewportVideo():
+    global decode_ViewportVideo, encode_ViewportVideo
+    from ask_sdk_model.interfaces.viewport.viewport_video import ViewportVideo as model
+    from ask_sdk_model.interfaces.viewport.video.codecs import Codecs as enum0
+    keys = frozenset(('codecs',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('codecs')
+            if value is not None:
+                obj.codecs = [None if i0 is None else enum0(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.codecs
+        if value is not None:
+            result['codecs'] = encode(value)
+        return result
+
+    decode_ViewportVideo, encode_ViewportVideo = decode_model, encode_model
+
+
+decode_ViewportVideo = _lazy('decode_ViewportVideo', _bind_ViewportVideo)
+encode_ViewportVideo = _lazy('encode_ViewportVideo', _bind_ViewportVideo)
+
+
+def _bind_LaunchRequest():
+    global decode_LaunchRequest, encode_LaunchRequest
+    from ask_sdk_model.launch_request import LaunchRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'task'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('task')
+            if value is not None:
+                obj.task = decode_Task(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.task
+        if value is not None:
+            result['task'] = encode(value)
+        return result
+
+    decode_LaunchRequest, encode_LaunchRequest = decode_model, encode_model
+
+
+decode_LaunchRequest = _lazy('decode_LaunchRequest', _bind_LaunchRequest)
+encode_LaunchRequest = _lazy('encode_LaunchRequest', _bind_LaunchRequest)
+
+
+def _bind_ListSlotValue():
+    global decode_ListSlotValue, encode_ListSlotValue
+    from ask_sdk_model.list_slot_value import ListSlotValue as model
+    keys = frozenset(('type', 'values'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('values')
+            if value is not None:
+                obj.values = [None if i0 is None else dispatch_SlotValue(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.values
+        if value is not None:
+            result['values'] = encode(value)
+        return result
+
+    decode_ListSlotValue, encode_ListSlotValue = decode_model, encode_model
+
+
+decode_ListSlotValue = _lazy('decode_ListSlotValue', _bind_ListSlotValue)
+encode_ListSlotValue = _lazy('encode_ListSlotValue', _bind_ListSlotValue)
+
+
+def _bind_Permissions():
+    global decode_Permissions, encode_Permissions
+    from ask_sdk_model.permissions import Permissions as model
+    keys = frozenset(('consentToken', 'scopes'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('consentToken')
+            if value is not None:
+                obj.consent_token = value if value.__class__ is str else _str(value)
+            value = get('scopes')
+            if value is not None:
+                obj.scopes = {k0: None if v0 is None else decode_Scope(v0) for k0, v0 in value.items()}
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.consent_token
+        if value is not None:
+            result['consentToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.scopes
+        if value is not None:
+            result['scopes'] = encode(value)
+        return result
+
+    decode_Permissions, encode_Permissions = decode_model, encode_model
+
+
+decode_Permissions = _lazy('decode_Permissions', _bind_Permissions)
+encode_Permissions = _lazy('encode_Permissions', _bind_Permissions)
+
+
+def _bind_Person():
+    global decode_Person, encode_Person
+    from ask_sdk_model.person import Person as model
+    keys = frozenset(('personId', 'accessToken'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('personId')
+            if value is not None:
+                obj.person_id = value if value.__class__ is str else _str(value)
+            value = get('accessToken')
+            if value is not None:
+                obj.access_token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.person_id
+        if value is not None:
+            result['personId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.access_token
+        if value is not None:
+            result['accessToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Person, encode_Person = decode_model, encode_model
+
+
+decode_Person = _lazy('decode_Person', _bind_Person)
+encode_Person = _lazy('encode_Person', _bind_Person)
+
+
+def _bind_Request():
+    global decode_Request, encode_Request
+    from ask_sdk_model.request import Request as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Request, encode_Request = decode_model, encode_model
+
+
+decode_Request = _lazy('decode_Request', _bind_Request)
+encode_Request = _lazy('encode_Request', _bind_Request)
+
+
+def _bind_RequestEnvelope():
+    global decode_RequestEnvelope, encode_RequestEnvelope
+    from ask_sdk_model.request_envelope import RequestEnvelope as model
+    keys = frozenset(('version', 'session', 'context', 'request'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('version')
+            if value is not None:
+                obj.version = value if value.__class__ is str else _str(value)
+            value = get('session')
+            if value is not None:
+                obj.session = decode_Session(value)
+            value = get('context')
+            if value is not None:
+                obj.context = decode_Context(value)
+            value = get('request')
+            if value is not None:
+                obj.request = dispatch_Request(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.version
+        if value is not None:
+            result['version'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.session
+        if value is not None:
+            result['session'] = encode(value)
+        value = obj.context
+        if value is not None:
+            result['context'] = encode(value)
+        value = obj.request
+        if value is not None:
+            result['request'] = encode(value)
+        return result
+
+    decode_RequestEnvelope, encode_RequestEnvelope = decode_model, encode_model
+
+
+decode_RequestEnvelope = _lazy('decode_RequestEnvelope', _bind_RequestEnvelope)
+encode_RequestEnvelope = _lazy('encode_RequestEnvelope', _bind_RequestEnvelope)
+
+
+def _bind_Response():
+    global decode_Response, encode_Response
+    from ask_sdk_model.response import Response as model
+    keys = frozenset(('outputSpeech', 'card', 'reprompt', 'directives', 'apiResponse', 'shouldEndSession', 'canFulfillIntent', 'experimentation'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('outputSpeech')
+            if value is not None:
+                obj.output_speech = dispatch_OutputSpeech(value)
+            value = get('card')
+            if value is not None:
+                obj.card = dispatch_Card(value)
+            value = get('reprompt')
+            if value is not None:
+                obj.reprompt = decode_Reprompt(value)
+            value = get('directives')
+            if value is not None:
+                obj.directives = [None if i0 is None else dispatch_Directive(i0) for i0 in value]
+            value = get('apiResponse')
+            if value is not None:
+                obj.api_response = value
+            value = get('shouldEndSession')
+            if value is not None:
+                obj.should_end_session = value if value.__class__ is bool else _bool(value)
+            value = get('canFulfillIntent')
+            if value is not None:
+                obj.can_fulfill_intent = decode_CanFulfillIntent(value)
+            value = get('experimentation')
+            if value is not None:
+                obj.experimentation = decode_ExperimentTriggerResponse(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.output_speech
+        if value is not None:
+            result['outputSpeech'] = encode(value)
+        value = obj.card
+        if value is not None:
+            result['card'] = encode(value)
+        value = obj.reprompt
+        if value is not None:
+            result['reprompt'] = encode(value)
+        value = obj.directives
+        if value is not None:
+            result['directives'] = encode(value)
+        value = obj.api_response
+        if value is not None:
+            result['apiResponse'] = encode(value)
+        value = obj.should_end_session
+        if value is not None:
+            result['shouldEndSession'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.can_fulfill_intent
+        if value is not None:
+            result['canFulfillIntent'] = encode(value)
+        value = obj.experimentation
+        if value is not None:
+            result['experimentation'] = encode(value)
+        return result
+
+    decode_Response, encode_Response = decode_model, encode_model
+
+
+decode_Response = _lazy('decode_Response', _bind_Response)
+encode_Response = _lazy('encode_Response', _bind_Response)
+
+
+def _bind_ResponseEnvelope():
+    global decode_ResponseEnvelope, encode_ResponseEnvelope
+    from ask_sdk_model.response_envelope import ResponseEnvelope as model
+    keys = frozenset(('version', 'sessionAttributes', 'userAgent', 'response'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('version')
+            if value is not None:
+                obj.version = value if value.__class__ is str else _str(value)
+            value = get('sessionAttributes')
+            if value is not None:
+                obj.session_attributes = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('userAgent')
+            if value is not None:
+                obj.user_agent = value if value.__class__ is str else _str(value)
+            value = get('response')
+            if value is not None:
+                obj.response = decode_Response(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.version
+        if value is not None:
+            result['version'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.session_attributes
+        if value is not None:
+            result['sessionAttributes'] = encode(value)
+        value = obj.user_agent
+        if value is not None:
+            result['userAgent'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.response
+        if value is not None:
+            result['response'] = encode(value)
+        return result
+
+    decode_ResponseEnvelope, encode_ResponseEnvelope = decode_model, encode_model
+
+
+decode_ResponseEnvelope = _lazy('decode_ResponseEnvelope', _bind_ResponseEnvelope)
+encode_ResponseEnvelope = _lazy('encode_ResponseEnvelope', _bind_ResponseEnvelope)
+
+
+def _bind_Scope():
+    global decode_Scope, encode_Scope
+    from ask_sdk_model.scope import Scope as model
+    from ask_sdk_model.permission_status import PermissionStatus as enum0
+    keys = frozenset(('status',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('status')
+            if value is not None:
+                obj.status = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.status
+        if value is not None:
+            result['status'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_Scope, encode_Scope = decode_model, encode_model
+
+
+decode_Scope = _lazy('decode_Scope', _bind_Scope)
+encode_Scope = _lazy('encode_Scope', _bind_Scope)
+
+
+def _bind_ClearCommand():
+    global decode_ClearCommand, encode_ClearCommand
+    from ask_sdk_model.services.datastore.v1.clear_command import ClearCommand as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ClearCommand, encode_ClearCommand = decode_model, encode_model
+
+
+decode_ClearCommand = _lazy('decode_ClearCommand', _bind_ClearCommand)
+encode_ClearCommand = _lazy('encode_ClearCommand', _bind_ClearCommand)
+
+
+def _bind_Command__services_datastore_v1_command():
+    global decode_Command__services_datastore_v1_command, encode_Command__services_datastore_v1_command
+    from ask_sdk_model.services.datastore.v1.command import Command as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Command__services_datastore_v1_command, encode_Command__services_datastore_v1_command = decode_model, encode_model
+
+
+decode_Command__services_datastore_v1_command = _lazy('decode_Command__services_datastore_v1_command', _bind_Command__services_datastore_v1_command)
+encode_Command__services_datastore_v1_command = _lazy('encode_Command__services_datastore_v1_command', _bind_Command__services_datastore_v1_command)
+
+
+def _bind_PutNamespaceCommand():
+    global decode_PutNamespaceCommand, encode_PutNamespaceCommand
+    from ask_sdk_model.services.datastore.v1.put_namespace_command import PutNamespaceCommand as model
+    keys = frozenset(('type', 'namespace'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('namespace')
+            if value is not None:
+                obj.namespace = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.namespace
+        if value is not None:
+            result['namespace'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PutNamespaceCommand, encode_PutNamespaceCommand = decode_model, encode_model
+
+
+decode_PutNamespaceCommand = _lazy('decode_PutNamespaceCommand', _bind_PutNamespaceCommand)
+encode_PutNamespaceCommand = _lazy('encode_PutNamespaceCommand', _bind_PutNamespaceCommand)
+
+
+def _bind_PutObjectCommand():
+    global decode_PutObjectCommand, encode_PutObjectCommand
+    from ask_sdk_model.services.datastore.v1.put_object_command import PutObjectCommand as model
+    keys = frozenset(('type', 'namespace', 'key', 'content'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('namespace')
+            if value is not None:
+                obj.namespace = value if value.__class__ is str else _str(value)
+            value = get('key')
+            if value is not None:
+                obj.key = value if value.__class__ is str else _str(value)
+            value = get('content')
+            if value is not None:
+                obj.content = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.namespace
+        if value is not None:
+            result['namespace'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.key
+        if value is not None:
+            result['key'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.content
+        if value is not None:
+            result['content'] = encode(value)
+        return result
+
+    decode_PutObjectCommand, encode_PutObjectCommand = decode_model, encode_model
+
+
+decode_PutObjectCommand = _lazy('decode_PutObjectCommand', _bind_PutObjectCommand)
+encode_PutObjectCommand = _lazy('encode_PutObjectCommand', _bind_PutObjectCommand)
+
+
+def _bind_RemoveNamespaceCommand():
+    global decode_RemoveNamespaceCommand, encode_RemoveNamespaceCommand
+    from ask_sdk_model.services.datastore.v1.remove_namespace_command import RemoveNamespaceCommand as model
+    keys = frozenset(('type', 'namespace'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('namespace')
+            if value is not None:
+                obj.namespace = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.namespace
+        if value is not None:
+            result['namespace'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_RemoveNamespaceCommand, encode_RemoveNamespaceCommand = decode_model, encode_model
+
+
+decode_RemoveNamespaceCommand = _lazy('decode_RemoveNamespaceCommand', _bind_RemoveNamespaceCommand)
+encode_RemoveNamespaceCommand = _lazy('encode_RemoveNamespaceCommand', _bind_RemoveNamespaceCommand)
+
+
+def _bind_RemoveObjectCommand():
+    global decode_RemoveObjectCommand, encode_RemoveObjectCommand
+    from ask_sdk_model.services.datastore.v1.remove_object_command import RemoveObjectCommand as model
+    keys = frozenset(('type', 'namespace', 'key'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('namespace')
+            if value is not None:
+                obj.namespace = value if value.__class__ is str else _str(value)
+            value = get('key')
+            if value is not None:
+                obj.key = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.namespace
+        if value is not None:
+            result['namespace'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.key
+        if value is not None:
+            result['key'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_RemoveObjectCommand, encode_RemoveObjectCommand = decode_model, encode_model
+
+
+decode_RemoveObjectCommand = _lazy('decode_RemoveObjectCommand', _bind_RemoveObjectCommand)
+encode_RemoveObjectCommand = _lazy('encode_RemoveObjectCommand', _bind_RemoveObjectCommand)
+
+
+def _bind_AnimationStep():
+    global decode_AnimationStep, encode_AnimationStep
+    from ask_sdk_model.services.gadget_controller.animation_step import AnimationStep as model
+    keys = frozenset(('durationMs', 'color', 'blend'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('durationMs')
+            if value is not None:
+                obj.duration_ms = value if value.__class__ is int else _int(value)
+            value = get('color')
+            if value is not None:
+                obj.color = value if value.__class__ is str else _str(value)
+            value = get('blend')
+            if value is not None:
+                obj.blend = value if value.__class__ is bool else _bool(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.duration_ms
+        if value is not None:
+            result['durationMs'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.color
+        if value is not None:
+            result['color'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.blend
+        if value is not None:
+            result['blend'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_AnimationStep, encode_AnimationStep = decode_model, encode_model
+
+
+decode_AnimationStep = _lazy('decode_AnimationStep', _bind_AnimationStep)
+encode_AnimationStep = _lazy('encode_AnimationStep', _bind_AnimationStep)
+
+
+def _bind_LightAnimation():
+    global decode_LightAnimation, encode_LightAnimation
+    from ask_sdk_model.services.gadget_controller.light_animation import LightAnimation as model
+    keys = frozenset(('repeat', 'targetLights', 'sequence'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('repeat')
+            if value is not None:
+                obj.repeat = value if value.__class__ is int else _int(value)
+            value = get('targetLights')
+            if value is not None:
+                obj.target_lights = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('sequence')
+            if value is not None:
+                obj.sequence = [None if i0 is None else decode_AnimationStep(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.repeat
+        if value is not None:
+            result['repeat'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.target_lights
+        if value is not None:
+            result['targetLights'] = encode(value)
+        value = obj.sequence
+        if value is not None:
+            result['sequence'] = encode(value)
+        return result
+
+    decode_LightAnimation, encode_LightAnimation = decode_model, encode_model
+
+
+decode_LightAnimation = _lazy('decode_LightAnimation', _bind_LightAnimation)
+encode_LightAnimation = _lazy('encode_LightAnimation', _bind_LightAnimation)
+
+
+def _bind_SetLightParameters():
+    global decode_SetLightParameters, encode_SetLightParameters
+    from ask_sdk_model.services.gadget_controller.set_light_parameters import SetLightParameters as model
+    from ask_sdk_model.services.gadget_controller.trigger_event_type import TriggerEventType as enum0
+    keys = frozenset(('triggerEvent', 'triggerEventTimeMs', 'animations'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('triggerEvent')
+            if value is not None:
+                obj.trigger_event = enum0(value)
+            value = get('triggerEventTimeMs')
+            if value is not None:
+                obj.trigger_event_time_ms = value if value.__class__ is int else _int(value)
+            value = get('animations')
+            if value is not None:
+                obj.animations = [None if i0 is None else decode_LightAnimation(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.trigger_event
+        if value is not None:
+            result['triggerEvent'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.trigger_event_time_ms
+        if value is not None:
+            result['triggerEventTimeMs'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.animations
+        if value is not None:
+            result['animations'] = encode(value)
+        return result
+
+    decode_SetLightParameters, encode_SetLightParameters = decode_model, encode_model
+
+
+decode_SetLightParameters = _lazy('decode_SetLightParameters', _bind_SetLightParameters)
+encode_SetLightParameters = _lazy('encode_SetLightParameters', _bind_SetLightParameters)
+
+
+def _bind_DeviationRecognizer():
+    global decode_DeviationRecognizer, encode_DeviationRecognizer
+    from ask_sdk_model.services.game_engine.deviation_recognizer import DeviationRecognizer as model
+    keys = frozenset(('type', 'recognizer'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('recognizer')
+            if value is not None:
+                obj.recognizer = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.recognizer
+        if value is not None:
+            result['recognizer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_DeviationRecognizer, encode_DeviationRecognizer = decode_model, encode_model
+
+
+decode_DeviationRecognizer = _lazy('decode_DeviationRecognizer', _bind_DeviationRecognizer)
+encode_DeviationRecognizer = _lazy('encode_DeviationRecognizer', _bind_DeviationRecognizer)
+
+
+def _bind_Event__services_game_engine_event():
+    global decode_Event__services_game_engine_event, encode_Event__services_game_engine_event
+    from ask_sdk_model.services.game_engine.event import Event as model
+    from ask_sdk_model.services.game_engine.event_reporting_type import EventReportingType as enum0
+    keys = frozenset(('shouldEndInputHandler', 'meets', 'fails', 'reports', 'maximumInvocations', 'triggerTimeMilliseconds'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('shouldEndInputHandler')
+            if value is not None:
+                obj.should_end_input_handler = value if value.__class__ is bool else _bool(value)
+            value = get('meets')
+            if value is not None:
+                obj.meets = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('fails')
+            if value is not None:
+                obj.fails = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('reports')
+            if value is not None:
+                obj.reports = enum0(value)
+            value = get('maximumInvocations')
+            if value is not None:
+                obj.maximum_invocations = value if value.__class__ is int else _int(value)
+            value = get('triggerTimeMilliseconds')
+            if value is not None:
+                obj.trigger_time_milliseconds = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.should_end_input_handler
+        if value is not None:
+            result['shouldEndInputHandler'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.meets
+        if value is not None:
+            result['meets'] = encode(value)
+        value = obj.fails
+        if value is not None:
+            result['fails'] = encode(value)
+        value = obj.reports
+        if value is not None:
+            result['reports'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.maximum_invocations
+        if value is not None:
+            result['maximumInvocations'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.trigger_time_milliseconds
+        if value is not None:
+            result['triggerTimeMilliseconds'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Event__services_game_engine_event, encode_Event__services_game_engine_event = decode_model, encode_model
+
+
+decode_Event__services_game_engine_event = _lazy('decode_Event__services_game_engine_event', _bind_Event__services_game_engine_event)
+encode_Event__services_game_engine_event = _lazy('encode_Event__services_game_engine_event', _bind_Event__services_game_engine_event)
+
+
+def _bind_InputEvent():
+    global decode_InputEvent, encode_InputEvent
+    from ask_sdk_model.services.game_engine.input_event import InputEvent as model
+    from ask_sdk_model.services.game_engine.input_event_action_type import InputEventActionType as enum0
+    keys = frozenset(('gadgetId', 'timestamp', 'action', 'color', 'feature'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('gadgetId')
+            if value is not None:
+                obj.gadget_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = value if value.__class__ is str else _str(value)
+            value = get('action')
+            if value is not None:
+                obj.action = enum0(value)
+            value = get('color')
+            if value is not None:
+                obj.color = value if value.__class__ is str else _str(value)
+            value = get('feature')
+            if value is not None:
+                obj.feature = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.gadget_id
+        if value is not None:
+            result['gadgetId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.action
+        if value is not None:
+            result['action'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.color
+        if value is not None:
+            result['color'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.feature
+        if value is not None:
+            result['feature'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_InputEvent, encode_InputEvent = decode_model, encode_model
+
+
+decode_InputEvent = _lazy('decode_InputEvent', _bind_InputEvent)
+encode_InputEvent = _lazy('encode_InputEvent', _bind_InputEvent)
+
+
+def _bind_InputHandlerEvent():
+    global decode_InputHandlerEvent, encode_InputHandlerEvent
+    from ask_sdk_model.services.game_engine.input_handler_event import InputHandlerEvent as model
+    keys = frozenset(('name', 'inputEvents'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('inputEvents')
+            if value is not None:
+                obj.input_events = [None if i0 is None else decode_InputEvent(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.input_events
+        if value is not None:
+            result['inputEvents'] = encode(value)
+        return result
+
+    decode_InputHandlerEvent, encode_InputHandlerEvent = decode_model, encode_model
+
+
+decode_InputHandlerEvent = _lazy('decode_InputHandlerEvent', _bind_InputHandlerEvent)
+encode_InputHandlerEvent = _lazy('encode_InputHandlerEvent', _bind_InputHandlerEvent)
+
+
+def _bind_Pattern():
+    global decode_Pattern, encode_Pattern
+    from ask_sdk_model.services.game_engine.pattern import Pattern as model
+    from ask_sdk_model.services.game_engine.input_event_action_type import InputEventActionType as enum0
+    keys = frozenset(('gadgetIds', 'colors', 'action', 'repeat'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('gadgetIds')
+            if value is not None:
+                obj.gadget_ids = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('colors')
+            if value is not None:
+                obj.colors = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('action')
+            if value is not None:
+                obj.action = enum0(value)
+            value = get('repeat')
+            if value is not None:
+                obj.repeat = value if value.__class__ is int else _int(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.gadget_ids
+        if value is not None:
+            result['gadgetIds'] = encode(value)
+        value = obj.colors
+        if value is not None:
+            result['colors'] = encode(value)
+        value = obj.action
+        if value is not None:
+            result['action'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.repeat
+        if value is not None:
+            result['repeat'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Pattern, encode_Pattern = decode_model, encode_model
+
+
+decode_Pattern = _lazy('decode_Pattern', _bind_Pattern)
+encode_Pattern = _lazy('encode_Pattern', _bind_Pattern)
+
+
+def _bind_PatternRecognizer():
+    global decode_PatternRecognizer, encode_PatternRecognizer
+    from ask_sdk_model.services.game_engine.pattern_recognizer import PatternRecognizer as model
+    from ask_sdk_model.services.game_engine.pattern_recognizer_anchor_type import PatternRecognizerAnchorType as enum0
+    keys = frozenset(('type', 'anchor', 'fuzzy', 'gadgetIds', 'actions', 'pattern'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('anchor')
+            if value is not None:
+                obj.anchor = enum0(value)
+            value = get('fuzzy')
+            if value is not None:
+                obj.fuzzy = value if value.__class__ is bool else _bool(value)
+            value = get('gadgetIds')
+            if value is not None:
+                obj.gadget_ids = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('actions')
+            if value is not None:
+                obj.actions = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            value = get('pattern')
+            if value is not None:
+                obj.pattern = [None if i0 is None else decode_Pattern(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.anchor
+        if value is not None:
+            result['anchor'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.fuzzy
+        if value is not None:
+            result['fuzzy'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.gadget_ids
+        if value is not None:
+            result['gadgetIds'] = encode(value)
+        value = obj.actions
+        if value is not None:
+            result['actions'] = encode(value)
+        value = obj.pattern
+        if value is not None:
+            result['pattern'] = encode(value)
+        return result
+
+    decode_PatternRecognizer, encode_PatternRecognizer = decode_model, encode_model
+
+
+decode_PatternRecognizer = _lazy('decode_PatternRecognizer', _bind_PatternRecognizer)
+encode_PatternRecognizer = _lazy('encode_PatternRecognizer', _bind_PatternRecognizer)
+
+
+def _bind_ProgressRecognizer():
+    global decode_ProgressRecognizer, encode_ProgressRecognizer
+    from ask_sdk_model.services.game_engine.progress_recognizer import ProgressRecognizer as model
+    keys = frozenset(('type', 'recognizer', 'completion'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('recognizer')
+            if value is not None:
+                obj.recognizer = value if value.__class__ is str else _str(value)
+            value = get('completion')
+            if value is not None:
+                obj.completion = value if value.__class__ is float else _float(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.recognizer
+        if value is not None:
+            result['recognizer'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.completion
+        if value is not None:
+            result['completion'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ProgressRecognizer, encode_ProgressRecognizer = decode_model, encode_model
+
+
+decode_ProgressRecognizer = _lazy('decode_ProgressRecognizer', _bind_ProgressRecognizer)
+encode_ProgressRecognizer = _lazy('encode_ProgressRecognizer', _bind_ProgressRecognizer)
+
+
+def _bind_Recognizer():
+    global decode_Recognizer, encode_Recognizer
+    from ask_sdk_model.services.game_engine.recognizer import Recognizer as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Recognizer, encode_Recognizer = decode_model, encode_model
+
+
+decode_Recognizer = _lazy('decode_Recognizer', _bind_Recognizer)
+encode_Recognizer = _lazy('encode_Recognizer', _bind_Recognizer)
+
+
+def _bind_ListBody():
+    global decode_ListBody, encode_ListBody
+    from ask_sdk_model.services.list_management.list_body import ListBody as model
+    keys = frozenset(('listId',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('listId')
+            if value is not None:
+                obj.list_id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.list_id
+        if value is not None:
+            result['listId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_ListBody, encode_ListBody = decode_model, encode_model
+
+
+decode_ListBody = _lazy('decode_ListBody', _bind_ListBody)
+encode_ListBody = _lazy('encode_ListBody', _bind_ListBody)
+
+
+def _bind_ListCreatedEventRequest():
+    global decode_ListCreatedEventRequest, encode_ListCreatedEventRequest
+    from ask_sdk_model.services.list_management.list_created_event_request import ListCreatedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_ListBody(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_ListCreatedEventRequest, encode_ListCreatedEventRequest = decode_model, encode_model
+
+
+decode_ListCreatedEventRequest = _lazy('decode_ListCreatedEventRequest', _bind_ListCreatedEventRequest)
+encode_ListCreatedEventRequest = _lazy('encode_ListCreatedEventRequest', _bind_ListCreatedEventRequest)
+
+
+def _bind_ListDeletedEventRequest():
+    global decode_ListDeletedEventRequest, encode_ListDeletedEventRequest
+    from ask_sdk_model.services.list_management.list_deleted_event_request import ListDeletedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_ListBody(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_ListDeletedEventRequest, encode_ListDeletedEventRequest = decode_model, encode_model
+
+
+decode_ListDeletedEventRequest = _lazy('decode_ListDeletedEventRequest', _bind_ListDeletedEventRequest)
+encode_ListDeletedEventRequest = _lazy('encode_ListDeletedEventRequest', _bind_ListDeletedEventRequest)
+
+
+def _bind_ListItemBody():
+    global decode_ListItemBody, encode_ListItemBody
+    from ask_sdk_model.services.list_management.list_item_body import ListItemBody as model
+    keys = frozenset(('listId', 'listItemIds'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('listId')
+            if value is not None:
+                obj.list_id = value if value.__class__ is str else _str(value)
+            value = get('listItemIds')
+            if value is not None:
+                obj.list_item_ids = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.list_id
+        if value is not None:
+            result['listId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.list_item_ids
+        if value is not None:
+            result['listItemIds'] = encode(value)
+        return result
+
+    decode_ListItemBody, encode_ListItemBody = decode_model, encode_model
+
+
+decode_ListItemBody = _lazy('decode_ListItemBody', _bind_ListItemBody)
+encode_ListItemBody = _lazy('encode_ListItemBody', _bind_ListItemBody)
+
+
+def _bind_ListItemsCreatedEventRequest():
+    global decode_ListItemsCreatedEventRequest, encode_ListItemsCreatedEventRequest
+    from ask_sdk_model.services.list_management.list_items_created_event_request import ListItemsCreatedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_ListItemBody(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_ListItemsCreatedEventRequest, encode_ListItemsCreatedEventRequest = decode_model, encode_model
+
+
+decode_ListItemsCreatedEventRequest = _lazy('decode_ListItemsCreatedEventRequest', _bind_ListItemsCreatedEventRequest)
+encode_ListItemsCreatedEventRequest = _lazy('encode_ListItemsCreatedEventRequest', _bind_ListItemsCreatedEventRequest)
+
+
+def _bind_ListItemsDeletedEventRequest():
+    global decode_ListItemsDeletedEventRequest, encode_ListItemsDeletedEventRequest
+    from ask_sdk_model.services.list_management.list_items_deleted_event_request import ListItemsDeletedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_ListItemBody(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_ListItemsDeletedEventRequest, encode_ListItemsDeletedEventRequest = decode_model, encode_model
+
+
+decode_ListItemsDeletedEventRequest = _lazy('decode_ListItemsDeletedEventRequest', _bind_ListItemsDeletedEventRequest)
+encode_ListItemsDeletedEventRequest = _lazy('encode_ListItemsDeletedEventRequest', _bind_ListItemsDeletedEventRequest)
+
+
+def _bind_ListItemsUpdatedEventRequest():
+    global decode_ListItemsUpdatedEventRequest, encode_ListItemsUpdatedEventRequest
+    from ask_sdk_model.services.list_management.list_items_updated_event_request import ListItemsUpdatedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_ListItemBody(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_ListItemsUpdatedEventRequest, encode_ListItemsUpdatedEventRequest = decode_model, encode_model
+
+
+decode_ListItemsUpdatedEventRequest = _lazy('decode_ListItemsUpdatedEventRequest', _bind_ListItemsUpdatedEventRequest)
+encode_ListItemsUpdatedEventRequest = _lazy('encode_ListItemsUpdatedEventRequest', _bind_ListItemsUpdatedEventRequest)
+
+
+def _bind_ListUpdatedEventRequest():
+    global decode_ListUpdatedEventRequest, encode_ListUpdatedEventRequest
+    from ask_sdk_model.services.list_management.list_updated_event_request import ListUpdatedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body', 'eventCreationTime', 'eventPublishingTime'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_ListBody(value)
+            value = get('eventCreationTime')
+            if value is not None:
+                obj.event_creation_time = _datetime(value)
+            value = get('eventPublishingTime')
+            if value is not None:
+                obj.event_publishing_time = _datetime(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        value = obj.event_creation_time
+        if value is not None:
+            result['eventCreationTime'] = encode(value)
+        value = obj.event_publishing_time
+        if value is not None:
+            result['eventPublishingTime'] = encode(value)
+        return result
+
+    decode_ListUpdatedEventRequest, encode_ListUpdatedEventRequest = decode_model, encode_model
+
+
+decode_ListUpdatedEventRequest = _lazy('decode_ListUpdatedEventRequest', _bind_ListUpdatedEventRequest)
+encode_ListUpdatedEventRequest = _lazy('encode_ListUpdatedEventRequest', _bind_ListUpdatedEventRequest)
+
+
+def _bind_Event__services_reminder_management_event():
+    global decode_Event__services_reminder_management_event, encode_Event__services_reminder_management_event
+    from ask_sdk_model.services.reminder_management.event import Event as model
+    from ask_sdk_model.services.reminder_management.status import Status as enum0
+    keys = frozenset(('status', 'alertToken'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('status')
+            if value is not None:
+                obj.status = enum0(value)
+            value = get('alertToken')
+            if value is not None:
+                obj.alert_token = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.status
+        if value is not None:
+            result['status'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.alert_token
+        if value is not None:
+            result['alertToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Event__services_reminder_management_event, encode_Event__services_reminder_management_event = decode_model, encode_model
+
+
+decode_Event__services_reminder_management_event = _lazy('decode_Event__services_reminder_management_event', _bind_Event__services_reminder_management_event)
+encode_Event__services_reminder_management_event = _lazy('encode_Event__services_reminder_management_event', _bind_Event__services_reminder_management_event)
+
+
+def _bind_ReminderCreatedEventRequest():
+    global decode_ReminderCreatedEventRequest, encode_ReminderCreatedEventRequest
+    from ask_sdk_model.services.reminder_management.reminder_created_event_request import ReminderCreatedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_Event__services_reminder_management_event(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        return result
+
+    decode_ReminderCreatedEventRequest, encode_ReminderCreatedEventRequest = decode_model, encode_model
+
+
+decode_ReminderCreatedEventRequest = _lazy('decode_ReminderCreatedEventRequest', _bind_ReminderCreatedEventRequest)
+encode_ReminderCreatedEventRequest = _lazy('encode_ReminderCreatedEventRequest', _bind_ReminderCreatedEventRequest)
+
+
+def _bind_ReminderDeletedEvent():
+    global decode_ReminderDeletedEvent, encode_ReminderDeletedEvent
+    from ask_sdk_model.services.reminder_management.reminder_deleted_event import ReminderDeletedEvent as model
+    keys = frozenset(('alertTokens',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('alertTokens')
+            if value is not None:
+                obj.alert_tokens = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.alert_tokens
+        if value is not None:
+            result['alertTokens'] = encode(value)
+        return result
+
+    decode_ReminderDeletedEvent, encode_ReminderDeletedEvent = decode_model, encode_model
+
+
+decode_ReminderDeletedEvent = _lazy('decode_ReminderDeletedEvent', _bind_ReminderDeletedEvent)
+encode_ReminderDeletedEvent = _lazy('encode_ReminderDeletedEvent', _bind_ReminderDeletedEvent)
+
+
+def _bind_ReminderDeletedEventRequest():
+    global decode_ReminderDeletedEventRequest, encode_ReminderDeletedEventRequest
+    from ask_sdk_model.services.reminder_management.reminder_deleted_event_request import ReminderDeletedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_ReminderDeletedEvent(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        return result
+
+    decode_ReminderDeletedEventRequest, encode_ReminderDeletedEventRequest = decode_model, encode_model
+
+
+decode_ReminderDeletedEventRequest = _lazy('decode_ReminderDeletedEventRequest', _bind_ReminderDeletedEventRequest)
+encode_ReminderDeletedEventRequest = _lazy('encode_ReminderDeletedEventRequest', _bind_ReminderDeletedEventRequest)
+
+
+def _bind_ReminderStartedEventRequest():
+    global decode_ReminderStartedEventRequest, encode_ReminderStartedEventRequest
+    from ask_sdk_model.services.reminder_management.reminder_started_event_request import ReminderStartedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_Event__services_reminder_management_event(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        return result
+
+    decode_ReminderStartedEventRequest, encode_ReminderStartedEventRequest = decode_model, encode_model
+
+
+decode_ReminderStartedEventRequest = _lazy('decode_ReminderStartedEventRequest', _bind_ReminderStartedEventRequest)
+encode_ReminderStartedEventRequest = _lazy('encode_ReminderStartedEventRequest', _bind_ReminderStartedEventRequest)
+
+
+def _bind_ReminderStatusChangedEventRequest():
+    global decode_ReminderStatusChangedEventRequest, encode_ReminderStatusChangedEventRequest
+    from ask_sdk_model.services.reminder_management.reminder_status_changed_event_request import ReminderStatusChangedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_Event__services_reminder_management_event(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        return result
+
+    decode_ReminderStatusChangedEventRequest, encode_ReminderStatusChangedEventRequest = decode_model, encode_model
+
+
+decode_ReminderStatusChangedEventRequest = _lazy('decode_ReminderStatusChangedEventRequest', _bind_ReminderStatusChangedEventRequest)
+encode_ReminderStatusChangedEventRequest = _lazy('encode_ReminderStatusChangedEventRequest', _bind_ReminderStatusChangedEventRequest)
+
+
+def _bind_ReminderUpdatedEventRequest():
+    global decode_ReminderUpdatedEventRequest, encode_ReminderUpdatedEventRequest
+    from ask_sdk_model.services.reminder_management.reminder_updated_event_request import ReminderUpdatedEventRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'body'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('body')
+            if value is not None:
+                obj.body = decode_Event__services_reminder_management_event(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.body
+        if value is not None:
+            result['body'] = encode(value)
+        return result
+
+    decode_ReminderUpdatedEventRequest, encode_ReminderUpdatedEventRequest = decode_model, encode_model
+
+
+decode_ReminderUpdatedEventRequest = _lazy('decode_ReminderUpdatedEventRequest', _bind_ReminderUpdatedEventRequest)
+encode_ReminderUpdatedEventRequest = _lazy('encode_ReminderUpdatedEventRequest', _bind_ReminderUpdatedEventRequest)
+
+
+def _bind_Session():
+    global decode_Session, encode_Session
+    from ask_sdk_model.session import Session as model
+    keys = frozenset(('new', 'sessionId', 'user', 'attributes', 'application'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('new')
+            if value is not None:
+                obj.new = value if value.__class__ is bool else _bool(value)
+            value = get('sessionId')
+            if value is not None:
+                obj.session_id = value if value.__class__ is str else _str(value)
+            value = get('user')
+            if value is not None:
+                obj.user = decode_User(value)
+            value = get('attributes')
+            if value is not None:
+                obj.attributes = {k0: None if v0 is None else v0 for k0, v0 in value.items()}
+            value = get('application')
+            if value is not None:
+                obj.application = decode_Application(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.new
+        if value is not None:
+            result['new'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.session_id
+        if value is not None:
+            result['sessionId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.user
+        if value is not None:
+            result['user'] = encode(value)
+        value = obj.attributes
+        if value is not None:
+            result['attributes'] = encode(value)
+        value = obj.application
+        if value is not None:
+            result['application'] = encode(value)
+        return result
+
+    decode_Session, encode_Session = decode_model, encode_model
+
+
+decode_Session = _lazy('decode_Session', _bind_Session)
+encode_Session = _lazy('encode_Session', _bind_Session)
+
+
+def _bind_SessionEndedError():
+    global decode_SessionEndedError, encode_SessionEndedError
+    from ask_sdk_model.session_ended_error import SessionEndedError as model
+    from ask_sdk_model.session_ended_error_type import SessionEndedErrorType as enum0
+    keys = frozenset(('type', 'message'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = enum0(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SessionEndedError, encode_SessionEndedError = decode_model, encode_model
+
+
+decode_SessionEndedError = _lazy('decode_SessionEndedError', _bind_SessionEndedError)
+encode_SessionEndedError = _lazy('encode_SessionEndedError', _bind_SessionEndedError)
+
+
+def _bind_SessionEndedRequest():
+    global decode_SessionEndedRequest, encode_SessionEndedRequest
+    from ask_sdk_model.session_ended_request import SessionEndedRequest as model
+    from ask_sdk_model.session_ended_reason import SessionEndedReason as enum0
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'reason', 'error'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('reason')
+            if value is not None:
+                obj.reason = enum0(value)
+            value = get('error')
+            if value is not None:
+                obj.error = decode_SessionEndedError(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.reason
+        if value is not None:
+            result['reason'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.error
+        if value is not None:
+            result['error'] = encode(value)
+        return result
+
+    decode_SessionEndedRequest, encode_SessionEndedRequest = decode_model, encode_model
+
+
+decode_SessionEndedRequest = _lazy('decode_SessionEndedRequest', _bind_SessionEndedRequest)
+encode_SessionEndedRequest = _lazy('encode_SessionEndedRequest', _bind_SessionEndedRequest)
+
+
+def _bind_SessionResumedRequest():
+    global decode_SessionResumedRequest, encode_SessionResumedRequest
+    from ask_sdk_model.session_resumed_request import SessionResumedRequest as model
+    keys = frozenset(('type', 'requestId', 'timestamp', 'locale', 'cause'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('requestId')
+            if value is not None:
+                obj.request_id = value if value.__class__ is str else _str(value)
+            value = get('timestamp')
+            if value is not None:
+                obj.timestamp = _datetime(value)
+            value = get('locale')
+            if value is not None:
+                obj.locale = value if value.__class__ is str else _str(value)
+            value = get('cause')
+            if value is not None:
+                obj.cause = dispatch_Cause(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.request_id
+        if value is not None:
+            result['requestId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.timestamp
+        if value is not None:
+            result['timestamp'] = encode(value)
+        value = obj.locale
+        if value is not None:
+            result['locale'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.cause
+        if value is not None:
+            result['cause'] = encode(value)
+        return result
+
+    decode_SessionResumedRequest, encode_SessionResumedRequest = decode_model, encode_model
+
+
+decode_SessionResumedRequest = _lazy('decode_SessionResumedRequest', _bind_SessionResumedRequest)
+encode_SessionResumedRequest = _lazy('encode_SessionResumedRequest', _bind_SessionResumedRequest)
+
+
+def _bind_SimpleSlotValue():
+    global decode_SimpleSlotValue, encode_SimpleSlotValue
+    from ask_sdk_model.simple_slot_value import SimpleSlotValue as model
+    keys = frozenset(('type', 'value', 'resolutions'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is str else _str(value)
+            value = get('resolutions')
+            if value is not None:
+                obj.resolutions = decode_Resolutions(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.resolutions
+        if value is not None:
+            result['resolutions'] = encode(value)
+        return result
+
+    decode_SimpleSlotValue, encode_SimpleSlotValue = decode_model, encode_model
+
+
+decode_SimpleSlotValue = _lazy('decode_SimpleSlotValue', _bind_SimpleSlotValue)
+encode_SimpleSlotValue = _lazy('encode_SimpleSlotValue', _bind_SimpleSlotValue)
+
+
+def _bind_Slot():
+    global decode_Slot, encode_Slot
+    from ask_sdk_model.slot import Slot as model
+    from ask_sdk_model.slot_confirmation_status import SlotConfirmationStatus as enum0
+    keys = frozenset(('name', 'value', 'confirmationStatus', 'resolutions', 'slotValue'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('value')
+            if value is not None:
+                obj.value = value if value.__class__ is str else _str(value)
+            value = get('confirmationStatus')
+            if value is not None:
+                obj.confirmation_status = enum0(value)
+            value = get('resolutions')
+            if value is not None:
+                obj.resolutions = decode_Resolutions(value)
+            value = get('slotValue')
+            if value is not None:
+                obj.slot_value = dispatch_SlotValue(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.value
+        if value is not None:
+            result['value'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.confirmation_status
+        if value is not None:
+            result['confirmationStatus'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.resolutions
+        if value is not None:
+            result['resolutions'] = encode(value)
+        value = obj.slot_value
+        if value is not None:
+            result['slotValue'] = encode(value)
+        return result
+
+    decode_Slot, encode_Slot = decode_model, encode_model
+
+
+decode_Slot = _lazy('decode_Slot', _bind_Slot)
+encode_Slot = _lazy('encode_Slot', _bind_Slot)
+
+
+def _bind_SlotValue():
+    global decode_SlotValue, encode_SlotValue
+    from ask_sdk_model.slot_value import SlotValue as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SlotValue, encode_SlotValue = decode_model, encode_model
+
+
+decode_SlotValue = _lazy('decode_SlotValue', _bind_SlotValue)
+encode_SlotValue = _lazy('encode_SlotValue', _bind_SlotValue)
+
+
+def _bind_Resolution():
+    global decode_Resolution, encode_Resolution
+    from ask_sdk_model.slu.entityresolution.resolution import Resolution as model
+    keys = frozenset(('authority', 'status', 'values'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('authority')
+            if value is not None:
+                obj.authority = value if value.__class__ is str else _str(value)
+            value = get('status')
+            if value is not None:
+                obj.status = decode_Status__slu_entityresolution_status(value)
+            value = get('values')
+            if value is not None:
+                obj.values = [None if i0 is None else decode_ValueWrapper(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.authority
+        if value is not None:
+            result['authority'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.status
+        if value is not None:
+            result['status'] = encode(value)
+        value = obj.values
+        if value is not None:
+            result['values'] = encode(value)
+        return result
+
+    decode_Resolution, encode_Resolution = decode_model, encode_model
+
+
+decode_Resolution = _lazy('decode_Resolution', _bind_Resolution)
+encode_Resolution = _lazy('encode_Resolution', _bind_Resolution)
+
+
+def _bind_Resolutions():
+    global decode_Resolutions, encode_Resolutions
+    from ask_sdk_model.slu.entityresolution.resolutions import Resolutions as model
+    keys = frozenset(('resolutionsPerAuthority',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('resolutionsPerAuthority')
+            if value is not None:
+                obj.resolutions_per_authority = [None if i0 is None else decode_Resolution(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.resolutions_per_authority
+        if value is not None:
+            result['resolutionsPerAuthority'] = encode(value)
+        return result
+
+    decode_Resolutions, encode_Resolutions = decode_model, encode_model
+
+
+decode_Resolutions = _lazy('decode_Resolutions', _bind_Resolutions)
+encode_Resolutions = _lazy('encode_Resolutions', _bind_Resolutions)
+
+
+def _bind_Status__slu_entityresolution_status():
+    global decode_Status__slu_entityresolution_status, encode_Status__slu_entityresolution_status
+    from ask_sdk_model.slu.entityresolution.status import Status as model
+    from ask_sdk_model.slu.entityresolution.status_code import StatusCode as enum0
+    keys = frozenset(('code',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('code')
+            if value is not None:
+                obj.code = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.code
+        if value is not None:
+            result['code'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_Status__slu_entityresolution_status, encode_Status__slu_entityresolution_status = decode_model, encode_model
+
+
+decode_Status__slu_entityresolution_status = _lazy('decode_Status__slu_entityresolution_status', _bind_Status__slu_entityresolution_status)
+encode_Status__slu_entityresolution_status = _lazy('encode_Status__slu_entityresolution_status', _bind_Status__slu_entityresolution_status)
+
+
+def _bind_Value():
+    global decode_Value, encode_Value
+    from ask_sdk_model.slu.entityresolution.value import Value as model
+    keys = frozenset(('name', 'id'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('id')
+            if value is not None:
+                obj.id = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.id
+        if value is not None:
+            result['id'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Value, encode_Value = decode_model, encode_model
+
+
+decode_Value = _lazy('decode_Value', _bind_Value)
+encode_Value = _lazy('encode_Value', _bind_Value)
+
+
+def _bind_ValueWrapper():
+    global decode_ValueWrapper, encode_ValueWrapper
+    from ask_sdk_model.slu.entityresolution.value_wrapper import ValueWrapper as model
+    keys = frozenset(('value',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('value')
+            if value is not None:
+                obj.value = decode_Value(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.value
+        if value is not None:
+            result['value'] = encode(value)
+        return result
+
+    decode_ValueWrapper, encode_ValueWrapper = decode_model, encode_model
+
+
+decode_ValueWrapper = _lazy('decode_ValueWrapper', _bind_ValueWrapper)
+encode_ValueWrapper = _lazy('encode_ValueWrapper', _bind_ValueWrapper)
+
+
+def _bind_Status__status():
+    global decode_Status__status, encode_Status__status
+    from ask_sdk_model.status import Status as model
+    keys = frozenset(('code', 'message'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('code')
+            if value is not None:
+                obj.code = value if value.__class__ is str else _str(value)
+            value = get('message')
+            if value is not None:
+                obj.message = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.code
+        if value is not None:
+            result['code'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.message
+        if value is not None:
+            result['message'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Status__status, encode_Status__status = decode_model, encode_model
+
+
+decode_Status__status = _lazy('decode_Status__status', _bind_Status__status)
+encode_Status__status = _lazy('encode_Status__status', _bind_Status__status)
+
+
+def _bind_SupportedInterfaces():
+    global decode_SupportedInterfaces, encode_SupportedInterfaces
+    from ask_sdk_model.supported_interfaces import SupportedInterfaces as model
+    keys = frozenset(('Alexa.Advertisement', 'Alexa.Presentation.APL', 'Alexa.Presentation.APLT', 'Alexa.Presentation.HTML', 'AppLink', 'AudioPlayer', 'Display', 'VideoApp', 'Geolocation', 'Navigation'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('Alexa.Advertisement')
+            if value is not None:
+                obj.alexa_advertisement = decode_AlexaAdvertisementInterface(value)
+            value = get('Alexa.Presentation.APL')
+            if value is not None:
+                obj.alexa_presentation_apl = decode_AlexaPresentationAplInterface(value)
+            value = get('Alexa.Presentation.APLT')
+            if value is not None:
+                obj.alexa_presentation_aplt = decode_AlexaPresentationApltInterface(value)
+            value = get('Alexa.Presentation.HTML')
+            if value is not None:
+                obj.alexa_presentation_html = decode_AlexaPresentationHtmlInterface(value)
+            value = get('AppLink')
+            if value is not None:
+                obj.app_link = decode_AppLinkInterface(value)
+            value = get('AudioPlayer')
+            if value is not None:
+                obj.audio_player = decode_AudioPlayerInterface(value)
+            value = get('Display')
+            if value is not None:
+                obj.display = decode_DisplayInterface(value)
+            value = get('VideoApp')
+            if value is not None:
+                obj.video_app = decode_VideoAppInterface(value)
+            value = get('Geolocation')
+            if value is not None:
+                obj.geolocation = decode_GeolocationInterface(value)
+            value = get('Navigation')
+            if value is not None:
+                obj.navigation = decode_NavigationInterface(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.alexa_advertisement
+        if value is not None:
+            result['Alexa.Advertisement'] = encode(value)
+        value = obj.alexa_presentation_apl
+        if value is not None:
+            result['Alexa.Presentation.APL'] = encode(value)
+        value = obj.alexa_presentation_aplt
+        if value is not None:
+            result['Alexa.Presentation.APLT'] = encode(value)
+        value = obj.alexa_presentation_html
+        if value is not None:
+            result['Alexa.Presentation.HTML'] = encode(value)
+        value = obj.app_link
+        if value is not None:
+            result['AppLink'] = encode(value)
+        value = obj.audio_player
+        if value is not None:
+            result['AudioPlayer'] = encode(value)
+        value = obj.display
+        if value is not None:
+            result['Display'] = encode(value)
+        value = obj.video_app
+        if value is not None:
+            result['VideoApp'] = encode(value)
+        value = obj.geolocation
+        if value is not None:
+            result['Geolocation'] = encode(value)
+        value = obj.navigation
+        if value is not None:
+            result['Navigation'] = encode(value)
+        return result
+
+    decode_SupportedInterfaces, encode_SupportedInterfaces = decode_model, encode_model
+
+
+decode_SupportedInterfaces = _lazy('decode_SupportedInterfaces', _bind_SupportedInterfaces)
+encode_SupportedInterfaces = _lazy('encode_SupportedInterfaces', _bind_SupportedInterfaces)
+
+
+def _bind_Task():
+    global decode_Task, encode_Task
+    from ask_sdk_model.task import Task as model
+    keys = frozenset(('name', 'version', 'input'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('name')
+            if value is not None:
+                obj.name = value if value.__class__ is str else _str(value)
+            value = get('version')
+            if value is not None:
+                obj.version = value if value.__class__ is str else _str(value)
+            value = get('input')
+            if value is not None:
+                obj.input = value
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.name
+        if value is not None:
+            result['name'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.version
+        if value is not None:
+            result['version'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.input
+        if value is not None:
+            result['input'] = encode(value)
+        return result
+
+    decode_Task, encode_Task = decode_model, encode_model
+
+
+decode_Task = _lazy('decode_Task', _bind_Task)
+encode_Task = _lazy('encode_Task', _bind_Task)
+
+
+def _bind_AskForPermissionsConsentCard():
+    global decode_AskForPermissionsConsentCard, encode_AskForPermissionsConsentCard
+    from ask_sdk_model.ui.ask_for_permissions_consent_card import AskForPermissionsConsentCard as model
+    keys = frozenset(('type', 'permissions'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('permissions')
+            if value is not None:
+                obj.permissions = [None if i0 is None else i0 if i0.__class__ is str else _str(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.permissions
+        if value is not None:
+            result['permissions'] = encode(value)
+        return result
+
+    decode_AskForPermissionsConsentCard, encode_AskForPermissionsConsentCard = decode_model, encode_model
+
+
+decode_AskForPermissionsConsentCard = _lazy('decode_AskForPermissionsConsentCard', _bind_AskForPermissionsConsentCard)
+encode_AskForPermissionsConsentCard = _lazy('encode_AskForPermissionsConsentCard', _bind_AskForPermissionsConsentCard)
+
+
+def _bind_Card():
+    global decode_Card, encode_Card
+    from ask_sdk_model.ui.card import Card as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Card, encode_Card = decode_model, encode_model
+
+
+decode_Card = _lazy('decode_Card', _bind_Card)
+encode_Card = _lazy('encode_Card', _bind_Card)
+
+
+def _bind_Image__ui_image():
+    global decode_Image__ui_image, encode_Image__ui_image
+    from ask_sdk_model.ui.image import Image as model
+    keys = frozenset(('smallImageUrl', 'largeImageUrl'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('smallImageUrl')
+            if value is not None:
+                obj.small_image_url = value if value.__class__ is str else _str(value)
+            value = get('largeImageUrl')
+            if value is not None:
+                obj.large_image_url = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.small_image_url
+        if value is not None:
+            result['smallImageUrl'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.large_image_url
+        if value is not None:
+            result['largeImageUrl'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_Image__ui_image, encode_Image__ui_image = decode_model, encode_model
+
+
+decode_Image__ui_image = _lazy('decode_Image__ui_image', _bind_Image__ui_image)
+encode_Image__ui_image = _lazy('encode_Image__ui_image', _bind_Image__ui_image)
+
+
+def _bind_LinkAccountCard():
+    global decode_LinkAccountCard, encode_LinkAccountCard
+    from ask_sdk_model.ui.link_account_card import LinkAccountCard as model
+    keys = frozenset(('type',))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_LinkAccountCard, encode_LinkAccountCard = decode_model, encode_model
+
+
+decode_LinkAccountCard = _lazy('decode_LinkAccountCard', _bind_LinkAccountCard)
+encode_LinkAccountCard = _lazy('encode_LinkAccountCard', _bind_LinkAccountCard)
+
+
+def _bind_OutputSpeech():
+    global decode_OutputSpeech, encode_OutputSpeech
+    from ask_sdk_model.ui.output_speech import OutputSpeech as model
+    from ask_sdk_model.ui.play_behavior import PlayBehavior as enum0
+    keys = frozenset(('type', 'playBehavior'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('type')
+            if value is not None:
+                obj.object_type = value if value.__class__ is str else _str(value)
+            value = get('playBehavior')
+            if value is not None:
+                obj.play_behavior = enum0(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.play_behavior
+        if value is not None:
+            result['playBehavior'] = value.value if value.__class__ is enum0 else encode(value)
+        return result
+
+    decode_OutputSpeech, encode_OutputSpeech = decode_model, encode_model
+
+
+decode_OutputSpeech = _lazy('decode_OutputSpeech', _bind_OutputSpeech)
+encode_OutputSpeech = _lazy('encode_OutputSpeech', _bind_OutputSpeech)
+
+
+def _bind_PlainTextOutputSpeech():
+    global decode_PlainTextOutputSpeech, encode_PlainTextOutputSpeech
+    from ask_sdk_model.ui.plain_text_output_speech import PlainTextOutputSpeech as model
+    from ask_sdk_model.ui.play_behavior import PlayBehavior as enum0
+    keys = frozenset(('type', 'playBehavior', 'text'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('playBehavior')
+            if value is not None:
+                obj.play_behavior = enum0(value)
+            value = get('text')
+            if value is not None:
+                obj.text = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.play_behavior
+        if value is not None:
+            result['playBehavior'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.text
+        if value is not None:
+            result['text'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_PlainTextOutputSpeech, encode_PlainTextOutputSpeech = decode_model, encode_model
+
+
+decode_PlainTextOutputSpeech = _lazy('decode_PlainTextOutputSpeech', _bind_PlainTextOutputSpeech)
+encode_PlainTextOutputSpeech = _lazy('encode_PlainTextOutputSpeech', _bind_PlainTextOutputSpeech)
+
+
+def _bind_Reprompt():
+    global decode_Reprompt, encode_Reprompt
+    from ask_sdk_model.ui.reprompt import Reprompt as model
+    keys = frozenset(('outputSpeech', 'directives'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('outputSpeech')
+            if value is not None:
+                obj.output_speech = dispatch_OutputSpeech(value)
+            value = get('directives')
+            if value is not None:
+                obj.directives = [None if i0 is None else dispatch_Directive(i0) for i0 in value]
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.output_speech
+        if value is not None:
+            result['outputSpeech'] = encode(value)
+        value = obj.directives
+        if value is not None:
+            result['directives'] = encode(value)
+        return result
+
+    decode_Reprompt, encode_Reprompt = decode_model, encode_model
+
+
+decode_Reprompt = _lazy('decode_Reprompt', _bind_Reprompt)
+encode_Reprompt = _lazy('encode_Reprompt', _bind_Reprompt)
+
+
+def _bind_SimpleCard():
+    global decode_SimpleCard, encode_SimpleCard
+    from ask_sdk_model.ui.simple_card import SimpleCard as model
+    keys = frozenset(('type', 'title', 'content'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('content')
+            if value is not None:
+                obj.content = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.content
+        if value is not None:
+            result['content'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SimpleCard, encode_SimpleCard = decode_model, encode_model
+
+
+decode_SimpleCard = _lazy('decode_SimpleCard', _bind_SimpleCard)
+encode_SimpleCard = _lazy('encode_SimpleCard', _bind_SimpleCard)
+
+
+def _bind_SsmlOutputSpeech():
+    global decode_SsmlOutputSpeech, encode_SsmlOutputSpeech
+    from ask_sdk_model.ui.ssml_output_speech import SsmlOutputSpeech as model
+    from ask_sdk_model.ui.play_behavior import PlayBehavior as enum0
+    keys = frozenset(('type', 'playBehavior', 'ssml'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('playBehavior')
+            if value is not None:
+                obj.play_behavior = enum0(value)
+            value = get('ssml')
+            if value is not None:
+                obj.ssml = value if value.__class__ is str else _str(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.play_behavior
+        if value is not None:
+            result['playBehavior'] = value.value if value.__class__ is enum0 else encode(value)
+        value = obj.ssml
+        if value is not None:
+            result['ssml'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        return result
+
+    decode_SsmlOutputSpeech, encode_SsmlOutputSpeech = decode_model, encode_model
+
+
+decode_SsmlOutputSpeech = _lazy('decode_SsmlOutputSpeech', _bind_SsmlOutputSpeech)
+encode_SsmlOutputSpeech = _lazy('encode_SsmlOutputSpeech', _bind_SsmlOutputSpeech)
+
+
+def _bind_StandardCard():
+    global decode_StandardCard, encode_StandardCard
+    from ask_sdk_model.ui.standard_card import StandardCard as model
+    keys = frozenset(('type', 'title', 'text', 'image'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            if 'type' in payload:
+                value = payload['type']
+                obj.object_type = None if value is None else value if value.__class__ is str else _str(value)
+            value = get('title')
+            if value is not None:
+                obj.title = value if value.__class__ is str else _str(value)
+            value = get('text')
+            if value is not None:
+                obj.text = value if value.__class__ is str else _str(value)
+            value = get('image')
+            if value is not None:
+                obj.image = decode_Image__ui_image(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.object_type
+        if value is not None:
+            result['type'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.title
+        if value is not None:
+            result['title'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.text
+        if value is not None:
+            result['text'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.image
+        if value is not None:
+            result['image'] = encode(value)
+        return result
+
+    decode_StandardCard, encode_StandardCard = decode_model, encode_model
+
+
+decode_StandardCard = _lazy('decode_StandardCard', _bind_StandardCard)
+encode_StandardCard = _lazy('encode_StandardCard', _bind_StandardCard)
+
+
+def _bind_User():
+    global decode_User, encode_User
+    from ask_sdk_model.user import User as model
+    keys = frozenset(('userId', 'accessToken', 'permissions'))
+
+    def decode_model(payload):
+        try:
+            obj = model()
+            get = payload.get
+            value = get('userId')
+            if value is not None:
+                obj.user_id = value if value.__class__ is str else _str(value)
+            value = get('accessToken')
+            if value is not None:
+                obj.access_token = value if value.__class__ is str else _str(value)
+            value = get('permissions')
+            if value is not None:
+                obj.permissions = decode_Permissions(value)
+            if not keys.issuperset(payload):
+                for key in payload:
+                    if key not in keys:
+                        setattr(obj, key, payload[key])
+            return obj
+        except Exception as e:
+            raise _failed(e)
+
+    def encode_model(obj):
+        result = {}
+        value = obj.user_id
+        if value is not None:
+            result['userId'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.access_token
+        if value is not None:
+            result['accessToken'] = value if value.__class__ in _PRIMITIVES else encode(value)
+        value = obj.permissions
+        if value is not None:
+            result['permissions'] = encode(value)
+        return result
+
+    decode_User, encode_User = decode_model, encode_model
+
+
+decode_User = _lazy('decode_User', _bind_User)
+encode_User = _lazy('encode_User', _bind_User)
+
+
+DECODERS = {
+    'ask_sdk_model.application.Application': 'decode_Application',
+    'ask_sdk_model.authorization.authorization_grant_body.AuthorizationGrantBody': 'decode_AuthorizationGrantBody',
+    'ask_sdk_model.authorization.authorization_grant_request.AuthorizationGrantRequest': 'dispatch_Request',
+    'ask_sdk_model.authorization.grant.Grant': 'decode_Grant',
+    'ask_sdk_model.canfulfill.can_fulfill_intent.CanFulfillIntent': 'decode_CanFulfillIntent',
+    'ask_sdk_model.canfulfill.can_fulfill_intent_request.CanFulfillIntentRequest': 'dispatch_Request',
+    'ask_sdk_model.canfulfill.can_fulfill_slot.CanFulfillSlot': 'decode_CanFulfillSlot',
+    'ask_sdk_model.cause.Cause': 'dispatch_Cause',
+    'ask_sdk_model.connection_completed.ConnectionCompleted': 'dispatch_Cause',
+    'ask_sdk_model.context.Context': 'decode_Context',
+    'ask_sdk_model.device.Device': 'decode_Device',
+    'ask_sdk_model.dialog.confirm_intent_directive.ConfirmIntentDirective': 'dispatch_Directive',
+    'ask_sdk_model.dialog.confirm_slot_directive.ConfirmSlotDirective': 'dispatch_Directive',
+    'ask_sdk_model.dialog.delegate_directive.DelegateDirective': 'dispatch_Directive',
+    'ask_sdk_model.dialog.delegate_request_directive.DelegateRequestDirective': 'dispatch_Directive',
+    'ask_sdk_model.dialog.delegation_period.DelegationPeriod': 'decode_DelegationPeriod',
+    'ask_sdk_model.dialog.dynamic_entities_directive.DynamicEntitiesDirective': 'dispatch_Directive',
+    'ask_sdk_model.dialog.elicit_slot_directive.ElicitSlotDirective': 'dispatch_Directive',
+    'ask_sdk_model.dialog.input.Input': 'decode_Input',
+    'ask_sdk_model.dialog.input_request.InputRequest': 'dispatch_Request',
+    'ask_sdk_model.dialog.updated_input_request.UpdatedInputRequest': 'dispatch_UpdatedRequest',
+    'ask_sdk_model.dialog.updated_intent_request.UpdatedIntentRequest': 'dispatch_UpdatedRequest',
+    'ask_sdk_model.dialog.updated_request.UpdatedRequest': 'dispatch_UpdatedRequest',
+    'ask_sdk_model.directive.Directive': 'dispatch_Directive',
+    'ask_sdk_model.er.dynamic.entity.Entity': 'decode_Entity',
+    'ask_sdk_model.er.dynamic.entity_list_item.EntityListItem': 'decode_EntityListItem',
+    'ask_sdk_model.er.dynamic.entity_value_and_synonyms.EntityValueAndSynonyms': 'decode_EntityValueAndSynonyms',
+    'ask_sdk_model.events.skillevents.account_linked_body.AccountLinkedBody': 'decode_AccountLinkedBody',
+    'ask_sdk_model.events.skillevents.account_linked_request.AccountLinkedRequest': 'dispatch_Request',
+    'ask_sdk_model.events.skillevents.notification_subscription_changed_body.NotificationSubscriptionChangedBody': 'decode_NotificationSubscriptionChangedBody',
+    'ask_sdk_model.events.skillevents.notification_subscription_changed_request.NotificationSubscriptionChangedRequest': 'dispatch_Request',
+    'ask_sdk_model.events.skillevents.notification_subscription_event.NotificationSubscriptionEvent': 'decode_NotificationSubscriptionEvent',
+    'ask_sdk_model.events.skillevents.permission.Permission': 'decode_Permission',
+    'ask_sdk_model.events.skillevents.permission_accepted_request.PermissionAcceptedRequest': 'dispatch_Request',
+    'ask_sdk_model.events.skillevents.permission_body.PermissionBody': 'decode_PermissionBody',
+    'ask_sdk_model.events.skillevents.permission_changed_request.PermissionChangedRequest': 'dispatch_Request',
+    'ask_sdk_model.events.skillevents.proactive_subscription_changed_body.ProactiveSubscriptionChangedBody': 'decode_ProactiveSubscriptionChangedBody',
+    'ask_sdk_model.events.skillevents.proactive_subscription_changed_request.ProactiveSubscriptionChangedRequest': 'dispatch_Request',
+    'ask_sdk_model.events.skillevents.proactive_subscription_event.ProactiveSubscriptionEvent': 'decode_ProactiveSubscriptionEvent',
+    'ask_sdk_model.events.skillevents.skill_disabled_request.SkillDisabledRequest': 'dispatch_Request',
+    'ask_sdk_model.events.skillevents.skill_enabled_request.SkillEnabledRequest': 'dispatch_Request',
+    'ask_sdk_model.intent.Intent': 'decode_Intent',
+    'ask_sdk_model.intent_request.IntentRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.advertisement.ad_completed.AdCompleted': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.advertisement.ad_not_rendered.AdNotRendered': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.advertisement.alexa_advertisement_interface.AlexaAdvertisementInterface': 'decode_AlexaAdvertisementInterface',
+    'ask_sdk_model.interfaces.alexa.advertisement.inject_ads.InjectAds': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.advertisement.ready_to_enqueue_audio.ReadyToEnqueueAudio': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.advertisement.reason.Reason': 'decode_Reason',
+    'ask_sdk_model.interfaces.alexa.datastore.commands_error.CommandsError': 'dispatch_CommandsError',
+    'ask_sdk_model.interfaces.alexa.datastore.data_store_error.DataStoreError': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.datastore.data_store_internal_error.DataStoreInternalError': 'dispatch_CommandsError',
+    'ask_sdk_model.interfaces.alexa.datastore.device_permanantly_unavailable_error.DevicePermanantlyUnavailableError': 'dispatch_CommandsError',
+    'ask_sdk_model.interfaces.alexa.datastore.device_unavailable_error.DeviceUnavailableError': 'dispatch_CommandsError',
+    'ask_sdk_model.interfaces.alexa.datastore.dispatch_error_content.DispatchErrorContent': 'decode_DispatchErrorContent',
+    'ask_sdk_model.interfaces.alexa.datastore.execution_error_content.ExecutionErrorContent': 'decode_ExecutionErrorContent',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.installation_error.InstallationError': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_error.PackageError': 'decode_PackageError',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_install_usage.PackageInstallUsage': 'decode_PackageInstallUsage',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_manager_state.PackageManagerState': 'decode_PackageManagerState',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_remove_usage.PackageRemoveUsage': 'decode_PackageRemoveUsage',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_state_information.PackageStateInformation': 'decode_PackageStateInformation',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.update_request.UpdateRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_install_request.UsagesInstallRequest': 'decode_UsagesInstallRequest',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_installed.UsagesInstalled': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_removed.UsagesRemoved': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_removed_request.UsagesRemovedRequest': 'decode_UsagesRemovedRequest',
+    'ask_sdk_model.interfaces.alexa.datastore.storage_limit_execeeded_error.StorageLimitExeceededError': 'dispatch_CommandsError',
+    'ask_sdk_model.interfaces.alexa.experimentation.experiment_assignment.ExperimentAssignment': 'decode_ExperimentAssignment',
+    'ask_sdk_model.interfaces.alexa.experimentation.experiment_trigger_response.ExperimentTriggerResponse': 'decode_ExperimentTriggerResponse',
+    'ask_sdk_model.interfaces.alexa.experimentation.experimentation_state.ExperimentationState': 'decode_ExperimentationState',
+    'ask_sdk_model.interfaces.alexa.extension.available_extension.AvailableExtension': 'decode_AvailableExtension',
+    'ask_sdk_model.interfaces.alexa.extension.extensions_state.ExtensionsState': 'decode_ExtensionsState',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.alexa_presentation_apl_interface.AlexaPresentationAplInterface': 'decode_AlexaPresentationAplInterface',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.animate_item_command.AnimateItemCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.animated_opacity_property.AnimatedOpacityProperty': 'dispatch_AnimatedProperty',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.animated_property.AnimatedProperty': 'dispatch_AnimatedProperty',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.animated_transform_property.AnimatedTransformProperty': 'dispatch_AnimatedProperty',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.auto_page_command.AutoPageCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.clear_focus_command.ClearFocusCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.command.Command': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_entity.ComponentEntity': 'decode_ComponentEntity',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen.ComponentVisibleOnScreen': 'decode_ComponentVisibleOnScreen',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_list_item_tag.ComponentVisibleOnScreenListItemTag': 'decode_ComponentVisibleOnScreenListItemTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_list_tag.ComponentVisibleOnScreenListTag': 'decode_ComponentVisibleOnScreenListTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_media_tag.ComponentVisibleOnScreenMediaTag': 'decode_ComponentVisibleOnScreenMediaTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_pager_tag.ComponentVisibleOnScreenPagerTag': 'decode_ComponentVisibleOnScreenPagerTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_scrollable_tag.ComponentVisibleOnScreenScrollableTag': 'decode_ComponentVisibleOnScreenScrollableTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_tags.ComponentVisibleOnScreenTags': 'decode_ComponentVisibleOnScreenTags',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_viewport_tag.ComponentVisibleOnScreenViewportTag': 'decode_ComponentVisibleOnScreenViewportTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.control_media_command.ControlMediaCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.execute_commands_directive.ExecuteCommandsDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.finish_command.FinishCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.go_back_command.GoBackCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.hide_overlay_command.HideOverlayCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.idle_command.IdleCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.list_runtime_error.ListRuntimeError': 'dispatch_RuntimeError__interfaces_alexa_presentation_apl_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.delete_item_operation.DeleteItemOperation': 'dispatch_Operation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.delete_multiple_items_operation.DeleteMultipleItemsOperation': 'dispatch_Operation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.insert_item_operation.InsertItemOperation': 'dispatch_Operation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.insert_multiple_items_operation.InsertMultipleItemsOperation': 'dispatch_Operation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.operation.Operation': 'dispatch_Operation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.set_item_operation.SetItemOperation': 'dispatch_Operation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.load_index_list_data_event.LoadIndexListDataEvent': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.load_token_list_data_event.LoadTokenListDataEvent': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.open_url_command.OpenUrlCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.parallel_command.ParallelCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.play_media_command.PlayMediaCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.reinflate_command.ReinflateCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.render_document_directive.RenderDocumentDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.rendered_document_state.RenderedDocumentState': 'decode_RenderedDocumentState',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.runtime.Runtime': 'decode_Runtime__interfaces_alexa_presentation_apl_runtime',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.runtime_error.RuntimeError': 'dispatch_RuntimeError__interfaces_alexa_presentation_apl_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.runtime_error_event.RuntimeErrorEvent': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.scroll_command.ScrollCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.scroll_to_component_command.ScrollToComponentCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.scroll_to_index_command.ScrollToIndexCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.select_command.SelectCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.send_event_command.SendEventCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.send_index_list_data_directive.SendIndexListDataDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.send_token_list_data_directive.SendTokenListDataDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.sequential_command.SequentialCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.set_focus_command.SetFocusCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.set_page_command.SetPageCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.set_state_command.SetStateCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.set_value_command.SetValueCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.show_overlay_command.ShowOverlayCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.speak_item_command.SpeakItemCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.speak_list_command.SpeakListCommand': 'dispatch_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.transform_property.TransformProperty': 'decode_TransformProperty',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.update_index_list_data_directive.UpdateIndexListDataDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.user_event.UserEvent': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.video_source.VideoSource': 'decode_VideoSource',
+    'ask_sdk_model.interfaces.alexa.presentation.apl_presentation_state_context.AplPresentationStateContext': 'dispatch_PresentationStateContext',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.audio_source_runtime_error.AudioSourceRuntimeError': 'dispatch_RuntimeError__interfaces_alexa_presentation_apla_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.document_runtime_error.DocumentRuntimeError': 'dispatch_RuntimeError__interfaces_alexa_presentation_apla_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.link_runtime_error.LinkRuntimeError': 'dispatch_RuntimeError__interfaces_alexa_presentation_apla_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.render_document_directive.RenderDocumentDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.render_runtime_error.RenderRuntimeError': 'dispatch_RuntimeError__interfaces_alexa_presentation_apla_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.runtime_error.RuntimeError': 'dispatch_RuntimeError__interfaces_alexa_presentation_apla_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.runtime_error_event.RuntimeErrorEvent': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.alexa_presentation_aplt_interface.AlexaPresentationApltInterface': 'decode_AlexaPresentationApltInterface',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.auto_page_command.AutoPageCommand': 'dispatch_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.command.Command': 'dispatch_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.execute_commands_directive.ExecuteCommandsDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.idle_command.IdleCommand': 'dispatch_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.parallel_command.ParallelCommand': 'dispatch_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.render_document_directive.RenderDocumentDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.runtime.Runtime': 'decode_Runtime__interfaces_alexa_presentation_aplt_runtime',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.scroll_command.ScrollCommand': 'dispatch_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.send_event_command.SendEventCommand': 'dispatch_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.sequential_command.SequentialCommand': 'dispatch_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.set_page_command.SetPageCommand': 'dispatch_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.set_value_command.SetValueCommand': 'dispatch_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.user_event.UserEvent': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.presentation.html.alexa_presentation_html_interface.AlexaPresentationHtmlInterface': 'decode_AlexaPresentationHtmlInterface',
+    'ask_sdk_model.interfaces.alexa.presentation.html.configuration.Configuration': 'decode_Configuration',
+    'ask_sdk_model.interfaces.alexa.presentation.html.handle_message_directive.HandleMessageDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.html.message_request.MessageRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.presentation.html.runtime.Runtime': 'decode_Runtime__interfaces_alexa_presentation_html_runtime',
+    'ask_sdk_model.interfaces.alexa.presentation.html.runtime_error.RuntimeError': 'decode_RuntimeError__interfaces_alexa_presentation_html_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.html.runtime_error_request.RuntimeErrorRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.alexa.presentation.html.start_directive.StartDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.alexa.presentation.html.start_request.StartRequest': 'decode_StartRequest',
+    'ask_sdk_model.interfaces.alexa.presentation.html.transformer.Transformer': 'decode_Transformer',
+    'ask_sdk_model.interfaces.alexa.presentation.presentation_state.PresentationState': 'decode_PresentationState',
+    'ask_sdk_model.interfaces.alexa.presentation.presentation_state_context.PresentationStateContext': 'dispatch_PresentationStateContext',
+    'ask_sdk_model.interfaces.alexa.smartvision.snapshotprovider.get_snapshot_directive.GetSnapshotDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.applink.app_link_interface.AppLinkInterface': 'decode_AppLinkInterface',
+    'ask_sdk_model.interfaces.applink.app_link_state.AppLinkState': 'decode_AppLinkState',
+    'ask_sdk_model.interfaces.applink.direct_launch.DirectLaunch': 'decode_DirectLaunch',
+    'ask_sdk_model.interfaces.applink.send_to_device.SendToDevice': 'decode_SendToDevice',
+    'ask_sdk_model.interfaces.audioplayer.audio_item.AudioItem': 'decode_AudioItem',
+    'ask_sdk_model.interfaces.audioplayer.audio_item_metadata.AudioItemMetadata': 'decode_AudioItemMetadata',
+    'ask_sdk_model.interfaces.audioplayer.audio_player_interface.AudioPlayerInterface': 'decode_AudioPlayerInterface',
+    'ask_sdk_model.interfaces.audioplayer.audio_player_state.AudioPlayerState': 'decode_AudioPlayerState',
+    'ask_sdk_model.interfaces.audioplayer.caption_data.CaptionData': 'decode_CaptionData',
+    'ask_sdk_model.interfaces.audioplayer.clear_queue_directive.ClearQueueDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.audioplayer.current_playback_state.CurrentPlaybackState': 'decode_CurrentPlaybackState',
+    'ask_sdk_model.interfaces.audioplayer.error.Error': 'decode_Error__interfaces_audioplayer_error',
+    'ask_sdk_model.interfaces.audioplayer.play_directive.PlayDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.audioplayer.playback_failed_request.PlaybackFailedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.audioplayer.playback_finished_request.PlaybackFinishedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.audioplayer.playback_nearly_finished_request.PlaybackNearlyFinishedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.audioplayer.playback_started_request.PlaybackStartedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.audioplayer.playback_stopped_request.PlaybackStoppedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.audioplayer.stop_directive.StopDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.audioplayer.stream.Stream': 'decode_Stream',
+    'ask_sdk_model.interfaces.automotive.automotive_state.AutomotiveState': 'decode_AutomotiveState',
+    'ask_sdk_model.interfaces.connections.connections_request.ConnectionsRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.connections.connections_response.ConnectionsResponse': 'dispatch_Request',
+    'ask_sdk_model.interfaces.connections.connections_status.ConnectionsStatus': 'decode_ConnectionsStatus',
+    'ask_sdk_model.interfaces.connections.send_request_directive.SendRequestDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.connections.send_response_directive.SendResponseDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.connections.v1.start_connection_directive.StartConnectionDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.conversations.api_invocation_request.APIInvocationRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.conversations.api_request.APIRequest': 'decode_APIRequest',
+    'ask_sdk_model.interfaces.conversations.reset_context_directive.ResetContextDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.custom_interface_controller.endpoint.Endpoint': 'decode_Endpoint',
+    'ask_sdk_model.interfaces.custom_interface_controller.event.Event': 'decode_Event__interfaces_custom_interface_controller_event',
+    'ask_sdk_model.interfaces.custom_interface_controller.event_filter.EventFilter': 'decode_EventFilter',
+    'ask_sdk_model.interfaces.custom_interface_controller.events_received_request.EventsReceivedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.custom_interface_controller.expiration.Expiration': 'decode_Expiration',
+    'ask_sdk_model.interfaces.custom_interface_controller.expired_request.ExpiredRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.custom_interface_controller.header.Header': 'decode_Header',
+    'ask_sdk_model.interfaces.custom_interface_controller.send_directive_directive.SendDirectiveDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.custom_interface_controller.start_event_handler_directive.StartEventHandlerDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.custom_interface_controller.stop_event_handler_directive.StopEventHandlerDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.display.body_template1.BodyTemplate1': 'dispatch_Template',
+    'ask_sdk_model.interfaces.display.body_template2.BodyTemplate2': 'dispatch_Template',
+    'ask_sdk_model.interfaces.display.body_template3.BodyTemplate3': 'dispatch_Template',
+    'ask_sdk_model.interfaces.display.body_template6.BodyTemplate6': 'dispatch_Template',
+    'ask_sdk_model.interfaces.display.body_template7.BodyTemplate7': 'dispatch_Template',
+    'ask_sdk_model.interfaces.display.display_interface.DisplayInterface': 'decode_DisplayInterface',
+    'ask_sdk_model.interfaces.display.display_state.DisplayState': 'decode_DisplayState',
+    'ask_sdk_model.interfaces.display.element_selected_request.ElementSelectedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.display.hint.Hint': 'dispatch_Hint',
+    'ask_sdk_model.interfaces.display.hint_directive.HintDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.display.image.Image': 'decode_Image__interfaces_display_image',
+    'ask_sdk_model.interfaces.display.image_instance.ImageInstance': 'decode_ImageInstance',
+    'ask_sdk_model.interfaces.display.list_item.ListItem': 'decode_ListItem',
+    'ask_sdk_model.interfaces.display.list_template1.ListTemplate1': 'dispatch_Template',
+    'ask_sdk_model.interfaces.display.list_template2.ListTemplate2': 'dispatch_Template',
+    'ask_sdk_model.interfaces.display.plain_text.PlainText': 'dispatch_TextField',
+    'ask_sdk_model.interfaces.display.plain_text_hint.PlainTextHint': 'dispatch_Hint',
+    'ask_sdk_model.interfaces.display.render_template_directive.RenderTemplateDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.display.rich_text.RichText': 'dispatch_TextField',
+    'ask_sdk_model.interfaces.display.template.Template': 'dispatch_Template',
+    'ask_sdk_model.interfaces.display.text_content.TextContent': 'decode_TextContent',
+    'ask_sdk_model.interfaces.display.text_field.TextField': 'dispatch_TextField',
+    'ask_sdk_model.interfaces.gadget_controller.set_light_directive.SetLightDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.game_engine.input_handler_event_request.InputHandlerEventRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.game_engine.start_input_handler_directive.StartInputHandlerDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.game_engine.stop_input_handler_directive.StopInputHandlerDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.geolocation.altitude.Altitude': 'decode_Altitude',
+    'ask_sdk_model.interfaces.geolocation.coordinate.Coordinate': 'decode_Coordinate',
+    'ask_sdk_model.interfaces.geolocation.geolocation_interface.GeolocationInterface': 'decode_GeolocationInterface',
+    'ask_sdk_model.interfaces.geolocation.geolocation_state.GeolocationState': 'decode_GeolocationState',
+    'ask_sdk_model.interfaces.geolocation.heading.Heading': 'decode_Heading',
+    'ask_sdk_model.interfaces.geolocation.location_services.LocationServices': 'decode_LocationServices',
+    'ask_sdk_model.interfaces.geolocation.speed.Speed': 'decode_Speed',
+    'ask_sdk_model.interfaces.messaging.message_received_request.MessageReceivedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.navigation.assistance.announce_road_regulation.AnnounceRoadRegulation': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.navigation.navigation_interface.NavigationInterface': 'decode_NavigationInterface',
+    'ask_sdk_model.interfaces.playbackcontroller.next_command_issued_request.NextCommandIssuedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.playbackcontroller.pause_command_issued_request.PauseCommandIssuedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.playbackcontroller.play_command_issued_request.PlayCommandIssuedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.playbackcontroller.previous_command_issued_request.PreviousCommandIssuedRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.system.error.Error': 'decode_Error__interfaces_system_error',
+    'ask_sdk_model.interfaces.system.error_cause.ErrorCause': 'decode_ErrorCause',
+    'ask_sdk_model.interfaces.system.exception_encountered_request.ExceptionEncounteredRequest': 'dispatch_Request',
+    'ask_sdk_model.interfaces.system.system_state.SystemState': 'decode_SystemState',
+    'ask_sdk_model.interfaces.system_unit.unit.Unit': 'decode_Unit',
+    'ask_sdk_model.interfaces.tasks.complete_task_directive.CompleteTaskDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.videoapp.launch_directive.LaunchDirective': 'dispatch_Directive',
+    'ask_sdk_model.interfaces.videoapp.metadata.Metadata': 'decode_Metadata',
+    'ask_sdk_model.interfaces.videoapp.video_app_interface.VideoAppInterface': 'decode_VideoAppInterface',
+    'ask_sdk_model.interfaces.videoapp.video_item.VideoItem': 'decode_VideoItem',
+    'ask_sdk_model.interfaces.viewport.apl.current_configuration.CurrentConfiguration': 'decode_CurrentConfiguration',
+    'ask_sdk_model.interfaces.viewport.apl.viewport_configuration.ViewportConfiguration': 'decode_ViewportConfiguration',
+    'ask_sdk_model.interfaces.viewport.apl_viewport_state.APLViewportState': 'dispatch_TypedViewportState',
+    'ask_sdk_model.interfaces.viewport.aplt.inter_segment.InterSegment': 'decode_InterSegment',
+    'ask_sdk_model.interfaces.viewport.aplt_viewport_state.APLTViewportState': 'dispatch_TypedViewportState',
+    'ask_sdk_model.interfaces.viewport.experience.Experience': 'decode_Experience',
+    'ask_sdk_model.interfaces.viewport.size.continuous_viewport_size.ContinuousViewportSize': 'dispatch_ViewportSize',
+    'ask_sdk_model.interfaces.viewport.size.discrete_viewport_size.DiscreteViewportSize': 'dispatch_ViewportSize',
+    'ask_sdk_model.interfaces.viewport.size.viewport_size.ViewportSize': 'dispatch_ViewportSize',
+    'ask_sdk_model.interfaces.viewport.typed_viewport_state.TypedViewportState': 'dispatch_TypedViewportState',
+    'ask_sdk_model.interfaces.viewport.viewport_state.ViewportState': 'decode_ViewportState',
+    'ask_sdk_model.interfaces.viewport.viewport_state_video.ViewportStateVideo': 'decode_ViewportStateVideo',
+    'ask_sdk_model.interfaces.viewport.viewport_video.ViewportVideo': 'decode_ViewportVideo',
+    'ask_sdk_model.launch_request.LaunchRequest': 'dispatch_Request',
+    'ask_sdk_model.list_slot_value.ListSlotValue': 'dispatch_SlotValue',
+    'ask_sdk_model.permissions.Permissions': 'decode_Permissions',
+    'ask_sdk_model.person.Person': 'decode_Person',
+    'ask_sdk_model.request.Request': 'dispatch_Request',
+    'ask_sdk_model.request_envelope.RequestEnvelope': 'decode_RequestEnvelope',
+    'ask_sdk_model.response.Response': 'decode_Response',
+    'ask_sdk_model.response_envelope.ResponseEnvelope': 'decode_ResponseEnvelope',
+    'ask_sdk_model.scope.Scope': 'decode_Scope',
+    'ask_sdk_model.services.datastore.v1.clear_command.ClearCommand': 'dispatch_Command__services_datastore_v1_command',
+    'ask_sdk_model.services.datastore.v1.command.Command': 'dispatch_Command__services_datastore_v1_command',
+    'ask_sdk_model.services.datastore.v1.put_namespace_command.PutNamespaceCommand': 'dispatch_Command__services_datastore_v1_command',
+    'ask_sdk_model.services.datastore.v1.put_object_command.PutObjectCommand': 'dispatch_Command__services_datastore_v1_command',
+    'ask_sdk_model.services.datastore.v1.remove_namespace_command.RemoveNamespaceCommand': 'dispatch_Command__services_datastore_v1_command',
+    'ask_sdk_model.services.datastore.v1.remove_object_command.RemoveObjectCommand': 'dispatch_Command__services_datastore_v1_command',
+    'ask_sdk_model.services.gadget_controller.animation_step.AnimationStep': 'decode_AnimationStep',
+    'ask_sdk_model.services.gadget_controller.light_animation.LightAnimation': 'decode_LightAnimation',
+    'ask_sdk_model.services.gadget_controller.set_light_parameters.SetLightParameters': 'decode_SetLightParameters',
+    'ask_sdk_model.services.game_engine.deviation_recognizer.DeviationRecognizer': 'dispatch_Recognizer',
+    'ask_sdk_model.services.game_engine.event.Event': 'decode_Event__services_game_engine_event',
+    'ask_sdk_model.services.game_engine.input_event.InputEvent': 'decode_InputEvent',
+    'ask_sdk_model.services.game_engine.input_handler_event.InputHandlerEvent': 'decode_InputHandlerEvent',
+    'ask_sdk_model.services.game_engine.pattern.Pattern': 'decode_Pattern',
+    'ask_sdk_model.services.game_engine.pattern_recognizer.PatternRecognizer': 'dispatch_Recognizer',
+    'ask_sdk_model.services.game_engine.progress_recognizer.ProgressRecognizer': 'dispatch_Recognizer',
+    'ask_sdk_model.services.game_engine.recognizer.Recognizer': 'dispatch_Recognizer',
+    'ask_sdk_model.services.list_management.list_body.ListBody': 'decode_ListBody',
+    'ask_sdk_model.services.list_management.list_created_event_request.ListCreatedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.list_management.list_deleted_event_request.ListDeletedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.list_management.list_item_body.ListItemBody': 'decode_ListItemBody',
+    'ask_sdk_model.services.list_management.list_items_created_event_request.ListItemsCreatedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.list_management.list_items_deleted_event_request.ListItemsDeletedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.list_management.list_items_updated_event_request.ListItemsUpdatedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.list_management.list_updated_event_request.ListUpdatedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.reminder_management.event.Event': 'decode_Event__services_reminder_management_event',
+    'ask_sdk_model.services.reminder_management.reminder_created_event_request.ReminderCreatedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.reminder_management.reminder_deleted_event.ReminderDeletedEvent': 'decode_ReminderDeletedEvent',
+    'ask_sdk_model.services.reminder_management.reminder_deleted_event_request.ReminderDeletedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.reminder_management.reminder_started_event_request.ReminderStartedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.reminder_management.reminder_status_changed_event_request.ReminderStatusChangedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.services.reminder_management.reminder_updated_event_request.ReminderUpdatedEventRequest': 'dispatch_Request',
+    'ask_sdk_model.session.Session': 'decode_Session',
+    'ask_sdk_model.session_ended_error.SessionEndedError': 'decode_SessionEndedError',
+    'ask_sdk_model.session_ended_request.SessionEndedRequest': 'dispatch_Request',
+    'ask_sdk_model.session_resumed_request.SessionResumedRequest': 'dispatch_Request',
+    'ask_sdk_model.simple_slot_value.SimpleSlotValue': 'dispatch_SlotValue',
+    'ask_sdk_model.slot.Slot': 'decode_Slot',
+    'ask_sdk_model.slot_value.SlotValue': 'dispatch_SlotValue',
+    'ask_sdk_model.slu.entityresolution.resolution.Resolution': 'decode_Resolution',
+    'ask_sdk_model.slu.entityresolution.resolutions.Resolutions': 'decode_Resolutions',
+    'ask_sdk_model.slu.entityresolution.status.Status': 'decode_Status__slu_entityresolution_status',
+    'ask_sdk_model.slu.entityresolution.value.Value': 'decode_Value',
+    'ask_sdk_model.slu.entityresolution.value_wrapper.ValueWrapper': 'decode_ValueWrapper',
+    'ask_sdk_model.status.Status': 'decode_Status__status',
+    'ask_sdk_model.supported_interfaces.SupportedInterfaces': 'decode_SupportedInterfaces',
+    'ask_sdk_model.task.Task': 'decode_Task',
+    'ask_sdk_model.ui.ask_for_permissions_consent_card.AskForPermissionsConsentCard': 'dispatch_Card',
+    'ask_sdk_model.ui.card.Card': 'dispatch_Card',
+    'ask_sdk_model.ui.image.Image': 'decode_Image__ui_image',
+    'ask_sdk_model.ui.link_account_card.LinkAccountCard': 'dispatch_Card',
+    'ask_sdk_model.ui.output_speech.OutputSpeech': 'dispatch_OutputSpeech',
+    'ask_sdk_model.ui.plain_text_output_speech.PlainTextOutputSpeech': 'dispatch_OutputSpeech',
+    'ask_sdk_model.ui.reprompt.Reprompt': 'decode_Reprompt',
+    'ask_sdk_model.ui.simple_card.SimpleCard': 'dispatch_Card',
+    'ask_sdk_model.ui.ssml_output_speech.SsmlOutputSpeech': 'dispatch_OutputSpeech',
+    'ask_sdk_model.ui.standard_card.StandardCard': 'dispatch_Card',
+    'ask_sdk_model.user.User': 'decode_User',
+}
+
+ENCODERS = {
+    'ask_sdk_model.application.Application': 'encode_Application',
+    'ask_sdk_model.authorization.authorization_grant_body.AuthorizationGrantBody': 'encode_AuthorizationGrantBody',
+    'ask_sdk_model.authorization.authorization_grant_request.AuthorizationGrantRequest': 'encode_AuthorizationGrantRequest',
+    'ask_sdk_model.authorization.grant.Grant': 'encode_Grant',
+    'ask_sdk_model.canfulfill.can_fulfill_intent.CanFulfillIntent': 'encode_CanFulfillIntent',
+    'ask_sdk_model.canfulfill.can_fulfill_intent_request.CanFulfillIntentRequest': 'encode_CanFulfillIntentRequest',
+    'ask_sdk_model.canfulfill.can_fulfill_slot.CanFulfillSlot': 'encode_CanFulfillSlot',
+    'ask_sdk_model.cause.Cause': 'encode_Cause',
+    'ask_sdk_model.connection_completed.ConnectionCompleted': 'encode_ConnectionCompleted',
+    'ask_sdk_model.context.Context': 'encode_Context',
+    'ask_sdk_model.device.Device': 'encode_Device',
+    'ask_sdk_model.dialog.confirm_intent_directive.ConfirmIntentDirective': 'encode_ConfirmIntentDirective',
+    'ask_sdk_model.dialog.confirm_slot_directive.ConfirmSlotDirective': 'encode_ConfirmSlotDirective',
+    'ask_sdk_model.dialog.delegate_directive.DelegateDirective': 'encode_DelegateDirective',
+    'ask_sdk_model.dialog.delegate_request_directive.DelegateRequestDirective': 'encode_DelegateRequestDirective',
+    'ask_sdk_model.dialog.delegation_period.DelegationPeriod': 'encode_DelegationPeriod',
+    'ask_sdk_model.dialog.dynamic_entities_directive.DynamicEntitiesDirective': 'encode_DynamicEntitiesDirective',
+    'ask_sdk_model.dialog.elicit_slot_directive.ElicitSlotDirective': 'encode_ElicitSlotDirective',
+    'ask_sdk_model.dialog.input.Input': 'encode_Input',
+    'ask_sdk_model.dialog.input_request.InputRequest': 'encode_InputRequest',
+    'ask_sdk_model.dialog.updated_input_request.UpdatedInputRequest': 'encode_UpdatedInputRequest',
+    'ask_sdk_model.dialog.updated_intent_request.UpdatedIntentRequest': 'encode_UpdatedIntentRequest',
+    'ask_sdk_model.dialog.updated_request.UpdatedRequest': 'encode_UpdatedRequest',
+    'ask_sdk_model.directive.Directive': 'encode_Directive',
+    'ask_sdk_model.er.dynamic.entity.Entity': 'encode_Entity',
+    'ask_sdk_model.er.dynamic.entity_list_item.EntityListItem': 'encode_EntityListItem',
+    'ask_sdk_model.er.dynamic.entity_value_and_synonyms.EntityValueAndSynonyms': 'encode_EntityValueAndSynonyms',
+    'ask_sdk_model.events.skillevents.account_linked_body.AccountLinkedBody': 'encode_AccountLinkedBody',
+    'ask_sdk_model.events.skillevents.account_linked_request.AccountLinkedRequest': 'encode_AccountLinkedRequest',
+    'ask_sdk_model.events.skillevents.notification_subscription_changed_body.NotificationSubscriptionChangedBody': 'encode_NotificationSubscriptionChangedBody',
+    'ask_sdk_model.events.skillevents.notification_subscription_changed_request.NotificationSubscriptionChangedRequest': 'encode_NotificationSubscriptionChangedRequest',
+    'ask_sdk_model.events.skillevents.notification_subscription_event.NotificationSubscriptionEvent': 'encode_NotificationSubscriptionEvent',
+    'ask_sdk_model.events.skillevents.permission.Permission': 'encode_Permission',
+    'ask_sdk_model.events.skillevents.permission_accepted_request.PermissionAcceptedRequest': 'encode_PermissionAcceptedRequest',
+    'ask_sdk_model.events.skillevents.permission_body.PermissionBody': 'encode_PermissionBody',
+    'ask_sdk_model.events.skillevents.permission_changed_request.PermissionChangedRequest': 'encode_PermissionChangedRequest',
+    'ask_sdk_model.events.skillevents.proactive_subscription_changed_body.ProactiveSubscriptionChangedBody': 'encode_ProactiveSubscriptionChangedBody',
+    'ask_sdk_model.events.skillevents.proactive_subscription_changed_request.ProactiveSubscriptionChangedRequest': 'encode_ProactiveSubscriptionChangedRequest',
+    'ask_sdk_model.events.skillevents.proactive_subscription_event.ProactiveSubscriptionEvent': 'encode_ProactiveSubscriptionEvent',
+    'ask_sdk_model.events.skillevents.skill_disabled_request.SkillDisabledRequest': 'encode_SkillDisabledRequest',
+    'ask_sdk_model.events.skillevents.skill_enabled_request.SkillEnabledRequest': 'encode_SkillEnabledRequest',
+    'ask_sdk_model.intent.Intent': 'encode_Intent',
+    'ask_sdk_model.intent_request.IntentRequest': 'encode_IntentRequest',
+    'ask_sdk_model.interfaces.alexa.advertisement.ad_completed.AdCompleted': 'encode_AdCompleted',
+    'ask_sdk_model.interfaces.alexa.advertisement.ad_not_rendered.AdNotRendered': 'encode_AdNotRendered',
+    'ask_sdk_model.interfaces.alexa.advertisement.alexa_advertisement_interface.AlexaAdvertisementInterface': 'encode_AlexaAdvertisementInterface',
+    'ask_sdk_model.interfaces.alexa.advertisement.inject_ads.InjectAds': 'encode_InjectAds',
+    'ask_sdk_model.interfaces.alexa.advertisement.ready_to_enqueue_audio.ReadyToEnqueueAudio': 'encode_ReadyToEnqueueAudio',
+    'ask_sdk_model.interfaces.alexa.advertisement.reason.Reason': 'encode_Reason',
+    'ask_sdk_model.interfaces.alexa.datastore.commands_error.CommandsError': 'encode_CommandsError',
+    'ask_sdk_model.interfaces.alexa.datastore.data_store_error.DataStoreError': 'encode_DataStoreError',
+    'ask_sdk_model.interfaces.alexa.datastore.data_store_internal_error.DataStoreInternalError': 'encode_DataStoreInternalError',
+    'ask_sdk_model.interfaces.alexa.datastore.device_permanantly_unavailable_error.DevicePermanantlyUnavailableError': 'encode_DevicePermanantlyUnavailableError',
+    'ask_sdk_model.interfaces.alexa.datastore.device_unavailable_error.DeviceUnavailableError': 'encode_DeviceUnavailableError',
+    'ask_sdk_model.interfaces.alexa.datastore.dispatch_error_content.DispatchErrorContent': 'encode_DispatchErrorContent',
+    'ask_sdk_model.interfaces.alexa.datastore.execution_error_content.ExecutionErrorContent': 'encode_ExecutionErrorContent',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.installation_error.InstallationError': 'encode_InstallationError',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_error.PackageError': 'encode_PackageError',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_install_usage.PackageInstallUsage': 'encode_PackageInstallUsage',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_manager_state.PackageManagerState': 'encode_PackageManagerState',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_remove_usage.PackageRemoveUsage': 'encode_PackageRemoveUsage',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.package_state_information.PackageStateInformation': 'encode_PackageStateInformation',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.update_request.UpdateRequest': 'encode_UpdateRequest',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_install_request.UsagesInstallRequest': 'encode_UsagesInstallRequest',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_installed.UsagesInstalled': 'encode_UsagesInstalled',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_removed.UsagesRemoved': 'encode_UsagesRemoved',
+    'ask_sdk_model.interfaces.alexa.datastore.packagemanager.usages_removed_request.UsagesRemovedRequest': 'encode_UsagesRemovedRequest',
+    'ask_sdk_model.interfaces.alexa.datastore.storage_limit_execeeded_error.StorageLimitExeceededError': 'encode_StorageLimitExeceededError',
+    'ask_sdk_model.interfaces.alexa.experimentation.experiment_assignment.ExperimentAssignment': 'encode_ExperimentAssignment',
+    'ask_sdk_model.interfaces.alexa.experimentation.experiment_trigger_response.ExperimentTriggerResponse': 'encode_ExperimentTriggerResponse',
+    'ask_sdk_model.interfaces.alexa.experimentation.experimentation_state.ExperimentationState': 'encode_ExperimentationState',
+    'ask_sdk_model.interfaces.alexa.extension.available_extension.AvailableExtension': 'encode_AvailableExtension',
+    'ask_sdk_model.interfaces.alexa.extension.extensions_state.ExtensionsState': 'encode_ExtensionsState',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.alexa_presentation_apl_interface.AlexaPresentationAplInterface': 'encode_AlexaPresentationAplInterface',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.animate_item_command.AnimateItemCommand': 'encode_AnimateItemCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.animated_opacity_property.AnimatedOpacityProperty': 'encode_AnimatedOpacityProperty',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.animated_property.AnimatedProperty': 'encode_AnimatedProperty',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.animated_transform_property.AnimatedTransformProperty': 'encode_AnimatedTransformProperty',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.auto_page_command.AutoPageCommand': 'encode_AutoPageCommand__interfaces_alexa_presentation_apl_auto_page_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.clear_focus_command.ClearFocusCommand': 'encode_ClearFocusCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.command.Command': 'encode_Command__interfaces_alexa_presentation_apl_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_entity.ComponentEntity': 'encode_ComponentEntity',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen.ComponentVisibleOnScreen': 'encode_ComponentVisibleOnScreen',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_list_item_tag.ComponentVisibleOnScreenListItemTag': 'encode_ComponentVisibleOnScreenListItemTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_list_tag.ComponentVisibleOnScreenListTag': 'encode_ComponentVisibleOnScreenListTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_media_tag.ComponentVisibleOnScreenMediaTag': 'encode_ComponentVisibleOnScreenMediaTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_pager_tag.ComponentVisibleOnScreenPagerTag': 'encode_ComponentVisibleOnScreenPagerTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_scrollable_tag.ComponentVisibleOnScreenScrollableTag': 'encode_ComponentVisibleOnScreenScrollableTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_tags.ComponentVisibleOnScreenTags': 'encode_ComponentVisibleOnScreenTags',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.component_visible_on_screen_viewport_tag.ComponentVisibleOnScreenViewportTag': 'encode_ComponentVisibleOnScreenViewportTag',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.control_media_command.ControlMediaCommand': 'encode_ControlMediaCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.execute_commands_directive.ExecuteCommandsDirective': 'encode_ExecuteCommandsDirective__interfaces_alexa_presentation_apl_execute_commands_directive',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.finish_command.FinishCommand': 'encode_FinishCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.go_back_command.GoBackCommand': 'encode_GoBackCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.hide_overlay_command.HideOverlayCommand': 'encode_HideOverlayCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.idle_command.IdleCommand': 'encode_IdleCommand__interfaces_alexa_presentation_apl_idle_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.list_runtime_error.ListRuntimeError': 'encode_ListRuntimeError',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.delete_item_operation.DeleteItemOperation': 'encode_DeleteItemOperation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.delete_multiple_items_operation.DeleteMultipleItemsOperation': 'encode_DeleteMultipleItemsOperation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.insert_item_operation.InsertItemOperation': 'encode_InsertItemOperation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.insert_multiple_items_operation.InsertMultipleItemsOperation': 'encode_InsertMultipleItemsOperation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.operation.Operation': 'encode_Operation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.listoperations.set_item_operation.SetItemOperation': 'encode_SetItemOperation',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.load_index_list_data_event.LoadIndexListDataEvent': 'encode_LoadIndexListDataEvent',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.load_token_list_data_event.LoadTokenListDataEvent': 'encode_LoadTokenListDataEvent',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.open_url_command.OpenUrlCommand': 'encode_OpenUrlCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.parallel_command.ParallelCommand': 'encode_ParallelCommand__interfaces_alexa_presentation_apl_parallel_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.play_media_command.PlayMediaCommand': 'encode_PlayMediaCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.reinflate_command.ReinflateCommand': 'encode_ReinflateCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.render_document_directive.RenderDocumentDirective': 'encode_RenderDocumentDirective__interfaces_alexa_presentation_apl_render_document_directive',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.rendered_document_state.RenderedDocumentState': 'encode_RenderedDocumentState',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.runtime.Runtime': 'encode_Runtime__interfaces_alexa_presentation_apl_runtime',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.runtime_error.RuntimeError': 'encode_RuntimeError__interfaces_alexa_presentation_apl_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.runtime_error_event.RuntimeErrorEvent': 'encode_RuntimeErrorEvent__interfaces_alexa_presentation_apl_runtime_error_event',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.scroll_command.ScrollCommand': 'encode_ScrollCommand__interfaces_alexa_presentation_apl_scroll_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.scroll_to_component_command.ScrollToComponentCommand': 'encode_ScrollToComponentCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.scroll_to_index_command.ScrollToIndexCommand': 'encode_ScrollToIndexCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.select_command.SelectCommand': 'encode_SelectCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.send_event_command.SendEventCommand': 'encode_SendEventCommand__interfaces_alexa_presentation_apl_send_event_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.send_index_list_data_directive.SendIndexListDataDirective': 'encode_SendIndexListDataDirective',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.send_token_list_data_directive.SendTokenListDataDirective': 'encode_SendTokenListDataDirective',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.sequential_command.SequentialCommand': 'encode_SequentialCommand__interfaces_alexa_presentation_apl_sequential_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.set_focus_command.SetFocusCommand': 'encode_SetFocusCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.set_page_command.SetPageCommand': 'encode_SetPageCommand__interfaces_alexa_presentation_apl_set_page_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.set_state_command.SetStateCommand': 'encode_SetStateCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.set_value_command.SetValueCommand': 'encode_SetValueCommand__interfaces_alexa_presentation_apl_set_value_command',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.show_overlay_command.ShowOverlayCommand': 'encode_ShowOverlayCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.speak_item_command.SpeakItemCommand': 'encode_SpeakItemCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.speak_list_command.SpeakListCommand': 'encode_SpeakListCommand',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.transform_property.TransformProperty': 'encode_TransformProperty',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.update_index_list_data_directive.UpdateIndexListDataDirective': 'encode_UpdateIndexListDataDirective',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.user_event.UserEvent': 'encode_UserEvent__interfaces_alexa_presentation_apl_user_event',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.video_source.VideoSource': 'encode_VideoSource',
+    'ask_sdk_model.interfaces.alexa.presentation.apl_presentation_state_context.AplPresentationStateContext': 'encode_AplPresentationStateContext',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.audio_source_runtime_error.AudioSourceRuntimeError': 'encode_AudioSourceRuntimeError',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.document_runtime_error.DocumentRuntimeError': 'encode_DocumentRuntimeError',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.link_runtime_error.LinkRuntimeError': 'encode_LinkRuntimeError',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.render_document_directive.RenderDocumentDirective': 'encode_RenderDocumentDirective__interfaces_alexa_presentation_apla_render_document_directive',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.render_runtime_error.RenderRuntimeError': 'encode_RenderRuntimeError',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.runtime_error.RuntimeError': 'encode_RuntimeError__interfaces_alexa_presentation_apla_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.apla.runtime_error_event.RuntimeErrorEvent': 'encode_RuntimeErrorEvent__interfaces_alexa_presentation_apla_runtime_error_event',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.alexa_presentation_aplt_interface.AlexaPresentationApltInterface': 'encode_AlexaPresentationApltInterface',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.auto_page_command.AutoPageCommand': 'encode_AutoPageCommand__interfaces_alexa_presentation_aplt_auto_page_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.command.Command': 'encode_Command__interfaces_alexa_presentation_aplt_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.execute_commands_directive.ExecuteCommandsDirective': 'encode_ExecuteCommandsDirective__interfaces_alexa_presentation_aplt_execute_commands_directive',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.idle_command.IdleCommand': 'encode_IdleCommand__interfaces_alexa_presentation_aplt_idle_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.parallel_command.ParallelCommand': 'encode_ParallelCommand__interfaces_alexa_presentation_aplt_parallel_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.render_document_directive.RenderDocumentDirective': 'encode_RenderDocumentDirective__interfaces_alexa_presentation_aplt_render_document_directive',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.runtime.Runtime': 'encode_Runtime__interfaces_alexa_presentation_aplt_runtime',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.scroll_command.ScrollCommand': 'encode_ScrollCommand__interfaces_alexa_presentation_aplt_scroll_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.send_event_command.SendEventCommand': 'encode_SendEventCommand__interfaces_alexa_presentation_aplt_send_event_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.sequential_command.SequentialCommand': 'encode_SequentialCommand__interfaces_alexa_presentation_aplt_sequential_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.set_page_command.SetPageCommand': 'encode_SetPageCommand__interfaces_alexa_presentation_aplt_set_page_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.set_value_command.SetValueCommand': 'encode_SetValueCommand__interfaces_alexa_presentation_aplt_set_value_command',
+    'ask_sdk_model.interfaces.alexa.presentation.aplt.user_event.UserEvent': 'encode_UserEvent__interfaces_alexa_presentation_aplt_user_event',
+    'ask_sdk_model.interfaces.alexa.presentation.html.alexa_presentation_html_interface.AlexaPresentationHtmlInterface': 'encode_AlexaPresentationHtmlInterface',
+    'ask_sdk_model.interfaces.alexa.presentation.html.configuration.Configuration': 'encode_Configuration',
+    'ask_sdk_model.interfaces.alexa.presentation.html.handle_message_directive.HandleMessageDirective': 'encode_HandleMessageDirective',
+    'ask_sdk_model.interfaces.alexa.presentation.html.message_request.MessageRequest': 'encode_MessageRequest',
+    'ask_sdk_model.interfaces.alexa.presentation.html.runtime.Runtime': 'encode_Runtime__interfaces_alexa_presentation_html_runtime',
+    'ask_sdk_model.interfaces.alexa.presentation.html.runtime_error.RuntimeError': 'encode_RuntimeError__interfaces_alexa_presentation_html_runtime_error',
+    'ask_sdk_model.interfaces.alexa.presentation.html.runtime_error_request.RuntimeErrorRequest': 'encode_RuntimeErrorRequest',
+    'ask_sdk_model.interfaces.alexa.presentation.html.start_directive.StartDirective': 'encode_StartDirective',
+    'ask_sdk_model.interfaces.alexa.presentation.html.start_request.StartRequest': 'encode_StartRequest',
+    'ask_sdk_model.interfaces.alexa.presentation.html.transformer.Transformer': 'encode_Transformer',
+    'ask_sdk_model.interfaces.alexa.presentation.presentation_state.PresentationState': 'encode_PresentationState',
+    'ask_sdk_model.interfaces.alexa.presentation.presentation_state_context.PresentationStateContext': 'encode_PresentationStateContext',
+    'ask_sdk_model.interfaces.alexa.smartvision.snapshotprovider.get_snapshot_directive.GetSnapshotDirective': 'encode_GetSnapshotDirective',
+    'ask_sdk_model.interfaces.applink.app_link_interface.AppLinkInterface': 'encode_AppLinkInterface',
+    'ask_sdk_model.interfaces.applink.app_link_state.AppLinkState': 'encode_AppLinkState',
+    'ask_sdk_model.interfaces.applink.direct_launch.DirectLaunch': 'encode_DirectLaunch',
+    'ask_sdk_model.interfaces.applink.send_to_device.SendToDevice': 'encode_SendToDevice',
+    'ask_sdk_model.interfaces.audioplayer.audio_item.AudioItem': 'encode_AudioItem',
+    'ask_sdk_model.interfaces.audioplayer.audio_item_metadata.AudioItemMetadata': 'encode_AudioItemMetadata',
+    'ask_sdk_model.interfaces.audioplayer.audio_player_interface.AudioPlayerInterface': 'encode_AudioPlayerInterface',
+    'ask_sdk_model.interfaces.audioplayer.audio_player_state.AudioPlayerState': 'encode_AudioPlayerState',
+    'ask_sdk_model.interfaces.audioplayer.caption_data.CaptionData': 'encode_CaptionData',
+    'ask_sdk_model.interfaces.audioplayer.clear_queue_directive.ClearQueueDirective': 'encode_ClearQueueDirective',
+    'ask_sdk_model.interfaces.audioplayer.current_playback_state.CurrentPlaybackState': 'encode_CurrentPlaybackState',
+    'ask_sdk_model.interfaces.audioplayer.error.Error': 'encode_Error__interfaces_audioplayer_error',
+    'ask_sdk_model.interfaces.audioplayer.play_directive.PlayDirective': 'encode_PlayDirective',
+    'ask_sdk_model.interfaces.audioplayer.playback_failed_request.PlaybackFailedRequest': 'encode_PlaybackFailedRequest',
+    'ask_sdk_model.interfaces.audioplayer.playback_finished_request.PlaybackFinishedRequest': 'encode_PlaybackFinishedRequest',
+    'ask_sdk_model.interfaces.audioplayer.playback_nearly_finished_request.PlaybackNearlyFinishedRequest': 'encode_PlaybackNearlyFinishedRequest',
+    'ask_sdk_model.interfaces.audioplayer.playback_started_request.PlaybackStartedRequest': 'encode_PlaybackStartedRequest',
+    'ask_sdk_model.interfaces.audioplayer.playback_stopped_request.PlaybackStoppedRequest': 'encode_PlaybackStoppedRequest',
+    'ask_sdk_model.interfaces.audioplayer.stop_directive.StopDirective': 'encode_StopDirective',
+    'ask_sdk_model.interfaces.audioplayer.stream.Stream': 'encode_Stream',
+    'ask_sdk_model.interfaces.automotive.automotive_state.AutomotiveState': 'encode_AutomotiveState',
+    'ask_sdk_model.interfaces.connections.connections_request.ConnectionsRequest': 'encode_ConnectionsRequest',
+    'ask_sdk_model.interfaces.connections.connections_response.ConnectionsResponse': 'encode_ConnectionsResponse',
+    'ask_sdk_model.interfaces.connections.connections_status.ConnectionsStatus': 'encode_ConnectionsStatus',
+    'ask_sdk_model.interfaces.connections.send_request_directive.SendRequestDirective': 'encode_SendRequestDirective',
+    'ask_sdk_model.interfaces.connections.send_response_directive.SendResponseDirective': 'encode_SendResponseDirective',
+    'ask_sdk_model.interfaces.connections.v1.start_connection_directive.StartConnectionDirective': 'encode_StartConnectionDirective',
+    'ask_sdk_model.interfaces.conversations.api_invocation_request.APIInvocationRequest': 'encode_APIInvocationRequest',
+    'ask_sdk_model.interfaces.conversations.api_request.APIRequest': 'encode_APIRequest',
+    'ask_sdk_model.interfaces.conversations.reset_context_directive.ResetContextDirective': 'encode_ResetContextDirective',
+    'ask_sdk_model.interfaces.custom_interface_controller.endpoint.Endpoint': 'encode_Endpoint',
+    'ask_sdk_model.interfaces.custom_interface_controller.event.Event': 'encode_Event__interfaces_custom_interface_controller_event',
+    'ask_sdk_model.interfaces.custom_interface_controller.event_filter.EventFilter': 'encode_EventFilter',
+    'ask_sdk_model.interfaces.custom_interface_controller.events_received_request.EventsReceivedRequest': 'encode_EventsReceivedRequest',
+    'ask_sdk_model.interfaces.custom_interface_controller.expiration.Expiration': 'encode_Expiration',
+    'ask_sdk_model.interfaces.custom_interface_controller.expired_request.ExpiredRequest': 'encode_ExpiredRequest',
+    'ask_sdk_model.interfaces.custom_interface_controller.header.Header': 'encode_Header',
+    'ask_sdk_model.interfaces.custom_interface_controller.send_directive_directive.SendDirectiveDirective': 'encode_SendDirectiveDirective',
+    'ask_sdk_model.interfaces.custom_interface_controller.start_event_handler_directive.StartEventHandlerDirective': 'encode_StartEventHandlerDirective',
+    'ask_sdk_model.interfaces.custom_interface_controller.stop_event_handler_directive.StopEventHandlerDirective': 'encode_StopEventHandlerDirective',
+    'ask_sdk_model.interfaces.display.body_template1.BodyTemplate1': 'encode_BodyTemplate1',
+    'ask_sdk_model.interfaces.display.body_template2.BodyTemplate2': 'encode_BodyTemplate2',
+    'ask_sdk_model.interfaces.display.body_template3.BodyTemplate3': 'encode_BodyTemplate3',
+    'ask_sdk_model.interfaces.display.body_template6.BodyTemplate6': 'encode_BodyTemplate6',
+    'ask_sdk_model.interfaces.display.body_template7.BodyTemplate7': 'encode_BodyTemplate7',
+    'ask_sdk_model.interfaces.display.display_interface.DisplayInterface': 'encode_DisplayInterface',
+    'ask_sdk_model.interfaces.display.display_state.DisplayState': 'encode_DisplayState',
+    'ask_sdk_model.interfaces.display.element_selected_request.ElementSelectedRequest': 'encode_ElementSelectedRequest',
+    'ask_sdk_model.interfaces.display.hint.Hint': 'encode_Hint',
+    'ask_sdk_model.interfaces.display.hint_directive.HintDirective': 'encode_HintDirective',
+    'ask_sdk_model.interfaces.display.image.Image': 'encode_Image__interfaces_display_image',
+    'ask_sdk_model.interfaces.display.image_instance.ImageInstance': 'encode_ImageInstance',
+    'ask_sdk_model.interfaces.display.list_item.ListItem': 'encode_ListItem',
+    'ask_sdk_model.interfaces.display.list_template1.ListTemplate1': 'encode_ListTemplate1',
+    'ask_sdk_model.interfaces.display.list_template2.ListTemplate2': 'encode_ListTemplate2',
+    'ask_sdk_model.interfaces.display.plain_text.PlainText': 'encode_PlainText',
+    'ask_sdk_model.interfaces.display.plain_text_hint.PlainTextHint': 'encode_PlainTextHint',
+    'ask_sdk_model.interfaces.display.render_template_directive.RenderTemplateDirective': 'encode_RenderTemplateDirective',
+    'ask_sdk_model.interfaces.display.rich_text.RichText': 'encode_RichText',
+    'ask_sdk_model.interfaces.display.template.Template': 'encode_Template',
+    'ask_sdk_model.interfaces.display.text_content.TextContent': 'encode_TextContent',
+    'ask_sdk_model.interfaces.display.text_field.TextField': 'encode_TextField',
+    'ask_sdk_model.interfaces.gadget_controller.set_light_directive.SetLightDirective': 'encode_SetLightDirective',
+    'ask_sdk_model.interfaces.game_engine.input_handler_event_request.InputHandlerEventRequest': 'encode_InputHandlerEventRequest',
+    'ask_sdk_model.interfaces.game_engine.start_input_handler_directive.StartInputHandlerDirective': 'encode_StartInputHandlerDirective',
+    'ask_sdk_model.interfaces.game_engine.stop_input_handler_directive.StopInputHandlerDirective': 'encode_StopInputHandlerDirective',
+    'ask_sdk_model.interfaces.geolocation.altitude.Altitude': 'encode_Altitude',
+    'ask_sdk_model.interfaces.geolocation.coordinate.Coordinate': 'encode_Coordinate',
+    'ask_sdk_model.interfaces.geolocation.geolocation_interface.GeolocationInterface': 'encode_GeolocationInterface',
+    'ask_sdk_model.interfaces.geolocation.geolocation_state.GeolocationState': 'encode_GeolocationState',
+    'ask_sdk_model.interfaces.geolocation.heading.Heading': 'encode_Heading',
+    'ask_sdk_model.interfaces.geolocation.location_services.LocationServices': 'encode_LocationServices',
+    'ask_sdk_model.interfaces.geolocation.speed.Speed': 'encode_Speed',
+    'ask_sdk_model.interfaces.messaging.message_received_request.MessageReceivedRequest': 'encode_MessageReceivedRequest',
+    'ask_sdk_model.interfaces.navigation.assistance.announce_road_regulation.AnnounceRoadRegulation': 'encode_AnnounceRoadRegulation',
+    'ask_sdk_model.interfaces.navigation.navigation_interface.NavigationInterface': 'encode_NavigationInterface',
+    'ask_sdk_model.interfaces.playbackcontroller.next_command_issued_request.NextCommandIssuedRequest': 'encode_NextCommandIssuedRequest',
+    'ask_sdk_model.interfaces.playbackcontroller.pause_command_issued_request.PauseCommandIssuedRequest': 'encode_PauseCommandIssuedRequest',
+    'ask_sdk_model.interfaces.playbackcontroller.play_command_issued_request.PlayCommandIssuedRequest': 'encode_PlayCommandIssuedRequest',
+    'ask_sdk_model.interfaces.playbackcontroller.previous_command_issued_request.PreviousCommandIssuedRequest': 'encode_PreviousCommandIssuedRequest',
+    'ask_sdk_model.interfaces.system.error.Error': 'encode_Error__interfaces_system_error',
+    'ask_sdk_model.interfaces.system.error_cause.ErrorCause': 'encode_ErrorCause',
+    'ask_sdk_model.interfaces.system.exception_encountered_request.ExceptionEncounteredRequest': 'encode_ExceptionEncounteredRequest',
+    'ask_sdk_model.interfaces.system.system_state.SystemState': 'encode_SystemState',
+    'ask_sdk_model.interfaces.system_unit.unit.Unit': 'encode_Unit',
+    'ask_sdk_model.interfaces.tasks.complete_task_directive.CompleteTaskDirective': 'encode_CompleteTaskDirective',
+    'ask_sdk_model.interfaces.videoapp.launch_directive.LaunchDirective': 'encode_LaunchDirective',
+    'ask_sdk_model.interfaces.videoapp.metadata.Metadata': 'encode_Metadata',
+    'ask_sdk_model.interfaces.videoapp.video_app_interface.VideoAppInterface': 'encode_VideoAppInterface',
+    'ask_sdk_model.interfaces.videoapp.video_item.VideoItem': 'encode_VideoItem',
+    'ask_sdk_model.interfaces.viewport.apl.current_configuration.CurrentConfiguration': 'encode_CurrentConfiguration',
+    'ask_sdk_model.interfaces.viewport.apl.viewport_configuration.ViewportConfiguration': 'encode_ViewportConfiguration',
+    'ask_sdk_model.interfaces.viewport.apl_viewport_state.APLViewportState': 'encode_APLViewportState',
+    'ask_sdk_model.interfaces.viewport.aplt.inter_segment.InterSegment': 'encode_InterSegment',
+    'ask_sdk_model.interfaces.viewport.aplt_viewport_state.APLTViewportState': 'encode_APLTViewportState',
+    'ask_sdk_model.interfaces.viewport.experience.Experience': 'encode_Experience',
+    'ask_sdk_model.interfaces.viewport.size.continuous_viewport_size.ContinuousViewportSize': 'encode_ContinuousViewportSize',
+    'ask_sdk_model.interfaces.viewport.size.discrete_viewport_size.DiscreteViewportSize': 'encode_DiscreteViewportSize',
+    'ask_sdk_model.interfaces.viewport.size.viewport_size.ViewportSize': 'encode_ViewportSize',
+    'ask_sdk_model.interfaces.viewport.typed_viewport_state.TypedViewportState': 'encode_TypedViewportState',
+    'ask_sdk_model.interfaces.viewport.viewport_state.ViewportState': 'encode_ViewportState',
+    'ask_sdk_model.interfaces.viewport.viewport_state_video.ViewportStateVideo': 'encode_ViewportStateVideo',
+    'ask_sdk_model.interfaces.viewport.viewport_video.ViewportVideo': 'encode_ViewportVideo',
+    'ask_sdk_model.launch_request.LaunchRequest': 'encode_LaunchRequest',
+    'ask_sdk_model.list_slot_value.ListSlotValue': 'encode_ListSlotValue',
+    'ask_sdk_model.permissions.Permissions': 'encode_Permissions',
+    'ask_sdk_model.person.Person': 'encode_Person',
+    'ask_sdk_model.request.Request': 'encode_Request',
+    'ask_sdk_model.request_envelope.RequestEnvelope': 'encode_RequestEnvelope',
+    'ask_sdk_model.response.Response': 'encode_Response',
+    'ask_sdk_model.response_envelope.ResponseEnvelope': 'encode_ResponseEnvelope',
+    'ask_sdk_model.scope.Scope': 'encode_Scope',
+    'ask_sdk_model.services.datastore.v1.clear_command.ClearCommand': 'encode_ClearCommand',
+    'ask_sdk_model.services.datastore.v1.command.Command': 'encode_Command__services_datastore_v1_command',
+    'ask_sdk_model.services.datastore.v1.put_namespace_command.PutNamespaceCommand': 'encode_PutNamespaceCommand',
+    'ask_sdk_model.services.datastore.v1.put_object_command.PutObjectCommand': 'encode_PutObjectCommand',
+    'ask_sdk_model.services.datastore.v1.remove_namespace_command.RemoveNamespaceCommand': 'encode_RemoveNamespaceCommand',
+    'ask_sdk_model.services.datastore.v1.remove_object_command.RemoveObjectCommand': 'encode_RemoveObjectCommand',
+    'ask_sdk_model.services.gadget_controller.animation_step.AnimationStep': 'encode_AnimationStep',
+    'ask_sdk_model.services.gadget_controller.light_animation.LightAnimation': 'encode_LightAnimation',
+    'ask_sdk_model.services.gadget_controller.set_light_parameters.SetLightParameters': 'encode_SetLightParameters',
+    'ask_sdk_model.services.game_engine.deviation_recognizer.DeviationRecognizer': 'encode_DeviationRecognizer',
+    'ask_sdk_model.services.game_engine.event.Event': 'encode_Event__services_game_engine_event',
+    'ask_sdk_model.services.game_engine.input_event.InputEvent': 'encode_InputEvent',
+    'ask_sdk_model.services.game_engine.input_handler_event.InputHandlerEvent': 'encode_InputHandlerEvent',
+    'ask_sdk_model.services.game_engine.pattern.Pattern': 'encode_Pattern',
+    'ask_sdk_model.services.game_engine.pattern_recognizer.PatternRecognizer': 'encode_PatternRecognizer',
+    'ask_sdk_model.services.game_engine.progress_recognizer.ProgressRecognizer': 'encode_ProgressRecognizer',
+    'ask_sdk_model.services.game_engine.recognizer.Recognizer': 'encode_Recognizer',
+    'ask_sdk_model.services.list_management.list_body.ListBody': 'encode_ListBody',
+    'ask_sdk_model.services.list_management.list_created_event_request.ListCreatedEventRequest': 'encode_ListCreatedEventRequest',
+    'ask_sdk_model.services.list_management.list_deleted_event_request.ListDeletedEventRequest': 'encode_ListDeletedEventRequest',
+    'ask_sdk_model.services.list_management.list_item_body.ListItemBody': 'encode_ListItemBody',
+    'ask_sdk_model.services.list_management.list_items_created_event_request.ListItemsCreatedEventRequest': 'encode_ListItemsCreatedEventRequest',
+    'ask_sdk_model.services.list_management.list_items_deleted_event_request.ListItemsDeletedEventRequest': 'encode_ListItemsDeletedEventRequest',
+    'ask_sdk_model.services.list_management.list_items_updated_event_request.ListItemsUpdatedEventRequest': 'encode_ListItemsUpdatedEventRequest',
+    'ask_sdk_model.services.list_management.list_updated_event_request.ListUpdatedEventRequest': 'encode_ListUpdatedEventRequest',
+    'ask_sdk_model.services.reminder_management.event.Event': 'encode_Event__services_reminder_management_event',
+    'ask_sdk_model.services.reminder_management.reminder_created_event_request.ReminderCreatedEventRequest': 'encode_ReminderCreatedEventRequest',
+    'ask_sdk_model.services.reminder_management.reminder_deleted_event.ReminderDeletedEvent': 'encode_ReminderDeletedEvent',
+    'ask_sdk_model.services.reminder_management.reminder_deleted_event_request.ReminderDeletedEventRequest': 'encode_ReminderDeletedEventRequest',
+    'ask_sdk_model.services.reminder_management.reminder_started_event_request.ReminderStartedEventRequest': 'encode_ReminderStartedEventRequest',
+    'ask_sdk_model.services.reminder_management.reminder_status_changed_event_request.ReminderStatusChangedEventRequest': 'encode_ReminderStatusChangedEventRequest',
+    'ask_sdk_model.services.reminder_management.reminder_updated_event_request.ReminderUpdatedEventRequest': 'encode_ReminderUpdatedEventRequest',
+    'ask_sdk_model.session.Session': 'encode_Session',
+    'ask_sdk_model.session_ended_error.SessionEndedError': 'encode_SessionEndedError',
+    'ask_sdk_model.session_ended_request.SessionEndedRequest': 'encode_SessionEndedRequest',
+    'ask_sdk_model.session_resumed_request.SessionResumedRequest': 'encode_SessionResumedRequest',
+    'ask_sdk_model.simple_slot_value.SimpleSlotValue': 'encode_SimpleSlotValue',
+    'ask_sdk_model.slot.Slot': 'encode_Slot',
+    'ask_sdk_model.slot_value.SlotValue': 'encode_SlotValue',
+    'ask_sdk_model.slu.entityresolution.resolution.Resolution': 'encode_Resolution',
+    'ask_sdk_model.slu.entityresolution.resolutions.Resolutions': 'encode_Resolutions',
+    'ask_sdk_model.slu.entityresolution.status.Status': 'encode_Status__slu_entityresolution_status',
+    'ask_sdk_model.slu.entityresolution.value.Value': 'encode_Value',
+    'ask_sdk_model.slu.entityresolution.value_wrapper.ValueWrapper': 'encode_ValueWrapper',
+    'ask_sdk_model.status.Status': 'encode_Status__status',
+    'ask_sdk_model.supported_interfaces.SupportedInterfaces': 'encode_SupportedInterfaces',
+    'ask_sdk_model.task.Task': 'encode_Task',
+    'ask_sdk_model.ui.ask_for_permissions_consent_card.AskForPermissionsConsentCard': 'encode_AskForPermissionsConsentCard',
+    'ask_sdk_model.ui.card.Card': 'encode_Card',
+    'ask_sdk_model.ui.image.Image': 'encode_Image__ui_image',
+    'ask_sdk_model.ui.link_account_card.LinkAccountCard': 'encode_LinkAccountCard',
+    'ask_sdk_model.ui.output_speech.OutputSpeech': 'encode_OutputSpeech',
+    'ask_sdk_model.ui.plain_text_output_speech.PlainTextOutputSpeech': 'encode_PlainTextOutputSpeech',
+    'ask_sdk_model.ui.reprompt.Reprompt': 'encode_Reprompt',
+    'ask_sdk_model.ui.simple_card.SimpleCard': 'encode_SimpleCard',
+    'ask_sdk_model.ui.ssml_output_speech.SsmlOutputSpeech': 'encode_SsmlOutputSpeech',
+    'ask_sdk_model.ui.standard_card.StandardCard': 'encode_StandardCard',
+    'ask_sdk_model.user.User': 'encode_User',
+}
@@ -0,0 +1,93 @@
+"""Cheap ``repr`` and ``to_dict`` for the SDK models, for logging.
+
+Every ask_sdk_model class has ``__repr__ = to_str = pprint.pformat(
+self.to_dict())``, and ``to_dict`` rebuilds the whole object graph
+recursively through ``map`` and a lambda per list or dict. Logging a
+``Response`` that way walks everything below it. Log with these instead:
+
+* :py:func:`short_repr`: the class name and the top-level fields, nested
+  models, lists and dicts only named or counted, truncated to REPR_LIMIT
+  characters;
+* :py:func:`to_dict`: the same result as ``model.to_dict()``, built with
+  an explicit stack, without the intermediate lambdas and lists.
+
+The model classes themselves are left as they are.
+"""
+from datetime import date, datetime
+from enum import Enum
+
+# Characters of one field value, and of the whole repr.
+FIELD_LIMIT = 40
+REPR_LIMIT = 200
+SCALARS = (str, int, float, bool, datetime, date)
+# Kept as they are by to_dict.
+PLAIN = frozenset((type(None), str, int, float, bool, datetime, date))
+
+
+def to_dict(model):
+    """``model.to_dict()`` as the SDK builds it, without recursion."""
+    root = {}
+    stack = [(model, root)]
+    while stack:
+        obj, result = stack.pop()
+        for attr in obj.deserialized_types:
+            value = getattr(obj, attr)
+            if value.__class__ in PLAIN:
+                result[attr] = value
+            elif isinstance(value, list):
+                result[attr] = [_item(item, stack) for item in value]
+            elif isinstance(value, Enum):
+                result[attr] = value.value
+            elif hasattr(value, "to_dict"):
+                result[attr] = _item(value, stack)
+            elif isinstance(value, dict):
+                result[attr] = {key: _item(item, stack) for key, item in value.items()}
+            else:
+                result[attr] = value
+    return root
+
+
+def _item(value, stack):
+    # Same precedence as the SDK: to_dict() (which the enums have too)
+    # before the Enum value.
+    if hasattr(value, "deserialized_types"):
+        child = {}
+        stack.append((value, child))
+        return child
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def short_repr(model):
+    """``ClassName(field=value, ...)`` for the fields that are set; the
+    truncated ``repr`` for anything but a model."""
+    if not hasattr(model, "deserialized_types"):
+        text = repr(model)
+        return text if len(text) <= REPR_LIMIT else text[:REPR_LIMIT - 1] + "…"
+    parts = []
+    length = 0
+    for attr in model.deserialized_types:
+        value = getattr(model, attr, None)
+        if value is None:
+            continue
+        if isinstance(value, Enum):
+            value = value.value
+        if isinstance(value, SCALARS):
+            text = repr(value)
+            if len(text) > FIELD_LIMIT:
+                text = text[:FIELD_LIMIT - 1] + "…"
+        elif isinstance(value, list):
+            text = "[{} items]".format(len(value))
+        elif isinstance(value, dict):
+            text = "{{{} keys}}".format(len(value))
+        else:
+            text = "<{}>".format(type(value).__name__)
+        parts.append("{}={}".format(attr, text))
+        length += len(parts[-1]) + 2
+        if length > REPR_LIMIT:
+            parts.append("…")
+            break
+    return "{}({})".format(type(model).__name__, ", ".join(parts))
@@ -0,0 +1,410 @@
+"""Compiled deserialization plans for the SDK models.
+
+``ask_sdk_core.serialize.DefaultSerializer`` works out how to decode every
+value while decoding it: a regex per ``'list[...]'``/``'dict(...)'`` type
+string, ``__import__`` + ``getattr`` per model class name, and a merge of
+``attribute_map`` with ``deserialized_types`` (written back into the
+class) per model instance. Here that work is done once per type and kept
+in a :py:class:`PlanRegistry`; decoding a payload is then mostly dict
+lookups. The results match the SDK serializer's.
+"""
+import re
+import sys
+import threading
+from datetime import date, datetime
+from enum import Enum
+
+from ask_sdk_core.exceptions import SerializationException
+from ask_sdk_core.serialize import DefaultSerializer as BaseDefaultSerializer
+
+from .timestamps import dateutil_parse, parse_timestamp
+
+LIST_TYPE = re.compile(r"list\[(.*)\]")
+DICT_TYPE = re.compile(r"dict\(([^,]*), (.*)\)")
+
+# Unknown discriminator values remembered per DiscriminatorRegistry.
+NEGATIVE_CACHE_SIZE = 256
+# What DiscriminatorRegistry.warm_up resolves by default: the request types.
+WARM_UP_BASES = ("ask_sdk_model.request.Request",)
+
+_MISSING = object()
+
+
+class IdentityPlan:
+    """``object`` and models without ``deserialized_types``: kept as is."""
+
+    def decode(self, payload):
+        return payload
+
+
+class PrimitivePlan:
+    def __init__(self, cls):
+        self.cls = cls
+
+    def decode(self, payload):
+        cls = self.cls
+        if type(payload) is cls:
+            return payload
+        try:
+            return cls(payload)
+        except UnicodeEncodeError:
+            return str(payload)
+        except TypeError:
+            return payload
+        except ValueError:
+            raise SerializationException(
+                "Failed to parse {} into '{}' object".format(payload, cls.__name__))
+
+
+class DatetimePlan:
+    """ISO 8601 strings to date/datetime; the forms Alexa sends are parsed
+    directly, anything else by python-dateutil."""
+
+    def __init__(self, cls):
+        self.cls = cls
+
+    def decode(self, payload):
+        parsed = parse_timestamp(payload) if payload.__class__ is str else None
+        if parsed is None:
+            parse = dateutil_parse()
+            if parse is None:
+                return payload
+            try:
+                parsed = parse(payload)
+            except ValueError:
+                raise SerializationException(
+                    "Failed to parse {} into '{}' object".format(payload, self.cls.__name__))
+        return parsed.date() if self.cls is date else parsed
+
+
+class EnumPlan:
+    def __init__(self, cls):
+        self.cls = cls
+
+    def decode(self, payload):
+        try:
+            return self.cls(payload)
+        except Exception as e:
+            raise SerializationException(str(e))
+
+
+class ListPlan:
+    """``list[T]``, or ``list[A, B, ...]`` decoded positionally."""
+
+    def __init__(self, item_plans, positional=False):
+        self.item_plans = item_plans
+        self.positional = positional
+
+    def decode(self, payload):
+        if self.positional:
+            return [None if item is None else plan.decode(item)
+                    for item, plan in zip(payload, self.item_plans)]
+        decode = self.item_plans[0].decode
+        return [None if item is None else decode(item) for item in payload]
+
+
+class DictPlan:
+    """``dict(K, V)``; keys are kept as they are."""
+
+    def __init__(self, value_plan):
+        self.value_plan = value_plan
+
+    def decode(self, payload):
+        decode = self.value_plan.decode
+        return {key: None if value is None else decode(value) for key, value in payload.items()}
+
+
+class EmptyPlan:
+    """Container type string the SDK cannot parse; it decodes to empty."""
+
+    def __init__(self, factory):
+        self.factory = factory
+
+    def decode(self, payload):
+        return self.factory()
+
+
+class ModelPlan:
+    """One concrete model class.
+
+    ``fields`` maps payload key -> (attribute name, plan) and is filled on
+    first use, so self-referencing models compile fine. Payload keys the
+    model does not know are set as plain attributes, like the SDK does.
+    """
+
+    def __init__(self, cls, registry):
+        self.cls = cls
+        self.registry = registry
+        self.fields = None
+
+    def compile_fields(self):
+        cls = self.cls
+        names = attribute_names(cls)
+        self.fields = {
+            key: (attr, self.registry.plan(cls.deserialized_types[attr]))
+            for attr, key in names.items() if attr in cls.deserialized_types
+        }
+        return self.fields
+
+    def field_plans(self):
+        """Plans of cls's fields, compiling them if need be."""
+        fields = self.fields or self.compile_fields()
+        return [plan for _, plan in fields.values()]
+
+    def decode(self, payload):
+        try:
+            fields = self.fields or self.compile_fields()
+            model = self.cls()
+            extras = None
+            for key, value in payload.items():
+                field = fields.get(key)
+                if field is None:
+                    if extras is None:
+                        extras = []
+                    extras.append((key, value))
+                else:
+                    attr, plan = field
+                    setattr(model, attr, None if value is None else plan.decode(value))
+            if extras:
+                for key, value in extras:
+                    setattr(model, key, value)
+            return model
+        except SerializationException:
+            raise
+        except Exception as e:
+            raise SerializationException(str(e))
+
+
+class DiscriminatorPlan:
+    """Base class with ``get_real_child_model``: picks the subclass from
+    the payload (see :py:class:`DiscriminatorRegistry`), then decodes with
+    that subclass's :py:class:`ModelPlan`."""
+
+    def __init__(self, cls, registry):
+        self.cls = cls
+        self.registry = registry
+
+    def decode(self, payload):
+        try:
+            child = self.registry.discriminators.child_class(self.cls, payload)
+        except SerializationException:
+            raise
+        except Exception as e:
+            raise SerializationException(str(e))
+        if child is None:
+            raise SerializationException(
+                "Couldn't resolve object by discriminator type for {} class".format(self.cls))
+        return self.registry.model_plan(child).decode(payload)
+
+
+class DiscriminatorRegistry:
+    """(base class, discriminator value) -> subclass, resolved once.
+
+    ``get_real_child_model`` returns a dotted class name that then has to
+    be imported; here each value is looked up in the base's
+    ``discriminator_value_class_map`` and imported on first use only, and
+    later payloads with that value are a single dict read. Values the base
+    does not know are cached as None (at most negative_cache_size of
+    them, payloads being untrusted) so they fail just as cheaply.
+    :py:meth:`warm_up` resolves whole bases ahead of time.
+    """
+
+    def __init__(self, negative_cache_size=NEGATIVE_CACHE_SIZE):
+        self.negative_cache_size = negative_cache_size
+        self._classes = {}
+        self._unknown = 0
+        self._lock = threading.Lock()
+
+    def child_class(self, base, payload):
+        """Subclass of base named by payload's discriminator, or None."""
+        return self.resolve(base, payload[base.json_discriminator_key])
+
+    def resolve(self, base, value):
+        key = (base, value)
+        cls = self._classes.get(key, _MISSING)
+        if cls is _MISSING:
+            class_name = base.discriminator_value_class_map.get(value)
+            cls = load_class(class_name) if class_name else None
+            with self._lock:
+                if cls is not None:
+                    self._classes[key] = cls
+                elif self._unknown < self.negative_cache_size:
+                    self._classes[key] = None
+                    self._unknown += 1
+        return cls
+
+    def warm_up(self, bases=WARM_UP_BASES):
+        """Resolve every discriminator value of bases (classes or dotted
+        names), e.g. during Lambda init; returns the number of classes."""
+        count = 0
+        for base in bases:
+            if isinstance(base, str):
+                base = load_class(base)
+            for value in base.discriminator_value_class_map:
+                count += self.resolve(base, value) is not None
+        return count
+
+    def clear(self):
+        with self._lock:
+            self._classes.clear()
+            self._unknown = 0
+
+
+def attribute_names(cls):
+    """attribute name -> payload key, for every deserialized attribute.
+
+    Same merge as the SDK's, without writing it back into
+    ``cls.attribute_map``.
+    """
+    names = dict(getattr(cls, "attribute_map", {}))
+    for attr in cls.deserialized_types:
+        names.setdefault(attr, attr)
+    return names
+
+
+class PlanRegistry:
+    """Thread-safe cache of compiled plans.
+
+    Plans are keyed by what the serializer is asked for: a class or an
+    SDK type string (``'list[ask_sdk_model.slot.Slot]'``, ``'str'``, ...).
+    Lookups are plain dict reads; compiling takes a lock. Discriminated
+    subclasses are resolved by discriminators (default
+    ``default_discriminators``).
+    """
+
+    model_plan_type = ModelPlan
+
+    def __init__(self, discriminators=None):
+        self.discriminators = discriminators or default_discriminators
+        self._plans = {}
+        self._models = {}
+        self._classes = {}
+        self._keys = {}
+        self._lock = threading.RLock()
+
+    def plan(self, obj_type):
+        plan = self._plans.get(obj_type)
+        if plan is None:
+            with self._lock:
+                plan = self._plans.get(obj_type)
+                if plan is None:
+                    plan = self._plans[obj_type] = self.compile(obj_type)
+        return plan
+
+    def model_plan(self, cls):
+        """Plan for exactly cls, without discriminator lookup."""
+        plan = self._models.get(cls)
+        if plan is None:
+            with self._lock:
+                plan = self._models.get(cls)
+                if plan is None:
+                    plan = self._models[cls] = self.model_plan_type(cls, self)
+        return plan
+
+    def serialized_keys(self, cls):
+        """((attribute name, payload key), ...) for serializing a cls instance."""
+        keys = self._keys.get(cls)
+        if keys is None:
+            names = attribute_names(cls)
+            keys = self._keys[cls] = tuple((attr, names[attr]) for attr in cls.deserialized_types)
+        return keys
+
+    def load_class(self, class_name):
+        cls = self._classes.get(class_name)
+        if cls is None:
+            cls = self._classes[class_name] = load_class(class_name)
+        return cls
+
+    def warm_up(self, *obj_types, depth=None):
+        """Compile the plans of obj_types and of the fields reachable from
+        them, down to depth model levels below (every level by default),
+        ahead of the first payload.
+
+        Model classes are compiled as themselves, so concrete subclasses
+        (e.g. the request types a skill handles) can be passed directly;
+        discriminated fields are not expanded into all their subclasses.
+        Returns the number of model plans compiled.
+        """
+        todo = []
+        for obj_type in obj_types:
+            if isinstance(obj_type, type) and hasattr(obj_type, "deserialized_types"):
+                todo.append((self.model_plan(obj_type), 0))
+            else:
+                todo.append((self.plan(obj_type), 0))
+        seen = set()
+        while todo:
+            plan, level = todo.pop()
+            if id(plan) in seen:
+                continue
+            seen.add(id(plan))
+            if isinstance(plan, ModelPlan):
+                fields = plan.field_plans()
+                if depth is not None and level >= depth:
+                    continue
+                level += 1
+                todo.extend((field, level) for field in fields)
+            elif isinstance(plan, ListPlan):
+                todo.extend((item, level) for item in plan.item_plans)
+            elif isinstance(plan, DictPlan):
+                todo.append((plan.value_plan, level))
+        return sum(1 for plan in self._models.values() if id(plan) in seen)
+
+    def compile(self, obj_type):
+        if isinstance(obj_type, str):
+            return self.compile_type_string(obj_type)
+
+        if obj_type in BaseDefaultSerializer.PRIMITIVE_TYPES:
+            return PrimitivePlan(obj_type)
+        if obj_type is object:
+            return IdentityPlan()
+        if obj_type is date or obj_type is datetime:
+            return DatetimePlan(obj_type)
+        if isinstance(obj_type, type) and issubclass(obj_type, Enum):
+            return EnumPlan(obj_type)
+        if not hasattr(obj_type, "deserialized_types"):
+            return IdentityPlan()
+        if hasattr(obj_type, "get_real_child_model"):
+            return DiscriminatorPlan(obj_type, self)
+        return self.model_plan(obj_type)
+
+    def compile_type_string(self, obj_type):
+        if obj_type.startswith("list["):
+            match = LIST_TYPE.match(obj_type)
+            if match is None:
+                return EmptyPlan(list)
+            item_types = match.group(1)
+            if "," in item_types:
+                return ListPlan(tuple(self.plan(t.strip()) for t in item_types.split(",")), positional=True)
+            return ListPlan((self.plan(item_types.strip()),))
+
+        if obj_type.startswith("dict("):
+            match = DICT_TYPE.match(obj_type)
+            if match is None:
+                return EmptyPlan(dict)
+            return DictPlan(self.plan(match.group(2)))
+
+        native = BaseDefaultSerializer.NATIVE_TYPES_MAPPING.get(obj_type)
+        return self.plan(native if native is not None else self.load_class(obj_type))
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+            self._models.clear()
+            self._classes.clear()
+            self._keys.clear()
+
+
+def load_class(class_name):
+    """Resolve ``'a.b.C'`` (or a bare name in ``ask_sdk_core.serialize``)."""
+    try:
+        module_name, _, name = class_name.rpartition(".")
+        if module_name:
+            return getattr(__import__(module_name, fromlist=[name]), name)
+        return getattr(sys.modules[BaseDefaultSerializer.__module__], name)
+    except Exception as e:
+        raise SerializationException(
+            "Unable to resolve class {} from installed modules: {}".format(class_name, str(e)))
+
+
+default_discriminators = DiscriminatorRegistry()
+default_plans = PlanRegistry()
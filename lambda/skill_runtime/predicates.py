@@ -0,0 +1,206 @@
+"""Composable request predicates the router can index.
+
+``ask_sdk_core.utils.predicate`` returns closures nothing can look into.
+The predicates here are objects with the same names and call signature
+(``is_intent_name("ChatIntent")(handler_input)``) that combine with
+``&``, ``|`` and ``~`` and say what they match on: :py:class:`Match`
+tests one field of the request key (request type, intent name, locale
+prefix, dialog state), :py:class:`All`, :py:class:`Any` and
+:py:class:`Not` combine them.
+
+Predicates evaluate against a :py:class:`RequestKey`, computed once per
+request, and :py:meth:`Predicate.route_keys` tells
+:py:class:`skill_runtime.routing.IndexedRequestMapper` which route keys a
+predicate can match at all, so it only evaluates the handlers indexed
+under the request's keys.
+"""
+from collections import namedtuple
+
+# Request types whose key carries an intent name.
+NAMED_REQUEST_TYPES = ("IntentRequest", "CanFulfillIntentRequest")
+
+RequestKey = namedtuple("RequestKey", ("request_type", "intent_name", "locale", "dialog_state"))
+
+
+def request_key(handler_input):
+    """The RequestKey of the request in handler_input."""
+    request = handler_input.request_envelope.request
+    request_type = request.object_type
+    intent_name = dialog_state = None
+    if request_type in NAMED_REQUEST_TYPES:
+        intent = getattr(request, "intent", None)
+        if intent is not None:
+            intent_name = intent.name
+        state = getattr(request, "dialog_state", None)
+        if state is not None:
+            dialog_state = state.value
+    return RequestKey(request_type, intent_name, getattr(request, "locale", None), dialog_state)
+
+
+def _merge(a, b):
+    # Route key matching both a and b (None is a wildcard), or None.
+    merged = []
+    for x, y in zip(a, b):
+        if x is not None and y is not None and x != y:
+            return None
+        merged.append(y if x is None else x)
+    return tuple(merged)
+
+
+class Predicate:
+    """Base of the predicates; callable with a handler input."""
+
+    def __call__(self, handler_input):
+        return self.evaluate(request_key(handler_input))
+
+    def evaluate(self, key):
+        """Whether the predicate holds for RequestKey key."""
+        raise NotImplementedError
+
+    def route_keys(self):
+        """``(keys, exact)``: the ``(request type, intent name)`` route keys
+        (None as a wildcard) outside of which the predicate never holds,
+        or None if it can hold for any request, and whether matching one
+        of them is enough for it to hold."""
+        return None, False
+
+    def __and__(self, other):
+        return All(self, other)
+
+    def __or__(self, other):
+        return Any(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+
+class Match(Predicate):
+    """The request key's field is one of values (a prefix of it, for the
+    locale)."""
+
+    FIELDS = RequestKey._fields
+
+    def __init__(self, field, *values):
+        if field not in self.FIELDS:
+            raise ValueError("unknown request key field {!r}".format(field))
+        self.field = field
+        self.values = values
+        self._position = self.FIELDS.index(field)
+
+    def evaluate(self, key):
+        value = key[self._position]
+        if self.field == "locale":
+            return value is not None and value.startswith(self.values)
+        return value in self.values
+
+    def route_keys(self):
+        if self.field == "request_type":
+            return tuple((value, None) for value in self.values), True
+        if self.field == "intent_name":
+            return tuple((None, value) for value in self.values), True
+        return None, False
+
+    def __repr__(self):
+        return "Match({!r}, {})".format(self.field, ", ".join(map(repr, self.values)))
+
+
+class All(Predicate):
+    """All of parts hold."""
+
+    def __init__(self, *parts):
+        self.parts = parts
+
+    def evaluate(self, key):
+        for part in self.parts:
+            if not part.evaluate(key):
+                return False
+        return True
+
+    def route_keys(self):
+        keys, exact = None, True
+        for part in self.parts:
+            part_keys, part_exact = part.route_keys()
+            exact = exact and part_exact
+            if part_keys is None:
+                continue
+            if keys is None:
+                keys = part_keys
+            else:
+                keys = tuple(merged for merged in (_merge(a, b) for a in keys for b in part_keys)
+                             if merged is not None)
+        return keys, exact and keys is not None
+
+    def __and__(self, other):
+        return All(*self.parts, other)
+
+    def __repr__(self):
+        return " & ".join("({!r})".format(part) if isinstance(part, Any) else repr(part)
+                          for part in self.parts)
+
+
+class Any(Predicate):
+    """At least one of parts holds."""
+
+    def __init__(self, *parts):
+        self.parts = parts
+
+    def evaluate(self, key):
+        for part in self.parts:
+            if part.evaluate(key):
+                return True
+        return False
+
+    def route_keys(self):
+        keys, exact = (), True
+        for part in self.parts:
+            part_keys, part_exact = part.route_keys()
+            if part_keys is None:
+                return None, False
+            keys += part_keys
+            exact = exact and part_exact
+        return tuple(dict.fromkeys(keys)), exact
+
+    def __or__(self, other):
+        return Any(*self.parts, other)
+
+    def __repr__(self):
+        return " | ".join(map(repr, self.parts))
+
+
+class Not(Predicate):
+    """part does not hold."""
+
+    def __init__(self, part):
+        self.part = part
+
+    def evaluate(self, key):
+        return not self.part.evaluate(key)
+
+    def __invert__(self):
+        return self.part
+
+    def __repr__(self):
+        return "~({!r})".format(self.part)
+
+
+def is_request_type(*request_types):
+    return Match("request_type", *request_types)
+
+
+def is_intent_name(*names):
+    return All(Match("request_type", "IntentRequest"), Match("intent_name", *names))
+
+
+def is_canfulfill_intent_name(*names):
+    return All(Match("request_type", "CanFulfillIntentRequest"), Match("intent_name", *names))
+
+
+def is_locale(*prefixes):
+    """Locale starts with one of prefixes (``"de"``, ``"en-US"``)."""
+    return Match("locale", *prefixes)
+
+
+def is_dialog_state(*states):
+    """Intent request dialog state (``"STARTED"``, ``"IN_PROGRESS"``,
+    ``"COMPLETED"``)."""
+    return Match("dialog_state", *states)
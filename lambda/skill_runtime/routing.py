@@ -0,0 +1,167 @@
+"""Request routing through an index of declared routes.
+
+``GenericRequestMapper`` asks every handler's ``can_handle`` in
+registration order until one says yes. Handlers registered with a route
+(a request type, intent name or CanFulfill intent name; see
+:py:func:`routes`) are instead looked up in a dict keyed by the request
+type and intent name. Handlers with only a ``can_handle`` predicate are
+still scanned in order, but only those registered before the indexed
+match, so the first registered handler that fits still wins.
+
+A routed handler is matched on its routes alone; its ``can_handle`` is
+not consulted by :py:class:`IndexedRequestMapper`. Handlers registered
+with a :py:mod:`skill_runtime.predicates` predicate are indexed under the
+route keys the predicate can match and the predicate is evaluated, on the
+request key computed once per request, only where needed.
+"""
+from operator import itemgetter
+
+from ask_sdk_runtime.dispatch_components.request_components import (
+    AbstractRequestHandler, GenericRequestHandlerChain, GenericRequestMapper)
+
+from .predicates import request_key
+
+# Distinct (request type, intent name) pairs whose candidates are memoized.
+ROUTE_CACHE_SIZE = 256
+
+
+def _names(value):
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+def routes(request_type=None, intent_name=None, can_fulfill_intent_name=None):
+    """Route keys, ``(request type, intent name or None)``, for the given
+    request types, intent names and CanFulfill intent names (each a
+    string or an iterable of them)."""
+    keys = [(name, None) for name in _names(request_type)]
+    keys += [("IntentRequest", name) for name in _names(intent_name)]
+    keys += [("CanFulfillIntentRequest", name) for name in _names(can_fulfill_intent_name)]
+    return tuple(dict.fromkeys(keys))
+
+
+def lookups(key):
+    """The route keys matching RequestKey key."""
+    if key.intent_name is None:
+        return ((key.request_type, None),)
+    return (key.request_type, None), (key.request_type, key.intent_name), (None, key.intent_name)
+
+
+def matches(keys, handler_input):
+    """Whether any of the route keys matches the request in handler_input."""
+    return any(route in keys for route in lookups(request_key(handler_input)))
+
+
+class RoutedRequestHandler(AbstractRequestHandler):
+    """Request handler declaring its routes as a class attribute, e.g.
+    ``routes = routes(intent_name="AMAZON.HelpIntent")``, or a predicate,
+    e.g. ``predicate = is_intent_name("ChatIntent") & is_locale("de")``;
+    ``can_handle`` checks them, for mappers without an index."""
+
+    routes = ()
+    predicate = None
+
+    def can_handle(self, handler_input):
+        if self.predicate is not None:
+            return self.predicate(handler_input)
+        return matches(self.routes, handler_input)
+
+
+class RoutedHandlerChain(GenericRequestHandlerChain):
+    """Handler chain with the route keys or the predicate it was
+    registered for."""
+
+    def __init__(self, request_handler, routes=(), predicate=None, request_interceptors=None,
+                 response_interceptors=None):
+        super().__init__(request_handler=request_handler, request_interceptors=request_interceptors,
+                         response_interceptors=response_interceptors)
+        self.routes = tuple(routes)
+        self.predicate = predicate
+
+
+class IndexedRequestMapper(GenericRequestMapper):
+    """``GenericRequestMapper`` looking routed chains up by route key.
+
+    The index is built on first use and rebuilt after a chain is added.
+    """
+
+    _table = None
+
+    def add_request_handler_chain(self, request_handler_chain):
+        super().add_request_handler_chain(request_handler_chain)
+        self._table = None
+
+    def compile(self):
+        """(route key -> ((position, predicate or None, chain), ...),
+        unindexed (position, predicate or None, chain)s, memo of the
+        sorted entries per request route); the predicate is left out where
+        matching the route key is enough."""
+        index = {}
+        scan = []
+        for position, chain in enumerate(self.request_handler_chains):
+            predicate = getattr(chain, "predicate", None)
+            if predicate is None:
+                keys, exact = getattr(chain, "routes", ()), True
+            else:
+                keys, exact = predicate.route_keys()
+            if not keys:
+                scan.append((position, predicate, chain))
+                continue
+            entry = (position, None if exact else predicate, chain)
+            for key in keys:
+                index[key] = index.get(key, ()) + (entry,)
+        table = self._table = (index, tuple(scan), {})
+        return table
+
+    def candidates(self, handler_input):
+        """``(chain, matched)`` in registration order: the unindexed
+        chains registered before the first indexed match (matched True
+        if their predicate holds, False for ``can_handle`` chains, which
+        are still to be asked), then the indexed match, if any."""
+        index, scan, memo = self._table or self.compile()
+        key = request_key(handler_input)
+        route = key[:2]
+        entries = memo.get(route)
+        if entries is None:
+            entries = sorted((entry for route in lookups(key) for entry in index.get(route, ())), key=itemgetter(0))
+            if len(memo) < ROUTE_CACHE_SIZE:
+                memo[route] = entries
+        hit = None
+        for position, predicate, chain in entries:
+            if predicate is None or predicate.evaluate(key):
+                hit = position, chain
+                break
+        for position, predicate, chain in scan:
+            if hit is not None and position > hit[0]:
+                break
+            if predicate is None:
+                yield chain, False
+            elif predicate.evaluate(key):
+                yield chain, True
+        if hit is not None:
+            yield hit[1], True
+
+    def get_request_handler_chain(self, handler_input):
+        for chain, matched in self.candidates(handler_input):
+            if matched or chain.request_handler.can_handle(handler_input=handler_input):
+                return chain
+        return None
+
+
+def candidates(mapper, chains, handler_input):
+    """mapper's ``(chain, matched)`` candidates for handler_input (see
+    IndexedRequestMapper.candidates); every one of its chains, unmatched,
+    for other mappers."""
+    if isinstance(mapper, IndexedRequestMapper):
+        return mapper.candidates(handler_input)
+    return ((chain, False) for chain in chains)
+
+
+def indexed(mapper):
+    """mapper as an IndexedRequestMapper, if it is a plain GenericRequestMapper."""
+    if type(mapper) is GenericRequestMapper:
+        return IndexedRequestMapper(request_handler_chains=mapper.request_handler_chains)
+    return mapper
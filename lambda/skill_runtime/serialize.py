@@ -0,0 +1,182 @@
+"""Serializer that also accepts already-parsed payloads.
+
+Lambda hands the skill the request envelope as a dict. The SDK's
+``DefaultSerializer.deserialize`` only takes a JSON string, so the stock
+``lambda_handler`` does ``json.dumps(event)`` just for the serializer to
+``json.loads`` it again. ``deserialize_object`` skips that round trip.
+
+Models with generated codecs (skill_runtime.model_codecs, written by
+tools/gen_codecs.py) use those; everything else goes through the compiled
+plans of skill_runtime.plans. The codecs module is large, so it is only
+imported once a serializer first needs it.
+"""
+import decimal
+import json
+import os
+from datetime import date, datetime
+from enum import Enum
+
+from ask_sdk_core.exceptions import SerializationException
+from ask_sdk_core.serialize import DefaultSerializer as BaseDefaultSerializer
+from ask_sdk_model.__version__ import __version__ as sdk_model_version
+from ask_sdk_model.services import Serializer as BaseSerializer
+
+from .json_codec import default_codec
+from .lazy import default_lazy_plans
+from .plans import default_plans
+from .slots import default_slotted_plans
+
+# Default of DefaultSerializer's codecs: skill_runtime.model_codecs, on first use.
+GENERATED = object()
+
+_model_codecs = GENERATED
+
+
+def generated_codecs():
+    """skill_runtime.model_codecs, imported on the first call, or None if
+    it is not generated or was generated for another ask-sdk-model."""
+    global _model_codecs
+    if _model_codecs is GENERATED:
+        try:
+            from . import model_codecs
+        except ImportError:  # not generated
+            model_codecs = None
+        else:
+            if model_codecs.SDK_VERSION != sdk_model_version:
+                # Generated for another ask-sdk-model; the models may have changed.
+                model_codecs = None
+        _model_codecs = model_codecs
+    return _model_codecs
+
+# Decode request envelopes lazily (see skill_runtime.lazy) with LAZY_ENVELOPES=1.
+LAZY_ENVELOPES = os.environ.get("LAZY_ENVELOPES") == "1"
+# Decode eagerly into slotted model variants (see skill_runtime.slots); off by default.
+SLOTTED_MODELS = os.environ.get("SLOTTED_MODELS") == "1"
+
+
+class Serializer(BaseSerializer):
+    """``ask_sdk_model.services.Serializer`` with a dict-native entry point."""
+
+    def deserialize_object(self, payload, obj_type):
+        """Deserialize an already-parsed payload (dict, list or primitive)
+        into an instance of obj_type.
+
+        Serializers that only implement the string API get it for free,
+        at the cost of a JSON round trip.
+        """
+        if payload is None:
+            return None
+        return self.deserialize(json.dumps(payload), obj_type)
+
+
+class DefaultSerializer(BaseDefaultSerializer, Serializer):
+    """``ask_sdk_core.serialize.DefaultSerializer`` plus ``deserialize_object``,
+    with per-type plans cached in a :py:class:`skill_runtime.plans.PlanRegistry`.
+
+    Output is the same as the SDK serializer's, except that the models'
+    class-level ``attribute_map`` is no longer modified. The generated
+    codecs are loaded when first needed (see :py:func:`generated_codecs`);
+    pass ``codecs=None`` to use the plans only. JSON strings are parsed with
+    json_codec (see skill_runtime.json_codec). With ``lazy=True``,
+    ``deserialize_object`` returns lazily materialized models (see
+    skill_runtime.lazy); the string API always decodes eagerly. With
+    ``slotted=True`` eager decoding goes through the plans (not the
+    codecs) into slotted model variants (see skill_runtime.slots).
+    """
+
+    def __init__(self, plans=None, codecs=GENERATED, lazy=False, lazy_plans=None, json_codec=None,
+                 slotted=False):
+        self.plans = plans or (default_slotted_plans if slotted else default_plans)
+        self.slotted = slotted
+        self.json_codec = json_codec or default_codec
+        self._codecs = codecs
+        self.lazy = lazy
+        self.lazy_plans = lazy_plans or default_lazy_plans
+        self._decoders = {}
+        self._eager_decoders = {}
+
+    @property
+    def codecs(self):
+        """The generated codecs module, or None."""
+        if self._codecs is GENERATED:
+            self._codecs = generated_codecs()
+        return self._codecs
+
+    def deserialize(self, payload, obj_type):
+        if payload is None:
+            return None
+        try:
+            payload = self.json_codec.loads(payload)
+        except Exception:
+            raise SerializationException("Couldn't parse response body: {}".format(payload))
+        decoder = self._eager_decoders.get(obj_type)
+        if decoder is None:
+            decoder = self._eager_decoders[obj_type] = self.eager_decoder(obj_type)
+        return decoder(payload)
+
+    def deserialize_object(self, payload, obj_type):
+        if payload is None:
+            return None
+        decoder = self._decoders.get(obj_type)
+        if decoder is None:
+            decoder = self._decoders[obj_type] = self.decoder(obj_type)
+        return decoder(payload)
+
+    def decoder(self, obj_type):
+        """Function decoding payloads into obj_type: the lazy plan's in lazy
+        mode, else the generated codec if there is one, else the plan's."""
+        if self.lazy:
+            return self.lazy_plans.plan(obj_type).decode
+        return self.eager_decoder(obj_type)
+
+    def prepare(self, *obj_types, depth=None):
+        """Get ``deserialize_object`` ready for obj_types: bind their
+        decoders and compile (see PlanRegistry.warm_up) only the plans it
+        will use. A generated codec needs none; lazy plans are compiled
+        for obj_types themselves, since their fields are only decoded
+        (and their modules imported) when read."""
+        for obj_type in obj_types:
+            decoder = self._decoders.get(obj_type)
+            if decoder is None:
+                decoder = self._decoders[obj_type] = self.decoder(obj_type)
+            if self.lazy:
+                self.lazy_plans.warm_up(obj_type, depth=0 if depth is None else depth)
+            elif self.codec_decoder(obj_type) is None:
+                self.plans.warm_up(obj_type, depth=depth)
+
+    def codec_decoder(self, obj_type):
+        """The generated codec decoding obj_type, or None."""
+        if not self.slotted and isinstance(obj_type, type) and self.codecs is not None:
+            return self.codecs.decoder(obj_type)
+        return None
+
+    def eager_decoder(self, obj_type):
+        return self.codec_decoder(obj_type) or self.plans.plan(obj_type).decode
+
+    def serialize(self, obj):
+        if self.codecs is not None:
+            return self.codecs.encode(obj)
+        if obj is None:
+            return None
+        elif isinstance(obj, self.PRIMITIVE_TYPES):
+            return obj
+        elif isinstance(obj, list):
+            return [self.serialize(sub_obj) for sub_obj in obj]
+        elif isinstance(obj, tuple):
+            return tuple(self.serialize(sub_obj) for sub_obj in obj)
+        elif isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        elif isinstance(obj, Enum):
+            return obj.value
+        elif isinstance(obj, decimal.Decimal):
+            return int(obj) if obj % 1 == 0 else float(obj)
+
+        if isinstance(obj, dict):
+            return {key: self.serialize(value) for key, value in obj.items()}
+
+        result = {}
+        for attr, key in self.plans.serialized_keys(type(obj)):
+            value = getattr(obj, attr)
+            if value is not None:
+                result[key] = self.serialize(value)
+        return result
@@ -0,0 +1,150 @@
+"""Custom skill wired to the tracing dispatcher."""
+from ask_sdk_core.__version__ import __version__ as sdk_version
+from ask_sdk_core.attributes_manager import AttributesManager
+from ask_sdk_core.handler_input import HandlerInput
+from ask_sdk_core.skill import CustomSkill as BaseCustomSkill
+from ask_sdk_core.utils import RESPONSE_FORMAT_VERSION, user_agent_info
+from ask_sdk_core.view_resolvers import TemplateFactory
+from ask_sdk_model import Request, RequestEnvelope, ResponseEnvelope
+from ask_sdk_model.services import ApiConfiguration, ServiceClientFactory
+from ask_sdk_runtime.exceptions import AskSdkException
+from ask_sdk_runtime.utils import UserAgentManager
+
+from .dispatch import RequestDispatcher
+from .serialize import LAZY_ENVELOPES, SLOTTED_MODELS, DefaultSerializer
+from .tracing import default_tracer
+
+# Request types CustomSkill.prepare compiles decoding plans for by default.
+PREPARED_REQUEST_TYPES = ("LaunchRequest", "IntentRequest", "SessionEndedRequest")
+WARM_UP_ID = "warm-up"
+
+
+class CustomSkill(BaseCustomSkill):
+    """``ask_sdk_core.skill.CustomSkill`` dispatching through
+    :py:class:`skill_runtime.dispatch.RequestDispatcher`.
+
+    Meant to be built once and reused for every warm invocation: the
+    dispatcher's component lists are frozen, and the user agent and the
+    template factory are computed up front instead of per request.
+    """
+
+    def __init__(self, skill_configuration, tracer=None, json_codec=None):
+        # Not BaseCustomSkill.__init__: it builds a dispatcher and a
+        # serializer that would be replaced right away.
+        self.persistence_adapter = skill_configuration.persistence_adapter
+        self.api_client = skill_configuration.api_client
+        self.skill_id = skill_configuration.skill_id
+        self.custom_user_agent = skill_configuration.custom_user_agent
+        self.loaders = skill_configuration.loaders
+        self.renderer = skill_configuration.renderer
+        UserAgentManager.register_component(user_agent_info(sdk_version=sdk_version))
+        if self.custom_user_agent is not None:
+            UserAgentManager.register_component(component_name=self.custom_user_agent)
+        self.tracer = tracer or default_tracer
+        self.serializer = DefaultSerializer(lazy=LAZY_ENVELOPES, json_codec=json_codec, slotted=SLOTTED_MODELS)
+        self.request_dispatcher = self.create_dispatcher(skill_configuration)
+        self.freeze()
+        self.user_agent = UserAgentManager.get_user_agent()
+        self.template_factory = TemplateFactory(
+            template_loaders=self.loaders, template_renderer=self.renderer)
+
+    def create_dispatcher(self, skill_configuration):
+        return RequestDispatcher(options=skill_configuration, tracer=self.tracer)
+
+    def freeze(self):
+        """Turn the dispatcher's component lists into tuples, so later
+        changes to the builder cannot leak into a skill already in use."""
+        dispatcher = self.request_dispatcher
+        dispatcher.request_mappers = tuple(dispatcher.request_mappers)
+        dispatcher.handler_adapters = tuple(dispatcher.handler_adapters)
+        dispatcher.request_interceptors = tuple(dispatcher.request_interceptors)
+        dispatcher.response_interceptors = tuple(dispatcher.response_interceptors)
+        self.loaders = tuple(self.loaders or ())
+
+    def invoke(self, request_envelope, context):
+        handler_input = self.handler_input_for(request_envelope, context)
+        response = self.dispatch(handler_input)
+        return self.response_envelope_for(handler_input, response)
+
+    def dispatch(self, handler_input):
+        return self.request_dispatcher.dispatch(handler_input=handler_input)
+
+    def prepare(self, request_types=PREPARED_REQUEST_TYPES, rehearse=True):
+        """Do now, e.g. during the Lambda init phase, what the first request
+        would otherwise do on its way.
+
+        Resolves every request class (see DiscriminatorRegistry.warm_up),
+        gets the serializer ready to decode the envelope and the classes of
+        request_types (``Request`` discriminator values; see
+        DefaultSerializer.prepare) and, with rehearse, runs a synthetic
+        LaunchRequest through deserialization, the dispatcher and
+        serialization. The rehearsal has no persistence adapter and no
+        service clients, so handlers cannot reach anything outside the
+        process through the SDK.
+        """
+        discriminators = self.serializer.plans.discriminators
+        discriminators.warm_up()
+        classes = [discriminators.resolve(Request, name) for name in request_types]
+        self.serializer.prepare(RequestEnvelope, *(cls for cls in classes if cls is not None))
+        if rehearse:
+            self.rehearse(launch_envelope(self.skill_id or WARM_UP_ID))
+
+    def rehearse(self, payload):
+        """Handle the request envelope payload with side effects stubbed;
+        returns the serialized response envelope."""
+        request_envelope = self.serializer.deserialize_object(payload=payload, obj_type=RequestEnvelope)
+        handler_input = HandlerInput(
+            request_envelope=request_envelope,
+            attributes_manager=AttributesManager(request_envelope=request_envelope),
+            template_factory=self.template_factory)
+        response = self.dispatch(handler_input)
+        return self.serializer.serialize(self.response_envelope_for(handler_input, response))
+
+    def handler_input_for(self, request_envelope, context):
+        """Everything ``CustomSkill.invoke`` sets up before dispatching."""
+        if (self.skill_id is not None and
+                request_envelope.context.system.application.application_id != self.skill_id):
+            raise AskSdkException("Skill ID Verification failed!!")
+
+        factory = None
+        if self.api_client is not None:
+            api_configuration = ApiConfiguration(
+                serializer=self.serializer, api_client=self.api_client,
+                authorization_value=request_envelope.context.system.api_access_token,
+                api_endpoint=request_envelope.context.system.api_endpoint)
+            factory = ServiceClientFactory(api_configuration=api_configuration)
+
+        return HandlerInput(
+            request_envelope=request_envelope,
+            attributes_manager=AttributesManager(
+                request_envelope=request_envelope,
+                persistence_adapter=self.persistence_adapter),
+            context=context,
+            service_client_factory=factory,
+            template_factory=self.template_factory)
+
+    def response_envelope_for(self, handler_input, response):
+        session_attributes = None
+        if handler_input.request_envelope.session is not None:
+            session_attributes = handler_input.attributes_manager.session_attributes
+
+        return ResponseEnvelope(
+            response=response, version=RESPONSE_FORMAT_VERSION,
+            session_attributes=session_attributes,
+            user_agent=self.user_agent)
+
+
+def launch_envelope(application_id, locale="en-US"):
+    """Minimal LaunchRequest envelope payload, as used by CustomSkill.prepare."""
+    application = {"applicationId": application_id}
+    user = {"userId": WARM_UP_ID}
+    return {
+        "version": "1.0",
+        "session": {"new": True, "sessionId": WARM_UP_ID, "application": application, "user": user,
+                    "attributes": {}},
+        "context": {"System": {"application": application, "user": user,
+                               "device": {"deviceId": WARM_UP_ID, "supportedInterfaces": {}},
+                               "apiEndpoint": "https://api.amazonalexa.com", "apiAccessToken": ""}},
+        "request": {"type": "LaunchRequest", "requestId": WARM_UP_ID, "timestamp": "2025-01-01T00:00:00Z",
+                    "locale": locale},
+    }
@@ -0,0 +1,191 @@
+"""Skill builders for the runtime extensions."""
+
+from ask_sdk_core.skill_builder import CustomSkillBuilder as BaseCustomSkillBuilder
+from ask_sdk_core.skill_builder import SkillBuilder as BaseSkillBuilder
+from ask_sdk_model import RequestEnvelope
+from ask_sdk_runtime.dispatch_components.request_components import AbstractRequestHandler
+from ask_sdk_runtime.exceptions import RuntimeConfigException, SkillBuilderException
+
+from .predicates import Predicate
+from .routing import RoutedHandlerChain, RoutedRequestHandler, indexed, routes
+from .skill import PREPARED_REQUEST_TYPES, CustomSkill
+from .tracing import default_tracer
+
+
+class SkillBuilder(BaseSkillBuilder):
+    """Drop-in ``ask_sdk_core.skill_builder.SkillBuilder`` that builds the
+    skill once and reuses it across warm invocations.
+
+    The built skill is dropped (and rebuilt on next use) whenever a handler,
+    interceptor, loader or renderer is added or one of the configuration
+    attributes (skill id, user agent, persistence adapter, api client)
+    changes. Invocations are traced phase by phase (see skill_runtime.tracing).
+    Handlers can be registered for routes (request types, intent names),
+    which the skill looks up in an index (see skill_runtime.routing).
+    json_codec (see skill_runtime.json_codec) parses JSON payloads in the
+    skill's serializer.
+    """
+
+    CONFIG_ATTRIBUTES = frozenset(("skill_id", "custom_user_agent", "persistence_adapter", "api_client", "json_codec"))
+
+    def __init__(self, tracer=None, json_codec=None):
+        self._skill = None
+        super().__init__()
+        self.tracer = tracer or default_tracer
+        self.json_codec = json_codec
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.CONFIG_ATTRIBUTES:
+            self.invalidate()
+
+    def invalidate(self):
+        """Forget the built skill; the next invocation builds a new one."""
+        self.__dict__["_skill"] = None
+
+    @property
+    def skill_configuration(self):
+        configuration = super().skill_configuration
+        configuration.request_mappers = [indexed(mapper) for mapper in configuration.request_mappers]
+        return configuration
+
+    def create(self):
+        return CustomSkill(skill_configuration=self.skill_configuration, tracer=self.tracer,
+                           json_codec=self.json_codec)
+
+    def skill(self):
+        """The built skill, created on first use."""
+        skill = self._skill
+        if skill is None:
+            skill = self._skill = self.create()
+        return skill
+
+    def warm_up(self, request_types=PREPARED_REQUEST_TYPES, rehearse=True, preconnect=()):
+        """Build the skill and prepare it (see CustomSkill.prepare), then
+        open the connection pools of preconnect (objects with a
+        ``preconnect()`` method, like OpenAIClient). Meant to be called at
+        module import, so the work lands in the Lambda init phase.
+        Returns the skill."""
+        skill = self.skill()
+        skill.prepare(request_types=request_types, rehearse=rehearse)
+        for client in preconnect:
+            client.preconnect()
+        return skill
+
+    def lambda_handler(self):
+        tracer = self.tracer
+
+        def wrapper(event, context):
+            tracer.start_trace()
+            try:
+                skill = self.skill()
+                request = event.get("request", {})
+                tracer.set_dimension("RequestType", request.get("type"))
+                with tracer.span("deserialize"):
+                    request_envelope = skill.serializer.deserialize_object(
+                        payload=event, obj_type=RequestEnvelope)
+                response_envelope = skill.invoke(request_envelope=request_envelope, context=context)
+                with tracer.span("serialize"):
+                    return skill.serializer.serialize(response_envelope)
+            finally:
+                tracer.finish_trace()
+        return wrapper
+
+    # --- registration; each one invalidates the built skill ---
+    def add_request_handler(self, request_handler, request_type=None, intent_name=None,
+                            can_fulfill_intent_name=None, predicate=None):
+        """Register request_handler, for the given routes (see
+        skill_runtime.routing.routes) or predicate (see
+        skill_runtime.predicates) or, without either, the handler's own
+        ``routes`` or ``predicate`` attribute if it has one; other handlers
+        are asked ``can_handle`` in registration order as usual."""
+        keys = routes(request_type, intent_name, can_fulfill_intent_name)
+        if keys and predicate is not None:
+            raise SkillBuilderException("Register a request handler for routes or a predicate, not both")
+        if not keys and predicate is None:
+            keys = getattr(request_handler, "routes", ())
+            predicate = getattr(request_handler, "predicate", None)
+            if not isinstance(predicate, Predicate):
+                predicate = None
+        if not keys and predicate is None:
+            super().add_request_handler(request_handler)
+        elif not isinstance(request_handler, AbstractRequestHandler):
+            raise RuntimeConfigException("Input should be a RequestHandler instance")
+        else:
+            self.runtime_configuration_builder.request_handler_chains.append(
+                RoutedHandlerChain(request_handler=request_handler, routes=() if predicate is not None else keys,
+                                   predicate=predicate))
+        self.invalidate()
+
+    def request_handler(self, can_handle_func):
+        """``request_handler`` decorator; a skill_runtime.predicates
+        predicate as can_handle_func is registered as such, so the skill
+        can index it."""
+        if not isinstance(can_handle_func, Predicate):
+            return super().request_handler(can_handle_func)
+
+        def wrapper(handle_func):
+            self.add_request_handler(routed_handler(handle_func, predicate=can_handle_func))
+            return handle_func
+        return wrapper
+
+    def route(self, request_type=None, intent_name=None, can_fulfill_intent_name=None):
+        """Decorator registering a handle function for the given routes,
+        like ``request_handler`` does for a can_handle function."""
+        keys = routes(request_type, intent_name, can_fulfill_intent_name)
+        if not keys:
+            raise SkillBuilderException("route needs a request type, intent name or CanFulfill intent name")
+
+        def wrapper(handle_func):
+            self.add_request_handler(routed_handler(handle_func, routes=keys))
+            return handle_func
+        return wrapper
+
+    def add_exception_handler(self, exception_handler):
+        super().add_exception_handler(exception_handler)
+        self.invalidate()
+
+    def add_global_request_interceptor(self, request_interceptor):
+        super().add_global_request_interceptor(request_interceptor)
+        self.invalidate()
+
+    def add_global_response_interceptor(self, response_interceptor):
+        super().add_global_response_interceptor(response_interceptor)
+        self.invalidate()
+
+    def add_loaders(self, loaders):
+        super().add_loaders(loaders)
+        self.invalidate()
+
+    def add_loader(self, loader):
+        super().add_loader(loader)
+        self.invalidate()
+
+    def add_renderer(self, renderer):
+        super().add_renderer(renderer)
+        self.invalidate()
+
+    def add_custom_user_agent(self, user_agent):
+        super().add_custom_user_agent(user_agent)
+        self.invalidate()
+
+
+def routed_handler(handle_func, **attributes):
+    """RoutedRequestHandler calling handle_func, with class attributes
+    (routes or predicate)."""
+    if not callable(handle_func):
+        raise SkillBuilderException("Request Handler handle_func input parameter should be callable")
+    attributes["handle"] = lambda self, handler_input: handle_func(handler_input)
+    handler_class = type("RequestHandler{}".format(handle_func.__name__.title().replace("_", "")),
+                         (RoutedRequestHandler,), attributes)
+    return handler_class()
+
+
+class CustomSkillBuilder(SkillBuilder, BaseCustomSkillBuilder):
+    """Traced ``CustomSkillBuilder`` (persistence adapter and api client)."""
+
+    def __init__(self, persistence_adapter=None, api_client=None, tracer=None, json_codec=None):
+        self._skill = None
+        BaseCustomSkillBuilder.__init__(self, persistence_adapter=persistence_adapter, api_client=api_client)
+        self.tracer = tracer or default_tracer
+        self.json_codec = json_codec
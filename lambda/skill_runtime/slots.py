@@ -0,0 +1,111 @@
+"""Slotted model variants.
+
+Every SDK model instance carries a ``__dict__`` holding its fields plus a
+name-mangled ``__discriminator_value`` per class in its hierarchy, and an
+APL-rich envelope builds hundreds of them. :py:func:`slotted_class`
+generates a variant of a model class with a ``__slots__`` entry per
+attribute (from ``deserialized_types`` and whatever the constructor
+sets), so fields live in fixed slots instead.
+
+The variant is not a subclass, since a slotted subclass of a class
+without ``__slots__`` keeps the per-instance dict, but it reports the
+model class as its ``__class__``: ``isinstance`` checks, ``super()`` in
+the copied constructors, ``to_dict``, ``repr`` and the generated codecs'
+encoders all treat its instances as the model's. ``type()`` gives the
+variant. Payload keys the model does not know still go into an instance
+``__dict__``, created only when one shows up.
+
+Slotted instances compare equal to eagerly decoded models with the same
+fields (an eager instance on the left compares its ``__dict__`` only, so
+put the slotted one first). Copies and pickles of them are plain
+instances of the model class.
+"""
+import copyreg
+import threading
+
+from .plans import ModelPlan, PlanRegistry
+
+# Not copied from the model classes into their slotted variants.
+NOT_COPIED = frozenset(("__dict__", "__weakref__", "__eq__", "__ne__", "__module__", "__qualname__", "__doc__"))
+
+
+class SlottedModel:
+    """Base of the generated slotted variants; see :py:func:`slotted_class`."""
+
+    __slots__ = ()
+    _model_class = None
+    _slot_names = ()
+
+    def __eq__(self, other):
+        if not isinstance(other, self._model_class):
+            return False
+        return fields(self) == fields(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce_ex__(self, protocol):
+        # The variant cannot be pickled by name; copy into the model class.
+        return copyreg.__newobj__, (self._model_class,), fields(self)
+
+
+def fields(obj):
+    """obj's attributes as a dict, slotted or not."""
+    names = getattr(type(obj), "_slot_names", None)
+    if not names:
+        return obj.__dict__
+    result = {name: getattr(obj, name) for name in names}
+    result.update(obj.__dict__)
+    return result
+
+
+def slotted_class(cls):
+    """Slotted variant of model cls; keeps cls's name and module."""
+    names = tuple(cls.deserialized_types)
+    names += tuple(name for name in vars(cls()) if name not in cls.deserialized_types)
+    namespace = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        namespace.update((key, value) for key, value in vars(klass).items() if key not in NOT_COPIED)
+    namespace.update({
+        "__slots__": names + ("__dict__",),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+        "__class__": property(lambda self: cls),
+        "_model_class": cls,
+        "_slot_names": names,
+    })
+    return type(cls.__name__, (SlottedModel,), namespace)
+
+
+class SlottedModelPlan(ModelPlan):
+    """Decodes into the slotted variant of cls."""
+
+    def __init__(self, cls, registry):
+        super().__init__(cls, registry)
+        self.model_cls = cls
+        self.cls = registry.slotted(cls)
+
+
+class SlottedPlanRegistry(PlanRegistry):
+    """:py:class:`skill_runtime.plans.PlanRegistry` whose model plans
+    decode into slotted variants; they are generated once per class."""
+
+    model_plan_type = SlottedModelPlan
+
+    def __init__(self, discriminators=None):
+        super().__init__(discriminators)
+        self._slotted = {}
+        self._slotted_lock = threading.Lock()
+
+    def slotted(self, cls):
+        variant = self._slotted.get(cls)
+        if variant is None:
+            with self._slotted_lock:
+                variant = self._slotted.get(cls)
+                if variant is None:
+                    variant = self._slotted[cls] = slotted_class(cls)
+        return variant
+
+
+default_slotted_plans = SlottedPlanRegistry()
@@ -0,0 +1,95 @@
+"""ISO 8601 timestamps as Alexa sends them.
+
+Every request carries a ``timestamp`` (AudioPlayer and reminder payloads
+several), and the SDK decodes each with the general
+``dateutil.parser.parse``. ``parse_timestamp`` handles the forms Alexa
+uses directly:
+
+    2025-10-19T10:15:30Z
+    2025-10-19T10:15:30.123Z          (any number of fraction digits)
+    2025-10-19T10:15:30+01:00         (also +0100, +01, and "Z"-less naive)
+    2025-10-19T10:15 / 2025-10-19
+
+and returns None for anything else, which then goes to dateutil,
+imported on first use only. Results are equal to dateutil's; "Z" becomes
+``timezone.utc`` and offsets fixed ``timezone`` objects.
+
+On Python 3.11+ ``datetime.fromisoformat`` accepts all of these (and the
+rest of ISO 8601) and is the fastest option; older runtimes use the
+parser below.
+"""
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+
+UTC = timezone.utc
+ISO_8601 = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[Tt ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?)?"
+    r"(?:([Zz])|([+-])(\d{2})(?::?(\d{2}))?)?")
+
+NATIVE_ISO_8601 = sys.version_info >= (3, 11)
+
+_offsets = {}
+_dateutil_parse = None
+
+
+def parse_timestamp(text):
+    """datetime for the ISO 8601 forms above, None for anything else."""
+    if NATIVE_ISO_8601:
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    return parse_iso8601(text)
+
+
+def parse_iso8601(text):
+    """Pure-Python parse_timestamp, for runtimes before 3.11."""
+    # The common case, "YYYY-MM-DDTHH:MM:SSZ", by slicing.
+    if (len(text) == 20 and text[19] == "Z" and text[10] == "T" and text[4] == "-" and text[7] == "-"
+            and text[13] == ":" and text[16] == ":"):
+        try:
+            return datetime(int(text[0:4]), int(text[5:7]), int(text[8:10]),
+                            int(text[11:13]), int(text[14:16]), int(text[17:19]), tzinfo=UTC)
+        except ValueError:
+            return None
+
+    match = ISO_8601.fullmatch(text)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, zulu, sign, offset_hours, offset_minutes = match.groups()
+    if zulu:
+        tzinfo = UTC
+    elif sign:
+        tzinfo = offset(sign, offset_hours, offset_minutes or "00")
+    else:
+        tzinfo = None
+    microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
+    try:
+        return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0),
+                        microsecond, tzinfo=tzinfo)
+    except ValueError:
+        return None
+
+
+def offset(sign, hours, minutes):
+    key = (sign, hours, minutes)
+    tzinfo = _offsets.get(key)
+    if tzinfo is None:
+        delta = timedelta(hours=int(hours), minutes=int(minutes))
+        tzinfo = _offsets[key] = timezone(-delta if sign == "-" else delta)
+    return tzinfo
+
+
+def dateutil_parse():
+    """``dateutil.parser.parse``, imported on first use; None if
+    python-dateutil is not installed."""
+    global _dateutil_parse
+    if _dateutil_parse is None:
+        try:
+            from dateutil.parser import parse
+        except ImportError:
+            return None
+        _dateutil_parse = parse
+    return _dateutil_parse
@@ -0,0 +1,145 @@
+"""Per-phase latency tracing for skill invocations.
+
+A sampled invocation records spans (deserialize, can_handle probes,
+interceptors, handle, outbound HTTP, serialize) and is written as one
+CloudWatch Embedded Metric Format line: per-phase totals become metrics,
+the individual spans ride along as a property. Unsampled invocations get a
+shared no-op span, so tracing costs an attribute check per phase.
+"""
+import json
+import os
+import random
+import sys
+import time
+
+from .api_client import DefaultApiClient
+
+NAMESPACE = "CosmicTeacher"
+
+
+class NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class Span:
+    __slots__ = ("trace", "name", "detail", "start")
+
+    def __init__(self, trace, name, detail):
+        self.trace = trace
+        self.name = name
+        self.detail = detail
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        self.trace.spans.append((self.name, self.detail, self.start, end))
+        return False
+
+
+class Trace:
+    __slots__ = ("started_at", "timestamp_ms", "spans", "dimensions")
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.timestamp_ms = int(time.time() * 1000)
+        self.spans = []
+        self.dimensions = {}
+
+
+class Tracer:
+    """Samples invocations and emits their spans as EMF lines."""
+
+    def __init__(self, sample_rate=0.0, namespace=NAMESPACE, stream=None):
+        self.sample_rate = sample_rate
+        self.namespace = namespace
+        self.stream = stream or sys.stdout
+        self.active = None
+
+    def start_trace(self):
+        """Begin an invocation; returns True if it is sampled."""
+        if self.sample_rate > 0 and (self.sample_rate >= 1 or random.random() < self.sample_rate):
+            self.active = Trace()
+            return True
+        self.active = None
+        return False
+
+    def span(self, name, detail=None):
+        """Context manager timing one phase of the running invocation."""
+        trace = self.active
+        if trace is None:
+            return NOOP_SPAN
+        return Span(trace, name, detail)
+
+    def set_dimension(self, name, value):
+        if self.active is not None:
+            self.active.dimensions[name] = value
+
+    def finish_trace(self):
+        """Write the EMF line for the running invocation, if sampled."""
+        trace, self.active = self.active, None
+        if trace is None:
+            return None
+        record = self.to_emf(trace)
+        self.stream.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+        return record
+
+    def to_emf(self, trace):
+        totals = {}
+        spans = []
+        for name, detail, start, end in trace.spans:
+            duration = (end - start) * 1000
+            totals[name] = totals.get(name, 0.0) + duration
+            spans.append({
+                "name": name if detail is None else f"{name}:{detail}",
+                "start_ms": round((start - trace.started_at) * 1000, 3),
+                "duration_ms": round(duration, 3),
+            })
+        totals["total"] = (time.perf_counter() - trace.started_at) * 1000
+
+        dimensions = {key: str(value) for key, value in trace.dimensions.items()}
+        record = {
+            "_aws": {
+                "Timestamp": trace.timestamp_ms,
+                "CloudWatchMetrics": [{
+                    "Namespace": self.namespace,
+                    "Dimensions": [sorted(dimensions)],
+                    "Metrics": [{"Name": name, "Unit": "Milliseconds"} for name in totals],
+                }],
+            },
+            "spans": spans,
+        }
+        record.update(dimensions)
+        record.update({name: round(value, 3) for name, value in totals.items()})
+        return record
+
+
+class TracedApiClient(DefaultApiClient):
+    """``DefaultApiClient`` that records each service call as a span."""
+
+    def __init__(self, tracer=None, json_codec=None):
+        super().__init__(json_codec=json_codec)
+        self.tracer = tracer
+
+    def invoke(self, request):
+        with (self.tracer or default_tracer).span("api_client", request.method):
+            return super().invoke(request)
+
+
+def from_environment():
+    """Tracer sampling TRACE_SAMPLE_RATE of invocations (default 0 = off)."""
+    return Tracer(sample_rate=float(os.environ.get("TRACE_SAMPLE_RATE", "0")))
+
+
+default_tracer = from_environment()
@@ -0,0 +1,11 @@
+"""Make the skill code, its dependencies and the tools importable."""
+import os
+import sys
+
+TOOLS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools")
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+import skill_env  # noqa: E402
+
+skill_env.setup()
@@ -0,0 +1,46 @@
+"""Token-budgeted context and the size-capped session history."""
+from conversation import ContextBuilder, HistoryStore, encoded_size, estimate_tokens
+
+
+def test_keeps_recent_turns_within_budget():
+    builder = ContextBuilder(max_tokens=40, summary_tokens=20)
+    session = {}
+    for number in range(10):
+        builder.record(session, f"frage nummer {number}", f"antwort {number}")
+    context = builder.build(session)
+    assert "frage nummer 9" in context
+    assert "Earlier topics: " in context
+    assert estimate_tokens(context) <= 40 + 20 + 10
+
+
+def test_newest_turn_is_always_included():
+    builder = ContextBuilder(max_tokens=30, summary_tokens=10)
+    session = {}
+    builder.record(session, "kurz", "ja")
+    builder.record(session, "sehr lange frage " * 20, "lange antwort " * 20)
+    context = builder.build(session)
+    assert context.startswith("Earlier topics: kurz. User: sehr lange frage")
+    assert context.endswith("...")
+    assert estimate_tokens(context) <= 30 + 10
+
+
+def test_history_stays_within_byte_budget():
+    store = HistoryStore(max_bytes=300, archive=True)
+    builder = ContextBuilder(max_tokens=60, summary_tokens=20, store=store)
+    session = {}
+    for number in range(30):
+        size = builder.record(session, f"was ist {number} mal {number}", f"{number * number} das ist, hmm")
+        assert size <= 300
+        assert size == encoded_size(session["chat"])
+    assert store.load(session).turns[-1] == ("was ist 29 mal 29", "841 das ist, hmm")
+
+
+def test_reads_the_legacy_layout():
+    session = {"conversation_history": ["User: hallo", "AI: hmm, hallo", "User: wie geht's", "AI: gut"],
+               "conversation_summary": "schule"}
+    conversation = HistoryStore().load(session)
+    assert conversation.turns == [("hallo", "hmm, hallo"), ("wie geht's", "gut")]
+    assert conversation.summary == "schule"
+    HistoryStore().save(session, conversation)
+    assert "conversation_history" not in session
+    assert HistoryStore().load(session).turns == conversation.turns
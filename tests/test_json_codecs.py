@@ -0,0 +1,59 @@
+"""Every installed JSON codec against the stdlib, on the corpus of
+tools/check_json_codecs.py."""
+import json
+
+import pytest
+
+import envelopes
+from bench_serializer import responses
+from check_json_codecs import EDGE_VALUES, openai_payloads
+from skill_runtime.json_codec import CODECS, StdlibCodec, detect, get_codec
+
+
+def installed():
+    names = []
+    for name in CODECS:
+        try:
+            get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+EVENTS = envelopes.representative("dot") + envelopes.representative("show")
+
+
+def corpus():
+    from ask_sdk_core.serialize import DefaultSerializer
+
+    serialized = [DefaultSerializer().serialize(response) for response in responses()]
+    return EVENTS + serialized + openai_payloads() + EDGE_VALUES
+
+
+@pytest.fixture(params=installed())
+def codec(request):
+    return get_codec(request.param)
+
+
+def test_detect_picks_an_installed_codec():
+    assert detect().name in installed()
+
+
+def test_values_round_trip(codec):
+    for value in corpus():
+        reference = json.dumps(value)
+        assert codec.loads(reference) == json.loads(reference)
+        assert codec.loads(reference.encode("utf-8")) == json.loads(reference)
+        assert codec.loads(codec.dumps(value)) == value
+        assert json.loads(codec.dumps(value)) == value
+
+
+@pytest.mark.parametrize("event", EVENTS, ids=lambda event: event["request"]["type"])
+def test_envelopes_decode_alike(codec, event):
+    from ask_sdk_model import RequestEnvelope
+    from skill_runtime.serialize import DefaultSerializer
+
+    text = json.dumps(event)
+    reference = DefaultSerializer(json_codec=StdlibCodec()).deserialize(text, RequestEnvelope)
+    assert DefaultSerializer(json_codec=codec).deserialize(text, RequestEnvelope) == reference
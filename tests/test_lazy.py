@@ -0,0 +1,54 @@
+"""Lazily decoded envelopes behave like the SDK's models."""
+import copy
+import json
+import pickle
+
+import pytest
+
+import envelopes
+
+EVENTS = envelopes.representative("dot") + envelopes.representative("show")
+COPIERS = {
+    "copy": copy.copy,
+    "deepcopy": copy.deepcopy,
+    "pickle": lambda value: pickle.loads(pickle.dumps(value)),
+}
+
+
+def decode(event):
+    from ask_sdk_model import RequestEnvelope
+    from skill_runtime.lazy import LazyPlanRegistry
+    from skill_runtime.serialize import DefaultSerializer
+
+    serializer = DefaultSerializer(lazy=True, lazy_plans=LazyPlanRegistry())
+    return serializer.deserialize_object(event, RequestEnvelope)
+
+
+def reference(event):
+    from ask_sdk_core.serialize import DefaultSerializer
+    from ask_sdk_model import RequestEnvelope
+
+    return DefaultSerializer().deserialize(json.dumps(event), RequestEnvelope)
+
+
+@pytest.mark.parametrize("event", EVENTS, ids=lambda event: event["request"]["type"])
+def test_decodes_like_the_sdk(event):
+    assert decode(event) == reference(event)
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+@pytest.mark.parametrize("event", EVENTS, ids=lambda event: event["request"]["type"])
+def test_copies_equal_the_sdk_model(copier, event):
+    # Copied before any field is read, so nothing is decoded yet.
+    duplicate = COPIERS[copier](decode(event))
+    assert duplicate == reference(event)
+    assert type(duplicate) is type(reference(event))
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+def test_copies_nested_models(copier):
+    event = envelopes.chat("was ist ein schwarzes loch")
+    intent = decode(event).request.intent
+    expected = reference(event).request.intent
+    assert COPIERS[copier](intent) == expected
+    assert COPIERS[copier](intent.slots) == expected.slots
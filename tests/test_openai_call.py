@@ -0,0 +1,106 @@
+"""call_openai against the local stand-in: caching, deadlines, hedging."""
+import json
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("SKILL_WARM_UP", "0")
+
+import lambda_function  # noqa: E402
+import openai_standin  # noqa: E402
+from deadline import Deadline  # noqa: E402
+from openai_client import OpenAIClient  # noqa: E402
+
+FIRST_SENTENCE = "Weißt du, was ein schwarzes Loch ist?"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    lambda_function.response_cache.clear()
+    yield
+    lambda_function.response_cache.clear()
+
+
+@pytest.fixture
+def standin():
+    started = []
+
+    def start(**settings):
+        config = openai_standin.StandinConfig(**settings)
+        server, url = openai_standin.start(config)
+        started.append(server)
+        return config, OpenAIClient(url, "test")
+
+    yield start
+    for server in started:
+        server.shutdown()
+
+
+def test_complete_replies_are_cached(standin):
+    config, client = standin(ttft_ms=0, tokens_per_sec=0)
+    first = lambda_function.call_openai("wer bist du", client=client, deadline=Deadline(5000))
+    second = lambda_function.call_openai("Wer bist du?", client=client, deadline=Deadline(5000))
+    assert first == second
+    assert first[0].endswith("Welchen Stern magst du am liebsten?")
+    assert config.requests == 1
+
+
+def test_deadline_cuts_the_stream_at_a_sentence(standin):
+    config, client = standin(ttft_ms=0, tokens_per_sec=10)
+    reply, _ = lambda_function.call_openai("wer bist du", client=client, deadline=Deadline(1200))
+    assert reply == FIRST_SENTENCE
+    # Cut short, so not cached: asking again goes out again.
+    lambda_function.call_openai("wer bist du", client=client, deadline=Deadline(1200))
+    assert config.requests == 2
+
+
+def test_deadline_before_the_first_sentence(standin):
+    _, client = standin(ttft_ms=0, tokens_per_sec=10)
+    reply, tokens = lambda_function.call_openai("wer bist du", client=client, deadline=Deadline(300))
+    assert (reply, tokens) == (lambda_function.OUT_OF_TIME_REPLY, 0)
+
+
+class SlowFirstClient:
+    """Blocking-call client whose first request hangs for delay seconds."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def post(self, data, timeout, stream=False):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            time.sleep(self.delay)
+        return FakeResponse("Hmm, Antwort {} ich habe.".format(call))
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.content = json.dumps({"choices": [{"message": {"content": text}}], "usage": {"total_tokens": 7}})
+
+    def raise_for_status(self):
+        pass
+
+
+def test_hedged_request_answers_first(monkeypatch):
+    monkeypatch.setattr(lambda_function, "HEDGE_AFTER_MS", 50)
+    client = SlowFirstClient(delay=1.0)
+    started = time.perf_counter()
+    reply, tokens = lambda_function.call_openai("wer bist du", stream=False, client=client, deadline=Deadline(5000))
+    assert (reply, tokens) == ("Hmm, Antwort 2 ich habe.", 7)
+    assert client.calls == 2
+    assert time.perf_counter() - started < 0.5
+
+
+def test_no_hedge_when_the_first_answers_in_time(monkeypatch):
+    monkeypatch.setattr(lambda_function, "HEDGE_AFTER_MS", 500)
+    client = SlowFirstClient(delay=0.0)
+    reply, _ = lambda_function.call_openai("wer bist du", stream=False, client=client, deadline=Deadline(5000))
+    assert reply == "Hmm, Antwort 1 ich habe."
+    assert client.calls == 1
@@ -0,0 +1,90 @@
+"""Composable predicates: what they match and the route keys they index under."""
+import json
+
+import pytest
+
+import envelopes
+from skill_runtime.predicates import (
+    is_canfulfill_intent_name, is_dialog_state, is_intent_name, is_locale, is_request_type)
+
+
+def handler_input(event):
+    from ask_sdk_core.handler_input import HandlerInput
+    from ask_sdk_core.serialize import DefaultSerializer
+    from ask_sdk_model import RequestEnvelope
+
+    return HandlerInput(request_envelope=DefaultSerializer().deserialize(json.dumps(event), RequestEnvelope))
+
+
+def in_locale(event, locale):
+    event["request"]["locale"] = locale
+    return event
+
+
+EVENTS = [
+    envelopes.launch(),
+    envelopes.chat("wer bist du"),
+    in_locale(envelopes.chat("who are you"), "en-US"),
+    envelopes.intent("AMAZON.HelpIntent"),
+    envelopes.session_ended(),
+]
+
+
+@pytest.mark.parametrize("event", EVENTS)
+def test_same_answers_as_the_sdk(event):
+    from ask_sdk_core.utils import predicate as sdk
+
+    inputs = handler_input(event)
+    pairs = [
+        (is_request_type("LaunchRequest"), sdk.is_request_type("LaunchRequest")),
+        (is_intent_name("ChatIntent"), sdk.is_intent_name("ChatIntent")),
+        (is_intent_name("AMAZON.HelpIntent"), sdk.is_intent_name("AMAZON.HelpIntent")),
+        (is_canfulfill_intent_name("ChatIntent"), sdk.is_canfulfill_intent_name("ChatIntent")),
+    ]
+    for ours, theirs in pairs:
+        assert ours(inputs) == theirs(inputs)
+
+
+def test_combinators():
+    german_chat = is_intent_name("ChatIntent") & is_locale("de")
+    assert german_chat(handler_input(envelopes.chat("wer bist du")))
+    assert not german_chat(handler_input(in_locale(envelopes.chat("who are you"), "en-US")))
+    assert (~german_chat)(handler_input(envelopes.launch()))
+    either = is_request_type("LaunchRequest") | is_intent_name("AMAZON.HelpIntent")
+    assert either(handler_input(envelopes.intent("AMAZON.HelpIntent")))
+    assert not either(handler_input(envelopes.session_ended()))
+
+
+def test_route_keys():
+    assert is_request_type("LaunchRequest").route_keys() == ((("LaunchRequest", None),), True)
+    assert is_intent_name("A", "B").route_keys() == ((("IntentRequest", "A"), ("IntentRequest", "B")), True)
+    # The locale narrows the match further, so the predicate is still evaluated.
+    assert (is_intent_name("A") & is_locale("de")).route_keys() == ((("IntentRequest", "A"),), False)
+    # No request is both.
+    assert (is_request_type("LaunchRequest") & is_intent_name("A")).route_keys() == ((), True)
+    assert (is_request_type("LaunchRequest") | is_intent_name("A")).route_keys() == (
+        (("LaunchRequest", None), ("IntentRequest", "A")), True)
+    # Anything but one route can match any request.
+    assert (~is_request_type("LaunchRequest")).route_keys() == (None, False)
+    assert (is_dialog_state("STARTED") | is_intent_name("A")).route_keys() == (None, False)
+
+
+def test_indexed_predicates_pick_what_the_scan_picks():
+    from ask_sdk_runtime.dispatch_components.request_components import GenericRequestMapper
+    from skill_runtime.routing import IndexedRequestMapper, RoutedHandlerChain, RoutedRequestHandler
+
+    predicates = [
+        ("GermanChat", is_intent_name("ChatIntent") & is_locale("de")),
+        ("Chat", is_intent_name("ChatIntent")),
+        ("LaunchOrHelp", is_request_type("LaunchRequest") | is_intent_name("AMAZON.HelpIntent")),
+        ("NotEnded", ~is_request_type("SessionEndedRequest")),
+    ]
+    chains = [RoutedHandlerChain(type(name, (RoutedRequestHandler,), {"predicate": predicate,
+                                                                      "handle": lambda self, hi: name})(),
+                                 predicate=predicate)
+              for name, predicate in predicates]
+    generic = GenericRequestMapper(request_handler_chains=chains)
+    indexed = IndexedRequestMapper(request_handler_chains=chains)
+    for event in EVENTS:
+        inputs = handler_input(event)
+        assert indexed.get_request_handler_chain(inputs) is generic.get_request_handler_chain(inputs)
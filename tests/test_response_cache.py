@@ -0,0 +1,50 @@
+"""Cache keys and the LRU/TTL/size limits of ResponseCache."""
+from response_cache import ResponseCache, normalize_utterance
+
+
+def test_normalizes_case_umlauts_punctuation_and_hesitation():
+    assert normalize_utterance("Äh, Yoda, was ist ein schwarzes Loch?") == "was ist ein schwarzes loch"
+    assert normalize_utterance("hmm ähm Größe der Sonne bitte") == "groesse der sonne"
+
+
+def test_keeps_words_that_carry_meaning():
+    assert normalize_utterance("gut oder böse") == "gut oder boese"
+    assert normalize_utterance("na und") == "na und"
+    assert normalize_utterance("also gut") == "also gut"
+
+
+def test_key_depends_on_the_context():
+    assert ResponseCache.make_key("Hallo!") == ResponseCache.make_key("hallo")
+    assert ResponseCache.make_key("hallo", "User: a AI: b") != ResponseCache.make_key("hallo")
+
+
+def test_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", ("eins", 1))
+    cache.put("b", ("zwei", 2))
+    assert cache.get("a") == ("eins", 1)
+    cache.put("c", ("drei", 3))
+    assert cache.get("b") is None
+    assert cache.get("a") == ("eins", 1)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expires_entries(monkeypatch):
+    import response_cache
+
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=10)
+    cache.put("a", "eins")
+    now[0] += 11
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_keeps_within_the_byte_budget():
+    cache = ResponseCache(max_bytes=100)
+    cache.put("big", "x" * 200)
+    assert cache.get("big") is None
+    for number in range(10):
+        cache.put(f"key{number}", "y" * 20)
+    assert cache.stats()["bytes"] <= 100
@@ -0,0 +1,110 @@
+"""IndexedRequestMapper picks the chain the SDK's scan would."""
+import json
+
+import pytest
+
+import envelopes
+
+EVENTS = [
+    envelopes.launch(),
+    envelopes.chat("wer bist du"),
+    envelopes.intent("AMAZON.HelpIntent"),
+    envelopes.intent("AMAZON.StopIntent"),
+    envelopes.intent("AMAZON.FallbackIntent"),
+    envelopes.session_ended(),
+]
+
+
+def handler_input(event):
+    from ask_sdk_core.handler_input import HandlerInput
+    from ask_sdk_core.serialize import DefaultSerializer
+    from ask_sdk_model import RequestEnvelope
+
+    return HandlerInput(request_envelope=DefaultSerializer().deserialize(json.dumps(event), RequestEnvelope))
+
+
+def routed(name, **route):
+    from skill_runtime.routing import RoutedRequestHandler, routes
+
+    return type(name, (RoutedRequestHandler,), {"routes": routes(**route), "handle": lambda self, hi: name})()
+
+
+def scanned(name, can_handle, asked=None):
+    from ask_sdk_runtime.dispatch_components.request_components import AbstractRequestHandler
+
+    def check(self, handler_input):
+        if asked is not None:
+            asked.append(name)
+        return can_handle(handler_input)
+
+    return type(name, (AbstractRequestHandler,), {"can_handle": check, "handle": lambda self, hi: name})()
+
+
+def chain(handler):
+    from skill_runtime.routing import RoutedHandlerChain
+
+    return RoutedHandlerChain(handler, routes=getattr(handler, "routes", ()))
+
+
+def mappers(handlers):
+    from ask_sdk_runtime.dispatch_components.request_components import GenericRequestMapper
+    from skill_runtime.routing import IndexedRequestMapper
+
+    chains = [chain(handler) for handler in handlers]
+    return GenericRequestMapper(request_handler_chains=chains), IndexedRequestMapper(request_handler_chains=chains)
+
+
+def is_session_ended(handler_input):
+    return handler_input.request_envelope.request.object_type == "SessionEndedRequest"
+
+
+HANDLERS = [
+    routed("Launch", request_type="LaunchRequest"),
+    scanned("EarlyEnd", is_session_ended),
+    routed("Chat", intent_name="ChatIntent"),
+    routed("Help", intent_name="AMAZON.HelpIntent"),
+    routed("Stop", intent_name=("AMAZON.StopIntent", "AMAZON.CancelIntent")),
+    routed("Ended", request_type="SessionEndedRequest"),
+    scanned("Anything", lambda handler_input: True),
+]
+
+
+def label(event):
+    request = event["request"]
+    return request["intent"]["name"] if "intent" in request else request["type"]
+
+
+@pytest.mark.parametrize("event", EVENTS, ids=label)
+def test_matches_the_scan(event):
+    generic, indexed = mappers(HANDLERS)
+    expected = generic.get_request_handler_chain(handler_input(event))
+    assert indexed.get_request_handler_chain(handler_input(event)) is expected
+
+
+def test_earlier_unrouted_handler_wins():
+    generic, indexed = mappers(HANDLERS)
+    found = indexed.get_request_handler_chain(handler_input(envelopes.session_ended()))
+    assert type(found.request_handler).__name__ == "EarlyEnd"
+
+
+def test_later_unrouted_handlers_are_not_asked():
+    asked = []
+    handlers = [routed("Launch", request_type="LaunchRequest"), scanned("Anything", lambda hi: True, asked)]
+    _, indexed = mappers(handlers)
+    found = indexed.get_request_handler_chain(handler_input(envelopes.launch()))
+    assert type(found.request_handler).__name__ == "Launch"
+    assert asked == []
+
+
+def test_unrouted_handlers_still_catch_the_rest():
+    _, indexed = mappers(HANDLERS)
+    found = indexed.get_request_handler_chain(handler_input(envelopes.intent("AMAZON.FallbackIntent")))
+    assert type(found.request_handler).__name__ == "Anything"
+
+
+def test_chain_added_after_use_is_indexed():
+    _, indexed = mappers(HANDLERS[:1])
+    assert indexed.get_request_handler_chain(handler_input(envelopes.intent("AMAZON.HelpIntent"))) is None
+    indexed.add_request_handler_chain(chain(routed("Help", intent_name="AMAZON.HelpIntent")))
+    found = indexed.get_request_handler_chain(handler_input(envelopes.intent("AMAZON.HelpIntent")))
+    assert type(found.request_handler).__name__ == "Help"
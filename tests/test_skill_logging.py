@@ -0,0 +1,52 @@
+"""StructuredLogger: level gating, sampling and per-invocation records."""
+import asyncio
+import io
+import json
+
+from skill_logging import DEBUG, INFO, StructuredLogger
+
+
+def lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_debug_fields_are_only_built_when_written():
+    stream = io.StringIO()
+    log = StructuredLogger(level=INFO, stream=stream)
+    log.debug("skipped", value=lambda: 1 / 0)
+    log.info("written", value=lambda: 42)
+    assert lines(stream) == [{"level": "INFO", "msg": "written", "value": 42}]
+
+
+def test_sampled_invocations_log_debug():
+    stream = io.StringIO()
+    log = StructuredLogger(level=INFO, sample_rate=1.0, stream=stream)
+    log.begin(request_id="r1")
+    assert log.threshold == DEBUG
+    log.debug("detail")
+    log.end()
+    assert log.threshold == INFO
+    first, summary = lines(stream)
+    assert first == {"level": "DEBUG", "msg": "detail", "request_id": "r1"}
+    assert summary["sampled"] is True and summary["request_id"] == "r1"
+
+
+def test_concurrent_invocations_keep_their_own_record():
+    stream = io.StringIO()
+    log = StructuredLogger(stream=stream)
+
+    async def invocation(request_id):
+        log.begin(request_id=request_id)
+        await asyncio.sleep(0)
+        log.annotate(handler=request_id.upper())
+        await asyncio.sleep(0)
+        log.end()
+
+    async def both():
+        await asyncio.gather(invocation("a"), invocation("b"))
+
+    asyncio.run(both())
+    summaries = {line["request_id"]: line for line in lines(stream)}
+    assert summaries["a"]["handler"] == "A"
+    assert summaries["b"]["handler"] == "B"
+    assert log.record is None
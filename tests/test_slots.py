@@ -0,0 +1,59 @@
+"""Slotted model variants behave like the SDK's models."""
+import copy
+import json
+import pickle
+
+import pytest
+
+import envelopes
+
+EVENTS = envelopes.representative("dot") + envelopes.representative("show")
+COPIERS = {
+    "copy": copy.copy,
+    "deepcopy": copy.deepcopy,
+    "pickle": lambda value: pickle.loads(pickle.dumps(value)),
+}
+
+
+def decode(event):
+    from ask_sdk_model import RequestEnvelope
+    from skill_runtime.serialize import DefaultSerializer
+    from skill_runtime.slots import SlottedPlanRegistry
+
+    serializer = DefaultSerializer(codecs=None, slotted=True, plans=SlottedPlanRegistry())
+    return serializer.deserialize_object(event, RequestEnvelope)
+
+
+def reference(event):
+    from ask_sdk_core.serialize import DefaultSerializer
+    from ask_sdk_model import RequestEnvelope
+
+    return DefaultSerializer().deserialize(json.dumps(event), RequestEnvelope)
+
+
+@pytest.mark.parametrize("event", EVENTS, ids=lambda event: event["request"]["type"])
+def test_decodes_into_slotted_variants(event):
+    from ask_sdk_model import RequestEnvelope
+
+    decoded = decode(event)
+    assert "__slots__" in vars(type(decoded))
+    assert isinstance(decoded, RequestEnvelope)
+    # Slotted on the left: an eager model compares its __dict__ only.
+    assert decoded == reference(event)
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+@pytest.mark.parametrize("event", EVENTS, ids=lambda event: event["request"]["type"])
+def test_copies_are_plain_models(copier, event):
+    duplicate = COPIERS[copier](decode(event))
+    assert type(duplicate) is type(reference(event))
+    assert duplicate == reference(event)
+
+
+@pytest.mark.parametrize("copier", COPIERS)
+def test_copies_nested_models(copier):
+    event = envelopes.chat("was ist ein schwarzes loch")
+    intent = decode(event).request.intent
+    expected = reference(event).request.intent
+    assert COPIERS[copier](intent) == expected
+    assert COPIERS[copier](intent.slots) == expected.slots
@@ -0,0 +1,151 @@
+"""End-to-end chat-turn benchmark against the local OpenAI stand-in.
+
+Pushes generated (or recorded) request envelopes through
+lambda_function.handler with every invocation traced, and reports
+p50/p95/p99 per phase (deserialize, can_handle, handle, openai, serialize,
+...) plus the wall time of the whole invocation:
+
+    python tools/bench_chat_turn.py --requests 200 --ttft-ms 400 --tokens-per-sec 60
+    python tools/bench_chat_turn.py --envelopes recorded/ --no-stream
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+import envelopes
+import openai_standin
+import skill_env
+
+
+class TraceSink(io.TextIOBase):
+    """Collects the EMF lines written by the tracer."""
+
+    def __init__(self):
+        self.records = []
+
+    def write(self, text):
+        for line in text.splitlines():
+            if line.strip():
+                self.records.append(json.loads(line))
+        return len(text)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(samples):
+    """{phase: [ms, ...]} -> rows of (phase, n, p50, p95, p99)."""
+    rows = []
+    for phase, values in samples.items():
+        rows.append((phase, len(values), percentile(values, 50), percentile(values, 95), percentile(values, 99)))
+    return rows
+
+
+def print_table(rows, out=sys.stdout):
+    out.write(f"{'phase':<22}{'n':>6}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}\n")
+    for phase, n, p50, p95, p99 in rows:
+        out.write(f"{phase:<22}{n:>6}{p50:>11.3f}{p95:>11.3f}{p99:>11.3f}\n")
+
+
+def generated_workload(count, turns_per_session, device):
+    """Sessions of a launch followed by chat turns, carrying attributes."""
+    workload = []
+    while len(workload) < count:
+        workload.append(("launch", envelopes.launch(device)))
+        for i in range(turns_per_session):
+            utterance = envelopes.UTTERANCES[(len(workload) + i) % len(envelopes.UTTERANCES)]
+            workload.append(("chat", utterance))
+    return workload[:count]
+
+
+def run(args):
+    config = openai_standin.config_from_args(args)
+    server, url = openai_standin.start(config)
+    os.environ["OPENAI_URL"] = url
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    os.environ["OPENAI_STREAM"] = "0" if args.no_stream else "1"
+    if args.hedge_ms:
+        os.environ["OPENAI_HEDGE_MS"] = str(args.hedge_ms)
+
+    skill_env.setup()
+    import lambda_function
+    from skill_logging import log
+    from skill_runtime import default_tracer
+
+    sink = TraceSink()
+    default_tracer.sample_rate = 1.0
+    default_tracer.stream = sink
+    log.stream = io.StringIO() if not args.verbose else sys.stderr
+    if not args.cache:
+        lambda_function.response_cache.max_bytes = 0
+
+    class Context:
+        """Stands in for the Lambda context object."""
+
+        def get_remaining_time_in_millis(self):
+            return args.lambda_timeout_ms
+
+    if args.envelopes:
+        workload = [("recorded", e) for e in envelopes.load(args.envelopes)]
+        workload = (workload * (args.requests // max(len(workload), 1) + 1))[:args.requests]
+    else:
+        workload = generated_workload(args.requests, args.turns, args.device)
+
+    samples = {}
+    attributes = {}
+    for _ in range(args.warmup):
+        lambda_function.handler(envelopes.launch(args.device), Context())
+    sink.records.clear()
+
+    for kind, item in workload:
+        if kind == "chat":
+            event = envelopes.chat(item, attributes, device=args.device)
+        else:
+            event = item
+        start = time.perf_counter()
+        response = lambda_function.handler(event, Context())
+        samples.setdefault("invocation", []).append((time.perf_counter() - start) * 1000)
+        attributes = response.get("sessionAttributes") or {}
+
+    for record in sink.records:
+        for metric in record["_aws"]["CloudWatchMetrics"][0]["Metrics"]:
+            samples.setdefault(metric["Name"], []).append(record[metric["Name"]])
+
+    server.shutdown()
+    return summarize(samples), config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--turns", type=int, default=4, help="chat turns per generated session")
+    parser.add_argument("--device", choices=("dot", "show"), default="dot")
+    parser.add_argument("--envelopes", help="recorded envelopes (.json, .jsonl or directory)")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--no-stream", action="store_true", help="use the blocking OpenAI call")
+    parser.add_argument("--hedge-ms", type=int, default=0)
+    parser.add_argument("--cache", action="store_true", help="keep the response cache enabled")
+    parser.add_argument("--lambda-timeout-ms", type=int, default=8000)
+    parser.add_argument("--json", action="store_true", help="print rows as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show the skill's log lines")
+    openai_standin.add_arguments(parser)
+    args = parser.parse_args()
+
+    rows, config = run(args)
+    if args.json:
+        print(json.dumps([dict(zip(("phase", "n", "p50", "p95", "p99"), row)) for row in rows]))
+    else:
+        print_table(rows)
+        print(f"openai: {config.requests} requests over {config.connections} connections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Envelope (de)serialization benchmark.
+
+Times deserializing representative request envelopes and serializing
+response envelopes with the SDK's DefaultSerializer and with each mode of
+skill_runtime's, after checking that every mode gives the SDK's result,
+also through copy, deepcopy and pickle. (The lazy mode defers decoding to the first field access, so its decode
+column is only the cost of wrapping the payload; "slots" decodes into
+slotted model variants.) The kB column is the memory held by one
+decoded envelope.
+
+    python tools/bench_serializer.py
+    python tools/bench_serializer.py --device show --rounds 500
+"""
+import argparse
+import copy
+import json
+import pickle
+import time
+import tracemalloc
+
+import envelopes
+import skill_env
+
+
+def modes():
+    """name -> (deserialize(event), serialize(obj))."""
+    from ask_sdk_core.serialize import DefaultSerializer as SdkSerializer
+    from ask_sdk_model import RequestEnvelope
+    from skill_runtime.lazy import LazyPlanRegistry
+    from skill_runtime.plans import PlanRegistry
+    from skill_runtime.serialize import DefaultSerializer, generated_codecs
+
+    sdk = SdkSerializer()
+    result = {"sdk": (lambda event: sdk.deserialize(json.dumps(event), RequestEnvelope), sdk.serialize)}
+    plans = DefaultSerializer(plans=PlanRegistry(), codecs=None)
+    result["plans"] = (lambda event: plans.deserialize_object(event, RequestEnvelope), plans.serialize)
+    if generated_codecs() is not None:
+        codecs = DefaultSerializer(plans=PlanRegistry())
+        result["codecs"] = (lambda event: codecs.deserialize_object(event, RequestEnvelope), codecs.serialize)
+    slots = DefaultSerializer(slotted=True)
+    result["slots"] = (lambda event: slots.deserialize_object(event, RequestEnvelope), slots.serialize)
+    lazy = DefaultSerializer(lazy=True, lazy_plans=LazyPlanRegistry())
+    result["lazy"] = (lambda event: lazy.deserialize_object(event, RequestEnvelope), lazy.serialize)
+    return result
+
+
+def responses():
+    """Response envelopes like the skill returns, one with an APL directive."""
+    from ask_sdk_model import ResponseEnvelope
+    from ask_sdk_model.interfaces.alexa.presentation.apl import RenderDocumentDirective
+    from ask_sdk_model.ui import SimpleCard
+    from ask_sdk_model.response import Response
+    from ask_sdk_model.ui.ssml_output_speech import SsmlOutputSpeech
+    from ask_sdk_model.ui.reprompt import Reprompt
+
+    speech = SsmlOutputSpeech(ssml="<speak><voice name=\"Hans\">Hmm, ein schwarzes Loch, das ist.</voice></speak>")
+    plain = Response(output_speech=speech, reprompt=Reprompt(output_speech=speech), should_end_session=False)
+    visual = Response(output_speech=speech, card=SimpleCard(title="Yoda", content="Hmm."),
+                      directives=[RenderDocumentDirective(token="main", document={"type": "APL", "version": "2023.2"},
+                                                          datasources={"text": {"value": "Hmm."}})])
+    attributes = {"chat": {"v": 1, "t": ["wer bist du", "Yoda ich bin."]}}
+    return [ResponseEnvelope(version="1.0", response=response, session_attributes=attributes)
+            for response in (plain, visual)]
+
+
+def check(all_modes, events, objects):
+    reference_decode, reference_encode = all_modes["sdk"]
+    for name, (decode, encode) in all_modes.items():
+        for event in events:
+            if decode(event) != reference_decode(event):
+                raise SystemExit(f"{name}: {event['request']['type']} decodes differently")
+            if encode(decode(event)) != reference_encode(reference_decode(event)):
+                raise SystemExit(f"{name}: {event['request']['type']} re-encodes differently")
+        for obj in objects:
+            if encode(obj) != reference_encode(obj):
+                raise SystemExit(f"{name}: response encodes differently")
+
+
+def check_copies(all_modes, events):
+    """copy, deepcopy and pickle give the SDK's result for every mode (an
+    envelope, its request's intent and the intent's slots)."""
+    reference_decode = all_modes["sdk"][0]
+    copiers = {"copy": copy.copy, "deepcopy": copy.deepcopy,
+               "pickle": lambda value: pickle.loads(pickle.dumps(value))}
+    for name, (decode, _) in all_modes.items():
+        for event in events:
+            decoded, reference = decode(event), reference_decode(event)
+            pairs = [(decoded, reference)]
+            intent = getattr(reference.request, "intent", None)
+            if intent is not None:
+                pairs.append((decoded.request.intent, intent))
+                pairs.append((decoded.request.intent.slots, intent.slots))
+            for copier, function in copiers.items():
+                for value, expected in pairs:
+                    if function(value) != expected:
+                        raise SystemExit(f"{name}: {copier} of {type(expected).__name__} differs")
+
+
+def timed(function, items, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            function(item)
+    return (time.perf_counter() - start) / (rounds * len(items)) * 1e6
+
+
+def held_kb(decode, events):
+    """Average memory held by one decoded envelope, in kB."""
+    tracemalloc.start()
+    decoded = [decode(event) for event in events]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del decoded
+    return size / len(events) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--device", choices=("dot", "show"), default="dot")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    skill_env.setup()
+    events = envelopes.representative(args.device)
+    objects = responses()
+    all_modes = modes()
+    check(all_modes, events, objects)
+    check_copies(all_modes, events)
+
+    print(f"{'mode':<10}{'decode us':>12}{'encode us':>12}{'speedup':>10}{'kB':>8}")
+    baseline = None
+    for name, (decode, encode) in all_modes.items():
+        decoded = [decode(event) for event in events]
+        decode_us = timed(decode, events, args.rounds)
+        encode_us = timed(encode, decoded + objects, args.rounds)
+        baseline = baseline or decode_us + encode_us
+        kb = held_kb(decode, events)
+        print(f"{name:<10}{decode_us:>12.1f}{encode_us:>12.1f}{baseline / (decode_us + encode_us):>9.1f}x{kb:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
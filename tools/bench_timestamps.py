@@ -0,0 +1,59 @@
+"""Timestamp decoding micro-benchmark.
+
+Times skill_runtime.timestamps against dateutil's parse (the SDK's path)
+on the ISO 8601 forms Alexa sends, after checking that both agree:
+"native" is datetime.fromisoformat (used on Python 3.11+), "parser" the
+pure-Python fallback for older runtimes.
+
+    python tools/bench_timestamps.py --rounds 20000
+"""
+import argparse
+import time
+from datetime import datetime
+
+import skill_env
+
+FORMATS = [
+    "2025-10-19T10:15:30Z",
+    "2025-10-19T10:15:30.123Z",
+    "2025-10-19T10:15:30.123456789Z",
+    "2025-10-19T10:15:30+01:00",
+    "2025-10-19T10:15:30-0500",
+    "2025-10-19T10:15:30",
+    "2025-10-19",
+]
+
+
+def timed(function, text, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function(text)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10000)
+    args = parser.parse_args()
+
+    skill_env.setup()
+    from dateutil.parser import parse
+    from skill_runtime.timestamps import parse_iso8601
+
+    print(f"{'timestamp':<34}{'dateutil us':>13}{'native us':>11}{'parser us':>11}")
+    for text in FORMATS:
+        if parse_iso8601(text) != parse(text):
+            raise SystemExit(f"{text}: {parse_iso8601(text)!r} != {parse(text)!r}")
+        try:
+            if datetime.fromisoformat(text) != parse(text):
+                raise SystemExit(f"{text}: fromisoformat disagrees with dateutil")
+            native = f"{timed(datetime.fromisoformat, text, args.rounds):>11.2f}"
+        except ValueError:
+            native = f"{'-':>11}"
+        dateutil_us = timed(parse, text, args.rounds)
+        parser_us = timed(parse_iso8601, text, args.rounds)
+        print(f"{text:<34}{dateutil_us:>13.2f}{native}{parser_us:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
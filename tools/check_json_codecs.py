@@ -0,0 +1,100 @@
+"""JSON codec parity check.
+
+Runs a corpus through every installed codec in skill_runtime.json_codec
+and compares with the stdlib: representative request envelopes (and
+recorded ones), the skill's response envelopes, OpenAI chat-completions
+payloads and a few awkward values. Exits non-zero on the first mismatch.
+
+    python tools/check_json_codecs.py
+    python tools/check_json_codecs.py --envelopes recorded/
+"""
+import argparse
+import json
+
+import envelopes
+import skill_env
+from bench_serializer import responses
+
+EDGE_VALUES = [
+    {"text": "Grüß Gott, Straße, Übermut"},
+    {"text": "Möge die Macht mit dir sein 🌌✨", "flag": "🇩🇪"},
+    {"text": "quote \" backslash \\ slash / tab \t newline \n nul \u0000 bell \u0007"},
+    {"text": "\u2028\u2029 line separators, <speak>&amp;</speak>"},
+    {"floats": [0.1, 1e-7, 1.5e300, -2.5, 123456.789, 0.0]},
+    {"ints": [0, -1, 2 ** 53 + 1, 2 ** 63 - 1, -(2 ** 63)]},
+    {"big": 2 ** 70},
+    {"nested": [[[[{"a": [None, True, False, {}, []]}]]]]},
+    {"empty": "", "list": [], "object": {}},
+]
+
+
+def openai_payloads():
+    """Request and response bodies as exchanged with chat-completions."""
+    messages = [{"role": "system", "content": "Antworte wie Yoda, kurz, auf Deutsch."},
+                {"role": "user", "content": "Was ist ein schwarzes Loch?"}]
+    return [
+        {"model": "gpt-4o-mini", "messages": messages, "max_tokens": 80, "temperature": 0.7, "stream": True},
+        {"id": "chatcmpl-standin", "object": "chat.completion", "model": "gpt-4o-mini",
+         "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hmm. Licht, es nicht entkommt."},
+                      "finish_reason": "stop"}],
+         "usage": {"prompt_tokens": 31, "completion_tokens": 9, "total_tokens": 40}},
+        {"id": "chatcmpl-standin", "object": "chat.completion.chunk", "model": "gpt-4o-mini",
+         "choices": [{"index": 0, "delta": {"content": " Ö"}, "finish_reason": None}]},
+    ]
+
+
+def check_values(codec, values, label):
+    for value in values:
+        reference = json.dumps(value)
+        if codec.loads(reference) != json.loads(reference):
+            raise SystemExit(f"{codec.name}: {label} loads differently: {reference[:80]}")
+        if codec.loads(reference.encode("utf-8")) != json.loads(reference):
+            raise SystemExit(f"{codec.name}: {label} loads differently from bytes: {reference[:80]}")
+        if codec.loads(codec.dumps(value)) != value:
+            raise SystemExit(f"{codec.name}: {label} does not round-trip: {reference[:80]}")
+        if json.loads(codec.dumps(value)) != value:
+            raise SystemExit(f"{codec.name}: {label} dumps differently: {reference[:80]}")
+
+
+def check_serializer(codec, events):
+    from ask_sdk_model import RequestEnvelope
+    from skill_runtime.json_codec import StdlibCodec
+    from skill_runtime.serialize import DefaultSerializer
+
+    reference = DefaultSerializer(json_codec=StdlibCodec())
+    serializer = DefaultSerializer(json_codec=codec)
+    for event in events:
+        text = json.dumps(event)
+        if serializer.deserialize(text, RequestEnvelope) != reference.deserialize(text, RequestEnvelope):
+            raise SystemExit(f"{codec.name}: {event['request']['type']} envelope decodes differently")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--envelopes", help="recorded envelopes (.json/.jsonl file or directory)")
+    args = parser.parse_args()
+
+    skill_env.setup()
+    from ask_sdk_core.serialize import DefaultSerializer as SdkSerializer
+    from skill_runtime.json_codec import CODECS, get_codec
+
+    events = envelopes.representative("dot") + envelopes.representative("show")
+    if args.envelopes:
+        events += envelopes.load(args.envelopes)
+    serialized = [SdkSerializer().serialize(response) for response in responses()]
+    corpus = {"envelope": events, "response": serialized, "openai": openai_payloads(), "edge": EDGE_VALUES}
+
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:<8} not installed, skipped")
+            continue
+        for label, values in corpus.items():
+            check_values(codec, values, label)
+        check_serializer(codec, events)
+        print(f"{name:<8} ok ({sum(map(len, corpus.values()))} values, {len(events)} envelopes)")
+
+
+if __name__ == "__main__":
+    main()
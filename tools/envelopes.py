@@ -0,0 +1,157 @@
+"""Alexa request envelopes for the offline tools.
+
+Generates envelopes shaped like the ones Alexa sends this skill (Echo Dot
+and Echo Show flavours) and loads recorded ones, e.g. copied from the
+CloudWatch "incoming request" debug lines, from .json or .jsonl files.
+"""
+import copy
+import json
+import os
+import uuid
+
+
+SKILL_ID = "amzn1.ask.skill.14a88490-52f7-46be-98c8-91de261d569e"
+
+UTTERANCES = [
+    "wer bist du",
+    "was ist ein schwarzes Loch",
+    "ähm wie weit ist der Mond weg",
+    "erzähl mir was über den Mars",
+    "ich hatte heute Mathe und es war langweilig",
+    "warum leuchten Sterne",
+    "was ist dein Lieblingsplanet",
+    "also kannst du mir einen Witz erzählen",
+]
+
+ECHO_SHOW_VIEWPORT = {
+    "experiences": [{"arcMinuteWidth": 246, "arcMinuteHeight": 144, "canRotate": False, "canResize": False}],
+    "mode": "HUB",
+    "shape": "RECTANGLE",
+    "pixelWidth": 1280,
+    "pixelHeight": 800,
+    "dpi": 160,
+    "currentPixelWidth": 1280,
+    "currentPixelHeight": 800,
+    "touch": ["SINGLE"],
+    "keyboard": [],
+    "video": {"codecs": ["H_264_42", "H_264_41"]},
+}
+
+
+def _apl_tree(depth=4, width=4):
+    """A visible-components tree like the one an Echo Show reports."""
+    def node(level, index):
+        component = {
+            "id": f"component-{level}-{index}",
+            "type": "text" if level == depth else "layout",
+            "uid": str(uuid.uuid4()),
+            "position": "1280x800+0+0:0",
+            "tags": {"focused": False, "clickable": level == depth},
+            "entities": [],
+        }
+        if level < depth:
+            component["children"] = [node(level + 1, i) for i in range(width)]
+        return component
+    return node(0, 0)
+
+
+def envelope(request, attributes=None, new=False, device="dot"):
+    """Wrap a request object into a full envelope."""
+    system = {
+        "application": {"applicationId": SKILL_ID},
+        "user": {"userId": "amzn1.ask.account.BENCH"},
+        "device": {"deviceId": "amzn1.ask.device.BENCH", "supportedInterfaces": {}},
+        "apiEndpoint": "https://api.eu.amazonalexa.com",
+        "apiAccessToken": "bench-token",
+    }
+    context = {"System": system}
+    if device == "show":
+        system["device"]["supportedInterfaces"] = {
+            "Alexa.Presentation.APL": {"runtime": {"maxVersion": "2023.2"}},
+            "AudioPlayer": {},
+        }
+        context["Viewport"] = copy.deepcopy(ECHO_SHOW_VIEWPORT)
+        context["Viewports"] = [{"type": "APL", "id": "main", "shape": "RECTANGLE", "dpi": 160,
+                                 "presentationType": "STANDARD", "canRotate": False,
+                                 "configuration": {"current": {"mode": "HUB", "video": {"codecs": ["H_264_42"]},
+                                                               "size": {"type": "DISCRETE", "pixelWidth": 1280,
+                                                                        "pixelHeight": 800}}}}]
+        context["Alexa.Presentation.APL"] = {
+            "token": "launch",
+            "version": "AriaRuntimeLibrary-2023.2",
+            "componentsVisibleOnScreen": [_apl_tree()],
+        }
+        context["AudioPlayer"] = {"playerActivity": "IDLE"}
+
+    return {
+        "version": "1.0",
+        "session": {
+            "new": new,
+            "sessionId": "amzn1.echo-api.session.BENCH",
+            "application": {"applicationId": SKILL_ID},
+            "attributes": attributes or {},
+            "user": {"userId": "amzn1.ask.account.BENCH"},
+        },
+        "context": context,
+        "request": request,
+    }
+
+
+def _request(request_type, **fields):
+    request = {
+        "type": request_type,
+        "requestId": f"amzn1.echo-api.request.{uuid.uuid4()}",
+        "timestamp": "2025-10-19T10:15:30Z",
+        "locale": "de-DE",
+    }
+    request.update(fields)
+    return request
+
+
+def launch(device="dot"):
+    return envelope(_request("LaunchRequest"), new=True, device=device)
+
+
+def chat(utterance, attributes=None, device="dot"):
+    intent = {
+        "name": "ChatIntent",
+        "confirmationStatus": "NONE",
+        "slots": {"utterance": {"name": "utterance", "value": utterance, "confirmationStatus": "NONE",
+                                "source": "USER", "slotValue": {"type": "Simple", "value": utterance}}},
+    }
+    return envelope(_request("IntentRequest", dialogState="COMPLETED", intent=intent), attributes, device=device)
+
+
+def intent(name, attributes=None, device="dot"):
+    return envelope(_request("IntentRequest", intent={"name": name, "confirmationStatus": "NONE"}),
+                    attributes, device=device)
+
+
+def session_ended(attributes=None, device="dot"):
+    return envelope(_request("SessionEndedRequest", reason="USER_INITIATED"), attributes, device=device)
+
+
+def representative(device="dot"):
+    """One of each request type the skill handles."""
+    envelopes = [launch(device)]
+    envelopes += [chat(utterance, device=device) for utterance in UTTERANCES[:3]]
+    envelopes += [intent(name, device=device) for name in
+                  ("AMAZON.HelpIntent", "AMAZON.FallbackIntent", "AMAZON.StopIntent", "AMAZON.CancelIntent")]
+    envelopes.append(session_ended(device=device))
+    return envelopes
+
+
+def load(path):
+    """Recorded envelopes from a .json file (object or list), a .jsonl
+    file, or a directory of such files."""
+    if os.path.isdir(path):
+        envelopes = []
+        for name in sorted(os.listdir(path)):
+            if name.endswith((".json", ".jsonl")):
+                envelopes.extend(load(os.path.join(path, name)))
+        return envelopes
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    return data if isinstance(data, list) else [data]
@@ -0,0 +1,383 @@
+"""Generate specialized encode_/decode_ functions for ask_sdk_model classes.
+
+Writes lambda/skill_runtime/model_codecs.py with one straight-line
+decode_<Class>/encode_<Class> pair per model reachable from the root
+classes, enum handling and discriminator dispatch (Request, Directive,
+SlotValue, ...) inlined. skill_runtime.serialize.DefaultSerializer uses
+the module when it exists and matches the installed ask-sdk-model version;
+everything else goes through the reflective plans.
+
+    python tools/gen_codecs.py
+    python tools/gen_codecs.py --all           # every class in ask_sdk_model
+    python tools/gen_codecs.py --check         # fail if the module is stale
+"""
+import argparse
+import importlib
+import inspect
+import os
+import pkgutil
+import re
+import sys
+from enum import Enum
+
+import skill_env
+
+DEFAULT_ROOTS = ("ask_sdk_model.RequestEnvelope", "ask_sdk_model.ResponseEnvelope")
+DEFAULT_OUTPUT = os.path.join(skill_env.LAMBDA_DIR, "skill_runtime", "model_codecs.py")
+PRIMITIVES = {"str": str, "int": int, "long": int, "float": float, "bool": bool}
+TYPE_NAME = re.compile(r"[A-Za-z_][\w.]*")
+
+HEADER = '''"""Generated by tools/gen_codecs.py from ask-sdk-model {version}; do not edit.
+
+Specialized decoders/encoders for {count} model classes (reachable from
+{roots}). Regenerate after upgrading ask-sdk-model:
+
+    python tools/gen_codecs.py{args}
+
+Importing this module imports no models: each class's codecs start out as
+stubs that import the class and define the real functions on first call.
+"""
+import datetime as _dt
+import decimal as _decimal
+from enum import Enum as _Enum
+
+from ask_sdk_core.exceptions import SerializationException
+
+from .plans import DatetimePlan, PrimitivePlan, default_plans
+
+SDK_VERSION = {version!r}
+
+_GLOBALS = globals()
+_PRIMITIVES = frozenset((str, int, float, bool, bytes))
+_PRIMITIVE_TYPES = (str, int, float, bool, bytes)
+_str = PrimitivePlan(str).decode
+_int = PrimitivePlan(int).decode
+_float = PrimitivePlan(float).decode
+_bool = PrimitivePlan(bool).decode
+_datetime = DatetimePlan(_dt.datetime).decode
+_date = DatetimePlan(_dt.date).decode
+_encoder_names = {{}}
+
+
+def _lazy(name, bind):
+    """Stand-in for the codec called name until bind() defines it."""
+    def stub(value):
+        if _GLOBALS[name] is stub:
+            bind()
+        return _GLOBALS[name](value)
+    return stub
+
+
+def _reflect(type_string, value):
+    return default_plans.plan(type_string).decode(value)
+
+
+def _failed(e):
+    if isinstance(e, SerializationException):
+        return e
+    return SerializationException(str(e))
+
+
+def _undiscriminated(base):
+    return SerializationException(
+        "Couldn't resolve object by discriminator type for {{}} class".format(base))
+
+
+def decoder(cls):
+    """Function decoding a payload into a cls instance, or None."""
+    name = DECODERS.get(cls.__module__ + "." + cls.__name__)
+    if name is None:
+        return None
+    return lambda payload: _GLOBALS[name](payload)
+
+
+def encode(value):
+    """Serialize value like DefaultSerializer.serialize."""
+    if value is None:
+        return None
+    cls = value.__class__
+    if cls in _PRIMITIVES:
+        return value
+    try:
+        name = _encoder_names[cls]
+    except KeyError:
+        name = _encoder_names[cls] = ENCODERS.get(cls.__module__ + "." + cls.__name__)
+    if name is not None:
+        return _GLOBALS[name](value)
+    if isinstance(value, _PRIMITIVE_TYPES):
+        return value
+    if isinstance(value, list):
+        return [encode(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(encode(item) for item in value)
+    if isinstance(value, (_dt.datetime, _dt.date)):
+        return value.isoformat()
+    if isinstance(value, _Enum):
+        return value.value
+    if isinstance(value, _decimal.Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    if isinstance(value, dict):
+        return {{key: encode(item) for key, item in value.items()}}
+    result = {{}}
+    for attr, key in default_plans.serialized_keys(cls):
+        item = getattr(value, attr)
+        if item is not None:
+            result[key] = encode(item)
+    return result
+'''
+
+
+def load_class(name):
+    module_name, _, class_name = name.rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def is_model(cls):
+    return inspect.isclass(cls) and hasattr(cls, "deserialized_types")
+
+
+def is_enum(cls):
+    return inspect.isclass(cls) and issubclass(cls, Enum)
+
+
+def discriminator_owner(cls):
+    """The class whose discriminator map cls dispatches with, or None."""
+    if not hasattr(cls, "get_real_child_model"):
+        return None
+    for klass in cls.__mro__:
+        if "discriminator_value_class_map" in vars(klass):
+            return klass
+    return None
+
+
+def all_classes():
+    import ask_sdk_model
+    classes = []
+    for info in pkgutil.walk_packages(ask_sdk_model.__path__, "ask_sdk_model."):
+        module = importlib.import_module(info.name)
+        for value in vars(module).values():
+            if (is_model(value) or is_enum(value)) and value.__module__ == module.__name__:
+                classes.append(value)
+    return classes
+
+
+def reachable(roots):
+    """Models and enums referenced, directly or through discriminators,
+    from roots."""
+    seen, todo = set(), list(roots)
+    while todo:
+        cls = todo.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        if not is_model(cls):
+            continue
+        owner = discriminator_owner(cls)
+        if owner is not None:
+            todo.extend(load_class(name) for name in owner.discriminator_value_class_map.values())
+        for type_string in cls.deserialized_types.values():
+            for name in TYPE_NAME.findall(type_string):
+                if "." in name:
+                    todo.append(load_class(name))
+    return seen
+
+
+def qualified(cls):
+    return f"{cls.__module__}.{cls.__name__}"
+
+
+class Generator:
+    def __init__(self, classes):
+        self.classes = sorted(classes, key=qualified)
+        counts = {}
+        for cls in self.classes:
+            counts[cls.__name__] = counts.get(cls.__name__, 0) + 1
+        self.names = {}
+        for cls in self.classes:
+            name = cls.__name__
+            if counts[name] > 1:
+                name += "__" + cls.__module__.replace("ask_sdk_model.", "").replace(".", "_")
+            self.names[cls] = name
+
+    def decoder_of(self, cls):
+        owner = discriminator_owner(cls)
+        if owner is not None:
+            return f"dispatch_{self.names[owner]}"
+        return f"decode_{self.names[cls]}"
+
+    def decode_expr(self, var, type_string, enums, depth=0):
+        """Expression decoding the non-None value in var. Enum classes it
+        needs are added to enums (class -> local name)."""
+        type_string = type_string.strip()
+        if type_string.startswith("list["):
+            inner = type_string[5:-1] if type_string.endswith("]") else ""
+            if not inner or "," in inner:
+                return f"_reflect({type_string!r}, {var})"
+            item = f"i{depth}"
+            expr = self.decode_expr(item, inner, enums, depth + 1)
+            return f"[None if {item} is None else {expr} for {item} in {var}]"
+        if type_string.startswith("dict("):
+            match = re.match(r"dict\(([^,]*), (.*)\)", type_string)
+            if match is None:
+                return f"_reflect({type_string!r}, {var})"
+            key, item = f"k{depth}", f"v{depth}"
+            expr = self.decode_expr(item, match.group(2), enums, depth + 1)
+            return f"{{{key}: None if {item} is None else {expr} for {key}, {item} in {var}.items()}}"
+        if type_string in PRIMITIVES:
+            name = PRIMITIVES[type_string].__name__
+            return f"{var} if {var}.__class__ is {name} else _{name}({var})"
+        if type_string == "object":
+            return var
+        if type_string in ("date", "datetime"):
+            return f"_{type_string}({var})"
+        cls = load_class(type_string)
+        if is_enum(cls):
+            return f"{enums.setdefault(cls, f'enum{len(enums)}')}({var})"
+        if not is_model(cls):
+            return var
+        if cls not in self.names:
+            return f"_reflect({type_string!r}, {var})"
+        return f"{self.decoder_of(cls)}({var})"
+
+    def encode_expr(self, var, type_string, enums):
+        type_string = type_string.strip()
+        if type_string in PRIMITIVES:
+            return f"{var} if {var}.__class__ in _PRIMITIVES else encode({var})"
+        if type_string in ("object", "date", "datetime") or type_string.startswith(("list[", "dict(")):
+            return f"encode({var})"
+        cls = load_class(type_string)
+        if is_enum(cls):
+            return f"{var}.value if {var}.__class__ is {enums.setdefault(cls, f'enum{len(enums)}')} else encode({var})"
+        return f"encode({var})"
+
+    def fields(self, cls):
+        names = dict(getattr(cls, "attribute_map", {}))
+        for attr in cls.deserialized_types:
+            names.setdefault(attr, attr)
+        return [(attr, names[attr], type_string) for attr, type_string in cls.deserialized_types.items()]
+
+    def model_functions(self, cls):
+        name = self.names[cls]
+        fields = self.fields(cls)
+        defaults = cls()
+        enums = {}
+
+        decode = ["    def decode_model(payload):", "        try:", "            obj = model()", "            get = payload.get"]
+        for attr, key, type_string in fields:
+            expr = self.decode_expr("value", type_string, enums)
+            if getattr(defaults, attr, None) is None:
+                decode.append(f"            value = get({key!r})")
+                decode.append("            if value is not None:")
+                decode.append(f"                obj.{attr} = {expr}")
+            else:
+                decode.append(f"            if {key!r} in payload:")
+                decode.append(f"                value = payload[{key!r}]")
+                decode.append(f"                obj.{attr} = None if value is None else {expr}")
+        decode += [
+            "            if not keys.issuperset(payload):",
+            "                for key in payload:",
+            "                    if key not in keys:",
+            "                        setattr(obj, key, payload[key])",
+            "            return obj",
+            "        except Exception as e:",
+            "            raise _failed(e)",
+        ]
+
+        encode = ["    def encode_model(obj):", "        result = {}"]
+        for attr, key, type_string in fields:
+            encode.append(f"        value = obj.{attr}")
+            encode.append("        if value is not None:")
+            encode.append(f"            result[{key!r}] = {self.encode_expr('value', type_string, enums)}")
+        encode.append("        return result")
+
+        lines = [f"def _bind_{name}():",
+                 f"    global decode_{name}, encode_{name}",
+                 f"    from {cls.__module__} import {cls.__name__} as model"]
+        lines += [f"    from {enum.__module__} import {enum.__name__} as {local}" for enum, local in enums.items()]
+        lines.append(f"    keys = frozenset({tuple(key for _, key, _ in fields)!r})")
+        lines.append("")
+        lines += decode
+        lines.append("")
+        lines += encode
+        lines.append("")
+        lines.append(f"    decode_{name}, encode_{name} = decode_model, encode_model")
+        lines += ["", ""]
+        lines.append(f"decode_{name} = _lazy({'decode_' + name!r}, _bind_{name})")
+        lines.append(f"encode_{name} = _lazy({'encode_' + name!r}, _bind_{name})")
+        lines += ["", ""]
+        return lines
+
+    def dispatch_function(self, owner):
+        name = self.names[owner]
+        table = "".join(
+            f"    {value!r}: {'decode_' + self.names[load_class(class_name)]!r},\n"
+            for value, class_name in owner.discriminator_value_class_map.items())
+        return [
+            f"_dispatch_{name} = {{\n{table}}}",
+            "",
+            "",
+            f"def dispatch_{name}(payload):",
+            "    try:",
+            f"        codec = _dispatch_{name}.get(payload[{owner.json_discriminator_key!r}])",
+            "    except Exception as e:",
+            "        raise _failed(e)",
+            "    if codec is None:",
+            f"        raise _undiscriminated({str(owner)!r})",
+            "    return _GLOBALS[codec](payload)",
+            "",
+            "",
+        ]
+
+    def render(self, version, roots, args):
+        models = [cls for cls in self.classes if is_model(cls)]
+        body = [HEADER.format(version=version, count=len(models), roots=", ".join(roots), args=args)]
+        owners = sorted({discriminator_owner(cls) for cls in models} - {None}, key=qualified)
+        for owner in owners:
+            body += self.dispatch_function(owner)
+        for cls in models:
+            body += self.model_functions(cls)
+        body.append("DECODERS = {")
+        body += [f"    {qualified(cls)!r}: {self.decoder_of(cls)!r}," for cls in models]
+        body.append("}")
+        body.append("")
+        body.append("ENCODERS = {")
+        body += [f"    {qualified(cls)!r}: {'encode_' + self.names[cls]!r}," for cls in models]
+        body.append("}")
+        return "\n".join(body) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", action="append", help=f"root class (default: {', '.join(DEFAULT_ROOTS)})")
+    parser.add_argument("--all", action="store_true", help="every model in ask_sdk_model")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--check", action="store_true", help="exit 1 if the output is out of date")
+    args = parser.parse_args()
+
+    skill_env.setup()
+    from ask_sdk_model.__version__ import __version__
+
+    roots = tuple(args.root or DEFAULT_ROOTS)
+    classes = all_classes() if args.all else reachable([load_class(root) for root in roots])
+    described = ("ask_sdk_model",) if args.all else roots
+    flags = " --all" if args.all else "".join(f" --root {root}" for root in args.root or ())
+    source = Generator(classes).render(__version__, described, flags)
+
+    if args.check:
+        try:
+            with open(args.output, encoding="utf-8") as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print(f"{args.output} is out of date; run tools/gen_codecs.py", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(source)
+    print(f"wrote {args.output} ({sum(is_model(c) for c in classes)} models)")
+
+
+if __name__ == "__main__":
+    main()
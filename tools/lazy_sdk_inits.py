@@ -0,0 +1,179 @@
+"""Rewrite ask_sdk_model's package __init__ modules to import lazily.
+
+Every ``ask_sdk_model`` package ``__init__`` imports all of its model
+modules, so ``from ask_sdk_model import Response`` (or
+``ask_sdk_core.response_helper``, which pulls in the ui, display and
+experimentation packages) imports hundreds of modules at cold start. This
+rewrites each ``__init__`` in a build directory into a name -> module
+table and a PEP 562 module ``__getattr__``: ``from ask_sdk_model import X``
+still works, but only imports X's module. Submodules and subpackages stay
+reachable as attributes. Files that are not plain re-export lists are
+left alone, and rewritten files are recognised and skipped, so running it
+twice is harmless.
+
+The files are rewritten in place, so run it on the bundle you are about
+to upload (``pip install -t build/``, or a copy of .ask/lambda), not on
+the committed .ask/lambda. It reports the cold import time of
+ask_sdk_model and of the skill before and after:
+
+    python tools/lazy_sdk_inits.py --target build/
+    python tools/lazy_sdk_inits.py --target build/ --rounds 10
+    python tools/lazy_sdk_inits.py --target build/ --check   # exit 1 if any __init__ is still eager
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+import skill_env
+
+PACKAGE = "ask_sdk_model"
+MARKER = "# Generated by tools/lazy_sdk_inits.py"
+
+TEMPLATE = '''{header}{marker}: names are imported from their
+# modules on first access (PEP 562) instead of all at package import.
+import importlib as _importlib
+
+# name -> (module, attribute); attribute None for the module itself.
+_LAZY = {{
+{table}}}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    target = _LAZY.get(name)
+    if target is None:
+        try:
+            return _importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != __name__ + "." + name:
+                raise
+        raise AttributeError("module {{!r}} has no attribute {{!r}}".format(__name__, name))
+    module, attribute = target
+    value = _importlib.import_module("." + module, __name__)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+'''
+
+TIMING = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, len(sys.modules))
+"""
+
+
+def lazy_table(source):
+    """name -> (module, attribute) for an __init__ that only re-exports
+    from its own modules, else None."""
+    table = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+            continue
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            continue  # docstring
+        if not isinstance(node, ast.ImportFrom) or node.level != 1:
+            return None
+        for alias in node.names:
+            if alias.name == "*":
+                return None
+            if node.module is None:
+                table[alias.asname or alias.name] = (alias.name, None)
+            else:
+                table[alias.asname or alias.name] = (node.module, alias.name)
+    return table
+
+
+def header(source):
+    """The leading comment block (coding line, license)."""
+    lines = []
+    for line in source.splitlines(keepends=True):
+        if not line.startswith("#") and line.strip():
+            break
+        lines.append(line)
+    return "".join(lines)
+
+
+def rewrite(source):
+    """Lazy version of an __init__ source, or None to leave it as is."""
+    if MARKER in source:
+        return None
+    table = lazy_table(source)
+    if not table:
+        return None
+    entries = "".join(f"    {name!r}: {target!r},\n" for name, target in table.items())
+    return TEMPLATE.format(header=header(source), marker=MARKER, table=entries)
+
+
+def init_files(target):
+    root = os.path.join(target, PACKAGE)
+    if not os.path.isdir(root):
+        raise SystemExit(f"no {PACKAGE} package in {target}")
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name != "__pycache__")
+        if "__init__.py" in filenames:
+            yield os.path.join(directory, "__init__.py")
+
+
+def cold_import(target, module, rounds):
+    """Fastest of rounds fresh-interpreter imports of module: (seconds, modules loaded)."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join((skill_env.LAMBDA_DIR, target)))
+    env.setdefault("OPENAI_API_KEY", "cold-start-timing")
+    results = []
+    for _ in range(rounds):
+        output = subprocess.run([sys.executable, "-c", TIMING.format(module=module)], env=env,
+                                cwd=skill_env.LAMBDA_DIR, capture_output=True, text=True, check=True).stdout
+        seconds, modules = output.split()
+        results.append((float(seconds), int(modules)))
+    return min(results)
+
+
+def report(target, rounds):
+    return {module: cold_import(target, module, rounds) for module in (PACKAGE, "lambda_function")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", required=True,
+                        help="bundle directory containing ask_sdk_model, rewritten in place")
+    parser.add_argument("--rounds", type=int, default=5, help="cold imports per measurement (fastest wins)")
+    parser.add_argument("--check", action="store_true", help="exit 1 if any __init__ would be rewritten")
+    args = parser.parse_args()
+
+    pending = {}
+    for path in init_files(args.target):
+        with open(path, encoding="utf-8") as f:
+            source = rewrite(f.read())
+        if source is not None:
+            pending[path] = source
+
+    if args.check:
+        if pending:
+            print(f"{len(pending)} eager __init__ modules in {args.target}; run tools/lazy_sdk_inits.py",
+                  file=sys.stderr)
+            sys.exit(1)
+        return
+
+    before = report(args.target, args.rounds)
+    for path, source in pending.items():
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source)
+    print(f"rewrote {len(pending)} __init__ modules in {args.target}")
+    after = report(args.target, args.rounds)
+
+    print(f"{'import':<18}{'before ms':>11}{'modules':>9}{'after ms':>11}{'modules':>9}")
+    for module in before:
+        (old, old_count), (new, new_count) = before[module], after[module]
+        print(f"{module:<18}{old * 1000:>11.1f}{old_count:>9}{new * 1000:>11.1f}{new_count:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Local stand-in for the OpenAI chat-completions endpoint.
+
+Serves POST /v1/chat/completions, plain JSON or SSE stream (when the request
+has "stream": true), with configurable time to first token, token rate and
+error injection. Used by tools/bench_chat_turn.py; can also be run on its
+own and pointed at with OPENAI_URL:
+
+    python tools/openai_standin.py --port 8700 --ttft-ms 400 --tokens-per-sec 60
+    OPENAI_URL=http://127.0.0.1:8700/v1/chat/completions ...
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Opens with a rhetorical question and ends with the follow-up question, like
+# the real replies; only the latter may end a streamed read.
+DEFAULT_REPLY = (
+    "Weißt du, was ein schwarzes Loch ist? Hmm, so schwer es ist, dass nicht einmal Licht "
+    "entkommen kann. Viele davon in unserer Galaxie es gibt, und in der Mitte ein riesiges. "
+    "Welchen Stern magst du am liebsten?"
+)
+
+
+class StandinConfig:
+    def __init__(self, ttft_ms=300, tokens_per_sec=50, error_rate=0.0, error_status=500, reply=DEFAULT_REPLY):
+        self.ttft_ms = ttft_ms
+        self.tokens_per_sec = tokens_per_sec
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.reply = reply
+        self.requests = 0
+        self.connections = 0
+
+
+def tokens_of(text):
+    """Split a reply into word-sized "tokens" that join back to the text."""
+    words = text.split(" ")
+    return [word + " " for word in words[:-1]] + words[-1:]
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = StandinConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.config.connections += 1
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        config = self.config
+        config.requests += 1
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            return self.send_json(404, {"error": {"message": "not found"}})
+        if config.error_rate and random.random() < config.error_rate:
+            return self.send_json(config.error_status, {"error": {"message": "injected error"}})
+
+        time.sleep(config.ttft_ms / 1000)
+        tokens = tokens_of(config.reply)
+        if body.get("max_tokens"):
+            tokens = tokens[: body["max_tokens"]]
+        delay = 1.0 / config.tokens_per_sec if config.tokens_per_sec else 0
+
+        if body.get("stream"):
+            self.stream_reply(tokens, delay, body)
+        else:
+            time.sleep(delay * max(len(tokens) - 1, 0))
+            self.send_json(200, {
+                "id": "chatcmpl-standin",
+                "object": "chat.completion",
+                "model": body.get("model"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": "".join(tokens)}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)},
+            })
+
+    def stream_reply(self, tokens, delay, body):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for i, token in enumerate(tokens):
+                if i:
+                    time.sleep(delay)
+                chunk = {"id": "chatcmpl-standin", "object": "chat.completion.chunk", "model": body.get("model"),
+                         "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+                self.write_chunk(f"data: {json.dumps(chunk)}\n\n")
+            self.write_chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client may still hang up early (deadline, errors).
+            pass
+
+    def write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start(config, host="127.0.0.1", port=0):
+    """Serve in a background thread; returns (server, url)."""
+    handler = type("ConfiguredStandinHandler", (StandinHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/v1/chat/completions"
+
+
+def add_arguments(parser):
+    parser.add_argument("--ttft-ms", type=float, default=300, help="time to first token")
+    parser.add_argument("--tokens-per-sec", type=float, default=50, help="token rate after the first one")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=500)
+
+
+def config_from_args(args):
+    return StandinConfig(ttft_ms=args.ttft_ms, tokens_per_sec=args.tokens_per_sec,
+                         error_rate=args.error_rate, error_status=args.error_status)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8700)
+    add_arguments(parser)
+    args = parser.parse_args()
+    server, url = start(config_from_args(args), args.host, args.port)
+    print(f"OpenAI stand-in listening on {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
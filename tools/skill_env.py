@@ -0,0 +1,21 @@
+"""Make the skill code (lambda/) and its dependencies importable.
+
+Dependencies come from the current environment if installed
+(pip install -r lambda/requirements.txt), otherwise from the ASK CLI
+build directory .ask/lambda.
+"""
+import importlib.util
+import os
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAMBDA_DIR = os.path.join(ROOT, "lambda")
+BUILD_DIR = os.path.join(ROOT, ".ask", "lambda")
+
+
+def setup():
+    if LAMBDA_DIR not in sys.path:
+        sys.path.insert(0, LAMBDA_DIR)
+    if importlib.util.find_spec("ask_sdk_core") is None and os.path.isdir(BUILD_DIR):
+        sys.path.append(BUILD_DIR)
@@ -0,0 +1,297 @@
+"""Profile the skill's cold start and build a trimmed deployment bundle.
+
+Copies lambda/ and its dependencies (default: the ASK CLI build
+directory .ask/lambda) into an output directory, then runs
+lambda_function.handler on representative envelopes (and recorded ones)
+against the local OpenAI stand-in, recording every import with
+``sys.addaudithook``. From that it prunes:
+
+* top-level packages and modules nothing imported (``--keep`` overrides),
+  with their .dist-info directories, plus scripts and build leftovers;
+* ask_sdk_model directories none of whose modules were imported or hold a
+  model reachable from RequestEnvelope/ResponseEnvelope, so any request
+  Alexa sends still decodes.
+
+The bundle is precompiled (unchecked-hash .pyc files, as /var/task is
+read-only) when this Python is the one of the Lambda runtime in
+ask-resources.json (other versions' .pyc files would only add weight),
+and the envelopes are replayed against it to check the responses are
+unchanged. Cold ``import lambda_function`` time (from
+``-X importtime``) and bundle size are reported before and after.
+
+    python tools/slim_bundle.py --output build/lambda --zip build/lambda.zip
+    python tools/slim_bundle.py --lazy-inits --envelopes recorded/ --top 15
+"""
+import argparse
+import compileall
+import json
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipfile
+
+import envelopes
+import lazy_sdk_inits
+import openai_standin
+import skill_env
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(skill_env.ROOT, ".ask", "slim-lambda")
+MODEL_PACKAGE = "ask_sdk_model"
+# Never part of the bundle.
+SKIPPED = ("bin", "__pycache__", "build.zip", "requirements.txt")
+
+DRIVER = '''
+import json
+import sys
+
+imported = []
+
+
+def record(event, args):
+    if event == "import":
+        imported.append(args[0])
+
+
+sys.addaudithook(record)
+with open(sys.argv[1], encoding="utf-8") as f:
+    events = json.load(f)
+
+
+class Context:
+    def get_remaining_time_in_millis(self):
+        return 8000
+
+
+import lambda_function
+
+responses = [lambda_function.handler(event, Context()) for event in events]
+files = {}
+for name in dict.fromkeys(imported):
+    module = sys.modules.get(name)
+    if getattr(module, "__file__", None):
+        files[name] = module.__file__
+
+from gen_codecs import DEFAULT_ROOTS, load_class, reachable
+
+required = sorted({cls.__module__ for cls in reachable([load_class(root) for root in DEFAULT_ROOTS])})
+with open(sys.argv[2], "w", encoding="utf-8") as f:
+    json.dump({"files": files, "missing": sorted(set(imported) - set(files)), "required": required,
+               "responses": responses}, f, default=str)
+'''
+
+
+def bundle_env(bundle, url=None):
+    """Environment running the skill from bundle alone (the interpreters
+    are started with -S, so site-packages stays out, as on Lambda)."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join((bundle, TOOLS_DIR)), PYTHONDONTWRITEBYTECODE="1")
+    env.setdefault("OPENAI_API_KEY", "slim-bundle")
+    if url:
+        env["OPENAI_URL"] = url
+    return env
+
+
+def profile(bundle, events, url):
+    """Run the envelopes through the skill in bundle; returns the driver's record."""
+    with tempfile.TemporaryDirectory() as tmp:
+        events_path, result_path = os.path.join(tmp, "events.json"), os.path.join(tmp, "result.json")
+        with open(events_path, "w", encoding="utf-8") as f:
+            json.dump(events, f)
+        run = subprocess.run([sys.executable, "-S", "-c", DRIVER, events_path, result_path], env=bundle_env(bundle, url),
+                             cwd=bundle, capture_output=True, text=True)
+        if run.returncode:
+            raise SystemExit(f"the skill failed in {bundle}:\n{run.stderr[-2000:]}")
+        with open(result_path, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def cold_import(bundle, rounds):
+    """Fastest cold ``import lambda_function``: (ms, {module: self us})."""
+    best = None
+    for _ in range(rounds):
+        stderr = subprocess.run([sys.executable, "-S", "-X", "importtime", "-c", "import lambda_function"],
+                                env=bundle_env(bundle), cwd=bundle, check=True, capture_output=True,
+                                text=True).stderr
+        self_us, total_ms = {}, 0.0
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+                continue
+            own, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            self_us[name] = int(own)
+            if name == "lambda_function":
+                total_ms = int(cumulative) / 1000
+        if best is None or total_ms < best[0]:
+            best = (total_ms, self_us)
+    return best
+
+
+def copy_bundle(source, output):
+    """lambda/ plus the dependencies in source, without build leftovers."""
+    if os.path.exists(output):
+        shutil.rmtree(output)
+    ignore = shutil.ignore_patterns("__pycache__", "*.pyc")
+    shutil.copytree(skill_env.LAMBDA_DIR, output, ignore=ignore)
+    for name in sorted(os.listdir(source)):
+        path = os.path.join(source, name)
+        if name in SKIPPED or os.path.exists(os.path.join(output, name)):
+            continue
+        if os.path.isdir(path):
+            shutil.copytree(path, os.path.join(output, name), ignore=ignore)
+        elif name.endswith(".py"):
+            shutil.copy2(path, output)
+
+
+def distributions(bundle):
+    """.dist-info directory -> top-level names it installed."""
+    result = {}
+    for name in os.listdir(bundle):
+        if name.endswith(".dist-info"):
+            tops = set()
+            with open(os.path.join(bundle, name, "RECORD"), encoding="utf-8") as f:
+                for line in f:
+                    top = line.split(",", 1)[0].split("/", 1)[0]
+                    if top and top != name and not top.startswith(".."):
+                        tops.add(top[:-3] if top.endswith(".py") else top)
+            result[name] = tops
+    return result
+
+
+def prune(bundle, needed_files, required_modules, keep):
+    """Remove what the profile shows is unused; returns removed paths."""
+    bundle = os.path.realpath(bundle)
+    code = {name[:-3] if name.endswith(".py") else name for name in os.listdir(skill_env.LAMBDA_DIR)}
+    needed_dirs, used_tops = set(), set(keep) | code
+    for path in needed_files:
+        path = os.path.realpath(path)
+        if path.startswith(bundle + os.sep):
+            relative = os.path.relpath(path, bundle)
+            used_tops.add(relative.split(os.sep, 1)[0].removesuffix(".py"))
+            needed_dirs.add(os.path.dirname(path))
+    for module in required_modules:
+        needed_dirs.add(os.path.dirname(os.path.join(bundle, *module.split("."))))
+
+    removed = []
+    for dist, tops in distributions(bundle).items():
+        if not tops & used_tops:
+            removed.append(os.path.join(bundle, dist))
+    for name in os.listdir(bundle):
+        path = os.path.join(bundle, name)
+        if name.endswith(".dist-info") or name.removesuffix(".py") in used_tops:
+            continue
+        if os.path.isdir(path) or name.endswith(".py"):
+            removed.append(path)
+    models = os.path.join(bundle, MODEL_PACKAGE)
+    for directory, dirnames, _ in os.walk(models):
+        for name in list(dirnames):
+            path = os.path.join(directory, name)
+            if name != "__pycache__" and not any(d == path or d.startswith(path + os.sep) for d in needed_dirs):
+                removed.append(path)
+                dirnames.remove(name)
+    for path in removed:
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.remove(path)
+    return removed
+
+
+def size(path):
+    """(bytes of everything but .pyc files, bytes of .pyc files, bytes zipped) of a directory."""
+    files, compiled = 0, 0
+    with tempfile.TemporaryFile() as tmp:
+        with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as archive:
+            for directory, _, filenames in os.walk(path):
+                for name in filenames:
+                    file_path = os.path.join(directory, name)
+                    if name.endswith(".pyc"):
+                        compiled += os.path.getsize(file_path)
+                    else:
+                        files += os.path.getsize(file_path)
+                    archive.write(file_path, os.path.relpath(file_path, path))
+        return files, compiled, tmp.tell()
+
+
+def write_zip(bundle, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for directory, dirnames, filenames in os.walk(bundle):
+            dirnames.sort()
+            for name in sorted(filenames):
+                file_path = os.path.join(directory, name)
+                archive.write(file_path, os.path.relpath(file_path, bundle))
+
+
+def runtime_version():
+    """Python version of the configured Lambda runtime, e.g. '3.12', or None."""
+    try:
+        with open(os.path.join(skill_env.ROOT, "ask-resources.json"), encoding="utf-8") as f:
+            resources = json.load(f)
+        runtime = resources["profiles"]["default"]["skillInfrastructure"]["userConfig"]["runtime"]
+    except (OSError, KeyError, ValueError):
+        return None
+    return runtime.removeprefix("python")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", default=skill_env.BUILD_DIR, help="directory with the installed dependencies")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--zip", help="also write the bundle as a zip file here")
+    parser.add_argument("--envelopes", help="recorded envelopes (.json, .jsonl or directory)")
+    parser.add_argument("--keep", action="append", default=[], help="top-level package to keep regardless")
+    parser.add_argument("--lazy-inits", action="store_true", help="rewrite ask_sdk_model __init__s (lazy_sdk_inits)")
+    parser.add_argument("--rounds", type=int, default=3, help="cold imports per measurement (fastest wins)")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    events = envelopes.representative("dot") + envelopes.representative("show")
+    if args.envelopes:
+        events += envelopes.load(args.envelopes)
+    server, url = openai_standin.start(openai_standin.StandinConfig(ttft_ms=0, tokens_per_sec=0))
+
+    copy_bundle(args.source, args.output)
+    before_ms, _ = cold_import(args.output, args.rounds)
+    before_size = size(args.output)
+    if args.lazy_inits:
+        for path in lazy_sdk_inits.init_files(args.output):
+            with open(path, encoding="utf-8") as f:
+                source = lazy_sdk_inits.rewrite(f.read())
+            if source is not None:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(source)
+
+    record = profile(args.output, events, url)
+    removed = prune(args.output, record["files"].values(), record["required"], args.keep)
+    runtime, current = runtime_version(), f"{sys.version_info.major}.{sys.version_info.minor}"
+    if runtime == current:
+        compileall.compile_dir(args.output, quiet=1, invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+    if profile(args.output, events, url)["responses"] != record["responses"]:
+        raise SystemExit("the trimmed bundle answers differently; rerun with --keep for the missing package")
+    server.shutdown()
+
+    after_ms, self_us = cold_import(args.output, args.rounds)
+    after_size = size(args.output)
+    if args.zip:
+        write_zip(args.output, args.zip)
+
+    print(f"{len(events)} envelopes: {len(record['files'])} modules imported, "
+          f"{len(record['missing'])} optional imports not found")
+    print(f"removed from {args.output}: {', '.join(sorted(os.path.relpath(path, args.output) for path in removed))}")
+    print(f"{'':<22}{'before':>12}{'after':>12}")
+    print(f"{'import lambda_function':<22}{before_ms:>9.1f} ms{after_ms:>9.1f} ms")
+    print(f"{'size without .pyc':<22}{before_size[0] / 1e6:>9.2f} MB{after_size[0] / 1e6:>9.2f} MB")
+    print(f"{'.pyc files':<22}{before_size[1] / 1e6:>9.2f} MB{after_size[1] / 1e6:>9.2f} MB")
+    print(f"{'zipped':<22}{before_size[2] / 1e6:>9.2f} MB{after_size[2] / 1e6:>9.2f} MB")
+    print("\nslowest imports (self time, after):")
+    for name, us in sorted(self_us.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {us / 1000:>8.2f} ms  {name}")
+    if runtime != current:
+        print(f"\nnote: not precompiled, this is Python {current} and the Lambda runtime is {runtime or 'unknown'}; "
+              f"run it with Python {runtime or 'of the runtime'} for .pyc files", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()